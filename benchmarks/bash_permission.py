@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Latency of the Bash tool's permission evaluation.
+
+Runs the checks the permission engine makes for one Bash call
+(``check_read_only``, ``check_permissions`` and ``generate_suggestions``)
+over a set of commands, first with the parse cache disabled, so that
+every check parses the command again, then with it enabled, where each
+command is parsed once.
+
+Usage::
+
+    python benchmarks/bash_permission.py [--rounds 200] [--json]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from agentscope.permission import PermissionContext
+from agentscope.tool import Bash
+from agentscope.tool._builtin._bash_parser import BashCommandParser
+
+COMMANDS = [
+    "ls -la",
+    "git status && git diff --stat",
+    "npm run build && npm test -- --coverage",
+    "find . -name '*.py' -exec rm {} +",
+    "sed -i 's/foo/bar/g' src/app.py | tee log.txt",
+    "rm -rf build dist > /dev/null 2>&1",
+    "FOO=1 python -m pytest tests/ -x -q | tail -n 20",
+    "cat README.md | grep -n install; echo done",
+]
+
+
+async def _evaluate(tool: Bash, command: str) -> None:
+    """Run the permission checks of one Bash call."""
+    tool_input = {"command": command}
+    await tool.check_read_only(tool_input)
+    await tool.check_permissions(tool_input, PermissionContext())
+    await tool.generate_suggestions(tool_input)
+
+
+async def _measure(cache_size: int, rounds: int) -> dict:
+    """Time the evaluation of every command, each round on new text."""
+    tool = Bash()
+    tool._bash_parser = BashCommandParser(cache_size=cache_size)
+    samples = []
+    for i in range(rounds):
+        for command in COMMANDS:
+            # A distinct text per round, so the cache only helps within
+            # one evaluation, as for a real tool call
+            start = time.perf_counter()
+            await _evaluate(tool, f"{command} # {i}")
+            samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "cache_size": cache_size,
+        "evaluations": len(samples),
+        "parses": tool._bash_parser.stats["misses"],
+        "mean_us": sum(samples) / len(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99)] * 1e6,
+    }
+
+
+async def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n", maxsplit=1)[0],
+    )
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = [
+        await _measure(0, args.rounds),
+        await _measure(BashCommandParser().cache_size, args.rounds),
+    ]
+    if args.json:
+        print(json.dumps({"benchmark": "bash_permission", "results": results}))
+        return
+    for result in results:
+        print(
+            f"cache_size={result['cache_size']:<4} "
+            f"parses/eval={result['parses'] / result['evaluations']:.1f} "
+            f"mean={result['mean_us']:.0f}us "
+            f"p50={result['p50_us']:.0f}us p99={result['p99_us']:.0f}us",
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
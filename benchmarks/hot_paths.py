@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+"""Throughput of the core hot paths, run offline on local stand-ins.
+
+Every benchmark runs in-process without network access or credentials:
+
+- ``session_events``: events/sec through ``publish_session_event`` on an
+  ``InMemoryMessageBus``, with a live subscriber draining the stream.
+- ``upsert_message``: messages/sec through ``upsert_message`` on an
+  ``AsyncSQLAlchemyStorage`` backed by a SQLite file, appending new
+  messages and then rewriting them in place as a streamed reply does.
+- ``agent_loop``: reasoning-acting iterations/sec of an ``Agent`` with N
+  tools, driven by a scripted chat model that streams deltas and calls
+  the ``Read`` tool on a temp-dir ``LocalBackend``.
+- ``formatter``: ``OpenAIChatFormatter.format`` latency against the
+  context length, for a text-only history and for one with a local
+  image in every tenth message, with the encodings of local files
+  cleared before each call (``images_cold``) or kept (``images_warm``).
+- ``rag``: chunks/sec inserted into and queries/sec searched from a
+  ``KnowledgeBase`` over an in-memory ``QdrantStore``, with a
+  deterministic fake embedding. Skipped when ``qdrant-client`` is not
+  installed.
+
+Usage::
+
+    python benchmarks/hot_paths.py [--rounds 200] [--only rag ...] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Any, AsyncGenerator
+
+from pydantic import BaseModel
+
+from agentscope.agent import Agent, ReActConfig
+from agentscope.app._bus_ops import publish_session_event
+from agentscope.app.message_bus import InMemoryMessageBus, MessageBusKeys
+from agentscope.app.storage import AsyncSQLAlchemyStorage
+from agentscope.credential import OpenAICredential
+from agentscope.embedding import (
+    EmbeddingModelBase,
+    EmbeddingResponse,
+    EmbeddingUsage,
+)
+from agentscope.formatter import OpenAIChatFormatter
+from agentscope.formatter._formatter_base import _LOCAL_FILE_CACHE
+from agentscope.message import (
+    AssistantMsg,
+    DataBlock,
+    Msg,
+    TextBlock,
+    ToolCallBlock,
+    URLSource,
+    UserMsg,
+)
+from agentscope.model import ChatModelBase, ChatResponse, ChatUsage
+from agentscope.permission import (
+    PermissionBehavior,
+    PermissionContext,
+    PermissionDecision,
+)
+from agentscope.rag import Chunk, KnowledgeBase
+from agentscope.tool import LocalBackend, Read, ToolBase, Toolkit
+
+TOOL_COUNTS = [1, 10, 50]
+CONTEXT_LENGTHS = [10, 100, 1000]
+EMBEDDING_DIMENSIONS = 64
+
+
+def _rate(count: int, seconds: float) -> float:
+    """Operations per second."""
+    return count / seconds if seconds > 0 else float("inf")
+
+
+def _latencies(samples: list[float]) -> dict:
+    """Mean, median and 99th percentile of samples, in microseconds."""
+    samples = sorted(samples)
+    return {
+        "mean_us": sum(samples) / len(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99)] * 1e6,
+    }
+
+
+def _history(length: int, image: str | None = None) -> list[Msg]:
+    """A conversation of alternating user and assistant messages, where
+    every tenth user message attaches ``image`` when given."""
+    history: list[Msg] = []
+    for i in range(length):
+        text = f"Message {i}: " + "lorem ipsum dolor sit amet " * 8
+        if i % 2:
+            history.append(AssistantMsg(name="assistant", content=text))
+        elif image is not None and i % 10 == 0:
+            history.append(
+                UserMsg(
+                    name="user",
+                    content=[
+                        TextBlock(text=text),
+                        DataBlock(
+                            source=URLSource(
+                                url=f"file://{image}",
+                                media_type="image/png",
+                            ),
+                        ),
+                    ],
+                ),
+            )
+        else:
+            history.append(UserMsg(name="user", content=text))
+    return history
+
+
+# ---------------------------------------------------------------------------
+# Stand-ins
+# ---------------------------------------------------------------------------
+
+
+class _ScriptedModel(ChatModelBase):
+    """A chat model streaming a scripted reply as deltas.
+
+    Each reply calls the ``Read`` tool ``tool_steps`` times, then answers
+    with text. The messages are formatted as a real OpenAI-compatible
+    model would before the first delta.
+    """
+
+    class Parameters(BaseModel):
+        """No parameters."""
+
+    def __init__(self, path: str, tool_steps: int) -> None:
+        """Initialize the scripted model.
+
+        Args:
+            path (`str`):
+                The file the tool calls read.
+            tool_steps (`int`):
+                The tool calls of each reply.
+        """
+        super().__init__(
+            credential=OpenAICredential(api_key="benchmark"),
+            model="scripted",
+            parameters=_ScriptedModel.Parameters(),
+            stream=True,
+            max_retries=0,
+        )
+        self.formatter = OpenAIChatFormatter()
+        self.path = path
+        self.tool_steps = tool_steps
+        self.steps = 0
+
+    async def _call_api(
+        self,
+        model_name: str,
+        messages: list[Msg],
+        tools: list[dict] | None = None,
+        tool_choice: Any = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[ChatResponse, None]:
+        """Stream the next step of the script."""
+        await self.formatter.format(messages)
+        step = self.steps % (self.tool_steps + 1)
+        self.steps += 1
+
+        async def _stream() -> AsyncGenerator[ChatResponse, None]:
+            for word in ("Let ", "me ", "look ", "this ", "up."):
+                yield ChatResponse(
+                    content=[TextBlock(text=word)],
+                    is_last=False,
+                )
+            if step < self.tool_steps:
+                yield ChatResponse(
+                    content=[
+                        ToolCallBlock(
+                            id=f"call-{self.steps}",
+                            name="Read",
+                            input=json.dumps({"file_path": self.path}),
+                        ),
+                    ],
+                    is_last=False,
+                )
+            yield ChatResponse(
+                content=[],
+                is_last=False,
+                usage=ChatUsage(input_tokens=100, output_tokens=10, time=0),
+            )
+
+        return _stream()
+
+
+class _StubTool(ToolBase):
+    """A read-only tool padding the toolkit; the script never calls it."""
+
+    description: str = "Return the input unchanged."
+    input_schema: dict = {
+        "type": "object",
+        "properties": {"text": {"type": "string"}},
+        "required": ["text"],
+    }
+    is_concurrency_safe: bool = True
+    is_read_only: bool = True
+
+    def __init__(self, index: int) -> None:
+        """Name the tool after its index."""
+        super().__init__()
+        self.name = f"stub_{index}"
+
+    async def check_permissions(
+        self,
+        tool_input: dict[str, Any],
+        context: PermissionContext,
+    ) -> PermissionDecision:
+        """Always allow."""
+        return PermissionDecision(
+            behavior=PermissionBehavior.ALLOW,
+            message="benchmark",
+        )
+
+    async def execute(self, text: str) -> str:
+        """Echo the text."""
+        return text
+
+
+class _FakeEmbedding(EmbeddingModelBase):
+    """A deterministic embedding seeded by the text, so that runs on
+    different commits index the same vectors."""
+
+    def __init__(self) -> None:
+        """Initialize the fake embedding."""
+        super().__init__(
+            credential=OpenAICredential(api_key="benchmark"),
+            model="fake-embedding",
+            dimensions=EMBEDDING_DIMENSIONS,
+            parameters=None,
+            context_size=8192,
+            batch_size=64,
+            max_retries=0,
+            retry_delay=0,
+        )
+
+    async def _call_api(
+        self,
+        inputs: list[Any],
+        **kwargs: Any,
+    ) -> EmbeddingResponse:
+        """Embed each text with a generator seeded by it."""
+        embeddings = []
+        for text in inputs:
+            rng = random.Random(str(text))
+            embeddings.append(
+                [rng.uniform(-1, 1) for _ in range(self.dimensions)],
+            )
+        return EmbeddingResponse(
+            embeddings=embeddings,
+            usage=EmbeddingUsage(tokens=0, time=0),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+
+async def _session_events(rounds: int) -> list[dict]:
+    """Publish events while a subscriber consumes them."""
+    bus = InMemoryMessageBus()
+    count = rounds * 50
+    ready = asyncio.Event()
+    received = 0
+
+    async def _consume() -> None:
+        nonlocal received
+        async for _ in bus.subscribe(
+            MessageBusKeys.session_events("s-1"),
+            on_ready=ready.set,
+        ):
+            received += 1
+            if received == count:
+                return
+
+    consumer = asyncio.create_task(_consume())
+    await ready.wait()
+    event = {"type": "TEXT_BLOCK_DELTA", "delta": "lorem ipsum " * 4}
+    start = time.perf_counter()
+    for _ in range(count):
+        await publish_session_event(bus, "s-1", event)
+    await consumer
+    elapsed = time.perf_counter() - start
+    return [
+        {
+            "name": "session_events",
+            "events": count,
+            "events_per_sec": _rate(count, elapsed),
+        },
+    ]
+
+
+async def _upsert_message(rounds: int, workdir: str) -> list[dict]:
+    """Append messages, then rewrite each one in place."""
+    url = f"sqlite+aiosqlite:///{os.path.join(workdir, 'bench.db')}"
+    messages = _history(rounds * 5)
+    results = []
+    async with AsyncSQLAlchemyStorage(url, create_tables=True) as storage:
+        for phase in ("append", "rewrite"):
+            start = time.perf_counter()
+            for msg in messages:
+                await storage.upsert_message("u-1", "s-1", msg)
+            elapsed = time.perf_counter() - start
+            results.append(
+                {
+                    "name": "upsert_message",
+                    "phase": phase,
+                    "messages": len(messages),
+                    "messages_per_sec": _rate(len(messages), elapsed),
+                },
+            )
+    return results
+
+
+async def _agent_loop(rounds: int, workdir: str) -> list[dict]:
+    """Run replies of several tool calls each with growing toolkits."""
+    path = os.path.join(workdir, "notes.txt")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("lorem ipsum dolor sit amet\n" * 50)
+
+    tool_steps = 4
+    replies = max(1, rounds // 10)
+    results = []
+    for count in TOOL_COUNTS:
+        model = _ScriptedModel(path, tool_steps)
+        tools: list[ToolBase] = [Read(backend=LocalBackend())]
+        tools.extend(_StubTool(i) for i in range(count - 1))
+        agent = Agent(
+            name="assistant",
+            system_prompt="You are a benchmark assistant.",
+            model=model,
+            toolkit=Toolkit(tools=tools),
+            react_config=ReActConfig(max_iters=tool_steps + 1),
+        )
+        start = time.perf_counter()
+        for i in range(replies):
+            await agent.reply(UserMsg(name="user", content=f"Question {i}"))
+        elapsed = time.perf_counter() - start
+        results.append(
+            {
+                "name": "agent_loop",
+                "tools": count,
+                "iterations": model.steps,
+                "iterations_per_sec": _rate(model.steps, elapsed),
+            },
+        )
+    return results
+
+
+async def _formatter(rounds: int) -> list[dict]:
+    """Time formatting histories of growing lengths, text-only and with
+    a local image in every tenth message."""
+    results = []
+    with tempfile.TemporaryDirectory() as root:
+        image = os.path.join(root, "image.png")
+        with open(image, "wb") as f:
+            f.write(os.urandom(256 * 1024))
+        formatter = OpenAIChatFormatter(input_types=["image/*"])
+        for length in CONTEXT_LENGTHS:
+            text = _history(length)
+            images = _history(length, image=image)
+            repeats = max(1, rounds * 10 // length)
+            for phase, history in (
+                ("text", text),
+                ("images_cold", images),
+                ("images_warm", images),
+            ):
+                samples = []
+                await formatter.format(history)
+                for _ in range(repeats):
+                    if phase == "images_cold":
+                        _LOCAL_FILE_CACHE.clear()
+                    start = time.perf_counter()
+                    await formatter.format(history)
+                    samples.append(time.perf_counter() - start)
+                results.append(
+                    {
+                        "name": "formatter",
+                        "phase": phase,
+                        "messages": length,
+                        **_latencies(samples),
+                    },
+                )
+    return results
+
+
+async def _rag(rounds: int) -> list[dict]:
+    """Insert documents into a knowledge base, then search it."""
+    try:
+        from agentscope.rag import QdrantStore
+
+        store = QdrantStore(location=":memory:")
+    except ImportError:
+        return [{"name": "rag", "skipped": "qdrant-client is not installed"}]
+
+    documents = max(1, rounds // 10)
+    chunks_per_document = 20
+    queries = rounds
+    async with store:
+        knowledge = KnowledgeBase(
+            name="benchmark",
+            description="Benchmark documents.",
+            embedding_model=_FakeEmbedding(),
+            vector_store=store,
+            collection="benchmark",
+        )
+        start = time.perf_counter()
+        for i in range(documents):
+            await knowledge.insert_document(
+                [
+                    Chunk(
+                        content=TextBlock(text=f"Document {i} chunk {j}."),
+                        source=f"doc-{i}.txt",
+                        chunk_index=j,
+                        total_chunks=chunks_per_document,
+                    )
+                    for j in range(chunks_per_document)
+                ],
+            )
+        insert_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(queries):
+            await knowledge.search([f"Document {i % documents} chunk 3?"])
+        search_elapsed = time.perf_counter() - start
+
+    chunks = documents * chunks_per_document
+    return [
+        {
+            "name": "rag",
+            "phase": "insert",
+            "chunks": chunks,
+            "chunks_per_sec": _rate(chunks, insert_elapsed),
+        },
+        {
+            "name": "rag",
+            "phase": "search",
+            "indexed_chunks": chunks,
+            "queries": queries,
+            "queries_per_sec": _rate(queries, search_elapsed),
+        },
+    ]
+
+
+BENCHMARKS = [
+    "session_events",
+    "upsert_message",
+    "agent_loop",
+    "formatter",
+    "rag",
+]
+
+
+async def _run(name: str, rounds: int, workdir: str) -> list[dict]:
+    """Run one benchmark by name."""
+    if name == "session_events":
+        return await _session_events(rounds)
+    if name == "upsert_message":
+        return await _upsert_message(rounds, workdir)
+    if name == "agent_loop":
+        return await _agent_loop(rounds, workdir)
+    if name == "formatter":
+        return await _formatter(rounds)
+    return await _rag(rounds)
+
+
+def _describe(result: dict) -> str:
+    """A one-line human-readable result."""
+    return " ".join(
+        f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+        for key, value in result.items()
+    )
+
+
+async def main() -> None:
+    """Run the benchmarks and print the results."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n", maxsplit=1)[0],
+    )
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in args.only or BENCHMARKS:
+            results.extend(await _run(name, args.rounds, workdir))
+    if args.json:
+        print(json.dumps({"benchmark": "hot_paths", "results": results}))
+        return
+    for result in results:
+        print(_describe(result))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
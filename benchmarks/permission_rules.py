@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Latency of rule matching in the permission engine.
+
+Evaluates Bash and Write calls against contexts of growing rule counts,
+once with the builtin tools, whose rules the engine compiles, and once
+with subclasses overriding ``match_rule`` only, which the engine matches
+rule by rule.
+
+Usage::
+
+    python benchmarks/permission_rules.py [--rounds 200] [--json]
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from agentscope.permission import (
+    PermissionBehavior,
+    PermissionContext,
+    PermissionEngine,
+    PermissionRule,
+)
+from agentscope.tool import Bash, ToolBase, Write
+
+RULE_COUNTS = [10, 100, 500]
+
+
+class _RuleByRuleBash(Bash):
+    """Bash matched rule by rule."""
+
+    async def match_rule(
+        self,
+        rule_content: str | None,
+        tool_input: dict[str, Any],
+    ) -> bool:
+        """Delegate to the builtin matching."""
+        return await super().match_rule(rule_content, tool_input)
+
+
+class _RuleByRuleWrite(Write):
+    """Write matched rule by rule."""
+
+    async def match_rule(
+        self,
+        rule_content: str | None,
+        tool_input: dict[str, Any],
+    ) -> bool:
+        """Delegate to the builtin matching."""
+        return await super().match_rule(rule_content, tool_input)
+
+
+def _context(count: int) -> PermissionContext:
+    """A context with ``count`` deny and allow rules per tool."""
+    context = PermissionContext()
+    engine = PermissionEngine(context)
+    for i in range(count):
+        for tool_name, deny, allow in (
+            ("Bash", f"tool{i} --force:*", f"tool{i}:*"),
+            ("Write", f"/srv/app{i}/secrets/*", f"/srv/app{i}/**"),
+        ):
+            for content, behavior in (
+                (deny, PermissionBehavior.DENY),
+                (allow, PermissionBehavior.ALLOW),
+            ):
+                engine.add_rule(
+                    PermissionRule(
+                        tool_name=tool_name,
+                        rule_content=content,
+                        behavior=behavior,
+                        source="benchmark",
+                    ),
+                )
+    return context
+
+
+async def _measure(count: int, compiled: bool, rounds: int) -> dict:
+    """Time the permission checks of calls matching the last rules."""
+    engine = PermissionEngine(_context(count))
+    calls: list[tuple[ToolBase, dict]] = [
+        (
+            Bash() if compiled else _RuleByRuleBash(),
+            {"command": f"tool{count - 1} build"},
+        ),
+        (
+            Write() if compiled else _RuleByRuleWrite(),
+            {"file_path": f"/srv/app{count - 1}/main.py"},
+        ),
+    ]
+    samples = []
+    for _ in range(rounds):
+        for tool, tool_input in calls:
+            start = time.perf_counter()
+            decision = await engine.check_permission(tool, tool_input)
+            samples.append(time.perf_counter() - start)
+            assert decision.behavior == PermissionBehavior.ALLOW
+    samples.sort()
+    return {
+        "rules": count,
+        "compiled": compiled,
+        "mean_us": sum(samples) / len(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99)] * 1e6,
+    }
+
+
+async def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n", maxsplit=1)[0],
+    )
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = [
+        await _measure(count, compiled, args.rounds)
+        for count in RULE_COUNTS
+        for compiled in (False, True)
+    ]
+    if args.json:
+        print(
+            json.dumps({"benchmark": "permission_rules", "results": results}),
+        )
+        return
+    for result in results:
+        print(
+            f"rules={result['rules']:<4} "
+            f"compiled={str(result['compiled']):<5} "
+            f"mean={result['mean_us']:.0f}us "
+            f"p50={result['p50_us']:.0f}us p99={result['p99_us']:.0f}us",
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,6 +7,16 @@ from ._logging import (
     setup_logger,
 )
 from ._utils._common import set_id_factory, set_timestamp_factory
+from ._utils._http_pool import (
+    HTTPTransportPool,
+    get_http_pool,
+    set_http_pool,
+)
+from ._utils._metrics import (
+    MetricsRegistry,
+    get_metrics_registry,
+    set_metrics_registry,
+)
 from ._version import __version__
 
 # Raise each warning only once
@@ -18,5 +28,11 @@ __all__ = [
     "setup_logger",
     "set_id_factory",
     "set_timestamp_factory",
+    "HTTPTransportPool",
+    "get_http_pool",
+    "set_http_pool",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "set_metrics_registry",
     "__version__",
 ]
@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+"""The process-wide pool of HTTP transports shared by the provider clients
+of the chat, embedding and TTS models."""
+import asyncio
+import importlib
+import os
+import time
+import urllib.request
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+from .._logging import logger
+
+
+@dataclass(frozen=True)
+class _TransportKey:
+    """The settings that distinguish two shared transports."""
+
+    backend: str
+    """The httpx package of the SDK, i.e. ``"httpx"`` or ``"httpx2"``,
+    whose transports aren't interchangeable."""
+    provider: str
+    base_url: str
+    proxy: str | None
+    verify: bool
+
+
+@dataclass
+class _TransportEntry:
+    """A shared transport with its consumers and connection metrics."""
+
+    key: _TransportKey
+    transports: weakref.WeakKeyDictionary = field(
+        default_factory=weakref.WeakKeyDictionary,
+    )
+    """The transport of each event loop, as connections can't be shared
+    across loops."""
+    refs: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+
+class _PooledTransportMixin:
+    """The handle of one client on a shared transport, mixed into the
+    ``AsyncBaseTransport`` of the SDK's httpx package.
+
+    Requests are sent through the entry's transport of the running event
+    loop. Closing the handle, or garbage-collecting it, releases its
+    reference on the entry instead of closing the shared connections.
+    """
+
+    def __init__(
+        self,
+        pool: "HTTPTransportPool",
+        entry: _TransportEntry,
+    ) -> None:
+        """Acquire a reference on the entry."""
+        self._pool = pool
+        self._entry = entry
+        entry.refs += 1
+        self._release = weakref.finalize(self, pool.release, entry)
+
+    async def handle_async_request(self, request: Any) -> Any:
+        """Send the request over the shared connections."""
+        entry = self._entry
+        transport = self._pool.get_loop_transport(entry)
+        entry.requests += 1
+        entry.in_flight += 1
+        entry.max_in_flight = max(entry.max_in_flight, entry.in_flight)
+        try:
+            return await transport.handle_async_request(request)
+        except BaseException:
+            entry.errors += 1
+            raise
+        finally:
+            entry.in_flight -= 1
+            entry.last_used = time.monotonic()
+
+    async def aclose(self) -> None:
+        """Release the reference on the shared transport."""
+        self._release()
+
+
+_pooled_transport_classes: dict[str, type] = {}
+
+
+def _get_pooled_transport_class(backend: str) -> type:
+    """Get the pooled transport class of an httpx package."""
+    if backend not in _pooled_transport_classes:
+        module = importlib.import_module(backend)
+        _pooled_transport_classes[backend] = type(
+            "_PooledTransport",
+            (_PooledTransportMixin, module.AsyncBaseTransport),
+            {"__module__": __name__},
+        )
+    return _pooled_transport_classes[backend]
+
+
+class HTTPTransportPool:
+    """A registry of HTTP transports shared by the provider clients.
+
+    Every model used to build its provider SDK client with a fresh httpx
+    connection pool, so a model created per run paid new TCP and TLS
+    handshakes on its first request, and never reused a keep-alive or
+    HTTP/2 connection. The pool instead keeps one transport per provider,
+    base URL, proxy and TLS setting, and hands out reference-counted
+    handles on it that the SDK clients use as their ``transport``.
+
+    A transport whose handles were all released is closed once it stays
+    unused for ``idle_ttl`` seconds, while the idle connections of a
+    transport in use expire after ``keepalive_expiry`` seconds.
+
+    Example:
+        .. code-block:: python
+
+            from agentscope import HTTPTransportPool, set_http_pool
+
+            set_http_pool(HTTPTransportPool(max_connections=200, http2=True))
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = 1000,
+        max_keepalive_connections: int | None = 100,
+        keepalive_expiry: float | None = 60.0,
+        idle_ttl: float = 300.0,
+        http2: bool = False,
+    ) -> None:
+        """Initialize the HTTP transport pool.
+
+        Args:
+            max_connections (`int | None`, defaults to `1000`):
+                The maximum connections of each shared transport, or
+                ``None`` for no limit.
+            max_keepalive_connections (`int | None`, defaults to `100`):
+                The maximum idle connections kept alive by each shared
+                transport, or ``None`` for no limit.
+            keepalive_expiry (`float | None`, defaults to `60.0`):
+                The seconds an idle connection is kept alive.
+            idle_ttl (`float`, defaults to `300.0`):
+                The seconds an unreferenced transport is kept before it's
+                closed.
+            http2 (`bool`, defaults to `False`):
+                Whether to negotiate HTTP/2, which requires the ``h2``
+                package.
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.idle_ttl = idle_ttl
+        self.http2 = http2
+        self._entries: dict[_TransportKey, _TransportEntry] = {}
+
+    def get_transport(
+        self,
+        provider: str,
+        base_url: str | None,
+        proxy: str | None = None,
+        verify: bool = True,
+        backend: str = "httpx",
+    ) -> Any:
+        """Get a handle on the shared transport of the given settings.
+
+        As httpx ignores the proxy environment variables for a client with
+        a custom transport, the proxy of ``base_url``, or of the SDK's
+        default URL if it's ``None``, is resolved from the environment
+        here when ``proxy`` isn't given.
+
+        Args:
+            provider (`str`):
+                The provider name, e.g. ``"openai"``.
+            base_url (`str | None`):
+                The base URL of the API, or ``None`` for the provider's
+                default.
+            proxy (`str | None`, optional):
+                The proxy URL.
+            verify (`bool`, defaults to `True`):
+                Whether to verify the TLS certificates.
+            backend (`str`, defaults to `"httpx"`):
+                The httpx package used by the SDK, e.g. ``"httpx2"`` for
+                the recent OpenAI and Anthropic SDKs.
+
+        Returns:
+            `AsyncBaseTransport`:
+                The handle, to be passed as the ``transport`` of a client
+                of the ``backend`` package. Closing it releases the handle.
+        """
+        self.evict_idle()
+        if proxy is None:
+            proxy = _get_environment_proxy(
+                base_url or _get_default_base_url(provider),
+            )
+        key = _TransportKey(
+            backend=backend,
+            provider=provider,
+            base_url=base_url or "",
+            proxy=proxy,
+            verify=verify,
+        )
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _TransportEntry(key=key)
+        entry.last_used = time.monotonic()
+        return _get_pooled_transport_class(backend)(self, entry)
+
+    def get_loop_transport(self, entry: _TransportEntry) -> Any:
+        """Get or open the entry's transport in the running event loop."""
+        loop = asyncio.get_running_loop()
+        transport = entry.transports.get(loop)
+        if transport is None:
+            module = importlib.import_module(entry.key.backend)
+            transport = module.AsyncHTTPTransport(
+                verify=entry.key.verify,
+                http2=self.http2,
+                limits=module.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                proxy=entry.key.proxy,
+            )
+            entry.transports[loop] = transport
+        return transport
+
+    def release(self, entry: _TransportEntry) -> None:
+        """Release a reference on the entry."""
+        entry.refs = max(entry.refs - 1, 0)
+        entry.last_used = time.monotonic()
+
+    def evict_idle(self) -> None:
+        """Close the transports that have been unreferenced for longer
+        than the idle TTL."""
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if entry.refs > 0 or now - entry.last_used < self.idle_ttl:
+                continue
+            del self._entries[key]
+            _close_transports(entry)
+
+    @property
+    def stats(self) -> dict[str, dict[str, int]]:
+        """The connection metrics of each shared transport, keyed by
+        ``"<provider> <base_url>"``, followed by ``" via <proxy>"`` if
+        it's proxied.
+
+        - ``refs``: the clients holding the transport,
+        - ``requests`` and ``errors``: the requests sent and failed,
+        - ``in_flight`` and ``max_in_flight``: the concurrent requests,
+        - ``connections`` and ``idle_connections``: the open connections
+          over all event loops.
+        """
+        stats: dict[str, dict[str, int]] = {}
+        for key, entry in self._entries.items():
+            name = f"{key.provider} {key.base_url}".strip()
+            if key.proxy:
+                name += f" via {key.proxy}"
+            counters = stats.setdefault(
+                name,
+                dict.fromkeys(
+                    [
+                        "refs",
+                        "requests",
+                        "errors",
+                        "in_flight",
+                        "max_in_flight",
+                        "connections",
+                        "idle_connections",
+                    ],
+                    0,
+                ),
+            )
+            counters["refs"] += entry.refs
+            counters["requests"] += entry.requests
+            counters["errors"] += entry.errors
+            counters["in_flight"] += entry.in_flight
+            counters["max_in_flight"] += entry.max_in_flight
+            for transport in list(entry.transports.values()):
+                pool = getattr(transport, "_pool", None)
+                for connection in getattr(pool, "connections", []):
+                    counters["connections"] += 1
+                    counters["idle_connections"] += connection.is_idle()
+        return stats
+
+    async def aclose(self) -> None:
+        """Close the shared transports of the running event loop and clear
+        the pool. The handles still in use open new transports on their
+        next request."""
+        entries = list(self._entries.values())
+        self._entries.clear()
+        loop = asyncio.get_running_loop()
+        for entry in entries:
+            transport = entry.transports.pop(loop, None)
+            if transport is not None:
+                await transport.aclose()
+            entry.transports.clear()
+
+
+_DEFAULT_BASE_URLS: dict[str, tuple[str, str]] = {
+    "openai": ("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+    "anthropic": ("ANTHROPIC_BASE_URL", "https://api.anthropic.com"),
+    "ollama": ("OLLAMA_HOST", "http://localhost:11434"),
+}
+"""The environment variable overriding the base URL of each provider SDK,
+and the URL it defaults to, used when a client is built without one."""
+
+
+def _get_default_base_url(provider: str) -> str:
+    """Get the base URL that a provider SDK uses when none is given.
+
+    Returns:
+        `str`:
+            The URL, or ``"https://"`` for an unknown provider, whose
+            default is assumed to be an HTTPS URL.
+    """
+    env_var, default = _DEFAULT_BASE_URLS.get(provider, ("", "https://"))
+    url = (os.environ.get(env_var) if env_var else None) or default
+    return url if "://" in url else f"http://{url}"
+
+
+def _get_environment_proxy(base_url: str) -> str | None:
+    """Resolve the proxy of ``base_url`` from the environment variables.
+    A URL without a host only gets the proxy of its scheme."""
+    parsed = urlparse(base_url)
+    if parsed.hostname and urllib.request.proxy_bypass(parsed.hostname):
+        return None
+    proxies = urllib.request.getproxies()
+    if not parsed.hostname and proxies.get("no", "").strip() == "*":
+        return None
+    return proxies.get(parsed.scheme) or proxies.get("all")
+
+
+def _close_transports(entry: _TransportEntry) -> None:
+    """Close the entry's transports, in the background for the running
+    event loop. The transports of other loops are left to the garbage
+    collector, as they can't be closed from here."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    transport = entry.transports.pop(loop, None) if loop else None
+    entry.transports.clear()
+    if transport is not None:
+        task = loop.create_task(transport.aclose())
+        task.add_done_callback(_log_close_error)
+
+
+def _log_close_error(task: "asyncio.Task") -> None:
+    """Log the failure of closing an evicted transport."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(
+            "Failed to close an idle HTTP transport: %s",
+            task.exception(),
+        )
+
+
+def _get_backend(http_client_factory: Callable[..., Any]) -> str:
+    """Get the httpx package that an SDK's httpx client class belongs to."""
+    for cls in getattr(http_client_factory, "__mro__", ()):
+        package = cls.__module__.partition(".")[0]
+        if package.startswith("httpx"):
+            return package
+    return "httpx"
+
+
+_http_pool: HTTPTransportPool | None = HTTPTransportPool()
+
+
+def set_http_pool(pool: HTTPTransportPool | None) -> None:
+    """Replace the process-wide HTTP transport pool used by the provider
+    clients of the models created afterwards.
+
+    Args:
+        pool (`HTTPTransportPool | None`):
+            The new pool, or ``None`` to let each model open its own
+            connections.
+
+    Example:
+        >>> from agentscope import set_http_pool
+        >>> set_http_pool(None)
+    """
+    global _http_pool
+    _http_pool = pool
+
+
+def get_http_pool() -> HTTPTransportPool | None:
+    """Get the process-wide HTTP transport pool.
+
+    Returns:
+        `HTTPTransportPool | None`:
+            The pool, or ``None`` if pooling is disabled.
+    """
+    return _http_pool
+
+
+def _with_pooled_http_client(
+    client_kwargs: dict[str, Any],
+    provider: str,
+    base_url: str | None,
+    http_client_factory: Callable[..., Any],
+) -> dict[str, Any]:
+    """Add an ``http_client`` over the shared transport to the keyword
+    arguments of a provider SDK client.
+
+    Args:
+        client_kwargs (`dict[str, Any]`):
+            The keyword arguments of the SDK client. They're returned
+            unchanged if they carry their own ``http_client``, or if
+            pooling is disabled.
+        provider (`str`):
+            The provider name.
+        base_url (`str | None`):
+            The base URL of the API.
+        http_client_factory (`Callable[..., Any]`):
+            The SDK's default httpx client class, e.g.
+            ``openai.DefaultAsyncHttpxClient``, so that the SDK's timeout
+            and redirect defaults are kept.
+
+    Returns:
+        `dict[str, Any]`:
+            The keyword arguments to build the SDK client with.
+    """
+    if _http_pool is None or "http_client" in client_kwargs:
+        return client_kwargs
+    transport = _http_pool.get_transport(
+        provider,
+        base_url,
+        backend=_get_backend(http_client_factory),
+    )
+    return {
+        **client_kwargs,
+        "http_client": http_client_factory(transport=transport),
+    }
+
+
+def _with_pooled_transport(
+    client_kwargs: dict[str, Any],
+    provider: str,
+    base_url: str | None,
+) -> dict[str, Any]:
+    """Add a ``transport`` over the shared transport to the keyword
+    arguments forwarded to an ``httpx.AsyncClient``, for SDKs that build
+    their own httpx client (e.g. Ollama).
+
+    Args:
+        client_kwargs (`dict[str, Any]`):
+            The keyword arguments forwarded to ``httpx.AsyncClient``.
+            They're returned unchanged if they already configure the
+            transport, the proxy or TLS, or if pooling is disabled.
+        provider (`str`):
+            The provider name.
+        base_url (`str | None`):
+            The base URL of the API.
+
+    Returns:
+        `dict[str, Any]`:
+            The keyword arguments to build the SDK client with.
+    """
+    if _http_pool is None or client_kwargs.keys() & {
+        "transport",
+        "proxy",
+        "verify",
+        "cert",
+        "http2",
+        "limits",
+        "mounts",
+    }:
+        return client_kwargs
+    return {
+        **client_kwargs,
+        "transport": _http_pool.get_transport(provider, base_url),
+    }
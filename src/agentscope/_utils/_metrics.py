@@ -0,0 +1,568 @@
+# -*- coding: utf-8 -*-
+"""The process-wide registry of runtime metrics, exposed in the Prometheus
+text format.
+
+The chat models, the toolkit, the formatters and the app's message bus,
+storage and chat service record into the registry returned by
+:func:`get_metrics_registry`; setting it to ``None`` with
+:func:`set_metrics_registry` turns the recording off.
+"""
+import bisect
+import contextvars
+import functools
+import inspect
+import math
+import time
+from typing import Any, Callable, Sequence
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""The default upper bounds, in seconds, of the histogram buckets."""
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value as the exposition format expects."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set, ``{}`` excluded when it's empty."""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class _CounterChild:
+    """The value of a counter for one label set."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter.
+
+        Args:
+            amount (`float`, defaults to `1.0`):
+                The non-negative increment.
+        """
+        if amount < 0:
+            raise ValueError("A counter can only increase.")
+        self.value += amount
+
+
+class _GaugeChild:
+    """The value of a gauge for one label set."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        self.value -= amount
+
+
+class _HistogramChild:
+    """The buckets of a histogram for one label set."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # One count per bound, then the +Inf bucket, not cumulated
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record an observation.
+
+        Args:
+            value (`float`):
+                The observed value, e.g. a duration in seconds.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric:
+    """A named metric, holding one child per label set."""
+
+    type_name = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        """Initialize the metric.
+
+        Args:
+            name (`str`):
+                The metric name.
+            documentation (`str`):
+                The help text.
+            labelnames (`Sequence[str]`, defaults to `()`):
+                The names of the labels.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+
+    def _new_child(self) -> Any:
+        """Create the child of a new label set."""
+        raise NotImplementedError
+
+    def labels(self, *values: str) -> Any:
+        """Get the child of a label set, created on first use.
+
+        Args:
+            *values (`str`):
+                The label values, in the order of ``labelnames``.
+
+        Returns:
+            The child to record into.
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"Metric {self.name!r} expects labels "
+                    f"{self.labelnames}, got {values}.",
+                )
+            child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def clear(self) -> None:
+        """Drop every label set."""
+        self._children.clear()
+
+    def _samples(self) -> list[str]:
+        """The sample lines of the metric."""
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} "
+            f"{_format_value(child.value)}"
+            for values, child in list(self._children.items())
+        ]
+
+    def render(self) -> str:
+        """Render the metric in the Prometheus text format."""
+        doc = self.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        lines = [
+            f"# HELP {self.name} {doc}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, e.g. of calls or errors."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+
+class Gauge(_Metric):
+    """A value that goes up and down, e.g. a queue depth."""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+
+class Histogram(_Metric):
+    """A distribution of observations, e.g. of latencies, in cumulative
+    buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name (`str`):
+                The metric name.
+            documentation (`str`):
+                The help text.
+            labelnames (`Sequence[str]`, defaults to `()`):
+                The names of the labels.
+            buckets (`Sequence[float]`, defaults to `DEFAULT_BUCKETS`):
+                The upper bounds of the buckets; ``+Inf`` is implied.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(b for b in buckets if not math.isinf(b)))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for values, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(
+                self.buckets + (math.inf,),
+                child.counts,
+            ):
+                cumulative += count
+                labels = _format_labels(
+                    self.labelnames + ("le",),
+                    values + (_format_value(bound),),
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """A set of named metrics, rendered together in the Prometheus text
+    format.
+
+    The ``counter``, ``gauge`` and ``histogram`` methods return the
+    metric of a name, creating it on first use, so instrumented code can
+    look its metrics up at the call site.
+
+    Example:
+        >>> registry = MetricsRegistry()
+        >>> calls = registry.counter("calls_total", "Calls.", ["tool"])
+        >>> calls.labels("Bash").inc()
+        >>> print(registry.render())
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+
+    def _get_or_create(
+        self,
+        cls: type[_Metric],
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        **kwargs: Any,
+    ) -> Any:
+        """Get the metric of a name, checking its kind and labels."""
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics.setdefault(
+                name,
+                cls(name, documentation, labelnames, **kwargs),
+            )
+        if type(metric) is not cls or metric.labelnames != tuple(
+            labelnames,
+        ):
+            raise ValueError(
+                f"Metric {name!r} is already registered as a "
+                f"{metric.type_name} with labels {metric.labelnames}.",
+            )
+        return metric
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> Counter:
+        """Get or create a counter.
+
+        Args:
+            name (`str`):
+                The metric name.
+            documentation (`str`):
+                The help text.
+            labelnames (`Sequence[str]`, defaults to `()`):
+                The names of the labels.
+
+        Returns:
+            `Counter`:
+                The counter.
+
+        Raises:
+            `ValueError`:
+                If the name is registered with another kind or labels.
+        """
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> Gauge:
+        """Get or create a gauge.
+
+        Args:
+            name (`str`):
+                The metric name.
+            documentation (`str`):
+                The help text.
+            labelnames (`Sequence[str]`, defaults to `()`):
+                The names of the labels.
+
+        Returns:
+            `Gauge`:
+                The gauge.
+
+        Raises:
+            `ValueError`:
+                If the name is registered with another kind or labels.
+        """
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram.
+
+        Args:
+            name (`str`):
+                The metric name.
+            documentation (`str`):
+                The help text.
+            labelnames (`Sequence[str]`, defaults to `()`):
+                The names of the labels.
+            buckets (`Sequence[float]`, defaults to `DEFAULT_BUCKETS`):
+                The upper bounds of the buckets, used on creation only.
+
+        Returns:
+            `Histogram`:
+                The histogram.
+
+        Raises:
+            `ValueError`:
+                If the name is registered with another kind or labels.
+        """
+        return self._get_or_create(
+            Histogram,
+            name,
+            documentation,
+            labelnames,
+            buckets=buckets,
+        )
+
+    def get(self, name: str) -> _Metric | None:
+        """Get a registered metric by name.
+
+        Args:
+            name (`str`):
+                The metric name.
+
+        Returns:
+            `Counter | Gauge | Histogram | None`:
+                The metric, or ``None`` if no metric has the name.
+        """
+        return self._metrics.get(name)
+
+    def clear(self) -> None:
+        """Drop every metric."""
+        self._metrics.clear()
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format (version
+        ``0.0.4``), sorted by name.
+
+        Returns:
+            `str`:
+                The exposition text.
+        """
+        return "".join(
+            self._metrics[name].render() for name in sorted(self._metrics)
+        )
+
+
+_metrics_registry: MetricsRegistry | None = MetricsRegistry()
+
+
+def set_metrics_registry(registry: MetricsRegistry | None) -> None:
+    """Replace the process-wide metrics registry.
+
+    Args:
+        registry (`MetricsRegistry | None`):
+            The new registry, or ``None`` to stop recording metrics.
+
+    Example:
+        >>> from agentscope import set_metrics_registry
+        >>> set_metrics_registry(None)
+    """
+    global _metrics_registry
+    _metrics_registry = registry
+
+
+def get_metrics_registry() -> MetricsRegistry | None:
+    """Get the process-wide metrics registry.
+
+    Returns:
+        `MetricsRegistry | None`:
+            The registry, or ``None`` if metrics are disabled.
+    """
+    return _metrics_registry
+
+
+def _observe_seconds(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str],
+    label_values: Sequence[str],
+    seconds: float,
+) -> None:
+    """Record a duration into a histogram of the process-wide registry,
+    if metrics are enabled."""
+    registry = _metrics_registry
+    if registry is not None:
+        registry.histogram(name, documentation, labelnames).labels(
+            *label_values,
+        ).observe(seconds)
+
+
+# The object whose instrumented operation is running in this context, so
+# that the operations it calls on itself, e.g. through ``super()``, are
+# not recorded twice
+_instrumented_owner: contextvars.ContextVar[Any] = contextvars.ContextVar(
+    "_instrumented_owner",
+    default=None,
+)
+
+
+def _interface_operations(cls: type) -> frozenset[str]:
+    """The names of the public coroutine methods that an interface class
+    declares, to pass as the ``operations`` of
+    :func:`_instrument_operations` for its implementations.
+
+    Args:
+        cls (`type`):
+            The interface class.
+
+    Returns:
+        `frozenset[str]`:
+            The method names.
+    """
+    return frozenset(
+        attr
+        for attr, func in vars(cls).items()
+        if not attr.startswith("_") and inspect.iscoroutinefunction(func)
+    )
+
+
+def _instrument_operations(
+    cls: type,
+    name: str,
+    documentation: str,
+    operations: Sequence[str] | None = None,
+) -> None:
+    """Time the public coroutine methods that ``cls`` defines itself.
+
+    Each call records its duration into the histogram ``name``, labelled
+    by the ``backend`` class name and the ``operation``. A call made by
+    an instrumented method on the same object isn't recorded, so only
+    the outermost operation of a caller is.
+
+    Args:
+        cls (`type`):
+            The class to instrument, typically from ``__init_subclass__``.
+        name (`str`):
+            The histogram name.
+        documentation (`str`):
+            The histogram help text.
+        operations (`Sequence[str] | None`, optional):
+            The methods to time, if not all the public ones.
+    """
+    labelnames = ("backend", "operation")
+    for attr, func in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.iscoroutinefunction(func):
+            continue
+        if operations is not None and attr not in operations:
+            continue
+        if getattr(func, "__wrapped_operation__", False):
+            continue
+        setattr(
+            cls,
+            attr,
+            _timed_operation(func, attr, name, documentation, labelnames),
+        )
+
+
+def _timed_operation(
+    func: Callable,
+    operation: str,
+    name: str,
+    documentation: str,
+    labelnames: tuple[str, ...],
+) -> Callable:
+    """Wrap a coroutine method to record its duration."""
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if _metrics_registry is None or _instrumented_owner.get() is self:
+            return await func(self, *args, **kwargs)
+        token = _instrumented_owner.set(self)
+        start = time.perf_counter()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            _instrumented_owner.reset(token)
+            _observe_seconds(
+                name,
+                documentation,
+                labelnames,
+                (type(self).__name__, operation),
+                time.perf_counter() - start,
+            )
+
+    wrapper.__wrapped_operation__ = True  # type: ignore[attr-defined]
+    return wrapper
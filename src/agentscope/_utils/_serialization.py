@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""Pluggable payload serializers.
+
+The message bus, the JSON columns of the SQL storage and the SSE
+stream all encode plain payloads (dicts of JSON values) through a
+:class:`Serializer`:
+
+- :class:`JSONSerializer` is the default. It encodes with ``orjson``
+  when that package is installed, several times faster than the
+  standard library on both ends, and falls back to :mod:`json`.
+- :class:`MsgpackSerializer` is a binary alternative for the payloads
+  that never leave the bus: smaller entries and cheaper codecs.
+
+``bytes`` passed to :meth:`Serializer.dumps` are taken as already
+encoded in the serializer's format and returned unchanged, so a
+payload read encoded (e.g. with
+:meth:`~agentscope.app.message_bus.MessageBus.log_read_encoded`) is
+relayed without a decode and re-encode.
+"""
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class Serializer(ABC):
+    """Encodes payloads to bytes and back."""
+
+    binary: bool = False
+    """Whether the encoded form is arbitrary bytes rather than UTF-8
+    text, which text-only transports cannot carry."""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a payload.
+
+        Args:
+            obj (`Any`):
+                The payload, or ``bytes`` already encoded in this
+                format, which are returned unchanged.
+
+        Returns:
+            `bytes`:
+                The encoded payload.
+        """
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a payload.
+
+        Args:
+            data (`bytes | str`):
+                The encoded payload.
+
+        Returns:
+            `Any`:
+                The decoded payload.
+        """
+
+
+class JSONSerializer(Serializer):
+    """Compact UTF-8 JSON, encoded with ``orjson`` when installed.
+
+    Both encoders produce the same JSON values. Non-string dict keys
+    are stringified as :mod:`json` does. The rare values ``orjson``
+    rejects (integers beyond 64 bits) fall back to :mod:`json`.
+    """
+
+    def __init__(self, use_orjson: bool = True) -> None:
+        """Pick the encoder.
+
+        Args:
+            use_orjson (`bool`, defaults to `True`):
+                Use ``orjson`` when installed. `False` forces the
+                standard library.
+        """
+        self._orjson: Any = None
+        if use_orjson:
+            try:
+                import orjson
+
+                self._orjson = orjson
+            except ImportError:
+                pass
+
+    @property
+    def backend(self) -> str:
+        """The encoder in use, ``"orjson"`` or ``"json"``."""
+        return "json" if self._orjson is None else "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a payload as compact JSON.
+
+        Args:
+            obj (`Any`):
+                A JSON-serializable value, or already-encoded JSON
+                ``bytes``.
+
+        Returns:
+            `bytes`:
+                The UTF-8 JSON text.
+
+        Raises:
+            `TypeError`:
+                If the value is not JSON-serializable.
+        """
+        if isinstance(obj, bytes):
+            return obj
+        if self._orjson is not None:
+            try:
+                return self._orjson.dumps(
+                    obj,
+                    option=self._orjson.OPT_NON_STR_KEYS,
+                )
+            except TypeError:
+                pass
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON text.
+
+        Args:
+            data (`bytes | str`):
+                The JSON text.
+
+        Returns:
+            `Any`:
+                The decoded value.
+        """
+        if self._orjson is not None:
+            return self._orjson.loads(data)
+        return json.loads(data)
+
+
+class MsgpackSerializer(Serializer):
+    """Binary MessagePack, for payloads that stay inside the bus.
+
+    Requires the ``msgpack`` package. Tuples decode as lists, as they
+    do through JSON.
+    """
+
+    binary = True
+
+    def __init__(self) -> None:
+        """Import ``msgpack``.
+
+        Raises:
+            `ImportError`:
+                If ``msgpack`` is not installed.
+        """
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError(
+                "MsgpackSerializer requires the 'msgpack' package. "
+                "Install it with: pip install msgpack (or "
+                '`pip install "agentscope[serialization]"`).',
+            ) from e
+        self._msgpack = msgpack
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a payload as MessagePack.
+
+        Args:
+            obj (`Any`):
+                A payload of JSON-compatible values, or already-encoded
+                MessagePack ``bytes``.
+
+        Returns:
+            `bytes`:
+                The encoded payload.
+        """
+        if isinstance(obj, bytes):
+            return obj
+        return self._msgpack.packb(obj, use_bin_type=True)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode MessagePack.
+
+        Args:
+            data (`bytes | str`):
+                The encoded payload; ``str`` is not a valid encoding
+                and is rejected by the decoder.
+
+        Returns:
+            `Any`:
+                The decoded payload.
+        """
+        return self._msgpack.unpackb(data, raw=False)
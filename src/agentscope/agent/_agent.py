@@ -216,6 +216,18 @@ class Agent:
         # reply loop only exits after the event is delivered (not swallowed)
         self._receive_reply_end: bool = False
 
+    def load_state(self, state: AgentState) -> None:
+        """Replace the agent state, e.g. to run an already assembled agent
+        on the state of a session's next turn.
+
+        Args:
+            state (`AgentState`):
+                The new agent state.
+        """
+        self.state = state
+        self._engine = PermissionEngine(self.state.permission_context)
+        self._receive_reply_end = False
+
     def _validate_configs(self) -> None:
         """Validate the config combinations that a single config class cannot
         check by itself.
@@ -18,6 +18,7 @@ from ._router import (
     hub_router,
     knowledge_base_router,
     embedding_model_router,
+    metrics_router,
     mcp_router,
     model_router,
     tts_model_router,
@@ -32,6 +33,7 @@ from .message_bus import MessageBus
 from .storage import StorageBase
 from ..agent import Agent
 from ..credential import CredentialFactory, CredentialBase
+from ..model import RateLimiterBase
 from ..rag import ApproxTokenChunker, ChunkerBase, ParserBase, TextParser
 
 from .._logging import logger
@@ -97,6 +99,9 @@ def create_app(
     resource_access_policy: ResourceAccessPolicyBase | None = None,
     channels: list[Type[ChannelBase]] | None = None,
     download_secret: str | None = None,
+    model_rate_limiter: RateLimiterBase | None = None,
+    agent_cache_size: int = 0,
+    agent_cache_ttl: float = 600.0,
     title: str = "AgentScope",
     version: str = __version__,
     **kwargs: Any,
@@ -265,6 +270,23 @@ def create_app(
             be set explicitly behind a load balancer** — otherwise a
             token minted by one replica is rejected by the next, and
             downloads fail at random.
+        model_rate_limiter (`RateLimiterBase | None`, optional):
+            Admits every chat model call against the requests- and
+            tokens-per-minute budgets of its credential and model, with
+            interactive sessions ahead of scheduled ones. Pass a
+            :class:`~agentscope.app.message_bus.MessageBusRateLimiter`
+            built on the app's ``message_bus`` to share the budgets
+            across replicas. ``None`` (default) leaves calls unlimited.
+        agent_cache_size (`int`, defaults to `0`):
+            The number of sessions whose assembled agent (toolkit,
+            models, middlewares) each process keeps for their next run.
+            Changes to agents, session configs, credentials, MCPs and
+            skills invalidate the cached agents on every replica. With
+            the cache on, ``extra_agent_middlewares`` and
+            ``extra_agent_tools`` run once per assembly rather than once
+            per turn. ``0`` (default) assembles the agent on every run.
+        agent_cache_ttl (`float`, defaults to `600.0`):
+            The seconds after which an unused cached agent expires.
         title (`str`, defaults to ``"AgentScope"``):
             OpenAPI title shown in the docs UI.
         version (`str`, defaults to the package version):
@@ -302,6 +324,9 @@ def create_app(
     app.state.mcp_hubs = _index_hubs(mcp_hubs, "MCP")
     app.state.skill_hubs = _index_hubs(skill_hubs, "skill")
     app.state.download_secret = download_secret or secrets.token_urlsafe(32)
+    app.state.model_rate_limiter = model_rate_limiter
+    app.state.agent_cache_size = agent_cache_size
+    app.state.agent_cache_ttl = agent_cache_ttl
 
     # Parser / chunker / blob-store defaults only make sense when the
     # KB feature is actually enabled.  When ``knowledge_base_manager`` is
@@ -383,6 +408,7 @@ def create_app(
         hub_router,
         knowledge_base_router,
         mcp_router,
+        metrics_router,
         schedule_router,
         session_router,
         skill_router,
@@ -14,13 +14,18 @@ other's internals.
      - Append an event to the session replay log and fan it out live.
    * - :func:`enqueue_run_trigger`
      - Enqueue a typed run trigger and signal dispatchers.
+   * - :func:`signal_inbox`
+     - Announce that session inboxes received entries.
    * - :func:`enqueue_index_task`
      - Enqueue a knowledge-document indexing task and signal consumers.
+   * - :func:`publish_assembly_invalidation`
+     - Drop cached agent assemblies on every node.
 """
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal
 
+from .message_bus._base import LockedQueuePush
 from .message_bus._keys import MessageBusKeys
 
 if TYPE_CHECKING:
@@ -136,6 +141,31 @@ async def enqueue_run_trigger(
     await bus.publish(MessageBusKeys.wakeup_signal(), {})
 
 
+# ── signal_inbox ───────────────────────────────────────────────────────
+
+
+async def signal_inbox(bus: "MessageBus", session_ids: list[str]) -> None:
+    """Announce that the inboxes of ``session_ids`` received entries.
+
+    Call after the entries are pushed. A run only drains its inbox on
+    the reasoning steps that follow such a signal (see
+    :class:`~agentscope.app._manager.InboxWatcher`), so a producer that
+    pushes without signalling delays its entries until the run's next
+    reply or its end-of-run check.
+
+    Args:
+        bus (`MessageBus`):
+            The application message bus.
+        session_ids (`list[str]`):
+            The sessions whose inboxes were pushed to.
+    """
+    if session_ids:
+        await bus.publish(
+            MessageBusKeys.inbox_signal_channel(),
+            {"session_ids": session_ids},
+        )
+
+
 # ── session inbox hand-off ─────────────────────────────────────────────
 #
 # Three helpers implementing one protocol, whose only job is to make
@@ -194,6 +224,7 @@ async def deliver_to_inbox(
             MessageBusKeys.INBOX_CONSUMER_FIELD,
         )
 
+    await signal_inbox(bus, [session_id])
     if consumer is None:
         await enqueue_run_trigger(
             bus,
@@ -203,6 +234,66 @@ async def deliver_to_inbox(
         )
 
 
+async def deliver_to_inboxes(
+    bus: "MessageBus",
+    *,
+    user_id: str,
+    recipients: list[tuple[str, str]],
+    payload: dict,
+) -> None:
+    """Deliver one payload to several session inboxes at once.
+
+    Equivalent to calling :func:`deliver_to_inbox` per recipient, with
+    the same lock protocol per inbox, but the pushes and consumer checks
+    go through one :meth:`MessageBus.queue_push_locked` batch and the
+    wake-ups of the idle recipients through one
+    :meth:`MessageBus.queue_push_many` and a single signal.
+
+    Args:
+        bus (`MessageBus`):
+            The application message bus.
+        user_id (`str`):
+            The owning user id, carried by the wake-up triggers.
+        recipients (`list[tuple[str, str]]`):
+            ``(session_id, agent_id)`` pairs of the receiving sessions.
+        payload (`dict`):
+            JSON-serialisable payload, normally a serialised
+            :class:`~agentscope.message.HintBlock`.
+    """
+    if not recipients:
+        return
+
+    consumers = await bus.queue_push_locked(
+        [
+            LockedQueuePush(
+                queue_key=MessageBusKeys.inbox(session_id),
+                payload=payload,
+                lock_key=MessageBusKeys.inbox_lock(session_id),
+                registry_namespace=MessageBusKeys.inbox_consumer(session_id),
+                registry_field=MessageBusKeys.INBOX_CONSUMER_FIELD,
+            )
+            for session_id, _agent_id in recipients
+        ],
+        lock_ttl_secs=MessageBusKeys.INBOX_LOCK_TTL_SECS,
+    )
+    await signal_inbox(bus, [session_id for session_id, _ in recipients])
+
+    triggers = [
+        {
+            "user_id": user_id,
+            "session_id": session_id,
+            "agent_id": agent_id,
+            "kind": MessageBusKeys.WAKEUP_KIND_WAKE,
+            "input": None,
+        }
+        for (session_id, agent_id), consumer in zip(recipients, consumers)
+        if consumer is None
+    ]
+    if triggers:
+        await bus.queue_push_many(MessageBusKeys.wakeup_queue(), triggers)
+        await bus.publish(MessageBusKeys.wakeup_signal(), {})
+
+
 async def register_inbox_consumer(bus: "MessageBus", session_id: str) -> None:
     """Mark this run as the consumer of ``session_id``'s inbox.
 
@@ -278,7 +369,10 @@ async def has_pending_inbox_or_release(
 
         for payload in payloads:
             await bus.queue_push(inbox, payload)
-        return True
+
+    # The run goes around once more; make its next step drain
+    await signal_inbox(bus, [session_id])
+    return True
 
 
 async def abandon_inbox_consumer(
@@ -363,3 +457,41 @@ async def enqueue_index_task(
         },
     )
     await bus.publish(MessageBusKeys.index_tasks_signal(), {})
+
+
+# ── publish_assembly_invalidation ──────────────────────────────────────
+
+
+async def publish_assembly_invalidation(
+    bus: "MessageBus",
+    *,
+    user_id: str | None = None,
+    agent_id: str | None = None,
+    session_id: str | None = None,
+) -> None:
+    """Drop the cached agent assemblies a change affects, on every node.
+
+    Called after a change to a resource that assembled agents are built
+    from but whose version the
+    :class:`~agentscope.app._manager.AssemblyCache` cannot check itself —
+    credentials, MCPs, skills — or that ends a session or agent. Each
+    given id narrows the invalidation; none drops every assembly.
+
+    Args:
+        bus (`MessageBus`):
+            The application message bus.
+        user_id (`str | None`, optional):
+            Drop the assemblies of this user's sessions.
+        agent_id (`str | None`, optional):
+            Drop the assemblies of this agent's sessions.
+        session_id (`str | None`, optional):
+            Drop the assembly of this session.
+    """
+    await bus.publish(
+        MessageBusKeys.assembly_invalidate_channel(),
+        {
+            "user_id": user_id,
+            "agent_id": agent_id,
+            "session_id": session_id,
+        },
+    )
@@ -6,9 +6,11 @@ from contextlib import AsyncExitStack, asynccontextmanager
 from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from ._manager import (
+    AssemblyCache,
     BackgroundTaskManager,
     CancelDispatcher,
     ChatRunRegistry,
+    InboxWatcher,
     SchedulerManager,
     WakeupDispatcher,
 )
@@ -53,8 +55,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     resource_access_policy = app.state.resource_access_policy
 
     async with AsyncExitStack() as stack:
-        await stack.enter_async_context(storage)
+        # The bus first: a ``CachedStorage`` subscribes to it on entry.
         await stack.enter_async_context(message_bus)
+        await stack.enter_async_context(storage)
         await stack.enter_async_context(workspace_manager)
         if knowledge_base_manager is not None:
             # ``KnowledgeBaseManagerBase.__aenter__`` enters the bound
@@ -151,6 +154,25 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         app.state.channel_clients = channel_clients
         app.state.channel_dispatcher = channel_dispatcher
 
+        # Opt-in: reusing a session's assembled agent skips re-building
+        # its toolkit, models and middlewares on every turn.
+        assembly_cache = None
+        if app.state.agent_cache_size > 0:
+            assembly_cache = await stack.enter_async_context(
+                AssemblyCache(
+                    message_bus=message_bus,
+                    max_size=app.state.agent_cache_size,
+                    idle_ttl=app.state.agent_cache_ttl,
+                ),
+            )
+        app.state.assembly_cache = assembly_cache
+
+        # Runs drain their inbox only on the reasoning steps after a
+        # delivery signal, instead of on every step.
+        inbox_watcher = await stack.enter_async_context(
+            InboxWatcher(message_bus=message_bus),
+        )
+
         chat_service = ChatService(
             storage=storage,
             workspace_manager=workspace_manager,
@@ -164,6 +186,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             custom_subagent_templates=app.state.custom_subagent_templates,
             custom_agent_cls=app.state.custom_agent_cls,
             channel_clients=channel_clients,
+            model_rate_limiter=app.state.model_rate_limiter,
+            assembly_cache=assembly_cache,
+            inbox_watcher=inbox_watcher,
         )
         app.state.chat_service = chat_service
 
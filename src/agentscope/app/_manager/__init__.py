@@ -5,13 +5,17 @@ application-wide resources."""
 from ._scheduler import SchedulerManager
 from ._wakeup_dispatcher import WakeupDispatcher
 from ._cancel_dispatcher import CancelDispatcher
+from ._inbox_watcher import InboxWatcher
 from ._chat_run_registry import ChatRunRegistry
 from ._background_task_manager import BackgroundTaskManager
+from ._assembly_cache import AssemblyCache
 
 __all__ = [
+    "AssemblyCache",
     "BackgroundTaskManager",
     "CancelDispatcher",
     "ChatRunRegistry",
+    "InboxWatcher",
     "SchedulerManager",
     "WakeupDispatcher",
 ]
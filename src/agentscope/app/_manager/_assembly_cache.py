@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""Per-process cache of the agents assembled for chat runs.
+
+Assembling a run's agent resolves credentials, builds the chat models,
+lists the workspace's skills and MCPs into a toolkit and constructs the
+middlewares — work that yields the same agent on every turn of a session
+until one of its inputs changes. The cache keeps the assembled agent of
+recent sessions, so the next run of a session only swaps in the
+session's current state.
+
+An entry is reused only while it is still valid:
+
+1. **Fingerprint** — the caller versions the records the agent is built
+   from (e.g. the agent record's ``updated_at`` and the session config);
+   a run whose fingerprint differs re-assembles.
+2. **Invalidation** — changes the records don't version (credentials,
+   MCPs, skills) and deletions are broadcast on the bus with
+   :func:`~agentscope.app._bus_ops.publish_assembly_invalidation`, and
+   every node drops the affected entries.
+3. **Bounds** — at most ``max_size`` entries are kept, least recently
+   used first out, and entries idle for ``idle_ttl`` seconds expire.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self
+
+from ..._logging import logger
+from ..message_bus import MessageBusKeys
+
+if TYPE_CHECKING:
+    from ..message_bus import MessageBus
+    from ...agent import Agent
+
+
+@dataclass
+class _AssemblyEntry:
+    """A cached agent assembly."""
+
+    fingerprint: tuple
+    user_id: str
+    agent_id: str
+    agent: "Agent"
+    last_used: float
+
+
+class AssemblyCache:
+    """Keeps the agents assembled for recent sessions, bounded by an LRU
+    and an idle TTL, and drops them on bus invalidations.
+
+    Runs of one session are serialised by the session lock, so a cached
+    agent is never used by two runs at once.
+
+    Args:
+        message_bus (`MessageBus`):
+            Application message bus, carrying the invalidations.
+        max_size (`int`, defaults to `256`):
+            The maximum number of cached assemblies.
+        idle_ttl (`float`, defaults to `600.0`):
+            The seconds after which an unused assembly expires.
+    """
+
+    def __init__(
+        self,
+        message_bus: "MessageBus",
+        max_size: int = 256,
+        idle_ttl: float = 600.0,
+    ) -> None:
+        """Bind dependencies.
+
+        Args:
+            message_bus (`MessageBus`):
+                Application message bus.
+            max_size (`int`, defaults to `256`):
+                The maximum number of cached assemblies.
+            idle_ttl (`float`, defaults to `600.0`):
+                The seconds after which an unused assembly expires.
+        """
+        self._bus = message_bus
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self._entries: OrderedDict[str, _AssemblyEntry] = OrderedDict()
+        self._task: asyncio.Task | None = None
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    async def __aenter__(self) -> Self:
+        """Start the invalidation loop and wait until its bus
+        subscription is live.
+
+        Returns:
+            `Self`: This cache instance.
+        """
+        ready = asyncio.Event()
+        self._task = asyncio.create_task(
+            self._invalidation_loop(ready),
+            name="assembly-cache:invalidate",
+        )
+        await ready.wait()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        """Stop the invalidation loop and drop every entry."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._entries.clear()
+
+    def get(self, session_id: str, fingerprint: tuple) -> "Agent | None":
+        """Get the cached agent of a session.
+
+        Args:
+            session_id (`str`):
+                The session to run.
+            fingerprint (`tuple`):
+                The current version of the inputs of the session's
+                assembly.
+
+        Returns:
+            `Agent | None`: The cached agent, or ``None`` if the session
+            has no valid assembly.
+        """
+        now = time.monotonic()
+        self._evict_expired(now)
+        entry = self._entries.get(session_id)
+        if entry is None or entry.fingerprint != fingerprint:
+            self._misses += 1
+            return None
+        entry.last_used = now
+        self._entries.move_to_end(session_id)
+        self._hits += 1
+        return entry.agent
+
+    def put(
+        self,
+        session_id: str,
+        fingerprint: tuple,
+        agent: "Agent",
+        *,
+        user_id: str,
+        agent_id: str,
+    ) -> None:
+        """Cache the agent assembled for a session.
+
+        Args:
+            session_id (`str`):
+                The session the agent was assembled for.
+            fingerprint (`tuple`):
+                The version of the inputs of the assembly.
+            agent (`Agent`):
+                The assembled agent.
+            user_id (`str`):
+                The user running the session.
+            agent_id (`str`):
+                The agent of the session.
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[session_id] = _AssemblyEntry(
+            fingerprint=fingerprint,
+            user_id=user_id,
+            agent_id=agent_id,
+            agent=agent,
+            last_used=time.monotonic(),
+        )
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(
+        self,
+        *,
+        user_id: str | None = None,
+        agent_id: str | None = None,
+        session_id: str | None = None,
+    ) -> int:
+        """Drop the cached assemblies matching every given id, or all of
+        them if none is given.
+
+        Args:
+            user_id (`str | None`, optional):
+                Drop the assemblies of this user's sessions.
+            agent_id (`str | None`, optional):
+                Drop the assemblies of this agent's sessions.
+            session_id (`str | None`, optional):
+                Drop the assembly of this session.
+
+        Returns:
+            `int`: The number of dropped assemblies.
+        """
+        stale = [
+            sid
+            for sid, entry in self._entries.items()
+            if (session_id is None or sid == session_id)
+            and (user_id is None or entry.user_id == user_id)
+            and (agent_id is None or entry.agent_id == agent_id)
+        ]
+        for sid in stale:
+            del self._entries[sid]
+        self._invalidations += len(stale)
+        return len(stale)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The cache size and its hit, miss, invalidation and eviction
+        counters."""
+        return {
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+            "evictions": self._evictions,
+        }
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop the entries idle for longer than the TTL.
+
+        Args:
+            now (`float`):
+                The current monotonic time.
+        """
+        while self._entries:
+            sid, entry = next(iter(self._entries.items()))
+            if now - entry.last_used < self.idle_ttl:
+                break
+            del self._entries[sid]
+            self._evictions += 1
+
+    async def _invalidation_loop(self, ready: asyncio.Event) -> None:
+        """Subscribe to the invalidation channel and drop the matching
+        entries on each signal.
+
+        Args:
+            ready (`asyncio.Event`):
+                Signalled after the underlying SUBSCRIBE completes.
+        """
+        try:
+            async for payload in self._bus.subscribe(
+                MessageBusKeys.assembly_invalidate_channel(),
+                on_ready=ready.set,
+            ):
+                self.invalidate(
+                    user_id=payload.get("user_id"),
+                    agent_id=payload.get("agent_id"),
+                    session_id=payload.get("session_id"),
+                )
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("AssemblyCache invalidation loop crashed.")
+        finally:
+            # Unblock ``__aenter__`` even if subscribe failed before
+            # ``on_ready`` ran, so startup cannot deadlock.
+            ready.set()
@@ -105,6 +105,15 @@ class ChatRunRegistry:
         """
         return self._tasks.get(session_id)
 
+    def session_ids(self) -> list[str]:
+        """Return the sessions with an unfinished task in this process.
+
+        Returns:
+            `list[str]`:
+                The session ids.
+        """
+        return [sid for sid, task in self._tasks.items() if not task.done()]
+
     async def __aenter__(self) -> Self:
         """No-op enter; the registry has no startup work.
 
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""Per-process tracker of the session inboxes that received entries.
+
+Producers announce every inbox push on
+:meth:`MessageBusKeys.inbox_signal_channel` (see
+:func:`~agentscope.app._bus_ops.signal_inbox`). The watcher subscribes
+once per process and remembers the signalled sessions, so that
+:class:`~agentscope.app.middleware.InboxMiddleware` only drains an inbox
+on the reasoning steps that follow a signal instead of paying a bus
+round trip on every step.
+
+The signal is a hint, never the only path to an entry: the middleware
+still drains on the first step of every reply, the end-of-run check
+(:func:`~agentscope.app._bus_ops.has_pending_inbox_or_release`) still
+reads the inbox before a run finishes, and a watcher whose subscription
+died reports every session as signalled.
+"""
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Self
+
+from ..._logging import logger
+from ..message_bus import MessageBusKeys
+
+if TYPE_CHECKING:
+    from ..message_bus import MessageBus
+
+
+class InboxWatcher:
+    """Subscribes to the inbox signal channel and records which
+    sessions have entries waiting.
+
+    Signals name sessions running on any node, so the record is bounded
+    to the ``max_sessions`` most recently signalled ones; a session
+    evicted before its run looked is drained at the latest by the
+    run's next reply or its end-of-run check.
+
+    Args:
+        message_bus (`MessageBus`):
+            Application message bus.
+        max_sessions (`int`, defaults to `10000`):
+            The maximum number of signalled sessions remembered.
+    """
+
+    def __init__(
+        self,
+        message_bus: "MessageBus",
+        max_sessions: int = 10000,
+    ) -> None:
+        """Bind dependencies.
+
+        Args:
+            message_bus (`MessageBus`):
+                Application message bus.
+            max_sessions (`int`, defaults to `10000`):
+                The maximum number of signalled sessions remembered.
+        """
+        self._bus = message_bus
+        self.max_sessions = max_sessions
+        self._signalled: OrderedDict[str, None] = OrderedDict()
+        self._task: asyncio.Task | None = None
+        self._signals = 0
+        self._drains = 0
+        self._skips = 0
+        self._evictions = 0
+
+    async def __aenter__(self) -> Self:
+        """Start the watch loop and wait until its bus subscription is
+        live.
+
+        Returns:
+            `Self`: This watcher instance.
+        """
+        ready = asyncio.Event()
+        self._task = asyncio.create_task(
+            self._watch_loop(ready),
+            name="inbox-watcher",
+        )
+        await ready.wait()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        """Stop the watch loop and forget every signal."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._signalled.clear()
+
+    @property
+    def live(self) -> bool:
+        """Whether the watch loop is running, so that a session absent
+        from the record really received no signal."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The signals received, the drains and skips reported, and the
+        signalled sessions evicted unread."""
+        return {
+            "signals": self._signals,
+            "drains": self._drains,
+            "skips": self._skips,
+            "evictions": self._evictions,
+            "size": len(self._signalled),
+        }
+
+    def mark(self, session_id: str) -> None:
+        """Record that a session's inbox has entries waiting.
+
+        Args:
+            session_id (`str`):
+                The signalled session.
+        """
+        self._signalled[session_id] = None
+        self._signalled.move_to_end(session_id)
+        while len(self._signalled) > self.max_sessions:
+            self._signalled.popitem(last=False)
+            self._evictions += 1
+
+    def should_drain(self, session_id: str) -> bool:
+        """Report whether a session's inbox may hold entries, consuming
+        its signal.
+
+        The signal is consumed before the caller drains, so one that
+        arrives during the drain is kept for the next step.
+
+        Args:
+            session_id (`str`):
+                The session about to reason.
+
+        Returns:
+            `bool`:
+                ``True`` when the session was signalled since it was
+                last asked about, or when the watcher is not live.
+        """
+        signalled = session_id in self._signalled
+        if signalled:
+            del self._signalled[session_id]
+        if signalled or not self.live:
+            self._drains += 1
+            return True
+        self._skips += 1
+        return False
+
+    async def _watch_loop(self, ready: asyncio.Event) -> None:
+        """Subscribe to the inbox signal channel and record the sessions
+        of each signal.
+
+        Args:
+            ready (`asyncio.Event`):
+                Signalled after the underlying SUBSCRIBE completes.
+        """
+        try:
+            async for payload in self._bus.subscribe(
+                MessageBusKeys.inbox_signal_channel(),
+                on_ready=ready.set,
+            ):
+                self._signals += 1
+                for session_id in payload.get("session_ids") or []:
+                    if isinstance(session_id, str):
+                        self.mark(session_id)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("InboxWatcher watch loop crashed.")
+        finally:
+            # Unblock ``__aenter__`` even if subscribe failed before
+            # ``on_ready`` ran, so startup cannot deadlock.
+            ready.set()
@@ -2,12 +2,22 @@
 """Single per-process dispatcher for all cross-session run triggers.
 
 One asyncio task per process. Subscribes to the shared trigger signal
-channel and drains the durable trigger queue on each signal. It is the
+channel and claims the durable trigger queue on each signal. It is the
 **sole** site that spawns :meth:`ChatService.run` into the shared
 :class:`ChatRunRegistry`, which is what makes concurrent-spawn races
 (two writers contending for one session's run slot → a spurious "already
-has an active chat run" 409) structurally impossible: every run trigger
-funnels through this one serial consumer.
+has an active chat run" 409) structurally impossible: the triggers of
+one session are dispatched one after another, in queue order, while
+different sessions are dispatched concurrently (up to
+``max_concurrency`` at a time).
+
+The dispatchers of every replica claim the queue as one consumer group
+(:meth:`MessageBus.queue_claim`), so each trigger goes to one replica.
+A trigger is acked only once it has been dispatched, re-queued or
+deliberately dropped; one claimed by a replica that died before acking
+is claimed again by another after ``reclaim_idle_secs``. Delivery is
+therefore at-least-once: a trigger delivered twice finds its session
+locked or already registered and is re-queued, never double-started.
 
 Each queue entry carries a ``kind`` that selects how a busy session is
 handled:
@@ -28,6 +38,9 @@ All bus keys live on the :class:`MessageBus` base class (see
 no hard-coded key strings.
 """
 import asyncio
+import os
+import socket
+import uuid
 from typing import TYPE_CHECKING, Self
 
 from pydantic import TypeAdapter
@@ -61,9 +74,12 @@ _RESUME_INPUT_ADAPTER: TypeAdapter = TypeAdapter(
 # to avoid a hot re-enqueue loop while the lock is held.
 _RESUME_RETRY_BACKOFF_SECS = 0.1
 
+# Default number of triggers claimed from the queue per round trip.
+_CLAIM_BATCH_SIZE = 64
+
 
 class WakeupDispatcher:
-    """One asyncio task per process, draining the shared trigger queue.
+    """One asyncio task per process, claiming the shared trigger queue.
 
     Args:
         message_bus (`MessageBus`):
@@ -79,14 +95,30 @@ class WakeupDispatcher:
         chat_run_registry (`ChatRunRegistry`):
             Per-process registry that holds the spawned task handle so
             it can be located by :class:`CancelDispatcher`.
+        max_concurrency (`int`, defaults to ``16``):
+            Maximum number of sessions dispatched at once.
+        batch_size (`int`, defaults to ``64``):
+            Triggers claimed from the queue per round trip.
+        reclaim_idle_secs (`float`, defaults to ``30.0``):
+            How long a trigger stays claimed but unacked before another
+            dispatcher claims it again; also the period at which the
+            queue is claimed without a signal.
+        consumer_name (`str | None`, optional):
+            This dispatcher's name in the consumer group. Defaults to
+            one unique to the host, process and instance.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         message_bus: "MessageBus",
         storage: "StorageBase",
         chat_service: "ChatService",
         chat_run_registry: "ChatRunRegistry",
+        *,
+        max_concurrency: int = 16,
+        batch_size: int = _CLAIM_BATCH_SIZE,
+        reclaim_idle_secs: float = 30.0,
+        consumer_name: str | None = None,
     ) -> None:
         """Bind dependencies.
 
@@ -99,12 +131,31 @@ class WakeupDispatcher:
                 Drives session runs via :meth:`ChatService.run`.
             chat_run_registry (`ChatRunRegistry`):
                 Shared chat-run registry to spawn into.
+            max_concurrency (`int`, defaults to ``16``):
+                Maximum number of sessions dispatched at once.
+            batch_size (`int`, defaults to ``64``):
+                Triggers claimed from the queue per round trip.
+            reclaim_idle_secs (`float`, defaults to ``30.0``):
+                Idle time after which an unacked trigger is claimed
+                again, and the period of the signal-less claim.
+            consumer_name (`str | None`, optional):
+                Name in the consumer group; unique by default.
         """
         self._bus = message_bus
         self._storage = storage
         self._chat_service = chat_service
         self._registry = chat_run_registry
+        self._batch_size = batch_size
+        self._reclaim_idle_secs = reclaim_idle_secs
+        self._consumer = consumer_name or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Serializes claim rounds: the signal loop and the periodic
+        # reclaim never dispatch two batches of one session at once.
+        self._drain_lock = asyncio.Lock()
         self._task: asyncio.Task | None = None
+        self._reclaim_task: asyncio.Task | None = None
         # Detached backoff timers for deferred ``resume`` re-enqueues.
         # Held so they are not garbage-collected mid-sleep and can be
         # cancelled on shutdown.
@@ -128,10 +179,25 @@ class WakeupDispatcher:
         )
         await ready.wait()
         await self._drain_and_dispatch()
+        self._reclaim_task = asyncio.create_task(
+            self._reclaim_loop(),
+            name="wakeup-reclaim",
+        )
         return self
 
     async def __aexit__(self, *exc: object) -> None:
-        """Cancel the dispatcher loop and any pending retries."""
+        """Cancel the dispatcher loop and any pending retries.
+
+        Triggers whose retry is cancelled stay unacked and are claimed
+        again by a live dispatcher.
+        """
+        if self._reclaim_task is not None:
+            self._reclaim_task.cancel()
+            try:
+                await self._reclaim_task
+            except asyncio.CancelledError:
+                pass
+            self._reclaim_task = None
         retries = list(self._retry_tasks)
         for retry in retries:
             retry.cancel()
@@ -175,38 +241,121 @@ class WakeupDispatcher:
                 "WakeupDispatcher loop crashed; subscription ended.",
             )
 
+    async def _reclaim_loop(self) -> None:
+        """Claim the queue every ``reclaim_idle_secs`` without waiting
+        for a signal, picking up the triggers left unacked by a
+        dispatcher that died and those whose signal was missed."""
+        while True:
+            await asyncio.sleep(self._reclaim_idle_secs)
+            await self._drain_and_dispatch()
+
     async def _drain_and_dispatch(self) -> None:
-        """Read up to a batch of trigger entries and dispatch each."""
+        """Claim trigger entries until the queue is empty and dispatch
+        them, concurrently across sessions and in order within one."""
+        async with self._drain_lock:
+            while True:
+                try:
+                    entries = await self._bus.queue_claim(
+                        MessageBusKeys.wakeup_queue(),
+                        MessageBusKeys.wakeup_group(),
+                        self._consumer,
+                        max_count=self._batch_size,
+                        reclaim_idle_secs=self._reclaim_idle_secs,
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("WakeupDispatcher: queue_claim failed.")
+                    return
+
+                by_session: dict[object, list[tuple[str, dict]]] = {}
+                for entry_id, payload in entries:
+                    try:
+                        session_key = payload["session_id"]
+                    except (KeyError, TypeError):
+                        session_key = None
+                    if not isinstance(session_key, str):
+                        # Malformed: dispatched alone, to be dropped.
+                        session_key = ("malformed", entry_id)
+                    by_session.setdefault(session_key, []).append(
+                        (entry_id, payload),
+                    )
+                await asyncio.gather(
+                    *(
+                        self._dispatch_session(session_entries)
+                        for session_entries in by_session.values()
+                    ),
+                )
+                if len(entries) < self._batch_size:
+                    return
+
+    async def _dispatch_session(
+        self,
+        entries: list[tuple[str, dict]],
+    ) -> None:
+        """Dispatch the claimed triggers of one session in order.
+
+        Args:
+            entries (`list[tuple[str, dict]]`):
+                ``(entry_id, payload)`` pairs of one session, in queue
+                order.
+        """
+        async with self._semaphore:
+            for entry_id, payload in entries:
+                try:
+                    await self._dispatch_entry(entry_id, payload)
+                except Exception:  # pylint: disable=broad-except
+                    # Left unacked: claimed again after the idle time.
+                    logger.exception(
+                        "WakeupDispatcher: failed to dispatch trigger "
+                        "entry %s.",
+                        entry_id,
+                    )
+
+    async def _dispatch_entry(self, entry_id: str, payload: dict) -> None:
+        """Dispatch one claimed trigger and ack it, unless it was
+        handed to a retry, which acks once it has re-queued it.
+
+        Args:
+            entry_id (`str`):
+                The id the trigger was claimed under.
+            payload (`dict`):
+                The trigger entry.
+        """
         try:
-            raw_entries = await self._bus.queue_drain(
-                MessageBusKeys.wakeup_queue(),
-                max_count=64,
+            user_id = payload["user_id"]
+            session_id = payload["session_id"]
+            agent_id = payload["agent_id"]
+        except (KeyError, TypeError):
+            logger.warning(
+                "WakeupDispatcher: skipping malformed trigger entry %r",
+                payload,
             )
-            entries = [payload for _, payload in raw_entries]
-        except Exception:  # pylint: disable=broad-except
-            logger.exception("WakeupDispatcher: dequeue_wakeups failed.")
+            await self._ack(entry_id)
             return
+        # Entries from older producers omit ``kind`` — treat as wake.
+        kind = payload.get("kind", MessageBusKeys.WAKEUP_KIND_WAKE)
+        retried = await self._dispatch_one(
+            user_id=user_id,
+            session_id=session_id,
+            agent_id=agent_id,
+            kind=kind,
+            raw_input=payload.get("input"),
+            entry_id=entry_id,
+        )
+        if not retried:
+            await self._ack(entry_id)
 
-        for payload in entries:
-            try:
-                user_id = payload["user_id"]
-                session_id = payload["session_id"]
-                agent_id = payload["agent_id"]
-            except (KeyError, TypeError):
-                logger.warning(
-                    "WakeupDispatcher: skipping malformed trigger entry %r",
-                    payload,
-                )
-                continue
-            # Entries from older producers omit ``kind`` — treat as wake.
-            kind = payload.get("kind", MessageBusKeys.WAKEUP_KIND_WAKE)
-            await self._dispatch_one(
-                user_id=user_id,
-                session_id=session_id,
-                agent_id=agent_id,
-                kind=kind,
-                raw_input=payload.get("input"),
-            )
+    async def _ack(self, entry_id: str) -> None:
+        """Acknowledge a claimed trigger entry.
+
+        Args:
+            entry_id (`str`):
+                The id the trigger was claimed under.
+        """
+        await self._bus.queue_ack(
+            MessageBusKeys.wakeup_queue(),
+            MessageBusKeys.wakeup_group(),
+            [entry_id],
+        )
 
     async def _dispatch_one(
         self,
@@ -215,7 +364,8 @@ class WakeupDispatcher:
         agent_id: str,
         kind: str,
         raw_input: dict | None,
-    ) -> None:
+        entry_id: str | None = None,
+    ) -> bool:
         """Dispatch a single trigger entry by its ``kind``.
 
         Args:
@@ -230,6 +380,14 @@ class WakeupDispatcher:
             raw_input (`dict | None`):
                 Serialised input event for ``resume`` triggers, else
                 ``None``.
+            entry_id (`str | None`, optional):
+                The claimed queue entry, acked by a retry once it has
+                re-queued the trigger.
+
+        Returns:
+            `bool`:
+                Whether the trigger was handed to a retry rather than
+                spawned or dropped.
         """
         is_resume = kind == MessageBusKeys.WAKEUP_KIND_RESUME
         is_message = kind == MessageBusKeys.WAKEUP_KIND_MESSAGE
@@ -255,7 +413,7 @@ class WakeupDispatcher:
                     kind,
                     session_id,
                 )
-                return
+                return False
             try:
                 input_msg = (
                     Msg.model_validate(raw_input)
@@ -270,7 +428,7 @@ class WakeupDispatcher:
                     session_id,
                     raw_input,
                 )
-                return
+                return False
 
         if await self._bus.is_locked(
             MessageBusKeys.session_lock(session_id),
@@ -289,8 +447,9 @@ class WakeupDispatcher:
                 agent_id,
                 kind,
                 input_msg,
+                entry_id,
             )
-            return
+            return True
 
         # Orphan guard: the queue is unaware of session lifecycle. A
         # trigger enqueued before the session was deleted (e.g. by a
@@ -326,7 +485,7 @@ class WakeupDispatcher:
                     ),
                 ).model_dump(mode="json"),
             )
-            return
+            return False
 
         try:
             self._registry.spawn(
@@ -350,7 +509,10 @@ class WakeupDispatcher:
                 agent_id,
                 kind,
                 input_msg,
+                entry_id,
             )
+            return True
+        return False
 
     def _schedule_retry(
         self,
@@ -363,6 +525,7 @@ class WakeupDispatcher:
         | UserInterruptEvent
         | Msg
         | None,
+        entry_id: str | None = None,
     ) -> None:
         """Re-enqueue an input-carrying (``resume``/``message``) trigger
         after a short backoff.
@@ -383,6 +546,10 @@ class WakeupDispatcher:
                 The trigger kind to re-enqueue (``resume`` / ``message``).
             input_msg:
                 The parsed input to redeliver.
+            entry_id (`str | None`, optional):
+                The claimed queue entry to ack once re-enqueued. Left
+                unacked if the retry fails or is cancelled, so it is
+                claimed again.
         """
 
         async def _retry() -> None:
@@ -396,6 +563,8 @@ class WakeupDispatcher:
                     kind=kind,  # type: ignore[arg-type]  # resume | message
                     inputs=input_msg,
                 )
+                if entry_id is not None:
+                    await self._ack(entry_id)
             except asyncio.CancelledError:
                 pass
             except Exception:  # pylint: disable=broad-except
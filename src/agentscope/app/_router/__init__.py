@@ -9,6 +9,7 @@ from ._health import health_router
 from ._hub import hub_router
 from ._knowledge_base import knowledge_base_router
 from ._mcp import mcp_router
+from ._metrics import metrics_router
 from ._schedule import schedule_router
 from ._session import session_router
 from ._skill import skill_router
@@ -28,6 +29,7 @@ __all__ = [
     "hub_router",
     "knowledge_base_router",
     "mcp_router",
+    "metrics_router",
     "schedule_router",
     "session_router",
     "skill_router",
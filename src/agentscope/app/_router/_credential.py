@@ -2,12 +2,15 @@
 """Credential router — CRUD endpoints for API key credentials."""
 from fastapi import APIRouter, Depends, status
 
+from .._bus_ops import publish_assembly_invalidation
 from ..access import ResourceKind
 from ..deps import (
     get_current_user_id,
+    get_message_bus,
     get_resource_access_service,
     get_storage,
 )
+from ..message_bus import MessageBus
 from ._schema import (
     CreateCredentialRequest,
     CreateCredentialResponse,
@@ -116,6 +119,7 @@ async def update_credential(
     user_id: str = Depends(get_current_user_id),
     storage: StorageBase = Depends(get_storage),
     access: ResourceAccessService = Depends(get_resource_access_service),
+    message_bus: MessageBus = Depends(get_message_bus),
 ) -> CredentialView:
     """Replace the payload of an existing credential.
 
@@ -127,6 +131,8 @@ async def update_credential(
         access (`ResourceAccessService`): Injected access service — used
             to resolve the owning user and enforce the edit permission
             when a shared editor updates the credential.
+        message_bus (`MessageBus`): Injected message bus — drops the
+            cached agents built on the old credential.
 
     Returns:
         `CredentialView`: The updated credential record.
@@ -144,6 +150,8 @@ async def update_credential(
     credential = CredentialFactory.from_dict(body.data)
     credential.id = credential_id
     await storage.upsert_credential(owner_id, credential)
+    # Shared credentials back other users' agents too
+    await publish_assembly_invalidation(message_bus)
     # ``resolve_for_edit`` proved the record existed under ``owner_id``
     # and the upsert above just wrote back to the same key, so the read
     # is a value refresh, not an existence check. If it still comes back
@@ -172,6 +180,7 @@ async def delete_credential(
     user_id: str = Depends(get_current_user_id),
     storage: StorageBase = Depends(get_storage),
     access: ResourceAccessService = Depends(get_resource_access_service),
+    message_bus: MessageBus = Depends(get_message_bus),
 ) -> None:
     """Permanently delete a credential.
 
@@ -182,6 +191,8 @@ async def delete_credential(
         access (`ResourceAccessService`): Injected access service — used
             to resolve the owning user and enforce the edit permission
             when a shared editor deletes the credential.
+        message_bus (`MessageBus`): Injected message bus — drops the
+            cached agents built on the credential.
 
     Raises:
         `HTTPException`: 404 if the credential is not visible to the
@@ -193,3 +204,4 @@ async def delete_credential(
         credential_id,
     )
     await storage.delete_credential(owner_id, credential_id)
+    await publish_assembly_invalidation(message_bus)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""The metrics router."""
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+
+from ..deps import get_current_user_id
+from ..message_bus import MessageBusKeys
+from ...formatter._formatter_base import _LOCAL_FILE_CACHE
+from ..._utils._metrics import MetricsRegistry, get_metrics_registry
+
+metrics_router = APIRouter(tags=["metrics"])
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+async def _collect_queue_depths(
+    state: object,
+    registry: MetricsRegistry,
+) -> None:
+    """Sample the depths of the shared queues and of the inboxes of the
+    runs in this process into gauges.
+
+    Args:
+        state (`object`):
+            The ``app.state`` holding the message bus and run registry.
+        registry (`MetricsRegistry`):
+            The registry to record into.
+    """
+    bus = getattr(state, "message_bus", None)
+    if bus is None:
+        return
+
+    queues = registry.gauge(
+        "agentscope_queue_depth",
+        "Entries waiting in the shared run-trigger and index-task queues.",
+        ("queue",),
+    )
+    for name, key in (
+        ("run_triggers", MessageBusKeys.wakeup_queue()),
+        ("index_tasks", MessageBusKeys.index_tasks_queue()),
+    ):
+        depth = await bus.queue_length(key)
+        if depth is not None:
+            queues.labels(name).set(depth)
+
+    run_registry = getattr(state, "chat_run_registry", None)
+    if run_registry is None:
+        return
+    session_ids = run_registry.session_ids()
+    registry.gauge(
+        "agentscope_chat_runs_registered",
+        "Chat runs registered in this process, parked ones included.",
+    ).labels().set(len(session_ids))
+    depths = await asyncio.gather(
+        *(bus.queue_length(MessageBusKeys.inbox(sid)) for sid in session_ids),
+    )
+    if None not in depths:
+        registry.gauge(
+            "agentscope_inbox_depth",
+            "Entries waiting in the inboxes of the runs in this process.",
+        ).labels().set(sum(depths))
+
+
+def _collect_cache_stats(registry: MetricsRegistry) -> None:
+    """Sample the counters of the formatters' local-file cache into a
+    gauge.
+
+    Args:
+        registry (`MetricsRegistry`):
+            The registry to record into.
+    """
+    gauge = registry.gauge(
+        "agentscope_formatter_file_cache",
+        "Entries, encoded bytes, hits, misses and evictions of the "
+        "formatters' cache of local-file encodings.",
+        ("stat",),
+    )
+    for stat, value in _LOCAL_FILE_CACHE.stats.items():
+        gauge.labels(stat).set(value)
+
+
+@metrics_router.get(
+    "/metrics",
+    response_class=Response,
+    summary="Expose runtime metrics in the Prometheus text format",
+)
+async def get_metrics(
+    request: Request,
+    _: str = Depends(get_current_user_id),
+) -> Response:
+    """Render the process-wide metrics registry for a Prometheus scrape.
+
+    The latency histograms are recorded as the process runs; the queue
+    depths and the cache counters are sampled on each scrape. Like
+    ``/health``, the endpoint expects the ``X-User-ID`` header, so the
+    scrape configuration has to send one.
+
+    Args:
+        request (`Request`): The incoming FastAPI request.
+
+    Returns:
+        `Response`: The exposition text.
+
+    Raises:
+        `HTTPException`: 404 if metrics are disabled with
+        :func:`~agentscope.set_metrics_registry`.
+    """
+    registry = get_metrics_registry()
+    if registry is None:
+        raise HTTPException(status_code=404, detail="Metrics are disabled.")
+    await _collect_queue_depths(request.app.state, registry)
+    _collect_cache_stats(registry)
+    return Response(content=registry.render(), media_type=_CONTENT_TYPE)
@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 """Session router — create, list, update, delete, stream, and get messages."""
 import asyncio
-import json
 from typing import AsyncGenerator
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 
 from ..._utils._common import _generate_id
+from ..._utils._serialization import JSONSerializer
 from ..access import ResourceKind
 from ..deps import (
     get_chat_service,
@@ -700,6 +700,14 @@ async def get_session_status(
 _HEARTBEAT_INTERVAL_SECS = 30
 # Interval between SSE heartbeat comment frames (``:\\n\\n``).
 
+_JSON = JSONSerializer()
+
+
+def _sse_frame(event: dict | bytes) -> bytes:
+    """Build an SSE data frame, encoding ``event`` unless it already is
+    JSON bytes."""
+    return b"data: " + _JSON.dumps(event) + b"\n\n"
+
 
 async def _worker_still_asking(
     storage: StorageBase,
@@ -804,13 +812,14 @@ async def stream_session_events(
             detail=f"Session '{session_id}' not found.",
         )
 
-    async def _sse_generator() -> AsyncGenerator[str, None]:
-        # 1. Replay buffered events from the current run (if any).
-        for _entry_id, event in await message_bus.log_read(
+    async def _sse_generator() -> AsyncGenerator[bytes, None]:
+        # 1. Replay buffered events from the current run (if any),
+        #    relaying the encoded entries as stored.
+        for _entry_id, data in await message_bus.log_read_encoded(
             MessageBusKeys.session_events(session_id),
             max_count=MessageBusKeys.SESSION_REPLAY_MAX_LEN,
         ):
-            yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+            yield _sse_frame(data)
 
         # 1b. Inject pending subagent HITL cards projected onto this
         #     session as a team leader (design §3.5). These live in a
@@ -846,12 +855,7 @@ async def stream_session_events(
                 name=SubagentHitlProjector.EVT_REQUIRE,
                 value=payload,
             )
-            data = json.dumps(
-                custom.model_dump(mode="json"),
-                ensure_ascii=False,
-            )
-
-            yield f"data: {data}\n\n"
+            yield _sse_frame(custom.model_dump_json().encode("utf-8"))
 
         # 2. Live subscribe via a background feeder task that pushes
         #    events into a queue. The main loop reads from the queue
@@ -895,9 +899,9 @@ async def stream_session_events(
                     )
                     if item is None:
                         break
-                    yield f"data: {json.dumps(item, ensure_ascii=False)}\n\n"
+                    yield _sse_frame(item)
                 except asyncio.TimeoutError:
-                    yield ":\n\n"
+                    yield b":\n\n"
         finally:
             feeder_task.cancel()
             try:
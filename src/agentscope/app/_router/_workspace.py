@@ -17,13 +17,16 @@ from fastapi import (
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
+from .._bus_ops import publish_assembly_invalidation
 from ..deps import (
     get_current_user_id,
+    get_message_bus,
     get_skill_hubs,
     get_storage,
     get_workspace_service,
 )
 from ..hub import SkillHubBase
+from ..message_bus import MessageBus
 from .._service import WorkspaceService, WorkspaceStatus
 from .._service._workspace import SkillUploadError, UploadManifest
 from ..storage import MCPRecord, StorageBase
@@ -104,6 +107,7 @@ async def add_mcp(
     user_id: str = Depends(get_current_user_id),
     storage: StorageBase = Depends(get_storage),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
+    message_bus: MessageBus = Depends(get_message_bus),
 ) -> None:
     """Add an MCP client to the session's workspace.
 
@@ -125,6 +129,8 @@ async def add_mcp(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e),
         ) from e
+    # A workspace may back several of the user's sessions
+    await publish_assembly_invalidation(message_bus, user_id=user_id)
 
     if await storage.get_mcp_by_name(user_id, mcp.name) is None:
         # No hub_id or card_id — this one has no card behind it, which
@@ -146,6 +152,7 @@ async def add_mcps_from_library(
     user_id: str = Depends(get_current_user_id),
     storage: StorageBase = Depends(get_storage),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
+    message_bus: MessageBus = Depends(get_message_bus),
 ) -> AddFromLibraryResponse:
     """Put MCPs the user has already installed into this workspace.
 
@@ -189,6 +196,8 @@ async def add_mcps_from_library(
             continue
         added.append(record.client.name)
 
+    if added:
+        await publish_assembly_invalidation(message_bus, user_id=user_id)
     return AddFromLibraryResponse(added=added, failed=failed)
 
 
@@ -202,6 +211,7 @@ async def remove_mcp(
     session_id: str = Query(...),
     user_id: str = Depends(get_current_user_id),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
+    message_bus: MessageBus = Depends(get_message_bus),
 ) -> None:
     """Remove an MCP client from the session's workspace by name."""
     workspace = await workspace_service.resolve(
@@ -214,6 +224,7 @@ async def remove_mcp(
         agent_id=agent_id,
         session_id=session_id,
     )
+    await publish_assembly_invalidation(message_bus, user_id=user_id)
 
 
 # ---------------------------------------------------------------------------
@@ -248,6 +259,7 @@ async def add_skill(
     session_id: str = Query(...),
     user_id: str = Depends(get_current_user_id),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
+    message_bus: MessageBus = Depends(get_message_bus),
 ) -> None:
     """Add a skill to the session's workspace from the given path.
 
@@ -262,6 +274,7 @@ async def add_skill(
         session_id,
     )
     await workspace.add_skill(body.skill_path, agent_id=agent_id)
+    await publish_assembly_invalidation(message_bus, user_id=user_id)
 
 
 @workspace_router.post(
@@ -280,6 +293,7 @@ async def upload_skill(
     session_id: str = Query(...),
     user_id: str = Depends(get_current_user_id),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
+    message_bus: MessageBus = Depends(get_message_bus),
 ) -> None:
     """Install a skill from an uploaded folder.
 
@@ -317,6 +331,7 @@ async def upload_skill(
             status.HTTP_422_UNPROCESSABLE_ENTITY,
             str(e),
         ) from e
+    await publish_assembly_invalidation(message_bus, user_id=user_id)
 
 
 @workspace_router.post(
@@ -330,6 +345,7 @@ async def add_skills_from_library(
     user_id: str = Depends(get_current_user_id),
     storage: StorageBase = Depends(get_storage),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
+    message_bus: MessageBus = Depends(get_message_bus),
     skill_hubs: dict[str, SkillHubBase] = Depends(get_skill_hubs),
 ) -> AddFromLibraryResponse:
     """Put skills the user has already installed into this workspace.
@@ -375,6 +391,8 @@ async def add_skills_from_library(
             continue
         added.append(record.name)
 
+    if added:
+        await publish_assembly_invalidation(message_bus, user_id=user_id)
     return AddFromLibraryResponse(added=added, failed=failed)
 
 
@@ -388,6 +406,7 @@ async def remove_skill(
     session_id: str = Query(...),
     user_id: str = Depends(get_current_user_id),
     workspace_service: WorkspaceService = Depends(get_workspace_service),
+    message_bus: MessageBus = Depends(get_message_bus),
 ) -> None:
     """Remove a skill from the session's workspace by name."""
     workspace = await workspace_service.resolve(
@@ -396,6 +415,7 @@ async def remove_skill(
         session_id,
     )
     await workspace.remove_skill(skill_name, agent_id=agent_id)
+    await publish_assembly_invalidation(message_bus, user_id=user_id)
 
 
 # ---------------------------------------------------------------------------
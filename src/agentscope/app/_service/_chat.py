@@ -14,6 +14,7 @@ that wants them subscribes through the
 import asyncio
 import inspect
 import json
+import time
 from dataclasses import dataclass
 from typing import Literal, TYPE_CHECKING
 
@@ -32,7 +33,12 @@ from ..rag.knowledge_base_manager import KnowledgeBaseManagerBase
 from ..channel import ChatKind
 from ..storage import StorageBase, AgentRecord, SessionRecord, SessionSource
 from ..storage._utils import _resolve_team_leader
-from .._manager import BackgroundTaskManager, SchedulerManager
+from .._manager import (
+    AssemblyCache,
+    BackgroundTaskManager,
+    InboxWatcher,
+    SchedulerManager,
+)
 from ..workspace_manager import WorkspaceManagerBase
 from ..middleware import (
     InboxMiddleware,
@@ -52,6 +58,7 @@ from ._access import ResourceAccessService
 from ._model import get_model
 from ._tts_model import get_tts_model
 from ._toolkit import get_toolkit
+from ._write_behind import SessionWriteBehind
 from ._session_projection import SessionProjection
 from ._projectors import SubagentHitlProjector
 
@@ -59,6 +66,7 @@ from ..._logging import logger
 from ...agent import Agent, ModelConfig
 from ...event import (
     AgentEvent,
+    EventType,
     ReplyStartEvent,
     ReplyEndEvent,
     ReplyFinishedReason,
@@ -68,8 +76,17 @@ from ...event import (
 )
 from ._errors import _classify_error, _classify_setup_error
 from ..._utils._common import _generate_id
-from ...message import AssistantMsg, HintBlock, Msg, ToolCallState
+from ..._utils._metrics import _observe_seconds, get_metrics_registry
+from ...message import (
+    AssistantMsg,
+    HintBlock,
+    Msg,
+    MsgAccumulator,
+    ToolCallState,
+)
+from ...model import RateLimiterBase, RateLimitPriority
 from ...permission import AdditionalWorkingDirectory
+from ...workspace import WorkspaceBase
 
 if TYPE_CHECKING:
     from ..channel import ChannelClients
@@ -95,6 +112,35 @@ class _WorkerContext:
 _TeamContext = _LeaderContext | _WorkerContext
 
 
+def _assembly_fingerprint(
+    agent_record: AgentRecord,
+    session_record: SessionRecord,
+    team_ctx: _TeamContext | None,
+    workspace: WorkspaceBase,
+    dependencies: tuple,
+) -> tuple:
+    """The version of everything a run's agent is assembled from, except
+    the session state and the resources whose changes are published as
+    assembly invalidations (credentials, MCPs, skills).
+
+    The workspace is compared by identity: a cached agent holds its
+    workspace, so the id cannot be reused while the entry lives, and a
+    rebuilt workspace yields a new one. The knowledge bases and the
+    channel come in ``dependencies``, see
+    :meth:`ChatService._assembly_dependencies`.
+    """
+    return (
+        agent_record.updated_at,
+        session_record.config.model_dump_json(),
+        session_record.source,
+        session_record.source_channel_id,
+        session_record.source_chat_id,
+        team_ctx,
+        id(workspace),
+        dependencies,
+    )
+
+
 class ChatService:
     """Run an agent against a session, persisting input/reply messages
     and updated agent state.
@@ -125,6 +171,9 @@ class ChatService:
         custom_agent_cls: type[Agent] | None = None,
         extra_projectors: list[EventProjector] | None = None,
         channel_clients: "ChannelClients | None" = None,
+        model_rate_limiter: RateLimiterBase | None = None,
+        assembly_cache: AssemblyCache | None = None,
+        inbox_watcher: InboxWatcher | None = None,
     ) -> None:
         """Initialize chat service.
 
@@ -191,6 +240,22 @@ class ChatService:
                 a channel-originated session's agent that channel's
                 platform tools and chat context. Neither needs the long
                 connection, so the run gets them wherever it lands.
+            model_rate_limiter (`RateLimiterBase | None`, optional):
+                Admits the chat model calls of every run against the
+                RPM/TPM budgets of their credential and model. Runs of
+                scheduled sessions are admitted after interactive ones.
+                ``None`` leaves the calls unlimited.
+            assembly_cache (`AssemblyCache | None`, optional):
+                Keeps the agents assembled for recent sessions, so the
+                next run of a session reuses its toolkit, models and
+                middlewares instead of assembling them again. The
+                ``extra_agent_middlewares`` and ``extra_agent_tools``
+                factories then run once per assembly rather than once
+                per turn. ``None`` assembles the agent on every run.
+            inbox_watcher (`InboxWatcher | None`, optional):
+                Tracks which session inboxes were signalled, so a run
+                only drains its inbox on the reasoning steps that follow
+                a delivery. ``None`` drains on every step.
         """
         self._storage = storage
         self._workspace_manager = workspace_manager
@@ -216,6 +281,9 @@ class ChatService:
                 pass
         self._extra_agent_tools = extra_agent_tools
         self._channel_clients = channel_clients
+        self._model_rate_limiter = model_rate_limiter
+        self._assembly_cache = assembly_cache
+        self._inbox_watcher = inbox_watcher
         self._sub_agent_templates = custom_subagent_templates
         self._agent_cls = custom_agent_cls or Agent
         self._projection = SessionProjection(message_bus)
@@ -275,9 +343,20 @@ class ChatService:
                   agent closes pending tool calls with interrupted
                   results and ends the reply (Case B, no reasoning).
         """
+        registry = get_metrics_registry()
+        active = None
+        if registry is not None:
+            active = registry.gauge(
+                "agentscope_chat_runs_active",
+                "Chat runs in progress in this process.",
+            ).labels()
+            active.inc()
+        start = time.perf_counter()
+        outcome = "ok"
         try:
             await self._run_impl(user_id, session_id, agent_id, input_msg)
         except Exception as e:
+            outcome = "error"
             logger.exception(
                 "ChatService.run failed for user_id=%s session_id=%s "
                 "agent_id=%s, error=%s",
@@ -286,6 +365,19 @@ class ChatService:
                 agent_id,
                 str(e),
             )
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            if active is not None:
+                active.dec()
+            _observe_seconds(
+                "agentscope_chat_run_seconds",
+                "Duration of chat runs, lock wait included.",
+                ("outcome",),
+                (outcome,),
+                time.perf_counter() - start,
+            )
 
     async def _close_failed_reply(
         self,
@@ -575,6 +667,329 @@ class ChatService:
             inputs=UserInterruptEvent(reply_id=session.state.reply_id),
         )
 
+    async def _assembly_dependencies(
+        self,
+        user_id: str,
+        session_record: SessionRecord,
+    ) -> tuple:
+        """The versions of the knowledge bases and the channel that an
+        assembly resolves, for the assembly fingerprint.
+
+        They are resolved again on every run: access to a shared
+        knowledge base is decided by the access policy, whose changes
+        are not published, and a knowledge base or channel may be
+        updated or deleted on any node.
+
+        Args:
+            user_id (`str`):
+                The user running the session.
+            session_record (`SessionRecord`):
+                The session record.
+
+        Returns:
+            `tuple`: The ``(id, owner, updated_at)`` of each knowledge
+            base, with ``None`` for the owner and version of one that
+            cannot be resolved, and the channel's ``updated_at``.
+        """
+        knowledge_bases = []
+        kb_cfg = session_record.config.knowledge_config
+        if (
+            kb_cfg is not None
+            and kb_cfg.knowledge_base_ids
+            and self._knowledge_base_manager is not None
+        ):
+            for kb_id in kb_cfg.knowledge_base_ids:
+                try:
+                    kb_record = await self._access.resolve_knowledge_base(
+                        user_id,
+                        kb_id,
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    # Skipped by the assembly as well
+                    knowledge_bases.append((kb_id, None, None))
+                    continue
+                knowledge_bases.append(
+                    (kb_id, kb_record.user_id, kb_record.updated_at),
+                )
+
+        channel_version = None
+        if (
+            session_record.source_channel_id
+            and self._channel_clients is not None
+        ):
+            channel_record = await self._storage.get_channel(
+                session_record.source_channel_id,
+            )
+            if channel_record is not None:
+                channel_version = channel_record.updated_at
+
+        return tuple(knowledge_bases), channel_version
+
+    async def _assemble_agent(
+        # pylint: disable=too-many-statements,too-many-branches
+        self,
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+        agent_record: AgentRecord,
+        session_record: SessionRecord,
+        workspace: WorkspaceBase,
+        team_ctx: _TeamContext | None,
+    ) -> Agent:
+        """Assemble the agent of a run: its middlewares, toolkit, models
+        and system prompt, around the session's state.
+
+        Args:
+            user_id (`str`):
+                The user running the session.
+            agent_id (`str`):
+                The agent of the session.
+            session_id (`str`):
+                The session being run.
+            agent_record (`AgentRecord`):
+                The resolved agent record.
+            session_record (`SessionRecord`):
+                The session record, whose state the agent runs on.
+            workspace (`WorkspaceBase`):
+                The session's workspace.
+            team_ctx (`_TeamContext | None`):
+                The session's role in its team, if any.
+
+        Returns:
+            `Agent`: The assembled agent.
+        """
+        # -------------------------------------------------------------
+        # 1c. Resolve the channel binding ONCE; the toolkit and the
+        # system-prompt attachment share it.
+        # -------------------------------------------------------------
+        channel = (
+            await self._channel_clients.get(
+                session_record.source_channel_id,
+            )
+            if session_record.source_channel_id
+            and self._channel_clients is not None
+            else None
+        )
+        channel_tools = (
+            await channel.list_tools(workspace) if channel is not None else []
+        )
+
+        # -------------------------------------------------------------
+        # 2. Middlewares — framework-supplied first, then caller
+        # extras. Background-tool completions deliver their results
+        # via ``message_bus.inbox_push + enqueue_wakeup``, so the
+        # dispatcher (any process) wakes an idle session — no
+        # in-process retrigger plumbing is needed here.
+        # -------------------------------------------------------------
+        middlewares: list = [
+            InboxMiddleware(
+                self._message_bus,
+                inbox_watcher=self._inbox_watcher,
+            ),
+            StateChangeMiddleware(
+                message_bus=self._message_bus,
+                session_id=session_id,
+            ),
+            ToolOffloadMiddleware(
+                bg_manager=self._background_task_manager,
+                message_bus=self._message_bus,
+                user_id=user_id,
+                agent_id=agent_id,
+            ),
+        ]
+        # Equip the member middleware for loop control
+        if isinstance(team_ctx, _WorkerContext):
+            middlewares.append(
+                TeamMemberLoopMiddleware(
+                    leader_name=team_ctx.leader_name,
+                ),
+            )
+
+        if self._extra_agent_middlewares is not None:
+            factory_args: tuple = (user_id, agent_id, session_id)
+            if self._middlewares_take_workspace:
+                factory_args += (workspace,)
+            middlewares.extend(
+                await self._extra_agent_middlewares(*factory_args),
+            )
+
+        # -------------------------------------------------------------
+        # 2b. TTS middleware — inject when the session has a TTS
+        # config.
+        # -------------------------------------------------------------
+        tts_cfg = session_record.config.tts_model_config
+        if tts_cfg is not None:
+            tts_model = await get_tts_model(
+                user_id,
+                tts_cfg,
+                self._access,
+            )
+            middlewares.append(TTSMiddleware(tts_model))
+
+        # -------------------------------------------------------------
+        # 2c. Knowledge-base middleware — inject when the session has
+        # KBs attached.  Each KB resolves to its own
+        # :class:`KnowledgeBase` handle
+        # (own embedding model + vector store), so the middleware can
+        # retrieve across heterogeneous KBs in one fan-out.
+        #
+        # Each KB may be either owned by the caller or shared to them
+        # via the resource access policy. We resolve the owner through
+        # ``resolve_knowledge_base`` first and hand the KB manager the
+        # true owner id — its own storage lookups stay owner-scoped
+        # and unaware of sharing.
+        # -------------------------------------------------------------
+        kb_cfg = session_record.config.knowledge_config
+        if (
+            kb_cfg is not None
+            and kb_cfg.knowledge_base_ids
+            and self._knowledge_base_manager is not None
+        ):
+            knowledges: list[KnowledgeBase] = []
+            for kb_id in kb_cfg.knowledge_base_ids:
+                try:
+                    kb_record = await self._access.resolve_knowledge_base(
+                        user_id,
+                        kb_id,
+                    )
+                    kb_manager = self._knowledge_base_manager
+                    knowledge = await kb_manager.get_knowledge(
+                        kb_record.user_id,
+                        kb_id,
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    # A KB the session referenced was deleted, its
+                    # sharing revoked, or its credential is gone —
+                    # log and skip so the chat turn can still run
+                    # with the remaining KBs.
+                    logger.exception(
+                        "Skipping knowledge base %r for session %r: "
+                        "failed to resolve runtime handle.",
+                        kb_id,
+                        session_id,
+                    )
+                    continue
+                knowledges.append(knowledge)
+            if knowledges:
+                middlewares.append(
+                    RAGMiddleware(
+                        knowledge_bases=knowledges,
+                        parameters=RAGMiddleware.Parameters(
+                            **(kb_cfg.parameters or {}),
+                        ),
+                    ),
+                )
+
+        # -------------------------------------------------------------
+        # 3. Toolkit (workspace tools + planning + ToolStop +
+        # schedule + team + extras + skills + mcps).
+        # -------------------------------------------------------------
+        toolkit = await get_toolkit(
+            storage=self._storage,
+            workspace=workspace,
+            workspace_manager=self._workspace_manager,
+            scheduler_manager=self._scheduler_manager,
+            background_task_manager=self._background_task_manager,
+            message_bus=self._message_bus,
+            middlewares=middlewares,
+            user_id=user_id,
+            agent_record=agent_record,
+            session_record=session_record,
+            resource_access_service=self._access,
+            extra_factory=self._extra_agent_tools,
+            sub_agent_templates=self._sub_agent_templates,
+            team_role=team_ctx.role if team_ctx else None,
+            channel_tools=channel_tools,
+        )
+
+        # -------------------------------------------------------------
+        # 4. Model + fallback (resolved from session's config).
+        # -------------------------------------------------------------
+        model_cfg = session_record.config.chat_model_config
+        if not model_cfg:
+            raise HTTPException(
+                status_code=404,
+                detail=(
+                    f"No model configuration found for agent " f"{agent_id}"
+                ),
+            )
+        priority = (
+            RateLimitPriority.BACKGROUND
+            if session_record.source == SessionSource.SCHEDULE
+            else RateLimitPriority.INTERACTIVE
+        )
+        model = await get_model(
+            user_id,
+            model_cfg,
+            self._access,
+            rate_limiter=self._model_rate_limiter,
+            rate_limit_priority=priority,
+        )
+
+        fallback_cfg = session_record.config.fallback_chat_model_config
+        fallback_model = (
+            await get_model(
+                user_id,
+                fallback_cfg,
+                self._access,
+                rate_limiter=self._model_rate_limiter,
+                rate_limit_priority=priority,
+            )
+            if fallback_cfg is not None
+            else None
+        )
+
+        # -------------------------------------------------------------
+        # 5. Assemble the Agent.
+        # -------------------------------------------------------------
+        attachment = f"You're within a session (id={session_id})."
+
+        # Channel-bound sessions: tell the agent which chat it serves.
+        if channel is not None:
+            tools = ", ".join(t.name for t in channel_tools)
+            chat_id = session_record.source_chat_id or ""
+            kind = await channel.chat_kind(chat_id)
+            name = await channel.chat_name(chat_id)
+            where = f' named "{name}"' if name else ""
+            attachment += (
+                f" This session is bound to a chat{where} on the "
+                f"{channel.display_name} platform: the messages, "
+                f"images and files people send there are relayed "
+                f"to you here, and your replies are delivered "
+                f"back to that same chat."
+            )
+            if kind is ChatKind.GROUP:
+                attachment += (
+                    " It is a group chat, so messages may come "
+                    "from several different people; each incoming "
+                    "user turn is labelled with its sender."
+                )
+            elif kind is ChatKind.PRIVATE:
+                attachment += (
+                    " It is a one-to-one private chat with a " "single user."
+                )
+            if tools:
+                attachment += (
+                    f" You also have these {channel.display_name} "
+                    f"tools available: {tools}."
+                )
+
+        attachment = f"<system-notification>{attachment}</system-notification>"
+        system_prompt = agent_record.data.system_prompt + "\n\n" + attachment
+
+        return self._agent_cls(
+            name=agent_record.data.name,
+            system_prompt=system_prompt,
+            model=model,
+            toolkit=toolkit,
+            model_config=ModelConfig(fallback_model=fallback_model),
+            context_config=agent_record.data.context_config,
+            react_config=agent_record.data.react_config,
+            state=session_record.state,
+            middlewares=middlewares,
+            offloader=workspace,
+        )
+
     @staticmethod
     def _skip_parked_wakeup(
         session_id: str,
@@ -766,229 +1181,48 @@ class ChatService:
                     )
 
                 # -------------------------------------------------------------
-                # 1c. Resolve the channel binding ONCE; the toolkit and the
-                # system-prompt attachment share it.
-                # -------------------------------------------------------------
-                channel = (
-                    await self._channel_clients.get(
-                        session_record.source_channel_id,
-                    )
-                    if session_record.source_channel_id
-                    and self._channel_clients is not None
-                    else None
-                )
-                channel_tools = (
-                    await channel.list_tools(workspace)
-                    if channel is not None
-                    else []
-                )
-
-                # -------------------------------------------------------------
-                # 2. Middlewares — framework-supplied first, then caller
-                # extras. Background-tool completions deliver their results
-                # via ``message_bus.inbox_push + enqueue_wakeup``, so the
-                # dispatcher (any process) wakes an idle session — no
-                # in-process retrigger plumbing is needed here.
+                # 1c-5. Assemble the agent, or reuse the one assembled for an
+                # earlier run of this session when nothing it is built from
+                # changed since. The session's state is refreshed on every
+                # run, so it is swapped in rather than versioned.
                 # -------------------------------------------------------------
-                middlewares: list = [
-                    InboxMiddleware(self._message_bus),
-                    StateChangeMiddleware(
-                        message_bus=self._message_bus,
-                        session_id=session_id,
-                    ),
-                    ToolOffloadMiddleware(
-                        bg_manager=self._background_task_manager,
-                        message_bus=self._message_bus,
-                        user_id=user_id,
-                        agent_id=agent_id,
-                    ),
-                ]
-                # Equip the member middleware for loop control
-                if isinstance(team_ctx, _WorkerContext):
-                    middlewares.append(
-                        TeamMemberLoopMiddleware(
-                            leader_name=team_ctx.leader_name,
+                agent_state = session_record.state
+                agent_state.session_id = session_id
+                agent = None
+                fingerprint = None
+                if self._assembly_cache is not None:
+                    fingerprint = _assembly_fingerprint(
+                        agent_record,
+                        session_record,
+                        team_ctx,
+                        workspace,
+                        await self._assembly_dependencies(
+                            user_id,
+                            session_record,
                         ),
                     )
-
-                if self._extra_agent_middlewares is not None:
-                    factory_args: tuple = (user_id, agent_id, session_id)
-                    if self._middlewares_take_workspace:
-                        factory_args += (workspace,)
-                    middlewares.extend(
-                        await self._extra_agent_middlewares(*factory_args),
-                    )
-
-                # -------------------------------------------------------------
-                # 2b. TTS middleware — inject when the session has a TTS
-                # config.
-                # -------------------------------------------------------------
-                tts_cfg = session_record.config.tts_model_config
-                if tts_cfg is not None:
-                    tts_model = await get_tts_model(
+                    agent = self._assembly_cache.get(session_id, fingerprint)
+                if agent is not None:
+                    agent.load_state(agent_state)
+                else:
+                    agent = await self._assemble_agent(
                         user_id,
-                        tts_cfg,
-                        self._access,
-                    )
-                    middlewares.append(TTSMiddleware(tts_model))
-
-                # -------------------------------------------------------------
-                # 2c. Knowledge-base middleware — inject when the session has
-                # KBs attached.  Each KB resolves to its own
-                # :class:`KnowledgeBase` handle
-                # (own embedding model + vector store), so the middleware can
-                # retrieve across heterogeneous KBs in one fan-out.
-                #
-                # Each KB may be either owned by the caller or shared to them
-                # via the resource access policy. We resolve the owner through
-                # ``resolve_knowledge_base`` first and hand the KB manager the
-                # true owner id — its own storage lookups stay owner-scoped
-                # and unaware of sharing.
-                # -------------------------------------------------------------
-                kb_cfg = session_record.config.knowledge_config
-                if (
-                    kb_cfg is not None
-                    and kb_cfg.knowledge_base_ids
-                    and self._knowledge_base_manager is not None
-                ):
-                    knowledges: list[KnowledgeBase] = []
-                    for kb_id in kb_cfg.knowledge_base_ids:
-                        try:
-                            kb_record = (
-                                await self._access.resolve_knowledge_base(
-                                    user_id,
-                                    kb_id,
-                                )
-                            )
-                            kb_manager = self._knowledge_base_manager
-                            knowledge = await kb_manager.get_knowledge(
-                                kb_record.user_id,
-                                kb_id,
-                            )
-                        except Exception:  # pylint: disable=broad-except
-                            # A KB the session referenced was deleted, its
-                            # sharing revoked, or its credential is gone —
-                            # log and skip so the chat turn can still run
-                            # with the remaining KBs.
-                            logger.exception(
-                                "Skipping knowledge base %r for session %r: "
-                                "failed to resolve runtime handle.",
-                                kb_id,
-                                session_id,
-                            )
-                            continue
-                        knowledges.append(knowledge)
-                    if knowledges:
-                        middlewares.append(
-                            RAGMiddleware(
-                                knowledge_bases=knowledges,
-                                parameters=RAGMiddleware.Parameters(
-                                    **(kb_cfg.parameters or {}),
-                                ),
-                            ),
-                        )
-
-                # -------------------------------------------------------------
-                # 3. Toolkit (workspace tools + planning + ToolStop +
-                # schedule + team + extras + skills + mcps).
-                # -------------------------------------------------------------
-                toolkit = await get_toolkit(
-                    storage=self._storage,
-                    workspace=workspace,
-                    workspace_manager=self._workspace_manager,
-                    scheduler_manager=self._scheduler_manager,
-                    background_task_manager=self._background_task_manager,
-                    message_bus=self._message_bus,
-                    middlewares=middlewares,
-                    user_id=user_id,
-                    agent_record=agent_record,
-                    session_record=session_record,
-                    resource_access_service=self._access,
-                    extra_factory=self._extra_agent_tools,
-                    sub_agent_templates=self._sub_agent_templates,
-                    team_role=team_ctx.role if team_ctx else None,
-                    channel_tools=channel_tools,
-                )
-
-                # -------------------------------------------------------------
-                # 4. Model + fallback (resolved from session's config).
-                # -------------------------------------------------------------
-                model_cfg = session_record.config.chat_model_config
-                if not model_cfg:
-                    raise HTTPException(
-                        status_code=404,
-                        detail=(
-                            f"No model configuration found for agent "
-                            f"{agent_id}"
-                        ),
-                    )
-                model = await get_model(user_id, model_cfg, self._access)
-
-                fallback_cfg = session_record.config.fallback_chat_model_config
-                fallback_model = (
-                    await get_model(user_id, fallback_cfg, self._access)
-                    if fallback_cfg is not None
-                    else None
-                )
-
-                # -------------------------------------------------------------
-                # 5. Assemble the Agent.
-                # -------------------------------------------------------------
-                attachment = f"You're within a session (id={session_id})."
-
-                # Channel-bound sessions: tell the agent which chat it serves.
-                if channel is not None:
-                    tools = ", ".join(t.name for t in channel_tools)
-                    chat_id = session_record.source_chat_id or ""
-                    kind = await channel.chat_kind(chat_id)
-                    name = await channel.chat_name(chat_id)
-                    where = f' named "{name}"' if name else ""
-                    attachment += (
-                        f" This session is bound to a chat{where} on the "
-                        f"{channel.display_name} platform: the messages, "
-                        f"images and files people send there are relayed "
-                        f"to you here, and your replies are delivered "
-                        f"back to that same chat."
+                        agent_id,
+                        session_id,
+                        agent_record,
+                        session_record,
+                        workspace,
+                        team_ctx,
                     )
-                    if kind is ChatKind.GROUP:
-                        attachment += (
-                            " It is a group chat, so messages may come "
-                            "from several different people; each incoming "
-                            "user turn is labelled with its sender."
-                        )
-                    elif kind is ChatKind.PRIVATE:
-                        attachment += (
-                            " It is a one-to-one private chat with a "
-                            "single user."
-                        )
-                    if tools:
-                        attachment += (
-                            f" You also have these {channel.display_name} "
-                            f"tools available: {tools}."
+                    if self._assembly_cache is not None:
+                        self._assembly_cache.put(
+                            session_id,
+                            fingerprint,
+                            agent,
+                            user_id=user_id,
+                            agent_id=agent_id,
                         )
 
-                attachment = (
-                    f"<system-notification>{attachment}</system-notification>"
-                )
-                system_prompt = (
-                    agent_record.data.system_prompt + "\n\n" + attachment
-                )
-
-                agent_state = session_record.state
-                agent_state.session_id = session_id
-                agent = self._agent_cls(
-                    name=agent_record.data.name,
-                    system_prompt=system_prompt,
-                    model=model,
-                    toolkit=toolkit,
-                    model_config=ModelConfig(fallback_model=fallback_model),
-                    context_config=agent_record.data.context_config,
-                    react_config=agent_record.data.react_config,
-                    state=agent_state,
-                    middlewares=middlewares,
-                    offloader=workspace,
-                )
-
                 if self._skip_parked_wakeup(session_id, agent, input_msg):
                     return
             except Exception as e:  # pylint: disable=broad-except
@@ -1028,12 +1262,24 @@ class ChatService:
                     agent_id=agent_id,
                 )
             reply_msg: Msg | None = None
+            # Folds the streamed deltas into ``reply_msg`` in linear time;
+            # built before the reply is handed on
+            reply_acc: MsgAccumulator | None = None
             reply_msgs: list[Msg] = []
             released = False
+            # Messages and state are written behind, in batches; see
+            # ``_write_behind`` for when they reach storage.
+            writer = SessionWriteBehind(
+                self._storage,
+                user_id,
+                agent_id,
+                session_id,
+            )
             await register_inbox_consumer(self._message_bus, session_id)
             try:
                 while True:
                     reply_msg = None
+                    reply_acc = None
                     try:
                         if input_msg is None or isinstance(
                             input_msg,
@@ -1048,11 +1294,10 @@ class ChatService:
                                     else input_msg
                                 )
                                 for msg in input_msgs:
-                                    await self._storage.upsert_message(
-                                        user_id,
-                                        session_id,
-                                        msg,
-                                    )
+                                    writer.add_message(msg)
+                                # Listed and durable before the reply
+                                # starts, as when written directly
+                                await writer.flush()
 
                             async for event in agent.reply_stream(
                                 inputs=input_msg,
@@ -1066,8 +1311,9 @@ class ChatService:
                                         name=event.name,
                                         content=[],
                                     )
-                                elif reply_msg is not None:
-                                    reply_msg.append_event(event)
+                                    reply_acc = MsgAccumulator(reply_msg)
+                                elif reply_acc is not None:
+                                    reply_acc.append_event(event)
                                 try:
                                     await publish_session_event(
                                         self._message_bus,
@@ -1080,6 +1326,12 @@ class ChatService:
                                         agent_record,
                                         event,
                                     )
+                                    await self._flush_run_writes(
+                                        writer,
+                                        event,
+                                        reply_acc,
+                                        agent,
+                                    )
                                 except asyncio.CancelledError:
                                     # Interrupt landed here, not at
                                     # ``__anext__``. Re-arm it so it is
@@ -1095,7 +1347,9 @@ class ChatService:
                         else:
                             # Case B: continuation (UserConfirmResult
                             #  / ExternalExecResult)
-                            reply_msg = await self._storage.get_message(
+                            reply_msg = writer.get_message(
+                                agent.state.reply_id,
+                            ) or await self._storage.get_message(
                                 user_id,
                                 session_id,
                                 agent.state.reply_id,
@@ -1110,8 +1364,10 @@ class ChatService:
                                     agent.state.reply_id,
                                     session_id,
                                 )
-                            elif input_msg:
-                                reply_msg.append_event(input_msg)
+                            else:
+                                reply_acc = MsgAccumulator(reply_msg)
+                                if input_msg:
+                                    reply_acc.append_event(input_msg)
 
                             # Broadcast the applied decision so
                             # observers that didn't make it (other tabs,
@@ -1156,8 +1412,8 @@ class ChatService:
                                 # Apply to the persisted reply FIRST
                                 # (synchronous), then publish/project —
                                 # see Case A above.
-                                if reply_msg is not None:
-                                    reply_msg.append_event(event)
+                                if reply_acc is not None:
+                                    reply_acc.append_event(event)
                                 try:
                                     await publish_session_event(
                                         self._message_bus,
@@ -1170,6 +1426,12 @@ class ChatService:
                                         agent_record,
                                         event,
                                     )
+                                    await self._flush_run_writes(
+                                        writer,
+                                        event,
+                                        reply_acc,
+                                        agent,
+                                    )
                                 except asyncio.CancelledError:
                                     # See Case A: redirect an interrupt
                                     # landing here back into the agent
@@ -1182,9 +1444,13 @@ class ChatService:
                         # CancelledError is a BaseException, so interrupts are
                         # unaffected. The lock is already held here, so the
                         # reporter is called directly.
+                        if reply_acc is not None:
+                            reply_acc.build()
                         if reply_msg is None:
                             # Failed before REPLY_START: nothing to close, so a
-                            # fresh reply carries the failure instead.
+                            # fresh reply carries the failure instead. It is
+                            # written directly, after the buffered input.
+                            await writer.maybe_flush(force=True)
                             await self._report_failure(
                                 user_id,
                                 session_id,
@@ -1205,10 +1471,14 @@ class ChatService:
                         # ``released`` cleanup below.
                         if reply_msg is not None:
                             reply_msgs.append(reply_msg)
+                            writer.add_message(reply_msg)
                         break
 
+                    if reply_acc is not None:
+                        reply_acc.build()
                     if reply_msg is not None:
                         reply_msgs.append(reply_msg)
+                        writer.add_message(reply_msg)
 
                     # Still holding the session lock: anything that
                     # landed in the inbox after this turn's last drain
@@ -1223,6 +1493,12 @@ class ChatService:
                         break
                     input_msg = None
 
+                    # Another turn follows: make the finished one durable
+                    # before starting it. The last turn is written with
+                    # the rest of the run below.
+                    writer.set_state(agent.state)
+                    await writer.maybe_flush(force=True)
+
             finally:
                 # An interrupt unwinds past the loop's own exit check, so
                 # the run may still be registered as the inbox consumer.
@@ -1240,10 +1516,13 @@ class ChatService:
                 # The last turn's reply is only in ``reply_msgs`` when the
                 # loop reached its own bookkeeping — an interrupt lands
                 # here instead, so add it now.
+                if reply_acc is not None:
+                    reply_acc.build()
                 if reply_msg is not None and (
                     not reply_msgs or reply_msgs[-1] is not reply_msg
                 ):
                     reply_msgs.append(reply_msg)
+                    writer.add_message(reply_msg)
 
                 # All persistence in a single coroutine, shielded from
                 # outer cancellation.  Must complete BEFORE the session
@@ -1252,18 +1531,8 @@ class ChatService:
                 # before this write lands.
                 async def _persist() -> None:
                     try:
-                        for msg in reply_msgs:
-                            await self._storage.upsert_message(
-                                user_id,
-                                session_id,
-                                msg,
-                            )
-                        await self._storage.update_session_state(
-                            user_id=user_id,
-                            agent_id=agent_id,
-                            session_id=session_id,
-                            state=agent.state,
-                        )
+                        writer.set_state(agent.state)
+                        await writer.flush()
                         await self._message_bus.log_trim(events_key)
                     finally:
                         # A worker whose turn died never reached
@@ -1301,6 +1570,39 @@ class ChatService:
                     await persist_task
                     raise
 
+    @staticmethod
+    async def _flush_run_writes(
+        writer: SessionWriteBehind,
+        event: AgentEvent,
+        reply_acc: MsgAccumulator | None,
+        agent: Agent,
+    ) -> None:
+        """Flush the buffered writes of a run after one of its events.
+
+        A model call starting on a reply that already has content is a
+        reasoning step following an acting step, i.e. a ReAct iteration
+        boundary: the reply so far and the agent state are written
+        then. Otherwise the size and time thresholds apply.
+
+        Args:
+            writer (`SessionWriteBehind`):
+                The write-behind buffer of the run.
+            event (`AgentEvent`):
+                The event just applied to the reply.
+            reply_acc (`MsgAccumulator | None`):
+                The accumulator of the reply, if it has started.
+            agent (`Agent`):
+                The agent running the reply.
+        """
+        if (
+            event.type == EventType.MODEL_CALL_START
+            and reply_acc is not None
+            and reply_acc.msg.content
+        ):
+            await writer.checkpoint(reply_acc.build(), agent.state)
+        else:
+            await writer.maybe_flush()
+
     async def _project_event(
         self,
         user_id: str,
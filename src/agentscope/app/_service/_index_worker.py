@@ -6,14 +6,33 @@ lifecycle.  Given a ``document_id`` it:
 
 1. acquires the processing lease via storage CAS (so only one worker
    in the cluster handles the document at a time);
-2. reads the bytes back from the blob store (streamed);
+2. spools the bytes from the blob store to a temporary file (streamed);
 3. routes to a parser by IANA media type;
-4. chunks the resulting sections;
-5. embeds + writes to the vector store through
+4. chunks each section as the parser yields it (for a
+   :attr:`~agentscope.rag.ChunkerBase.section_local` chunker), and
+   embeds the chunks in batches while the parser reads on;
+5. writes the chunks and vectors to the vector store through
    :class:`~agentscope.rag.KnowledgeBase`;
 6. transitions the status through ``parsing → chunking → indexing →
    ready`` (or ``error``) on the way.
 
+Streaming parsers (:attr:`ParserBase.streaming`, which all built-in
+parsers set) read the spooled file lazily and yield one page, slide or
+sheet at a time, so the worker never holds the raw file or the full
+section list, and the first embedding call starts while a large upload
+is still being parsed.  They run off the event loop: in the
+``parser_executor`` process pool when one is configured, with the
+sections handed back through a file in the same temporary directory,
+and otherwise in the default thread pool.  Other parsers receive the
+file bytes and return every section at once, as before.
+
+Uploads with the same content share a ``derived`` blob (see
+:attr:`KnowledgeDocumentData.derived_uri`), in which the worker caches
+the chunks per ``(parser, chunker config)`` and their vectors per
+embedding model.  A duplicate upload then skips steps 2-4 and, when its
+knowledge base embeds with the same model and dimensions, the embedding
+call as well.
+
 The worker is intentionally embeddable: a single instance can live
 inside the API process (embedded deployment) or inside a dedicated
 worker process (dedicated deployment).  Coordination across workers
@@ -22,26 +41,40 @@ know about each other.
 """
 import asyncio
 import contextlib
+import hashlib
+import io
+import json
 import mimetypes
+import os
+import tempfile
 from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
-from typing import Any, TYPE_CHECKING
+from typing import Any, AsyncIterator, TYPE_CHECKING
 
 from pydantic import ValidationError
 
 from ..._logging import logger
-from ...rag import ApproxTokenChunker
+from ...rag import ApproxTokenChunker, Chunk, Section
 
 if TYPE_CHECKING:
     from ..rag.blob_store import BlobStoreBase
     from ..rag.knowledge_base_manager import KnowledgeBaseManagerBase
-    from ..storage import KnowledgeBaseRecord, StorageBase
-    from ...rag import ChunkerBase, ParserBase, Section
+    from ..storage import (
+        KnowledgeBaseRecord,
+        KnowledgeDocumentRecord,
+        StorageBase,
+    )
+    from ...rag import ChunkerBase, KnowledgeBase, ParserBase
+    from ...types import Embedding
 
 # Read blob bytes in chunks bounded so the worker never holds the whole
 # file in memory at once even when the parser is byte-oriented.
 _READ_CHUNK = 1 << 20  # 1 MiB
 
+# How often the worker checks the file a pooled parser writes its
+# sections to.
+_POLL_INTERVAL = 0.05
+
 
 def _build_parser_registry(
     parsers: "list[ParserBase] | dict[str, ParserBase]",
@@ -123,6 +156,7 @@ class IndexWorker:
         max_concurrency: int = 4,
         lease_ttl: timedelta = timedelta(seconds=90),
         parser_executor: ProcessPoolExecutor | None = None,
+        embed_batch_size: int = 64,
         **kwargs: Any,
     ) -> None:
         """Initialize the worker.
@@ -170,11 +204,17 @@ class IndexWorker:
                 trip the sweeper.
             parser_executor (`ProcessPoolExecutor | None`, optional):
                 Process pool used to off-load CPU-intensive parses
-                (PDF, Office).  ``None`` runs parses in the event-loop
-                thread, which is fine for plain text but unsafe for
-                third-party byte-oriented parsers.  Injected so a
-                single pool can be shared across the app (built in
-                lifespan).
+                (PDF, Office).  Every parser runs there, streaming
+                parsers handing back their sections as they go.
+                ``None`` runs streaming parsers in the default thread
+                pool and other parsers in the event-loop thread, which
+                is fine for plain text but unsafe for third-party
+                byte-oriented parsers.  Injected so a single pool can
+                be shared across the app (built in lifespan).
+            embed_batch_size (`int`, defaults to ``64``):
+                Chunks per embedding call.  While a document is being
+                parsed, each full batch is embedded as soon as it is
+                chunked, one call in flight at a time.
             **kwargs (`Any`):
                 Deprecated. ``chunker`` (a shared chunker instance) is
                 still accepted for backward compatibility; only its
@@ -206,6 +246,7 @@ class IndexWorker:
         self._lease_ttl = lease_ttl
         self._sem = asyncio.Semaphore(max_concurrency)
         self._parser_executor = parser_executor
+        self._embed_batch_size = max(1, embed_batch_size)
         # Renewal cadence: refresh while there is still half the lease
         # left so a one-cycle missed renewal doesn't drop the lease.
         self._renew_interval = max(lease_ttl / 2, timedelta(seconds=5))
@@ -389,6 +430,32 @@ class IndexWorker:
                 f"No parser registered for media type {media_type!r}.",
             )
 
+        # Outputs cached by an earlier upload of the same content
+        derived = await self._load_derived(data.derived_uri)
+        dirty = False
+        chunks_key = _digest(
+            {
+                "parser": type(parser).__qualname__,
+                "media_type": media_type,
+                "chunker": type(chunker).chunker_type,
+                "parameters": chunker.parameters.model_dump(mode="json"),
+            },
+        )
+        vectors_key = _digest(
+            {
+                "chunks": chunks_key,
+                "embedding": kb_record.data.embedding_model_config.model_dump(
+                    mode="json",
+                    exclude={"credential_id"},
+                ),
+            },
+        )
+
+        knowledge = await self._manager.get_knowledge(
+            user_id,
+            knowledge_base_id,
+        )
+
         # ---- parsing ----
         await self._storage.update_knowledge_document_status(
             user_id,
@@ -396,8 +463,21 @@ class IndexWorker:
             document_id,
             "parsing",
         )
-        file_bytes = await self._read_blob(data.blob_uri)
-        sections = await self._parse(parser, file_bytes, data.filename)
+        cached_chunks = derived["chunks"].get(chunks_key)
+        if cached_chunks is None:
+            chunks, embeddings = await self._stream_chunks(
+                knowledge,
+                parser,
+                chunker,
+                data.blob_uri,
+                data.filename,
+            )
+            # Cache before indexing, which merges metadata into them
+            derived["chunks"][chunks_key] = [
+                chunk.model_dump(mode="json") for chunk in chunks
+            ]
+            derived["vectors"][vectors_key] = embeddings
+            dirty = True
 
         # ---- chunking ----
         await self._storage.update_knowledge_document_status(
@@ -406,7 +486,12 @@ class IndexWorker:
             document_id,
             "chunking",
         )
-        chunks = await chunker.chunk(sections)
+        if cached_chunks is not None:
+            chunks = [Chunk.model_validate(_) for _ in cached_chunks]
+            # The same bytes may have been uploaded under another name
+            for chunk in chunks:
+                chunk.source = data.filename
+            embeddings = derived["vectors"].get(vectors_key)
 
         # ---- indexing ----
         await self._storage.update_knowledge_document_status(
@@ -415,10 +500,6 @@ class IndexWorker:
             document_id,
             "indexing",
         )
-        knowledge = await self._manager.get_knowledge(
-            user_id,
-            knowledge_base_id,
-        )
         # A retry re-runs the whole pipeline. Records are keyed by
         # (document_id, chunk_index), so re-inserting overwrites in
         # place — but a re-parse that yields fewer chunks would leave
@@ -431,6 +512,13 @@ class IndexWorker:
         # ``chunk_index >= len(chunks)`` — needs a vector-store API that
         # deletes by more than ``document_id``, which is not worth a new
         # abstract method for a retry-only window.
+        if embeddings is None or len(embeddings) != len(chunks):
+            embeddings = await self._embed(knowledge, chunks)
+            derived["vectors"][vectors_key] = embeddings
+            dirty = True
+        if dirty and data.content_hash and data.derived_uri:
+            await self._save_derived(record, derived)
+
         await knowledge.delete_document(document_id)
         await knowledge.insert_document(
             chunks=chunks,
@@ -440,6 +528,7 @@ class IndexWorker:
                 "media_type": media_type,
                 "size_bytes": data.size,
             },
+            embeddings=embeddings,
         )
 
         # ---- ready ----
@@ -451,6 +540,181 @@ class IndexWorker:
             chunk_count=len(chunks),
         )
 
+    async def _stream_chunks(
+        self,
+        knowledge: "KnowledgeBase",
+        parser: "ParserBase",
+        chunker: "ChunkerBase",
+        blob_uri: str,
+        filename: str,
+    ) -> "tuple[list[Chunk], list[Embedding]]":
+        """Parse, chunk and embed a document as a pipeline.
+
+        With a :attr:`~ChunkerBase.section_local` chunker each section
+        is chunked as soon as the parser yields it, and every
+        ``embed_batch_size`` chunks are embedded while the parser reads
+        on, one call in flight at a time; the chunks are renumbered
+        across the document once the parser is done.  Any other chunker
+        is given the whole section list once the parser is done.
+
+        Returns:
+            `tuple[list[Chunk], list[Embedding]]`:
+                The chunks in document order and their vectors.
+        """
+        section_local = getattr(chunker, "section_local", False)
+        sections_left: "list[Section]" = []
+        chunks: list[Chunk] = []
+        embeddings: "list[Embedding]" = []
+        embedded = 0
+        in_flight: "asyncio.Task[list[Embedding]] | None" = None
+        try:
+            async with contextlib.aclosing(
+                self._iter_sections(parser, blob_uri, filename),
+            ) as sections:
+                async for section in sections:
+                    if not section_local:
+                        sections_left.append(section)
+                        continue
+                    chunks.extend(await chunker.chunk([section]))
+                    if len(chunks) - embedded < self._embed_batch_size:
+                        continue
+                    if in_flight is not None:
+                        embeddings.extend(await in_flight)
+                    in_flight = asyncio.create_task(
+                        self._embed(knowledge, chunks[embedded:]),
+                    )
+                    embedded = len(chunks)
+            if sections_left:
+                chunks.extend(await chunker.chunk(sections_left))
+            if in_flight is not None:
+                embeddings.extend(await in_flight)
+                in_flight = None
+            embeddings.extend(await self._embed(knowledge, chunks[embedded:]))
+        finally:
+            if in_flight is not None:
+                in_flight.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await in_flight
+
+        for index, chunk in enumerate(chunks):
+            chunk.chunk_index = index
+            chunk.total_chunks = len(chunks)
+        return chunks, embeddings
+
+    async def _iter_sections(
+        self,
+        parser: "ParserBase",
+        blob_uri: str,
+        filename: str,
+    ) -> AsyncIterator["Section"]:
+        """Yield the sections of a blob as the parser produces them.
+
+        A streaming parser reads the blob spooled to a temporary file,
+        in the process pool when one is configured; any other parser
+        gets the bytes and returns all its sections at once.
+        """
+        if not getattr(parser, "streaming", False):
+            file_bytes = await self._read_blob(blob_uri)
+            for section in await self._parse(parser, file_bytes, filename):
+                yield section
+            return
+
+        with tempfile.TemporaryDirectory(prefix="agentscope-index-") as tmp:
+            path = os.path.join(tmp, "source" + os.path.splitext(filename)[1])
+            await self._spool_blob(blob_uri, path)
+            if self._parser_executor is None:
+                async for section in parser.parse_stream(path, filename):
+                    yield section
+                return
+
+            sections_path = os.path.join(tmp, "sections.jsonl")
+            with open(sections_path, "wb"):
+                pass
+            future = asyncio.get_running_loop().run_in_executor(
+                self._parser_executor,
+                _stream_parser_sync,
+                parser,
+                path,
+                filename,
+                sections_path,
+            )
+            try:
+                async with contextlib.aclosing(
+                    _tail_sections(sections_path, future),
+                ) as sections:
+                    async for section in sections:
+                        yield section
+            finally:
+                # A parse already running finishes in its process; the
+                # directory goes away with its output
+                future.cancel()
+
+    async def _embed(
+        self,
+        knowledge: "KnowledgeBase",
+        chunks: list[Chunk],
+    ) -> "list[Embedding]":
+        """Embed the chunks with the knowledge base's embedding model, in
+        batches of ``embed_batch_size``."""
+        embeddings: "list[Embedding]" = []
+        for start in range(0, len(chunks), self._embed_batch_size):
+            response = await knowledge.embedding_model(
+                [
+                    chunk.content
+                    for chunk in chunks[start : start + self._embed_batch_size]
+                ],
+            )
+            embeddings.extend(response.embeddings)
+        return embeddings
+
+    async def _load_derived(self, derived_uri: str | None) -> dict:
+        """Read the cached outputs derived from a document's content.
+
+        A missing, empty or unreadable blob (e.g. one being rewritten
+        by a concurrent worker) reads as an empty cache — it only costs
+        a recomputation.
+        """
+        derived: dict = {}
+        if derived_uri:
+            try:
+                derived = json.loads(await self._read_blob(derived_uri))
+            except Exception:  # noqa: BLE001 — a cache miss
+                logger.warning(
+                    "Ignoring unreadable derived blob %s",
+                    derived_uri,
+                )
+        if not isinstance(derived, dict):
+            derived = {}
+        derived.setdefault("chunks", {})
+        derived.setdefault("vectors", {})
+        return derived
+
+    async def _save_derived(
+        self,
+        record: "KnowledgeDocumentRecord",
+        derived: dict,
+    ) -> None:
+        """Write the derived outputs back to the content's shared blob.
+
+        Best-effort: concurrent workers on the same content race
+        last-writer-wins, which can only drop a cache entry.
+        """
+        try:
+            await self._blob_store.write_stream(
+                # Records written before the key was recorded share the
+                # content blob of the owner and digest
+                key=record.data.derived_key
+                or _derived_key(
+                    f"kb-content/{record.user_id}/{record.data.content_hash}",
+                ),
+                stream=io.BytesIO(json.dumps(derived).encode("utf-8")),
+            )
+        except Exception:  # noqa: BLE001 — cache write only
+            logger.exception(
+                "Failed to cache the derived outputs of %s",
+                record.id,
+            )
+
     async def _parse(
         self,
         parser: "ParserBase",
@@ -508,12 +772,10 @@ class IndexWorker:
     async def _read_blob(self, blob_uri: str) -> bytes:
         """Stream the blob into memory in bounded chunks.
 
-        We buffer the whole file before handing it to the parser
-        because today's parser API is byte-oriented (``parse(file:
-        bytes, filename: str)``).  The read loop still avoids large
-        single allocations and gives us a single place to upgrade to a
-        true streaming parser API later — only this method needs to
-        change.
+        Used for the derived-output cache and for parsers that are not
+        streaming, whose API is byte-oriented (``parse(file: bytes,
+        filename: str)``).  The read loop still avoids large single
+        allocations.
         """
         buffer = bytearray()
         async with self._blob_store.open(blob_uri) as fp:
@@ -524,6 +786,17 @@ class IndexWorker:
                 buffer.extend(chunk)
         return bytes(buffer)
 
+    async def _spool_blob(self, blob_uri: str, path: str) -> None:
+        """Copy the blob to a local file in bounded chunks, for a
+        streaming parser to read lazily."""
+        with open(path, "wb") as out:
+            async with self._blob_store.open(blob_uri) as fp:
+                while True:
+                    chunk = await fp.read(_READ_CHUNK)
+                    if not chunk:
+                        break
+                    await asyncio.to_thread(out.write, chunk)
+
     # ------------------------------------------------------------------
     # Lease heartbeat
     # ------------------------------------------------------------------
@@ -608,6 +881,23 @@ class IndexWorker:
 # ----------------------------------------------------------------------
 
 
+def _content_key(owner_id: str, content_hash: str, document_id: str) -> str:
+    """The blob key of content first stored for a document, which the
+    owner's later uploads with the same digest share."""
+    return f"kb-content/{owner_id}/{content_hash}/{document_id}"
+
+
+def _derived_key(content_key: str) -> str:
+    """The blob key caching the outputs derived from shared content."""
+    return f"{content_key}.derived"
+
+
+def _digest(obj: Any) -> str:
+    """Hash a JSON-serialisable configuration into a cache key."""
+    payload = json.dumps(obj, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def _run_parser_sync(
     parser: "ParserBase",
     file_bytes: bytes,
@@ -617,6 +907,46 @@ def _run_parser_sync(
     return asyncio.run(parser.parse(file_bytes, filename))
 
 
+def _stream_parser_sync(
+    parser: "ParserBase",
+    path: str,
+    filename: str,
+    sections_path: str,
+) -> int:
+    """Run a streaming parser inside a sync executor, appending each
+    section to ``sections_path`` as one JSON line as soon as it is
+    parsed.  Returns the number of sections."""
+    count = 0
+    with open(sections_path, "ab") as out:
+        for section in parser.iter_sections(path, filename):
+            out.write(section.model_dump_json().encode("utf-8") + b"\n")
+            out.flush()
+            count += 1
+    return count
+
+
+async def _tail_sections(
+    sections_path: str,
+    future: "asyncio.Future[int]",
+) -> AsyncIterator[Section]:
+    """Yield the sections :func:`_stream_parser_sync` writes, as they
+    are written, until the parse completes; re-raises its error."""
+    with open(sections_path, "rb") as fp:
+        pending = b""
+        while True:
+            done = future.done()
+            data = fp.read(_READ_CHUNK)
+            if data:
+                *lines, pending = (pending + data).split(b"\n")
+                for line in lines:
+                    yield Section.model_validate_json(line)
+            elif done:
+                break
+            else:
+                await asyncio.sleep(_POLL_INTERVAL)
+    await future
+
+
 def _sanitise_error(exc: BaseException) -> str:
     """Reduce an exception to a single user-facing line.
 
@@ -17,6 +17,8 @@ with service-mode listing would leave records out of sync, and the
 project's stance is that a knowledge base is managed end-to-end in one
 mode.
 """
+import hashlib
+import io
 import uuid
 from collections import Counter
 from typing import IO, TYPE_CHECKING, AsyncIterator
@@ -37,6 +39,7 @@ from ..storage import (
 from ..._logging import logger
 from ...rag import ApproxTokenChunker, Chunk
 from .._bus_ops import enqueue_index_task
+from ._index_worker import _content_key, _derived_key
 from ._access import (
     KnowledgeBaseStatusCounts,
     KnowledgeBaseView,
@@ -54,6 +57,31 @@ if TYPE_CHECKING:
     )
     from ...rag import ChunkerBase, VectorSearchResult
 
+# Hash uploads in bounded reads, matching the blob store's copy size.
+_HASH_CHUNK = 1 << 20  # 1 MiB
+
+
+class _HashingReader:
+    """Wrap a binary stream, hashing the bytes as they are read."""
+
+    def __init__(self, stream: IO[bytes], digest: "hashlib._Hash") -> None:
+        self._stream = stream
+        self._digest = digest
+
+    def read(self, n: int = -1) -> bytes:
+        """Read up to ``n`` bytes and feed them to the digest."""
+        chunk = self._stream.read(n)
+        self._digest.update(chunk)
+        return chunk
+
+
+def _seekable(stream: IO[bytes]) -> bool:
+    """Whether the stream can be rewound after hashing it."""
+    try:
+        return bool(stream.seekable())
+    except (AttributeError, ValueError):
+        return False
+
 
 class KnowledgeBaseService:
     """HTTP service for knowledge bases.
@@ -334,15 +362,14 @@ class KnowledgeBaseService:
         Documents under the KB are cascade-deleted at the storage
         layer; blob files referenced by those records are released
         best-effort here so disk space is reclaimed even though the
-        manager + storage cascade would otherwise orphan them.
+        manager + storage cascade would otherwise orphan them.  Blobs
+        shared with documents of other knowledge bases are kept.
         """
         owner_id = await self._require_edit(user_id, knowledge_base_id)
         documents = await self._storage.list_knowledge_documents(
             owner_id,
             knowledge_base_id,
         )
-        for document in documents:
-            await self._delete_blob_quietly(document.data.blob_uri)
 
         deleted = await self._manager.delete_knowledge_base(
             owner_id,
@@ -353,6 +380,7 @@ class KnowledgeBaseService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Knowledge base {knowledge_base_id!r} not found.",
             )
+        await self._release_blobs(owner_id, documents)
 
     # ------------------------------------------------------------------
     # Document management
@@ -376,6 +404,15 @@ class KnowledgeBaseService:
         from here and the client tracks progress via
         :meth:`get_document_status`.
 
+        Uploads are content-addressed per owner: the bytes are hashed
+        first, and a document whose content the owner already uploaded
+        (to any of their knowledge bases) shares the existing blob and
+        the worker's cached parse / chunk / embedding outputs instead
+        of storing and indexing another copy.  Content is never shared
+        across owners, so a digest cannot reveal another user's files.
+        A stream that cannot be rewound is hashed while it is written
+        and stored under its own key.
+
         Args:
             user_id (`str`):
                 The owner user id.
@@ -408,11 +445,6 @@ class KnowledgeBaseService:
         owner_id = await self._require_edit(user_id, knowledge_base_id)
 
         document_id = uuid.uuid4().hex
-        blob_uri = await self._blob_store.write_stream(
-            key=f"kb/{knowledge_base_id}/{document_id}",
-            stream=stream,
-        )
-
         record = KnowledgeDocumentRecord(
             id=document_id,
             user_id=owner_id,
@@ -421,19 +453,10 @@ class KnowledgeBaseService:
                 filename=filename,
                 size=size,
                 content_type=content_type,
-                blob_uri=blob_uri,
+                blob_uri="",
             ),
         )
-        try:
-            stored = await self._storage.upsert_knowledge_document(
-                owner_id,
-                record,
-            )
-        except Exception:
-            # Storage write failed — drop the blob so the orphan
-            # sweeper doesn't later see a referenced-by-nobody file.
-            await self._delete_blob_quietly(blob_uri)
-            raise
+        stored = await self._store_document(record, stream)
 
         await enqueue_index_task(
             self._bus,
@@ -798,7 +821,7 @@ class KnowledgeBaseService:
             knowledge_base_id,
             document_id,
         )
-        await self._delete_blob_quietly(record.data.blob_uri)
+        await self._release_blobs(owner_id, [record])
 
     # ------------------------------------------------------------------
     # Search
@@ -886,6 +909,131 @@ class KnowledgeBaseService:
                 detail=str(exc),
             ) from exc
 
+    async def _store_document(
+        self,
+        record: KnowledgeDocumentRecord,
+        stream: IO[bytes],
+    ) -> KnowledgeDocumentRecord:
+        """Store an upload's bytes and persist its record, sharing the
+        blobs of the owner's earlier upload of the same content.
+
+        Args:
+            record (`KnowledgeDocumentRecord`):
+                The new record with the upload metadata; the content
+                fields (``blob_uri``, ``content_hash``, ``derived_uri``,
+                ``derived_key``) are filled in here.
+            stream (`IO[bytes]`):
+                The uploaded bytes.
+
+        Returns:
+            `KnowledgeDocumentRecord`:
+                The persisted record.
+        """
+        owner_id = record.user_id
+        data = record.data
+        digest = hashlib.sha256()
+        if not _seekable(stream):
+            data.blob_uri = await self._blob_store.write_stream(
+                key=f"kb/{record.knowledge_base_id}/{record.id}",
+                stream=_HashingReader(stream, digest),  # type: ignore
+            )
+            data.content_hash = digest.hexdigest()
+            return await self._persist_document(record)
+
+        start = stream.tell()
+        while chunk := stream.read(_HASH_CHUNK):
+            digest.update(chunk)
+        stream.seek(start)
+        data.content_hash = digest.hexdigest()
+
+        for (
+            document
+        ) in await self._storage.list_knowledge_documents_by_content(
+            owner_id,
+            data.content_hash,
+        ):
+            if not document.data.derived_uri:
+                continue
+            data.blob_uri = document.data.blob_uri
+            data.derived_uri = document.data.derived_uri
+            data.derived_key = document.data.derived_key
+            # Fails when the document was deleted since the lookup and
+            # its blobs may be released
+            if await self._storage.insert_shared_knowledge_document(
+                owner_id,
+                record,
+            ):
+                return record
+
+        # Keyed by this document, so that a release of an earlier copy
+        # racing this upload cannot delete it
+        content_key = _content_key(owner_id, data.content_hash, record.id)
+        data.blob_uri = await self._blob_store.write_stream(
+            key=content_key,
+            stream=stream,
+        )
+        # Reserve the blob the worker caches its outputs in
+        data.derived_key = _derived_key(content_key)
+        data.derived_uri = await self._blob_store.write_stream(
+            key=data.derived_key,
+            stream=io.BytesIO(b"{}"),
+        )
+        return await self._persist_document(record)
+
+    async def _persist_document(
+        self,
+        record: KnowledgeDocumentRecord,
+    ) -> KnowledgeDocumentRecord:
+        """Persist the record of an upload whose blobs it owns."""
+        try:
+            return await self._storage.upsert_knowledge_document(
+                record.user_id,
+                record,
+            )
+        except Exception:
+            # Storage write failed — drop the blob so the orphan
+            # sweeper doesn't later see a referenced-by-nobody file.
+            await self._release_blobs(record.user_id, [record])
+            raise
+
+    async def _release_blobs(
+        self,
+        owner_id: str,
+        documents: list[KnowledgeDocumentRecord],
+    ) -> None:
+        """Delete the blobs of removed documents that no remaining
+        document of the owner references.
+
+        Call after the records are gone.  Content blobs may be shared,
+        so they are only deleted with their last reference, looked up
+        by digest.  An upload takes its reference to a shared blob with
+        ``insert_shared_knowledge_document``, atomically with checking
+        that another document still holds one, so a blob released here
+        is never reused.
+        """
+        uris = {
+            uri
+            for document in documents
+            for uri in (document.data.blob_uri, document.data.derived_uri)
+            if uri
+        }
+        content_hashes = {
+            document.data.content_hash
+            for document in documents
+            if document.data.derived_uri and document.data.content_hash
+        }
+        for content_hash in content_hashes:
+            for (
+                document
+            ) in await self._storage.list_knowledge_documents_by_content(
+                owner_id,
+                content_hash,
+            ):
+                uris.discard(document.data.blob_uri)
+                uris.discard(document.data.derived_uri)
+        for uri in uris:
+            await self._delete_blob_quietly(uri)
+
     async def _delete_blob_quietly(self, blob_uri: str) -> None:
         """Best-effort blob delete — swallow backend errors.
 
@@ -3,7 +3,7 @@
 from ._access import ResourceAccessService
 from ..storage import ChatModelConfig
 from ...credential import CredentialFactory
-from ...model import ChatModelBase
+from ...model import ChatModelBase, RateLimiterBase, RateLimitPriority
 from ..._logging import logger
 
 
@@ -11,6 +11,8 @@ async def get_model(
     user_id: str,
     config: ChatModelConfig,
     access: ResourceAccessService,
+    rate_limiter: RateLimiterBase | None = None,
+    rate_limit_priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
 ) -> ChatModelBase:
     """Build a chat model instance from a stored credential and config.
 
@@ -29,6 +31,12 @@ async def get_model(
             The chat model configuration.
         access (`ResourceAccessService`):
             Injected resource access service.
+        rate_limiter (`RateLimiterBase | None`, optional):
+            The rate limiter admitting the model's calls. ``None``
+            leaves the calls unlimited.
+        rate_limit_priority (`RateLimitPriority`, defaults to \
+         `RateLimitPriority.INTERACTIVE`):
+            The admission priority of the model's calls.
 
     Returns:
         `ChatModelBase`:
@@ -56,6 +64,8 @@ async def get_model(
         model=config.model,
         parameters=parameters,
     )
+    model.rate_limiter = rate_limiter
+    model.rate_limit_priority = rate_limit_priority
 
     # Override the formatter's input types with the built-in model card's
     # when one matches; custom models have no card, so keep the default.
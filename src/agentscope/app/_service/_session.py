@@ -48,6 +48,7 @@ imports the bus; bus code never imports storage.
 import asyncio
 from enum import StrEnum
 
+from .._bus_ops import publish_assembly_invalidation
 from ..message_bus import MessageBus, MessageBusKeys
 from ..storage import StorageBase
 from ..workspace_manager import WorkspaceManagerBase
@@ -650,7 +651,8 @@ class SessionService:
         return [m.session_id for m in members]
 
     async def _purge_session_bus(self, session_id: str) -> None:
-        """Drop all per-session bus state for one session."""
+        """Drop all per-session bus state for one session, and its
+        cached agent assembly on every node."""
         await self._bus.log_trim(
             MessageBusKeys.session_events(session_id),
         )
@@ -660,6 +662,10 @@ class SessionService:
         await self._bus.registry_drop(
             MessageBusKeys.bg_tasks(session_id),
         )
+        await publish_assembly_invalidation(
+            self._bus,
+            session_id=session_id,
+        )
 
     async def _purge_subagent_hitl(
         self,
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""Write-behind persistence of the messages and state of one chat run.
+
+A chat run buffers its message upserts and state updates in a
+:class:`SessionWriteBehind` instead of writing each one through, and
+the buffer writes everything pending with one
+:meth:`StorageBase.write_session_batch` call: one transaction on SQL
+backends, one ``MULTI`` pipeline on Redis.
+
+Durability
+----------
+A flush returns once the batch is committed; what was buffered before a
+successful flush survives a crash. The run flushes:
+
+- the input messages of a turn before its reply starts, raising on
+  failure as the direct writes did, so they are listed and durable
+  while the reply streams;
+- at each ReAct iteration boundary, when a reasoning step follows an
+  acting step, with the reply so far and the agent state;
+- between two turns, with the finished turn's reply and the agent
+  state;
+- when ``max_pending`` writes are buffered, or when the oldest one has
+  waited ``flush_interval`` seconds;
+- before the run writes a message outside the buffer, so the session
+  keeps its message order;
+- when the run ends, before the session lock is released, as the
+  direct writes did.
+
+A one-turn run thus makes one batched write for its input, one per
+tool-using iteration and one for its reply and the state, where it made
+one write per message plus one for the state. A message the run reads
+back is looked up in the buffer first.
+
+A process crash therefore loses the buffered writes since the last
+flush: at most the iteration in flight of the reply, with the writes
+of the last ``flush_interval`` seconds. A failed opportunistic flush is
+logged and keeps its writes buffered for the next one; the input and
+final flushes raise.
+"""
+import time
+from typing import TYPE_CHECKING
+
+from ..._logging import logger
+
+if TYPE_CHECKING:
+    from ..storage import StorageBase
+    from ...message import Msg
+    from ...state import AgentState
+
+
+class SessionWriteBehind:
+    """Buffers the message upserts and state updates of one session.
+
+    Upserts of the same message id are coalesced: the buffer keeps the
+    latest message object in the position of its first upsert, so a
+    message rewritten many times before a flush is written once. The
+    state is written as of the flush.
+
+    Args:
+        storage (`StorageBase`):
+            The storage the writes go to.
+        user_id (`str`):
+            The owner of the session.
+        agent_id (`str`):
+            The agent of the session.
+        session_id (`str`):
+            The session written to.
+        max_pending (`int`, defaults to `64`):
+            The buffered writes that trigger a flush.
+        flush_interval (`float`, defaults to `1.0`):
+            Seconds the oldest buffered write may wait before
+            :meth:`maybe_flush` flushes it.
+    """
+
+    def __init__(
+        self,
+        storage: "StorageBase",
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+        max_pending: int = 64,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Bind the session.
+
+        Args:
+            storage (`StorageBase`):
+                The storage the writes go to.
+            user_id (`str`):
+                The owner of the session.
+            agent_id (`str`):
+                The agent of the session.
+            session_id (`str`):
+                The session written to.
+            max_pending (`int`, defaults to `64`):
+                The buffered writes that trigger a flush.
+            flush_interval (`float`, defaults to `1.0`):
+                Seconds the oldest buffered write may wait before
+                :meth:`maybe_flush` flushes it.
+        """
+        self._storage = storage
+        self._user_id = user_id
+        self._agent_id = agent_id
+        self._session_id = session_id
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self._messages: dict[str, "Msg"] = {}
+        self._state: "AgentState | None" = None
+        self._oldest: float | None = None
+        self._flushes = 0
+        self._coalesced = 0
+
+    @property
+    def pending(self) -> int:
+        """The buffered writes, the state counting as one."""
+        return len(self._messages) + (self._state is not None)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The flushes made, the upserts coalesced into a buffered one,
+        and the writes pending."""
+        return {
+            "flushes": self._flushes,
+            "coalesced": self._coalesced,
+            "pending": self.pending,
+        }
+
+    def get_message(self, message_id: str) -> "Msg | None":
+        """Return a buffered message.
+
+        Args:
+            message_id (`str`):
+                The message id.
+
+        Returns:
+            `Msg | None`:
+                The buffered message, or ``None`` if none is pending.
+        """
+        return self._messages.get(message_id)
+
+    def add_message(self, msg: "Msg") -> None:
+        """Buffer a message upsert.
+
+        Args:
+            msg (`Msg`):
+                The message to persist.
+        """
+        if msg.id in self._messages:
+            self._coalesced += 1
+        self._messages[msg.id] = msg
+        self._touch()
+
+    def set_state(self, state: "AgentState") -> None:
+        """Buffer a state update.
+
+        Args:
+            state (`AgentState`):
+                The agent state to persist.
+        """
+        self._state = state
+        self._touch()
+
+    def _touch(self) -> None:
+        """Start the wait of the oldest buffered write."""
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+
+    async def checkpoint(self, msg: "Msg", state: "AgentState") -> None:
+        """Buffer the reply in progress and the state, and flush them.
+
+        Called at an iteration boundary; like :meth:`maybe_flush`, a
+        failure is logged and the writes stay buffered.
+
+        Args:
+            msg (`Msg`):
+                The reply so far.
+            state (`AgentState`):
+                The agent state.
+        """
+        self.add_message(msg)
+        self.set_state(state)
+        await self.maybe_flush(force=True)
+
+    async def maybe_flush(self, force: bool = False) -> None:
+        """Flush when the size or time threshold is reached.
+
+        A failure is logged and the writes stay buffered for the next
+        flush, so a storage hiccup does not fail the turn.
+
+        Args:
+            force (`bool`, defaults to `False`):
+                Flush whatever is buffered, regardless of the thresholds.
+        """
+        if self._oldest is None:
+            return
+        if (
+            not force
+            and self.pending < self.max_pending
+            and time.monotonic() - self._oldest < self.flush_interval
+        ):
+            return
+        try:
+            await self.flush()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(
+                "Write-behind flush failed for session %r; retrying at "
+                "the next flush.",
+                self._session_id,
+            )
+
+    async def flush(self) -> None:
+        """Write everything buffered in one batch.
+
+        On failure the writes are put back, behind any buffered since,
+        and the error is raised.
+        """
+        if self._oldest is None:
+            return
+        messages, state = self._messages, self._state
+        self._messages, self._state, self._oldest = {}, None, None
+        try:
+            await self._storage.write_session_batch(
+                self._user_id,
+                self._agent_id,
+                self._session_id,
+                list(messages.values()),
+                state,
+            )
+        except BaseException:
+            messages.update(self._messages)
+            self._messages = messages
+            self._state = self._state or state
+            self._touch()
+            raise
+        self._flushes += 1
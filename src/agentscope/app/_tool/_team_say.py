@@ -7,7 +7,7 @@ from pydantic import Field
 
 from ._constants import HANDLE_LEN
 from ._team_tool_base import _TeamToolBase
-from .._bus_ops import deliver_to_inbox
+from .._bus_ops import deliver_to_inboxes
 from ..storage._utils import _ensure_team_members, _resolve_team_leader
 from ...message import HintBlock, TextBlock, ToolResultState
 from ...tool import ToolChunk, ParamsBase
@@ -128,7 +128,8 @@ class TeamSay(_TeamToolBase):
         Reads the current session record from storage to resolve the
         team_id (the agent's team membership may have changed since
         agent assembly), builds the team's (agent_id, session_id)
-        directory, and pushes a HintBlock + wakeup to each recipient.
+        directory from one batched agent read, and pushes a HintBlock
+        + wakeup to every recipient in one batched delivery.
 
         Args:
             content (`str`):
@@ -187,11 +188,13 @@ class TeamSay(_TeamToolBase):
                 self._user_id,
                 team,
             )
-            for member in members:
-                member_agent = await self._storage.get_agent(
-                    member.owner_id,
-                    member.agent_id,
-                )
+            # One batched read resolves every member and the sender.
+            agents = await self._storage.get_agents(
+                [(member.owner_id, member.agent_id) for member in members]
+                + [(self._user_id, self._agent_id)],
+            )
+            sender_agent = agents.pop()
+            for member, member_agent in zip(members, agents):
                 if member_agent is None:
                     continue
                 if member.role == "invited":
@@ -255,11 +258,6 @@ class TeamSay(_TeamToolBase):
                     )
                 recipients = [(target_session_id, target_agent_id)]
 
-            # Resolve sender display name once.
-            sender_agent = await self._storage.get_agent(
-                self._user_id,
-                self._agent_id,
-            )
             sender_name = (
                 sender_agent.data.name
                 if sender_agent is not None
@@ -279,14 +277,12 @@ class TeamSay(_TeamToolBase):
             )
             payload = hint.model_dump(mode="json")
 
-            for sid, aid in recipients:
-                await deliver_to_inbox(
-                    self._message_bus,
-                    user_id=self._user_id,
-                    session_id=sid,
-                    agent_id=aid,
-                    payload=payload,
-                )
+            await deliver_to_inboxes(
+                self._message_bus,
+                user_id=self._user_id,
+                recipients=recipients,
+                payload=payload,
+            )
 
             count = len(recipients)
             target = "broadcast" if to is None else f"member {to!r}"
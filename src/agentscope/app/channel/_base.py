@@ -22,15 +22,9 @@ from typing import Any, AsyncIterator, Awaitable, Callable, TYPE_CHECKING
 from pydantic import BaseModel, Field, TypeAdapter
 
 from ...event import AgentEvent
-from ...message import (
-    DataBlock,
-    Msg,
-    TextBlock,
-    ThinkingBlock,
-    ToolCallBlock,
-    ToolResultBlock,
-)
+from ...message import DataBlock, Msg, TextBlock
 from ...types import ReplyFinishedReason
+from ._render import _render_block
 
 if TYPE_CHECKING:
     from ...tool import ToolBase
@@ -355,19 +349,12 @@ class ChannelBase(ABC):
         parts: list[str] = []
         data: list[DataBlock] = []
         for block in reply.content:
-            if isinstance(block, TextBlock):
-                parts.append(block.text)
-            elif isinstance(block, DataBlock):
+            if isinstance(block, DataBlock):
                 data.append(block)
-            elif isinstance(block, ThinkingBlock):
-                if show_thinking:
-                    parts.append(f"\n💭 {block.thinking}\n")
-            elif isinstance(block, ToolCallBlock):
-                if show_tool_process:
-                    parts.append(f"\n🔧 Calling tool: {block.name}\n")
-            elif isinstance(block, ToolResultBlock):
-                if show_tool_process and isinstance(block.output, str):
-                    parts.append(block.output)
+                continue
+            part = _render_block(block, show_thinking, show_tool_process)
+            if part is not None:
+                parts.append(part)
         text = "".join(parts).strip()
         if reply.finished_reason == ReplyFinishedReason.ERROR:
             text = text or _AGENT_ERROR_REPLY
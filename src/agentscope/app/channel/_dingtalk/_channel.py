@@ -20,15 +20,7 @@ from pydantic import BaseModel, Field
 
 from ...._logging import logger
 from ....event import ReplyEndEvent, RequireUserConfirmEvent
-from ....message import (
-    Base64Source,
-    DataBlock,
-    Msg,
-    TextBlock,
-    ThinkingBlock,
-    ToolCallBlock,
-    ToolResultBlock,
-)
+from ....message import Base64Source, DataBlock, TextBlock
 from .._base import (
     ChannelBase,
     ChannelCapability,
@@ -38,6 +30,7 @@ from .._base import (
     ChatKind,
     _EVENT_ADAPTER,
 )
+from .._render import StreamingRenderer
 from ._card import (
     _approval_card_data,
     _parse_card_callback,
@@ -56,6 +49,7 @@ _MAX_LEN = 4000
 _MARKDOWN_TITLE = "AgentScope"
 _STATUS_POLL_INTERVAL = 0.2
 _STREAM_MIN_INTERVAL = 0.3
+_STREAM_MAX_INTERVAL = 3.0
 _STREAM_MAX_CONTENT_BYTES = 1024
 _STREAM_FALLBACK_NOTICE = (
     "Streaming stopped. The complete reply follows as a Markdown message."
@@ -283,46 +277,32 @@ class DingTalkChannel(ChannelBase):
             event (`ChannelEvent`): The DingTalk reply target.
             events (`AsyncIterator[dict]`): The run's streamed Agent events.
         """
-        reply: Msg | None = None
+        renderer = StreamingRenderer(
+            _STREAM_MIN_INTERVAL,
+            _STREAM_MAX_INTERVAL,
+            show_thinking=self._config.show_thinking,
+            show_tool_process=self._config.show_tool_process,
+        )
         confirm: RequireUserConfirmEvent | None = None
         stream_ref: str | None = None
         stream_failed = False
-        last_stream_update = 0.0
         async for raw in events:
             agent_event = _EVENT_ADAPTER.validate_python(raw)
             if isinstance(agent_event, RequireUserConfirmEvent):
                 confirm = agent_event
                 break
-            reply_id = getattr(agent_event, "reply_id", None)
-            if reply_id is not None:
-                if reply is None:
-                    reply = Msg(
-                        name="assistant",
-                        role="assistant",
-                        content=[],
-                    )
-                    reply.id = reply_id
-                reply.append_event(agent_event)
+            renderer.feed(agent_event)
             if isinstance(agent_event, ReplyEndEvent):
                 break
 
+            # Only render once the card is due for an update
             if (
                 not self.capabilities.streaming
                 or stream_failed
-                or reply is None
-                or not self._has_streaming_text(reply)
+                or not renderer.due()
             ):
                 continue
-            rendered = self._render(
-                reply,
-                show_thinking=self._config.show_thinking,
-                show_tool_process=self._config.show_tool_process,
-            )
-            text = "".join(
-                block.text
-                for block in rendered
-                if isinstance(block, TextBlock)
-            )
+            text = renderer.render()
             if not text:
                 continue
             if not self._fits_streaming_card(text):
@@ -333,15 +313,12 @@ class DingTalkChannel(ChannelBase):
                 if stream_ref is None:
                     stream_failed = True
                     continue
-            now = time.monotonic()
-            if now - last_stream_update >= _STREAM_MIN_INTERVAL:
-                last_stream_update = now
-                if not await self._update_streaming_card(
-                    stream_ref,
-                    text,
-                ):
-                    stream_failed = True
+            started = time.monotonic()
+            if not await self._update_streaming_card(stream_ref, text):
+                stream_failed = True
+            renderer.record_update(time.monotonic() - started)
 
+        reply = renderer.reply
         blocks = self._render(
             reply,
             show_thinking=self._config.show_thinking,
@@ -368,31 +345,6 @@ class DingTalkChannel(ChannelBase):
         """Whether a full Markdown update fits DingTalk's request limit."""
         return len(text.encode("utf-8")) <= _STREAM_MAX_CONTENT_BYTES
 
-    def _has_streaming_text(self, reply: Msg) -> bool:
-        """Whether the partial reply contains text enabled for display."""
-        for block in reply.content:
-            if isinstance(block, TextBlock) and block.text.strip():
-                return True
-            if (
-                isinstance(block, ThinkingBlock)
-                and self._config.show_thinking
-                and block.thinking.strip()
-            ):
-                return True
-            if (
-                isinstance(block, ToolCallBlock)
-                and self._config.show_tool_process
-            ):
-                return True
-            if (
-                isinstance(block, ToolResultBlock)
-                and self._config.show_tool_process
-                and isinstance(block.output, str)
-                and block.output.strip()
-            ):
-                return True
-        return False
-
     async def _open_streaming_card(self, chat_id: str) -> str | None:
         """Create and deliver a configured AI streaming card."""
         if self._openapi is None:
@@ -20,7 +20,13 @@ from pydantic import BaseModel, Field
 
 from ...._logging import logger
 from ....event import ReplyEndEvent, RequireUserConfirmEvent
-from ....message import Base64Source, DataBlock, Msg, TextBlock
+from ....message import (
+    Base64Source,
+    DataBlock,
+    Msg,
+    MsgAccumulator,
+    TextBlock,
+)
 from .._base import (
     ChannelBase,
     ChannelCapability,
@@ -321,6 +327,7 @@ class DiscordChannel(ChannelBase):
         if channel is None:
             return
         reply: Msg | None = None
+        accumulator: MsgAccumulator | None = None
         confirm: RequireUserConfirmEvent | None = None
         async for raw in events:
             evt = _EVENT_ADAPTER.validate_python(raw)
@@ -329,12 +336,15 @@ class DiscordChannel(ChannelBase):
                 break
             reply_id = getattr(evt, "reply_id", None)
             if reply_id is not None:
-                if reply is None:
+                if accumulator is None:
                     reply = Msg(name="assistant", role="assistant", content=[])
                     reply.id = reply_id
-                reply.append_event(evt)
+                    accumulator = MsgAccumulator(reply)
+                accumulator.append_event(evt)
             if isinstance(evt, ReplyEndEvent):
                 break
+        if accumulator is not None:
+            accumulator.build()
         for block in self._render(
             reply,
             show_thinking=self._config.show_thinking,
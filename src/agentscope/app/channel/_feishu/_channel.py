@@ -23,7 +23,7 @@ from pydantic import BaseModel, Field
 
 from ...._logging import logger
 from ....event import ReplyEndEvent, RequireUserConfirmEvent
-from ....message import Base64Source, DataBlock, Msg, TextBlock
+from ....message import Base64Source, DataBlock, TextBlock
 from .._base import (
     ChannelBase,
     ChannelCapability,
@@ -33,6 +33,7 @@ from .._base import (
     ChatKind,
     _EVENT_ADAPTER,
 )
+from .._render import StreamingRenderer
 from ._card_templates import (
     _build_action_response,
     _build_approval_card,
@@ -56,6 +57,7 @@ _MEDIA_TYPES = frozenset({"image", "audio", "media", "file"})
 _STREAM_ELEMENT_ID = "md"
 # Minimum seconds between live streaming-card updates (throttle).
 _STREAM_MIN_INTERVAL = 0.7
+_STREAM_MAX_INTERVAL = 3.0
 
 
 class _ThreadLoopProxy:
@@ -662,34 +664,27 @@ class FeishuChannel(ChannelBase):
             event (`ChannelEvent`): The send target (chat id).
             events (`AsyncIterator[dict]`): The run's session events.
         """
-        reply: Msg | None = None
+        renderer = StreamingRenderer(
+            _STREAM_MIN_INTERVAL,
+            _STREAM_MAX_INTERVAL,
+            show_thinking=self._config.show_thinking,
+            show_tool_process=self._config.show_tool_process,
+        )
         confirm: RequireUserConfirmEvent | None = None
         ref: str | None = None
         failed = False
-        last = 0.0
         async for raw in events:
             evt = _EVENT_ADAPTER.validate_python(raw)
             if isinstance(evt, RequireUserConfirmEvent):
                 confirm = evt
                 break
-            reply_id = getattr(evt, "reply_id", None)
-            if reply_id is not None:
-                if reply is None:
-                    reply = Msg(name="assistant", role="assistant", content=[])
-                    reply.id = reply_id
-                reply.append_event(evt)
+            renderer.feed(evt)
             if isinstance(evt, ReplyEndEvent):
                 break
-            if failed or reply is None:
+            # Only render once the card is due for an update
+            if failed or not renderer.due():
                 continue
-            rendered = self._render(
-                reply,
-                show_thinking=self._config.show_thinking,
-                show_tool_process=self._config.show_tool_process,
-            )
-            text = "".join(
-                b.text for b in rendered if isinstance(b, TextBlock)
-            )
+            text = renderer.render()
             if not text:
                 continue
             if ref is None:
@@ -697,10 +692,10 @@ class FeishuChannel(ChannelBase):
                 if ref is None:
                     failed = True
                     continue
-            now = time.monotonic()
-            if now - last >= _STREAM_MIN_INTERVAL:
-                last = now
-                await self._card_push(ref, text)
+            started = time.monotonic()
+            await self._card_push(ref, text)
+            renderer.record_update(time.monotonic() - started)
+        reply = renderer.reply
         blocks = self._render(
             reply,
             show_thinking=self._config.show_thinking,
@@ -22,7 +22,7 @@ from ..._logging import logger
 from ...message import DataBlock, HintBlock, TextBlock, UserMsg
 from ...permission import PermissionContext, PermissionMode
 from ...state import AgentState
-from .._bus_ops import enqueue_run_trigger
+from .._bus_ops import enqueue_run_trigger, signal_inbox
 from ..message_bus import MessageBus, MessageBusKeys
 from ..storage import (
     ChannelRecord,
@@ -171,6 +171,7 @@ class ChannelGateway:
                     ),
                 ).model_dump(mode="json"),
             )
+            await signal_inbox(self._bus, [session_id])
             return
 
         await self._ensure_session(record, agent_id, session_id, event, scope)
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Render accumulated replies into channel text, incrementally for the
+live cards that channels update while a reply streams.
+
+A streaming card shows the whole reply so far on every update, so
+re-rendering the reply on each agent event costs time proportional to
+the reply, once per token. :class:`StreamingRenderer` instead folds the
+events into the reply, only marks it dirty, and renders when the card is
+due for an update — reusing the rendered text of the blocks that haven't
+changed since. How often the card is due adapts to how long the platform
+takes to apply an update.
+"""
+import time
+
+from ...event import AgentEvent
+from ...message import (
+    ContentBlock,
+    Msg,
+    MsgAccumulator,
+    TextBlock,
+    ThinkingBlock,
+    ToolCallBlock,
+    ToolResultBlock,
+)
+
+
+def _render_block(
+    block: ContentBlock,
+    show_thinking: bool,
+    show_tool_process: bool,
+) -> str | None:
+    """Render one content block into the text it contributes to a reply.
+
+    Args:
+        block (`ContentBlock`): The content block.
+        show_thinking (`bool`): Include thinking blocks inline.
+        show_tool_process (`bool`): Include tool call/result inline.
+
+    Returns:
+        `str | None`: The rendered text, or ``None`` if the block isn't
+        shown as text.
+    """
+    if isinstance(block, TextBlock):
+        return block.text
+    if isinstance(block, ThinkingBlock):
+        if show_thinking:
+            return f"\n💭 {block.thinking}\n"
+    elif isinstance(block, ToolCallBlock):
+        if show_tool_process:
+            return f"\n🔧 Calling tool: {block.name}\n"
+    elif isinstance(block, ToolResultBlock):
+        if show_tool_process and isinstance(block.output, str):
+            return block.output
+    return None
+
+
+def _render_version(block: ContentBlock) -> tuple:
+    """The version of a block's rendered text: it only changes when the
+    block's rendered fields grow or are replaced."""
+    if isinstance(block, TextBlock):
+        return (len(block.text),)
+    if isinstance(block, ThinkingBlock):
+        return (len(block.thinking),)
+    if isinstance(block, ToolCallBlock):
+        return (block.name,)
+    if isinstance(block, ToolResultBlock):
+        output = block.output
+        return (len(output),) if isinstance(output, str) else (None,)
+    return ()
+
+
+class StreamingRenderer:
+    """Fold a reply's agent events and render its text for a live card at
+    an adaptive, throttled rate.
+
+    Feeding an event is constant time: the reply accumulates it and is
+    marked dirty. The text is only rendered by :meth:`render`, which
+    callers invoke once :meth:`due` reports that the update interval has
+    elapsed. It reuses the rendered text of every block whose version
+    hasn't changed, so only the blocks that grew since the last update
+    are rendered again.
+
+    The update interval starts at ``min_interval`` and follows the
+    platform's latency: each update's round trip, reported through
+    :meth:`record_update`, feeds an exponential moving average, and the
+    interval is ``latency_factor`` times that average, bounded by
+    ``[min_interval, max_interval]``. A slow card API thus receives fewer,
+    larger updates instead of a growing backlog of small ones.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float = 3.0,
+        *,
+        show_thinking: bool = False,
+        show_tool_process: bool = False,
+        latency_factor: float = 2.0,
+        smoothing: float = 0.3,
+    ) -> None:
+        """Initialize the streaming renderer.
+
+        Args:
+            min_interval (`float`):
+                The minimum seconds between two card updates, i.e. the
+                platform's rate limit.
+            max_interval (`float`, defaults to `3.0`):
+                The maximum seconds between two card updates, however slow
+                the platform is.
+            show_thinking (`bool`, defaults to `False`):
+                Include thinking blocks inline.
+            show_tool_process (`bool`, defaults to `False`):
+                Include tool call/result inline.
+            latency_factor (`float`, defaults to `2.0`):
+                The multiple of the average update latency used as the
+                interval.
+            smoothing (`float`, defaults to `0.3`):
+                The weight of the latest latency in the moving average.
+        """
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.show_thinking = show_thinking
+        self.show_tool_process = show_tool_process
+        self.latency_factor = latency_factor
+        self.smoothing = smoothing
+
+        self._accumulator: MsgAccumulator | None = None
+        self.interval = min_interval
+        """The current seconds between two card updates."""
+
+        self._latency: float | None = None
+        self._dirty = False
+        self._last_render = 0.0
+        self._parts: list[str | None] = []
+        self._versions: list[tuple[int, tuple]] = []
+
+    def feed(self, event: AgentEvent) -> None:
+        """Fold an agent event into the reply.
+
+        Args:
+            event (`AgentEvent`): The agent event. Events without a reply
+                id are ignored.
+        """
+        reply_id = getattr(event, "reply_id", None)
+        if reply_id is None:
+            return
+        if self._accumulator is None:
+            reply = Msg(name="assistant", role="assistant", content=[])
+            reply.id = reply_id
+            self._accumulator = MsgAccumulator(reply)
+        self._accumulator.append_event(event)
+        self._dirty = True
+
+    @property
+    def reply(self) -> Msg | None:
+        """The reply accumulated from the fed events."""
+        if self._accumulator is None:
+            return None
+        return self._accumulator.build()
+
+    def due(self) -> bool:
+        """Whether the reply changed and the update interval elapsed."""
+        return (
+            self._dirty
+            and time.monotonic() - self._last_render >= self.interval
+        )
+
+    def render(self) -> str:
+        """Render the reply's text as of now and start a new interval.
+
+        Unlike :meth:`ChannelBase._render`, a reply without displayable
+        text renders to an empty string rather than a placeholder, as it
+        may still be streaming. An empty render doesn't start a new
+        interval, so the first text is shown without delay.
+
+        Returns:
+            `str`: The stripped text of the reply so far.
+        """
+        self._dirty = False
+        reply = self.reply
+        if reply is None:
+            return ""
+
+        content = reply.content
+        del self._parts[len(content) :]
+        del self._versions[len(content) :]
+        for i, block in enumerate(content):
+            version = (id(block), _render_version(block))
+            if i < len(self._versions) and self._versions[i] == version:
+                continue
+            part = _render_block(
+                block,
+                self.show_thinking,
+                self.show_tool_process,
+            )
+            if i < len(self._parts):
+                self._parts[i] = part
+                self._versions[i] = version
+            else:
+                self._parts.append(part)
+                self._versions.append(version)
+        text = "".join(part for part in self._parts if part).strip()
+        if text:
+            self._last_render = time.monotonic()
+        return text
+
+    def record_update(self, latency: float) -> None:
+        """Adapt the update interval to the latency of a card update.
+
+        Args:
+            latency (`float`): The seconds the platform took to apply the
+                update.
+        """
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += self.smoothing * (latency - self._latency)
+        self.interval = min(
+            self.max_interval,
+            max(self.min_interval, self.latency_factor * self._latency),
+        )
@@ -1,14 +1,25 @@
 # -*- coding: utf-8 -*-
 """The message bus module — live transport for cross-session messages."""
 
-from ._base import MessageBus
+from ._base import LockedQueuePush, MessageBus
 from ._in_memory_message_bus import InMemoryMessageBus
 from ._keys import MessageBusKeys
+from ._rate_limiter import MessageBusRateLimiter
 from ._redis_message_bus import RedisMessageBus
+from ..._utils._serialization import (
+    JSONSerializer,
+    MsgpackSerializer,
+    Serializer,
+)
 
 __all__ = [
     "InMemoryMessageBus",
+    "JSONSerializer",
+    "LockedQueuePush",
     "MessageBus",
     "MessageBusKeys",
+    "MessageBusRateLimiter",
+    "MsgpackSerializer",
     "RedisMessageBus",
+    "Serializer",
 ]
@@ -28,6 +28,15 @@ orphaned data when the consumer   or TTL expires the whole key.
 disappears.
 ============================  ===========================================
 
+Mode B — claim queue: ``queue_claim`` / ``queue_ack`` over a drain
+queue's key. The consumers of one *group* (e.g. the replicas of a
+service) share the queue: each entry is delivered to one consumer and
+stays pending until that consumer acks it, and an entry left pending
+longer than ``reclaim_idle_secs`` — its consumer died mid-way — is
+delivered again to the next consumer that claims. Delivery is
+at-least-once; a key is consumed either by claiming or by draining,
+and by a single group.
+
 Mode D — transient broadcast: ``publish`` / ``subscribe``. Fire-and-forget
 pub/sub; only currently-subscribed listeners receive a payload, no
 history. Use for wake-up signals where missed-while-offline is fine.
@@ -40,14 +49,39 @@ should fan out at write time — push one entry per recipient inbox using
 Mode A. The bus stays simple; deduplication is the producer's
 responsibility.
 """
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import Any, Callable, Self
+from typing import Any, Callable, NamedTuple, Self
 
 from typing_extensions import deprecated
 
 from ._keys import MessageBusKeys
+from ..._utils._metrics import _instrument_operations, _interface_operations
+from ..._utils._serialization import JSONSerializer
+
+_JSON = JSONSerializer()
+
+
+class LockedQueuePush(NamedTuple):
+    """A queue push made under a lock, for
+    :meth:`MessageBus.queue_push_locked`."""
+
+    queue_key: str
+    """The drain queue to push to."""
+
+    payload: dict
+    """The JSON-serializable payload to push."""
+
+    lock_key: str
+    """The lock held while pushing."""
+
+    registry_namespace: str
+    """The registry read under the same lock."""
+
+    registry_field: str
+    """The registry field read under the same lock."""
 
 
 class MessageBus(ABC):  # pylint: disable=too-many-public-methods
@@ -56,8 +90,22 @@ class MessageBus(ABC):  # pylint: disable=too-many-public-methods
     Implementations expose three consumption modes (drain queue, replay
     log, transient broadcast) over arbitrary string keys and JSON-style
     dict payloads. Callers own key naming and payload schemas.
+
+    The durations of the operations of this interface that an
+    implementation defines are recorded in the process-wide metrics
+    registry, labelled by the implementation class.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Instrument the operations of an implementation."""
+        super().__init_subclass__(**kwargs)
+        _instrument_operations(
+            cls,
+            "agentscope_message_bus_operation_seconds",
+            "Duration of message bus operations.",
+            operations=_interface_operations(MessageBus),
+        )
+
     async def __aenter__(self) -> Self:
         """Open underlying transport resources (connection pools, …).
 
@@ -167,6 +215,176 @@ class MessageBus(ABC):  # pylint: disable=too-many-public-methods
                 Queue identifier.
         """
 
+    async def queue_length(
+        self,
+        key: str,  # pylint: disable=unused-argument
+    ) -> int | None:
+        """Count the entries waiting in the drain queue at ``key``,
+        without consuming them.
+
+        Used for monitoring only. The default reports ``None``, for
+        backends that cannot count without draining.
+
+        Args:
+            key (`str`):
+                Queue identifier.
+
+        Returns:
+            `int | None`:
+                The number of entries, ``0`` when the key does not
+                exist, or ``None`` when the backend cannot tell.
+        """
+        return None
+
+    async def queue_push_many(
+        self,
+        key: str,
+        payloads: list[dict],
+        *,
+        ttl_secs: int | None = None,
+    ) -> list[str]:
+        """Append several payloads to the drain queue at ``key``, in
+        order.
+
+        The default pushes them one by one; backends override it to
+        send the whole batch in one round trip.
+
+        Args:
+            key (`str`):
+                Queue identifier.
+            payloads (`list[dict]`):
+                JSON-serializable dicts to enqueue, in order.
+            ttl_secs (`int | None`, optional):
+                As for :meth:`queue_push`.
+
+        Returns:
+            `list[str]`:
+                The entry ids, one per payload.
+        """
+        return [
+            await self.queue_push(key, payload, ttl_secs=ttl_secs)
+            for payload in payloads
+        ]
+
+    async def queue_push_locked(
+        self,
+        pushes: list[LockedQueuePush],
+        *,
+        lock_ttl_secs: int = 600,
+    ) -> list[str | None]:
+        """Make several queue pushes, each in a critical section of its
+        own lock that also reads a registry field.
+
+        Each push is equivalent to::
+
+            async with bus.acquire_lock(push.lock_key):
+                await bus.queue_push(push.queue_key, push.payload)
+                value = await bus.registry_get(
+                    push.registry_namespace,
+                    push.registry_field,
+                )
+
+        No two locks are held at once, so batches cannot deadlock each
+        other. The default runs the critical sections concurrently;
+        backends override it to make them in a few pipelined round
+        trips.
+
+        Args:
+            pushes (`list[LockedQueuePush]`):
+                The pushes to make.
+            lock_ttl_secs (`int`, defaults to ``600``):
+                Lease duration of each lock.
+
+        Returns:
+            `list[str | None]`:
+                The registry value read in each critical section, or
+                ``None`` where the field is absent.
+        """
+
+        async def _push(push: LockedQueuePush) -> str | None:
+            async with self.acquire_lock(
+                push.lock_key,
+                ttl_secs=lock_ttl_secs,
+            ):
+                await self.queue_push(push.queue_key, push.payload)
+                return await self.registry_get(
+                    push.registry_namespace,
+                    push.registry_field,
+                )
+
+        return list(await asyncio.gather(*(_push(p) for p in pushes)))
+
+    # ------------------------------------------------------------------
+    # Mode B — claim queue (consumer group, ack after processing)
+    # ------------------------------------------------------------------
+
+    async def queue_claim(
+        self,
+        key: str,
+        group: str,
+        consumer: str,
+        max_count: int = 100,
+        *,
+        reclaim_idle_secs: float = 30.0,
+    ) -> list[tuple[str, dict]]:
+        """Claim up to ``max_count`` entries of the queue at ``key`` for
+        ``consumer``, a member of ``group``.
+
+        Entries pushed with :meth:`queue_push` are delivered to one
+        consumer of the group and stay pending until acked with
+        :meth:`queue_ack`. Entries pending for at least
+        ``reclaim_idle_secs`` — typically because their consumer died
+        before acking — are claimed again first.
+
+        The default drains the queue (see :meth:`queue_drain`), so
+        entries are gone once read and :meth:`queue_ack` is a no-op:
+        at-most-once delivery, for backends without consumer groups.
+
+        Args:
+            key (`str`):
+                Queue identifier.
+            group (`str`):
+                The consumer group sharing the queue. Created on first
+                use, starting from the oldest entry.
+            consumer (`str`):
+                The consumer claiming, unique within the group.
+            max_count (`int`, defaults to ``100``):
+                Maximum number of entries to return.
+            reclaim_idle_secs (`float`, defaults to ``30.0``):
+                How long an entry stays pending with another consumer
+                before it is claimed again. Must exceed the time a
+                consumer takes to process and ack an entry.
+
+        Returns:
+            `list[tuple[str, dict]]`:
+                ``(entry_id, payload)`` pairs, reclaimed entries first,
+                then new ones in arrival order.
+        """
+        del group, consumer, reclaim_idle_secs
+        return await self.queue_drain(key, max_count=max_count)
+
+    async def queue_ack(
+        self,
+        key: str,
+        group: str,
+        entry_ids: list[str],
+    ) -> None:
+        """Acknowledge claimed entries, removing them from the queue.
+
+        Acking an unknown or already acked id is a no-op. The default
+        does nothing, as :meth:`queue_claim` already removed the
+        entries.
+
+        Args:
+            key (`str`):
+                Queue identifier.
+            group (`str`):
+                The consumer group the entries were claimed in.
+            entry_ids (`list[str]`):
+                The ids returned by :meth:`queue_claim`.
+        """
+        del key, group, entry_ids
+
     # ------------------------------------------------------------------
     # Mode C — replay log (multi-consumer, externally bounded)
     # ------------------------------------------------------------------
@@ -239,6 +457,39 @@ class MessageBus(ABC):  # pylint: disable=too-many-public-methods
                 list when no entries are newer than ``since``.
         """
 
+    async def log_read_encoded(
+        self,
+        key: str,
+        since: str | None = None,
+        max_count: int = 100,
+    ) -> list[tuple[str, bytes]]:
+        """Read like :meth:`log_read`, with each payload as UTF-8 JSON
+        bytes, ready to relay to a client.
+
+        The default encodes the decoded payloads; backends that store
+        JSON override it to return the stored bytes undecoded.
+
+        Args:
+            key (`str`):
+                Log identifier.
+            since (`str | None`, optional):
+                As for :meth:`log_read`.
+            max_count (`int`, defaults to ``100``):
+                As for :meth:`log_read`.
+
+        Returns:
+            `list[tuple[str, bytes]]`:
+                ``(entry_id, json_bytes)`` pairs in append order.
+        """
+        return [
+            (entry_id, _JSON.dumps(payload))
+            for entry_id, payload in await self.log_read(
+                key,
+                since=since,
+                max_count=max_count,
+            )
+        ]
+
     @abstractmethod
     async def log_trim(
         self,
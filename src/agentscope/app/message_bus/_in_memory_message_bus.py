@@ -27,7 +27,9 @@ from typing import Callable, Self
 from ._base import MessageBus
 
 
-class InMemoryMessageBus(MessageBus):
+class InMemoryMessageBus(
+    MessageBus,
+):  # pylint: disable=too-many-public-methods
     """In-memory implementation of :class:`MessageBus`.
 
     Mapping of bus modes to in-memory structures:
@@ -36,6 +38,9 @@ class InMemoryMessageBus(MessageBus):
       :class:`list[tuple[str, dict]]` of ``(entry_id, payload)`` pairs.
       ``queue_push`` appends; ``queue_drain`` pops from the front (FIFO)
       and deletes the returned entries.
+    - **Mode B (claim queue)** — ``queue_claim`` moves entries from the
+      drain queue into a per-``(key, group)`` dict of pending entries,
+      recording the consumer and claim time; ``queue_ack`` drops them.
     - **Mode C (replay log)** — same underlying list structure, but
       ``log_read`` is non-destructive.  ``log_trim`` removes entries
       in-place.
@@ -65,6 +70,13 @@ class InMemoryMessageBus(MessageBus):
             list[tuple[str, dict, float | None]],
         ] = defaultdict(list)
 
+        # Mode B — pending entries: (key, group) ->
+        # {entry_id: (payload, consumer, claimed_at)}, in claim order
+        self._pending: dict[
+            tuple[str, str],
+            dict[str, tuple[dict, str, float]],
+        ] = defaultdict(dict)
+
         # Mode C — replay logs: key -> [(entry_id, payload), ...]
         self._logs: dict[str, list[tuple[str, dict]]] = defaultdict(list)
 
@@ -185,13 +197,109 @@ class InMemoryMessageBus(MessageBus):
         return [(entry_id, payload) for entry_id, payload, _ in drained]
 
     async def queue_delete(self, key: str) -> None:
-        """Delete the drain queue at ``key``.
+        """Delete the drain queue at ``key``, with its pending entries.
 
         Args:
             key (`str`):
                 Queue identifier.
         """
         self._queues.pop(key, None)
+        for pending_key in [k for k in self._pending if k[0] == key]:
+            del self._pending[pending_key]
+
+    async def queue_length(self, key: str) -> int:
+        """Count the unexpired entries of the drain queue at ``key``.
+
+        Args:
+            key (`str`):
+                Queue identifier.
+
+        Returns:
+            `int`:
+                The number of entries.
+        """
+        now = time.monotonic()
+        return sum(
+            1
+            for _, _, expire_at in self._queues.get(key, ())
+            if expire_at is None or expire_at > now
+        )
+
+    # ------------------------------------------------------------------
+    # Mode B — claim queue
+    # ------------------------------------------------------------------
+
+    async def queue_claim(
+        self,
+        key: str,
+        group: str,
+        consumer: str,
+        max_count: int = 100,
+        *,
+        reclaim_idle_secs: float = 30.0,
+    ) -> list[tuple[str, dict]]:
+        """Claim entries of the queue at ``key`` for a consumer group.
+
+        Entries pending for at least ``reclaim_idle_secs`` are claimed
+        again first, then new entries are drained into the group's
+        pending entries.
+
+        Args:
+            key (`str`):
+                Queue identifier.
+            group (`str`):
+                The consumer group sharing the queue.
+            consumer (`str`):
+                The consumer claiming.
+            max_count (`int`, defaults to ``100``):
+                Maximum entries to return.
+            reclaim_idle_secs (`float`, defaults to ``30.0``):
+                How long an entry stays pending before it is claimed
+                again.
+
+        Returns:
+            `list[tuple[str, dict]]`:
+                ``(entry_id, payload)`` pairs, reclaimed entries first.
+        """
+        pending = self._pending[(key, group)]
+        now = time.monotonic()
+        claimed: list[tuple[str, dict]] = []
+        for entry_id, (payload, _, claimed_at) in list(pending.items()):
+            if len(claimed) >= max_count:
+                break
+            if now - claimed_at >= reclaim_idle_secs:
+                pending[entry_id] = (payload, consumer, now)
+                claimed.append((entry_id, payload))
+        if len(claimed) < max_count:
+            for entry_id, payload in await self.queue_drain(
+                key,
+                max_count - len(claimed),
+            ):
+                pending[entry_id] = (payload, consumer, now)
+                claimed.append((entry_id, payload))
+        return claimed
+
+    async def queue_ack(
+        self,
+        key: str,
+        group: str,
+        entry_ids: list[str],
+    ) -> None:
+        """Drop claimed entries from the group's pending entries.
+
+        Args:
+            key (`str`):
+                Queue identifier.
+            group (`str`):
+                The consumer group the entries were claimed in.
+            entry_ids (`list[str]`):
+                The ids returned by :meth:`queue_claim`.
+        """
+        pending = self._pending.get((key, group))
+        if not pending:
+            return
+        for entry_id in entry_ids:
+            pending.pop(entry_id, None)
 
     # ------------------------------------------------------------------
     # Mode C — replay log
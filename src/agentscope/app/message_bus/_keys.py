@@ -152,6 +152,7 @@ class MessageBusKeys:  # pylint: disable=too-many-public-methods
     _INBOX = "agentscope:inbox:{sid}"
     _INBOX_LOCK = "agentscope:inbox:lock:{sid}"
     _INBOX_CONSUMER = "agentscope:inbox:consumer:{sid}"
+    _INBOX_SIGNAL = "agentscope:inbox:signal"
 
     INBOX_LOCK_TTL_SECS = 30
     """Lease for the inbox hand-off lock. The critical sections it
@@ -192,12 +193,23 @@ class MessageBusKeys:  # pylint: disable=too-many-public-methods
         """
         return cls._INBOX_CONSUMER.format(sid=session_id)
 
+    @classmethod
+    def inbox_signal_channel(cls) -> str:
+        """Global broadcast channel announcing that session inboxes
+        received entries.
+
+        The payload is ``{"session_ids": [...]}``. Lets a live run skip
+        the inbox round trip on reasoning steps where nothing arrived.
+        """
+        return cls._INBOX_SIGNAL
+
     # ------------------------------------------------------------------
     # Run trigger queue (wakeup / resume)
     # ------------------------------------------------------------------
 
     _WAKEUP_QUEUE = "agentscope:wakeups"
     _WAKEUP_SIGNAL = "agentscope:wakeup_signal"
+    _WAKEUP_GROUP = "agentscope:wakeup_dispatchers"
 
     @classmethod
     def wakeup_queue(cls) -> str:
@@ -209,6 +221,12 @@ class MessageBusKeys:  # pylint: disable=too-many-public-methods
         """Shared signal channel that nudges dispatchers to drain."""
         return cls._WAKEUP_SIGNAL
 
+    @classmethod
+    def wakeup_group(cls) -> str:
+        """Consumer group in which the dispatchers of every replica
+        claim the run-trigger queue."""
+        return cls._WAKEUP_GROUP
+
     # ------------------------------------------------------------------
     # Cross-process cancel
     # ------------------------------------------------------------------
@@ -238,6 +256,30 @@ class MessageBusKeys:  # pylint: disable=too-many-public-methods
         """
         return cls._SESSION_INTERRUPT
 
+    # ------------------------------------------------------------------
+    # Storage cache invalidation
+    # ------------------------------------------------------------------
+
+    _STORAGE_INVALIDATE = "agentscope:storage:invalidate"
+
+    @classmethod
+    def storage_invalidate_channel(cls) -> str:
+        """Global broadcast channel that drops cached storage records on
+        every node."""
+        return cls._STORAGE_INVALIDATE
+
+    # ------------------------------------------------------------------
+    # Assembled-agent cache invalidation
+    # ------------------------------------------------------------------
+
+    _ASSEMBLY_INVALIDATE = "agentscope:assembly:invalidate"
+
+    @classmethod
+    def assembly_invalidate_channel(cls) -> str:
+        """Global broadcast channel that drops cached agent assemblies
+        on every node."""
+        return cls._ASSEMBLY_INVALIDATE
+
     # ------------------------------------------------------------------
     # Background task registry
     # ------------------------------------------------------------------
@@ -252,6 +294,34 @@ class MessageBusKeys:  # pylint: disable=too-many-public-methods
         """Per-session background task registry key."""
         return cls._BG_TASKS.format(sid=session_id)
 
+    # ------------------------------------------------------------------
+    # Chat model rate limiting
+    # ------------------------------------------------------------------
+
+    _RATE_LIMIT_BUCKET = "agentscope:rate_limit:{key}"
+    _RATE_LIMIT_LOCK = "agentscope:rate_limit:lock:{key}"
+
+    RATE_LIMIT_BUCKET_FIELD = "bucket"
+    """Field name of the serialised token bucket inside the registry."""
+
+    RATE_LIMIT_BUCKET_TTL_SECS = 120
+    """Sliding TTL of an idle bucket. A bucket refills completely within
+    a minute, so an expired bucket is equivalent to a full one."""
+
+    RATE_LIMIT_LOCK_TTL_SECS = 10
+    """Lease for the lock guarding a bucket's read-modify-write."""
+
+    @classmethod
+    def rate_limit_bucket(cls, key: str) -> str:
+        """Registry namespace holding the token bucket of a credential
+        and model pair."""
+        return cls._RATE_LIMIT_BUCKET.format(key=key)
+
+    @classmethod
+    def rate_limit_lock(cls, key: str) -> str:
+        """Lock serialising the updates of a token bucket."""
+        return cls._RATE_LIMIT_LOCK.format(key=key)
+
     # ------------------------------------------------------------------
     # Knowledge-base indexing pipeline
     # ------------------------------------------------------------------
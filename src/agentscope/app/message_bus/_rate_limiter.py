@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""The cluster-wide chat model rate limiter backed by the message bus."""
+import json
+import time
+
+from ._base import MessageBus
+from ._keys import MessageBusKeys
+from ...model import RateLimit, RateLimiterBase
+from ...model._rate_limit import TokenBucket
+
+
+class MessageBusRateLimiter(RateLimiterBase):
+    """A rate limiter whose token buckets live on the message bus, so that
+    every replica calling the same credential and model shares one budget.
+
+    Each bucket is a serialised :class:`TokenBucket` in a registry
+    namespace (Mode F), updated under the bucket's lock (Mode E) so the
+    read-modify-write is atomic across processes. Timestamps are wall-clock
+    seconds since replicas don't share a monotonic clock. The priority
+    queue in front of the buckets stays per-process: each replica only
+    sends the head of its queue to the shared bucket.
+    """
+
+    def __init__(
+        self,
+        message_bus: MessageBus,
+        default_limit: RateLimit | None = None,
+        limits: dict[str, RateLimit] | None = None,
+        max_poll_interval: float = 1.0,
+    ) -> None:
+        """Initialize the message-bus rate limiter.
+
+        Args:
+            message_bus (`MessageBus`):
+                The application message bus. Use a
+                :class:`RedisMessageBus` to share the budgets across
+                processes.
+            default_limit (`RateLimit | None`, optional):
+                The budgets of the models that aren't listed in ``limits``.
+                ``None`` leaves them unlimited.
+            limits (`dict[str, RateLimit] | None`, optional):
+                The budgets keyed by model name.
+            max_poll_interval (`float`, defaults to `1.0`):
+                The maximum seconds the head of a queue sleeps before
+                polling the shared bucket again.
+        """
+        super().__init__(
+            default_limit=default_limit,
+            limits=limits,
+            max_poll_interval=max_poll_interval,
+        )
+        self._bus = message_bus
+
+    async def _load(self, key: str, limit: RateLimit) -> TokenBucket:
+        """Load the bucket of ``key``, or a full one if absent or expired.
+
+        Must be called with the bucket lock held.
+        """
+        raw = await self._bus.registry_get(
+            MessageBusKeys.rate_limit_bucket(key),
+            MessageBusKeys.RATE_LIMIT_BUCKET_FIELD,
+        )
+        if raw is None:
+            return TokenBucket.full(limit, time.time())
+        return TokenBucket.from_dict(json.loads(raw))
+
+    async def _save(self, key: str, bucket: TokenBucket) -> None:
+        """Store the bucket of ``key`` with a sliding TTL.
+
+        Must be called with the bucket lock held.
+        """
+        await self._bus.registry_set(
+            MessageBusKeys.rate_limit_bucket(key),
+            MessageBusKeys.RATE_LIMIT_BUCKET_FIELD,
+            json.dumps(bucket.to_dict()),
+            ttl_secs=MessageBusKeys.RATE_LIMIT_BUCKET_TTL_SECS,
+        )
+
+    async def _reserve(self, key: str, limit: RateLimit, tokens: int) -> float:
+        """Take the budget from the shared bucket of ``key``."""
+        async with self._bus.acquire_lock(
+            MessageBusKeys.rate_limit_lock(key),
+            ttl_secs=MessageBusKeys.RATE_LIMIT_LOCK_TTL_SECS,
+        ):
+            bucket = await self._load(key, limit)
+            wait = bucket.try_take(limit, tokens, time.time())
+            if wait <= 0:
+                await self._save(key, bucket)
+            return wait
+
+    async def _adjust(self, key: str, limit: RateLimit, delta: int) -> None:
+        """Adjust the shared bucket of ``key``."""
+        async with self._bus.acquire_lock(
+            MessageBusKeys.rate_limit_lock(key),
+            ttl_secs=MessageBusKeys.RATE_LIMIT_LOCK_TTL_SECS,
+        ):
+            bucket = await self._load(key, limit)
+            bucket.refill(limit, time.time())
+            bucket.adjust(limit, delta)
+            await self._save(key, bucket)
+
+    async def _pause(self, key: str, limit: RateLimit, seconds: float) -> None:
+        """Pause the shared bucket of ``key``."""
+        async with self._bus.acquire_lock(
+            MessageBusKeys.rate_limit_lock(key),
+            ttl_secs=MessageBusKeys.RATE_LIMIT_LOCK_TTL_SECS,
+        ):
+            bucket = await self._load(key, limit)
+            bucket.paused_until = max(
+                bucket.paused_until,
+                time.time() + seconds,
+            )
+            await self._save(key, bucket)
@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
 """The Redis-backed message bus implementation."""
 import asyncio
-import json
 import uuid
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any, Callable, Self, TYPE_CHECKING
 
-from ._base import MessageBus
+from ._base import LockedQueuePush, MessageBus
+from ..._utils._serialization import JSONSerializer, Serializer
 
 if TYPE_CHECKING:
     from redis.asyncio import ConnectionPool, Redis
@@ -16,17 +16,22 @@ else:
     Redis = Any
 
 
-class RedisMessageBus(MessageBus):
+class RedisMessageBus(MessageBus):  # pylint: disable=too-many-public-methods
     """Redis-backed implementation of :class:`MessageBus`.
 
     Mapping of bus modes to Redis primitives:
 
     - **Mode A (drain queue)** uses a Redis Stream per key. ``XADD``
       appends a payload whose single field ``payload`` carries the
-      JSON-serialised dict. ``queue_drain`` performs ``XRANGE`` followed
-      by per-id ``XDEL`` so the read is destructive and idempotent
-      under the single-consumer-per-key invariant. ``ttl_secs`` is
+      dict encoded by the bus's :class:`Serializer`. ``queue_drain``
+      performs ``XRANGE`` followed by per-id ``XDEL`` so the read is
+      destructive and idempotent under the single-consumer-per-key
+      invariant. ``ttl_secs`` is
       enforced via ``EXPIRE`` after each push (sliding TTL).
+    - **Mode B (claim queue)** reads the same stream through a consumer
+      group: ``XAUTOCLAIM`` takes over entries pending too long with
+      another consumer, ``XREADGROUP`` delivers new ones, and
+      ``queue_ack`` ``XACK``s and ``XDEL``s them. Requires Redis 6.2+.
     - **Mode C (replay log)** also uses a Redis Stream, but never
       ``XDEL``s on read. Trimming happens via ``XADD … MAXLEN ~N``
       (approximate, for performance) on append, via the ``ttl_secs``
@@ -35,7 +40,13 @@ class RedisMessageBus(MessageBus):
       start id derived from ``since``.
     - **Mode D (transient broadcast)** rides Redis Pub/Sub. Wake-ups
       are best-effort: payloads published before a subscription exists
-      are not delivered.
+      are not delivered. Messages are always JSON: the subscription
+      connection decodes what it reads as text.
+
+    Stream entries are read undecoded and handed to the serializer as
+    bytes, and :meth:`log_read_encoded` returns stored JSON as is.
+    Every process sharing the Redis database must use the same
+    serializer; drain the queues and logs before switching.
 
     The bus owns its own connection pool by default; an external pool
     may be supplied for tests or for sharing a pool across services.
@@ -48,6 +59,7 @@ class RedisMessageBus(MessageBus):
         db: int = 0,
         password: str | None = None,
         connection_pool: ConnectionPool | None = None,
+        serializer: Serializer | None = None,
         **kwargs: Any,
     ) -> None:
         """Store connection parameters; the actual pool is created in
@@ -69,6 +81,10 @@ class RedisMessageBus(MessageBus):
                 lifecycle. When omitted a pool is created from
                 *host*/*port*/*db*/*password* on :meth:`__aenter__`
                 and closed on :meth:`aclose`.
+            serializer (`Serializer | None`, optional):
+                Encodes the queue and log payloads. Defaults to
+                :class:`JSONSerializer`; a binary one such as
+                :class:`MsgpackSerializer` makes smaller entries.
             **kwargs (`Any`):
                 Extra keyword arguments forwarded to
                 ``redis.asyncio.ConnectionPool`` when the pool is
@@ -81,11 +97,19 @@ class RedisMessageBus(MessageBus):
         self._password = password
         self._external_pool: ConnectionPool | None = connection_pool
         self._kwargs = kwargs
+        self.serializer = serializer or JSONSerializer()
+        self._broadcast_serializer = (
+            JSONSerializer() if self.serializer.binary else self.serializer
+        )
 
         # Populated in __aenter__; None until the context is entered.
         self._client: Redis | None = None
         self._owned_pool: ConnectionPool | None = None
 
+        # Consumer groups known to exist, and where the next XAUTOCLAIM
+        # scan of each group's pending entries resumes
+        self._claim_cursors: dict[tuple[str, str], str] = {}
+
     async def __aenter__(self) -> Self:
         """Create the connection pool and Redis client.
 
@@ -219,7 +243,7 @@ class RedisMessageBus(MessageBus):
         """
         entry_id = await self._client.xadd(
             key,
-            {"payload": json.dumps(payload, ensure_ascii=False)},
+            {"payload": self.serializer.dumps(payload)},
         )
         if ttl_secs is not None:
             await self._client.expire(key, ttl_secs)
@@ -248,24 +272,138 @@ class RedisMessageBus(MessageBus):
                 ``(entry_id, payload)`` pairs in arrival order. Empty
                 list when the queue is empty or absent.
         """
-        entries = await self._client.xrange(key, count=max_count)
+        entries = await self._xrange_raw(key, "-", max_count)
         if not entries:
             return []
 
         results: list[tuple[str, dict]] = []
         ids_to_delete: list[str] = []
-        for entry_id, fields in entries:
+        for entry_id, raw in entries:
             ids_to_delete.append(entry_id)
-            raw = fields.get("payload")
             if raw is None:
                 continue
-            results.append((entry_id, json.loads(raw)))
+            results.append((entry_id, self.serializer.loads(raw)))
 
         if ids_to_delete:
             await self._client.xdel(key, *ids_to_delete)
 
         return results
 
+    async def queue_push_many(
+        self,
+        key: str,
+        payloads: list[dict],
+        *,
+        ttl_secs: int | None = None,
+    ) -> list[str]:
+        """Append several payloads to the drain queue at ``key`` in one
+        pipelined round trip.
+
+        Args:
+            key (`str`):
+                Stream key for this drain queue.
+            payloads (`list[dict]`):
+                JSON-serializable dicts to enqueue, in order.
+            ttl_secs (`int | None`, optional):
+                If set, refresh the key's expiry after the pushes.
+
+        Returns:
+            `list[str]`:
+                The Redis Stream entry ids assigned by ``XADD``.
+        """
+        if not payloads:
+            return []
+        async with self._client.pipeline(transaction=False) as pipe:
+            for payload in payloads:
+                pipe.xadd(
+                    key,
+                    {"payload": self.serializer.dumps(payload)},
+                )
+            if ttl_secs is not None:
+                pipe.expire(key, ttl_secs)
+            replies = await pipe.execute()
+        return replies[: len(payloads)]
+
+    async def queue_push_locked(
+        self,
+        pushes: list[LockedQueuePush],
+        *,
+        lock_ttl_secs: int = 600,
+    ) -> list[str | None]:
+        """Make several locked queue pushes in two pipelined round trips.
+
+        Implementation:
+
+        - One pipeline claims every lock with ``SET NX EX``.
+        - One ``MULTI`` / ``EXEC`` transaction then makes, for each
+          claimed lock, the ``XADD``, the ``HGET`` and the ``DEL`` that
+          releases it. The lock was claimed a round trip earlier, well
+          within its lease, so the release cannot drop another holder's
+          lock.
+        - The pushes whose lock is held elsewhere fall back to the
+          blocking :meth:`acquire_lock` path, concurrently.
+
+        Args:
+            pushes (`list[LockedQueuePush]`):
+                The pushes to make.
+            lock_ttl_secs (`int`, defaults to ``600``):
+                Lease duration of each lock.
+
+        Returns:
+            `list[str | None]`:
+                The registry value read under each lock.
+        """
+        if not pushes:
+            return []
+        token = uuid.uuid4().hex
+        async with self._client.pipeline(transaction=False) as pipe:
+            for push in pushes:
+                pipe.set(push.lock_key, token, nx=True, ex=lock_ttl_secs)
+            claimed = await pipe.execute()
+
+        values: list[str | None] = [None] * len(pushes)
+        owned = [i for i, ok in enumerate(claimed) if ok]
+        if owned:
+            try:
+                async with self._client.pipeline(transaction=True) as pipe:
+                    for i in owned:
+                        push = pushes[i]
+                        pipe.xadd(
+                            push.queue_key,
+                            {
+                                "payload": self.serializer.dumps(
+                                    push.payload,
+                                ),
+                            },
+                        )
+                        pipe.hget(
+                            push.registry_namespace,
+                            push.registry_field,
+                        )
+                        pipe.delete(push.lock_key)
+                    replies = await pipe.execute()
+            except BaseException:
+                # Do not leave the claimed locks to their lease
+                try:
+                    await self._client.delete(
+                        *(pushes[i].lock_key for i in owned),
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    pass
+                raise
+            for n, i in enumerate(owned):
+                values[i] = replies[3 * n + 1]
+
+        contended = [i for i, ok in enumerate(claimed) if not ok]
+        if contended:
+            fallback = await super().queue_push_locked(
+                [pushes[i] for i in contended],
+                lock_ttl_secs=lock_ttl_secs,
+            )
+            for i, value in zip(contended, fallback):
+                values[i] = value
+        return values
+
     async def queue_delete(self, key: str) -> None:
         """Delete the drain queue at ``key``.
 
@@ -276,6 +414,188 @@ class RedisMessageBus(MessageBus):
         """
         await self._client.delete(key)
 
+    async def queue_length(self, key: str) -> int:
+        """Count the entries of the drain queue at ``key`` with
+        ``XLEN``.
+
+        Args:
+            key (`str`):
+                Stream key for the drain queue.
+
+        Returns:
+            `int`:
+                The number of entries, ``0`` when the key is absent.
+        """
+        return await self._client.xlen(key)
+
+    # ------------------------------------------------------------------
+    # Mode B — claim queue
+    # ------------------------------------------------------------------
+
+    async def queue_claim(
+        self,
+        key: str,
+        group: str,
+        consumer: str,
+        max_count: int = 100,
+        *,
+        reclaim_idle_secs: float = 30.0,
+    ) -> list[tuple[str, dict]]:
+        """Claim entries of the stream at ``key`` for a consumer group.
+
+        ``XAUTOCLAIM`` first takes over entries pending for at least
+        ``reclaim_idle_secs``, resuming its scan of the pending list
+        where the previous call stopped; ``XREADGROUP`` then fills the
+        batch with new entries. The group is created on first use
+        (``XGROUP CREATE … 0 MKSTREAM``), and again if the stream was
+        deleted since.
+
+        Args:
+            key (`str`):
+                Stream key for the queue.
+            group (`str`):
+                The consumer group sharing the queue.
+            consumer (`str`):
+                The consumer claiming, unique within the group.
+            max_count (`int`, defaults to ``100``):
+                Maximum entries to return in one call.
+            reclaim_idle_secs (`float`, defaults to ``30.0``):
+                How long an entry stays pending with another consumer
+                before it is claimed again.
+
+        Returns:
+            `list[tuple[str, dict]]`:
+                ``(entry_id, payload)`` pairs, reclaimed entries first.
+        """
+        from redis.exceptions import ResponseError
+
+        try:
+            entries = await self._claim_raw(
+                key,
+                group,
+                consumer,
+                max_count,
+                reclaim_idle_secs,
+            )
+        except ResponseError:
+            # The group went away with its stream; recreate and retry
+            self._claim_cursors.pop((key, group), None)
+            entries = await self._claim_raw(
+                key,
+                group,
+                consumer,
+                max_count,
+                reclaim_idle_secs,
+            )
+
+        results: list[tuple[str, dict]] = []
+        deleted: list[str] = []
+        for entry_id, raw in entries:
+            if raw is None:
+                deleted.append(entry_id)
+            else:
+                results.append((entry_id, self.serializer.loads(raw)))
+        if deleted:
+            await self.queue_ack(key, group, deleted)
+        return results
+
+    async def _claim_raw(
+        self,
+        key: str,
+        group: str,
+        consumer: str,
+        max_count: int,
+        reclaim_idle_secs: float,
+    ) -> list[tuple[str, bytes | None]]:
+        """``XAUTOCLAIM`` then ``XREADGROUP``, payloads left as bytes.
+
+        Returns:
+            `list[tuple[str, bytes | None]]`:
+                ``(entry_id, payload)`` pairs; the payload is ``None``
+                for an entry deleted while pending.
+        """
+        from redis.client import NEVER_DECODE
+        from redis.exceptions import ResponseError
+
+        cursor = self._claim_cursors.get((key, group))
+        if cursor is None:
+            try:
+                await self._client.xgroup_create(
+                    key,
+                    group,
+                    id="0",
+                    mkstream=True,
+                )
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+            cursor = "0-0"
+
+        response = await self._client.execute_command(
+            "XAUTOCLAIM",
+            key,
+            group,
+            consumer,
+            max(0, int(reclaim_idle_secs * 1000)),
+            cursor,
+            "COUNT",
+            max_count,
+            **{NEVER_DECODE: []},
+        )
+        next_cursor, entries = response[0], list(response[1] or [])
+        self._claim_cursors[(key, group)] = (
+            next_cursor.decode()
+            if isinstance(next_cursor, bytes)
+            else next_cursor
+        )
+
+        if len(entries) < max_count:
+            streams = await self._client.execute_command(
+                "XREADGROUP",
+                "GROUP",
+                group,
+                consumer,
+                "COUNT",
+                max_count - len(entries),
+                "STREAMS",
+                key,
+                ">",
+                **{NEVER_DECODE: []},
+            )
+            for _stream, fresh in streams or []:
+                entries.extend(fresh)
+
+        return [
+            (entry_id.decode(), (fields or {}).get(b"payload"))
+            for entry_id, fields in entries
+        ]
+
+    async def queue_ack(
+        self,
+        key: str,
+        group: str,
+        entry_ids: list[str],
+    ) -> None:
+        """``XACK`` and ``XDEL`` claimed entries in one round trip.
+
+        The entries are deleted as well as acked so the stream stays
+        bounded; this is why a stream is consumed by a single group.
+
+        Args:
+            key (`str`):
+                Stream key for the queue.
+            group (`str`):
+                The consumer group the entries were claimed in.
+            entry_ids (`list[str]`):
+                The ids returned by :meth:`queue_claim`.
+        """
+        if not entry_ids:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.xack(key, group, *entry_ids)
+            pipe.xdel(key, *entry_ids)
+            await pipe.execute()
+
     # ------------------------------------------------------------------
     # Mode C — replay log
     # ------------------------------------------------------------------
@@ -316,7 +636,7 @@ class RedisMessageBus(MessageBus):
             kwargs["approximate"] = True
         entry_id = await self._client.xadd(
             key,
-            {"payload": json.dumps(payload, ensure_ascii=False)},
+            {"payload": self.serializer.dumps(payload)},
             **kwargs,
         )
         if ttl_secs is not None:
@@ -345,19 +665,87 @@ class RedisMessageBus(MessageBus):
             `list[tuple[str, dict]]`:
                 ``(entry_id, payload)`` pairs in append order.
         """
-        start = self._exclusive_start(since)
-        entries = await self._client.xrange(
+        entries = await self._xrange_raw(
             key,
-            min=start,
-            count=max_count,
+            self._exclusive_start(since),
+            max_count,
         )
-        results: list[tuple[str, dict]] = []
-        for entry_id, fields in entries:
-            raw = fields.get("payload")
-            if raw is None:
-                continue
-            results.append((entry_id, json.loads(raw)))
-        return results
+        return [
+            (entry_id, self.serializer.loads(raw))
+            for entry_id, raw in entries
+            if raw is not None
+        ]
+
+    async def log_read_encoded(
+        self,
+        key: str,
+        since: str | None = None,
+        max_count: int = 100,
+    ) -> list[tuple[str, bytes]]:
+        """Read the stored JSON of up to ``max_count`` entries newer than
+        ``since``, without decoding it.
+
+        With a serializer other than :class:`JSONSerializer` the
+        payloads are decoded and re-encoded as JSON.
+
+        Args:
+            key (`str`):
+                Stream key for the replay log.
+            since (`str | None`, optional):
+                Exclusive cursor, as for :meth:`log_read`.
+            max_count (`int`, defaults to ``100``):
+                Maximum entries to return.
+
+        Returns:
+            `list[tuple[str, bytes]]`:
+                ``(entry_id, json_bytes)`` pairs in append order.
+        """
+        if not isinstance(self.serializer, JSONSerializer):
+            return await super().log_read_encoded(key, since, max_count)
+        entries = await self._xrange_raw(
+            key,
+            self._exclusive_start(since),
+            max_count,
+        )
+        return [(entry_id, raw) for entry_id, raw in entries if raw]
+
+    async def _xrange_raw(
+        self,
+        key: str,
+        start: str,
+        count: int,
+    ) -> list[tuple[str, bytes | None]]:
+        """``XRANGE`` from ``start`` with the payload fields left as
+        bytes, whatever the client's ``decode_responses``.
+
+        Args:
+            key (`str`):
+                Stream key.
+            start (`str`):
+                Inclusive start id, ``-`` for the beginning.
+            count (`int`):
+                Maximum entries to return.
+
+        Returns:
+            `list[tuple[str, bytes | None]]`:
+                ``(entry_id, payload)`` pairs; the payload is ``None``
+                for an entry without one.
+        """
+        from redis.client import NEVER_DECODE
+
+        entries = await self._client.execute_command(
+            "XRANGE",
+            key,
+            start,
+            "+",
+            "COUNT",
+            count,
+            **{NEVER_DECODE: []},
+        )
+        return [
+            (entry_id.decode(), (fields or {}).get(b"payload"))
+            for entry_id, fields in entries or []
+        ]
 
     async def log_trim(
         self,
@@ -504,7 +892,7 @@ class RedisMessageBus(MessageBus):
         """
         await self._client.publish(
             key,
-            json.dumps(payload, ensure_ascii=False),
+            self._broadcast_serializer.dumps(payload),
         )
 
     async def subscribe(
@@ -558,7 +946,7 @@ class RedisMessageBus(MessageBus):
                 data = message.get("data")
                 if data is None:
                     continue
-                yield json.loads(data)
+                yield self._broadcast_serializer.loads(data)
         finally:
             await pubsub.unsubscribe(key)
             await pubsub.aclose()
@@ -10,8 +10,12 @@ the last assistant message's content list (same pattern as
 
 Each injected HintBlock also yields a one-shot ``HintBlockEvent``
 so the front-end SSE stream can render it in real time.
+
+With an :class:`~agentscope.app._manager.InboxWatcher`, the drain is
+skipped on the steps where no producer signalled the session since the
+previous one, so an empty inbox costs no bus round trip.
 """
-from typing import Any, AsyncGenerator, Callable
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable
 
 from ..message_bus import MessageBus, MessageBusKeys
 from ..._logging import logger
@@ -20,6 +24,9 @@ from ...event import HintBlockEvent
 from ...message import AssistantMsg, HintBlock
 from ...middleware import MiddlewareBase
 
+if TYPE_CHECKING:
+    from .._manager import InboxWatcher
+
 
 class InboxMiddleware(MiddlewareBase):  # pylint: disable=abstract-method
     """Drain the session's inbox and inject HintBlocks before each
@@ -36,12 +43,17 @@ class InboxMiddleware(MiddlewareBase):  # pylint: disable=abstract-method
             The application message bus to read from.
         max_count (`int`, defaults to ``100``):
             Maximum number of entries drained per reasoning step.
+        inbox_watcher (`InboxWatcher | None`, optional):
+            When given, the inbox is drained on the first step of each
+            reply and afterwards only on the steps the watcher reports a
+            signal for. Without it, every step drains.
     """
 
     def __init__(
         self,
         message_bus: MessageBus,
         max_count: int = 100,
+        inbox_watcher: "InboxWatcher | None" = None,
     ) -> None:
         """Initialise the middleware.
 
@@ -50,9 +62,29 @@ class InboxMiddleware(MiddlewareBase):  # pylint: disable=abstract-method
                 The application-level message bus.
             max_count (`int`, defaults to ``100``):
                 Maximum entries drained per reasoning step.
+            inbox_watcher (`InboxWatcher | None`, optional):
+                The process-wide inbox signal tracker.
         """
         self._bus = message_bus
         self._max_count = max_count
+        self._watcher = inbox_watcher
+        self._reply_id: str | None = None
+
+    def _should_drain(self, agent: Agent) -> bool:
+        """Whether this reasoning step has to read the inbox.
+
+        Entries pushed before the watcher subscribed, or whose signal
+        was evicted, are picked up by the unconditional drain on the
+        first step of the reply.
+        """
+        if self._watcher is None:
+            return True
+        # Always consume the signal, so it does not trigger a second
+        # drain on the step after a first-step one
+        signalled = self._watcher.should_drain(agent.state.session_id)
+        first_step = agent.state.reply_id != self._reply_id
+        self._reply_id = agent.state.reply_id
+        return signalled or first_step
 
     async def on_reasoning(  # type: ignore[override]
         self,
@@ -78,10 +110,15 @@ class InboxMiddleware(MiddlewareBase):  # pylint: disable=abstract-method
                 One ``HintBlockEvent`` per drained inbox entry,
                 followed by events from downstream.
         """
-        entries = await self._bus.queue_drain(
-            MessageBusKeys.inbox(agent.state.session_id),
-            max_count=self._max_count,
-        )
+        entries = []
+        if self._should_drain(agent):
+            entries = await self._bus.queue_drain(
+                MessageBusKeys.inbox(agent.state.session_id),
+                max_count=self._max_count,
+            )
+            if self._watcher is not None and len(entries) >= self._max_count:
+                # More may be queued behind a full batch
+                self._watcher.mark(agent.state.session_id)
 
         if entries:
             hint_blocks = [
@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING
 
 from ._base import StorageBase
+from ._cached_storage import CachedStorage
 from ._redis_storage import RedisStorage
 from ._model import (
     AgentData,
@@ -67,6 +68,7 @@ def __getattr__(name: str) -> object:
 
 __all__ = [
     "StorageBase",
+    "CachedStorage",
     "RedisStorage",
     "AsyncSQLAlchemyStorage",
     # The ORM models
@@ -21,13 +21,32 @@ from ._model import (
     SkillRecord,
     TeamRecord,
 )
+from ..._utils._metrics import _instrument_operations, _interface_operations
 from ...credential import CredentialBase
 from ...message import Msg
 from ...state import AgentState
 
 
 class StorageBase(ABC):
-    """The storage abstract base class."""
+    """The storage abstract base class.
+
+    The durations of the operations of this interface that an
+    implementation defines are recorded in the process-wide metrics
+    registry, labelled by the implementation class. A storage wrapping
+    another one, such as :class:`CachedStorage`, records each call under
+    its own label and again under the wrapped backend's when it reaches
+    it, so the counts must not be summed across the ``backend`` label.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Instrument the operations of an implementation."""
+        super().__init_subclass__(**kwargs)
+        _instrument_operations(
+            cls,
+            "agentscope_storage_operation_seconds",
+            "Duration of storage operations.",
+            operations=_interface_operations(StorageBase),
+        )
 
     async def __aenter__(self) -> Self:
         """Start the storage backend (open connection pool, etc.)."""
@@ -347,6 +366,28 @@ class StorageBase(ABC):
             `AgentRecord | None`: The record, or ``None`` if not found.
         """
 
+    async def get_agents(
+        self,
+        keys: list[tuple[str, str]],
+    ) -> list[AgentRecord | None]:
+        """Fetch several agent records, possibly of different owners.
+
+        The default calls :meth:`get_agent` per key; backends override
+        it to read every record in one query.
+
+        Args:
+            keys (`list[tuple[str, str]]`):
+                ``(user_id, agent_id)`` pairs to fetch.
+
+        Returns:
+            `list[AgentRecord | None]`:
+                The records in key order, ``None`` where not found.
+        """
+        return [
+            await self.get_agent(user_id, agent_id)
+            for user_id, agent_id in keys
+        ]
+
     @abstractmethod
     async def delete_agent(self, user_id: str, agent_id: str) -> bool:
         """Delete an agent record.
@@ -744,6 +785,40 @@ class StorageBase(ABC):
             msg (`Msg`): The message to persist.
         """
 
+    async def write_session_batch(
+        self,
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+        messages: list[Msg],
+        state: AgentState | None = None,
+    ) -> None:
+        """Persist several messages and the state of a session together.
+
+        The messages are upserted in order, with the semantics of
+        :meth:`upsert_message`, then the state is written as by
+        :meth:`update_session_state`. The default makes one call per
+        write; backends override it to write everything in one
+        transaction.
+
+        Args:
+            user_id (`str`): The owner user id.
+            agent_id (`str`): The agent id.
+            session_id (`str`): The session id.
+            messages (`list[Msg]`): The messages to persist, in order.
+            state (`AgentState | None`, optional): The new agent state,
+                or ``None`` to leave it unchanged.
+        """
+        for msg in messages:
+            await self.upsert_message(user_id, session_id, msg)
+        if state is not None:
+            await self.update_session_state(
+                user_id=user_id,
+                agent_id=agent_id,
+                session_id=session_id,
+                state=state,
+            )
+
     @abstractmethod
     async def get_message(
         self,
@@ -986,6 +1061,9 @@ class StorageBase(ABC):
         indexing should go through :meth:`update_knowledge_document_status`
         instead, which is cheaper and atomic w.r.t. the lease fields.
 
+        A backend that indexes documents by content updates the index
+        in the same write, see :meth:`list_knowledge_documents_by_content`.
+
         Args:
             user_id (`str`):
                 The owner user id.  Must match ``record.user_id``.
@@ -997,6 +1075,96 @@ class StorageBase(ABC):
                 The stored record (with ``updated_at`` refreshed).
         """
 
+    async def insert_shared_knowledge_document(
+        self,
+        user_id: str,
+        record: KnowledgeDocumentRecord,
+    ) -> bool:
+        """Persist a document record that shares the content blob of
+        another of the owner's documents, only while one still does.
+
+        Succeeds only if another document of the owner with the same
+        ``data.content_hash`` references the same ``data.blob_uri``.
+        The check and the write should be atomic with respect to
+        :meth:`delete_knowledge_document`, so the blob a document
+        shares is never released between the two: a caller that sees
+        ``False`` stores the content itself.
+
+        The default upserts the record between two checks and deletes
+        it again if the second one fails, which narrows the race with
+        a concurrent delete without closing it; backends override it
+        with a compare-and-set.
+
+        Args:
+            user_id (`str`):
+                The owner user id.  Must match ``record.user_id``.
+            record (`KnowledgeDocumentRecord`):
+                The new record, with ``data.content_hash`` and the
+                shared ``data.blob_uri`` set.
+
+        Returns:
+            `bool`:
+                ``True`` if the record was stored, ``False`` if no
+                document references the blob anymore.
+        """
+
+        async def _shared() -> bool:
+            """Whether another document still references the blob."""
+            return any(
+                document.id != record.id
+                and document.data.blob_uri == record.data.blob_uri
+                for document in await self.list_knowledge_documents_by_content(
+                    user_id,
+                    record.data.content_hash,
+                )
+            )
+
+        if not await _shared():
+            return False
+        await self.upsert_knowledge_document(user_id, record)
+        if await _shared():
+            return True
+        await self.delete_knowledge_document(
+            user_id,
+            record.knowledge_base_id,
+            record.id,
+        )
+        return False
+
+    async def list_knowledge_documents_by_content(
+        self,
+        user_id: str,
+        content_hash: str,
+    ) -> list[KnowledgeDocumentRecord]:
+        """List the owner's documents with the given content digest,
+        across all their knowledge bases.
+
+        The default lists the documents of every knowledge base of the
+        owner; backends override it with an index maintained in the
+        same write as the document records, so that the cost is
+        proportional to the number of matching documents rather than
+        to the owner's total.
+
+        Args:
+            user_id (`str`):
+                The owner user id.
+            content_hash (`str`):
+                The ``data.content_hash`` to look up.
+
+        Returns:
+            `list[KnowledgeDocumentRecord]`:
+                The matching records, in arbitrary order.
+        """
+        return [
+            document
+            for knowledge_base in await self.list_knowledge_bases(user_id)
+            for document in await self.list_knowledge_documents(
+                user_id,
+                knowledge_base.id,
+            )
+            if document.data.content_hash == content_hash
+        ]
+
     @abstractmethod
     async def get_knowledge_document(
         self,
@@ -1048,8 +1216,10 @@ class StorageBase(ABC):
     ) -> bool:
         """Delete a knowledge document record.
 
-        Only removes the metadata record; cleanup of the underlying
-        blob and vector store records is the caller's responsibility.
+        Only removes the metadata record and, in the same write, its
+        entry in the content index if the backend keeps one; cleanup of
+        the underlying blob and vector store records is the caller's
+        responsibility.
 
         Args:
             user_id (`str`):
@@ -0,0 +1,996 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=too-many-public-methods
+"""A read-through cache in front of any storage backend.
+
+Credentials, agents, MCPs, skills, knowledge bases and teams are read on
+every chat run and most requests — resolving access, assembling agents,
+listing sessions with their teams — but written rarely.
+:class:`CachedStorage` wraps a :class:`StorageBase` and serves those reads
+from process memory, so every backend benefits without changes.
+
+Consistency across replicas goes through the :class:`MessageBus`: every
+``upsert_*`` / ``delete_*`` of a cached kind drops the writer's own
+entries of that kind and user at once, and broadcasts the same
+invalidation, which every other replica applies on receipt. A TTL bounds
+how long an entry survives a lost broadcast. Sessions, messages,
+schedules, channels and knowledge documents change too often to be worth
+caching and always go to the backend.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Self
+
+from pydantic import BaseModel
+
+from ._base import StorageBase
+from ._model import (
+    AgentRecord,
+    ChannelRecord,
+    CredentialRecord,
+    KnowledgeBaseRecord,
+    KnowledgeDocumentRecord,
+    KnowledgeDocumentStatus,
+    MCPRecord,
+    ScheduleRecord,
+    SessionConfig,
+    SessionRecord,
+    SessionSource,
+    SkillRecord,
+    TeamRecord,
+)
+from ..message_bus import MessageBus, MessageBusKeys
+from ..._logging import logger
+from ...credential import CredentialBase
+from ...message import Msg
+from ...state import AgentState
+
+_CREDENTIAL = "credential"
+_MCP = "mcp"
+_SKILL = "skill"
+_AGENT = "agent"
+_TEAM = "team"
+_KNOWLEDGE_BASE = "knowledge_base"
+
+
+def _copy(value: Any) -> Any:
+    """Deep-copy a cached record or list of records, so callers that
+    mutate what they read cannot corrupt the cache."""
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
+
+
+class CachedStorage(StorageBase):
+    """Cache the rarely-written records of a storage backend in process,
+    invalidated across replicas over the message bus.
+
+    Reads of a cached kind are keyed by method and arguments, and scoped
+    by ``(kind, user_id)`` — the unit a write invalidates. A read that
+    overlaps an invalidation of its scope is returned but not cached, so
+    a slow read cannot re-insert the value the write just replaced.
+    Callers receive copies of the cached records.
+
+    Operation metrics are recorded under the ``CachedStorage`` backend
+    label for every call and under the wrapped backend's label for the
+    calls that reach it, i.e. the misses and the writes.
+
+    Example:
+        .. code-block:: python
+
+            bus = RedisMessageBus()
+            app = create_app(
+                storage=CachedStorage(RedisStorage(), bus),
+                message_bus=bus,
+                workspace_manager=LocalWorkspaceManager(),
+            )
+    """
+
+    def __init__(
+        self,
+        storage: StorageBase,
+        message_bus: MessageBus,
+        ttl: float = 30.0,
+        max_size: int = 10000,
+    ) -> None:
+        """Initialize the cached storage.
+
+        Args:
+            storage (`StorageBase`):
+                The storage backend to cache.
+            message_bus (`MessageBus`):
+                The application message bus, carrying the invalidations
+                between replicas. It must be entered before this storage.
+            ttl (`float`, defaults to `30.0`):
+                The seconds a cached read stays valid, bounding the
+                staleness when an invalidation is lost.
+            max_size (`int`, defaults to `10000`):
+                The maximum number of cached reads, least recently used
+                first out.
+        """
+        self.storage = storage
+        self.ttl = ttl
+        self.max_size = max_size
+        self._bus = message_bus
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._scopes: dict[tuple[str, str], set[tuple]] = {}
+        self._generations: dict[tuple[str, str], int] = {}
+        self._task: asyncio.Task | None = None
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    async def __aenter__(self) -> Self:
+        """Start the backend, then the invalidation loop once its bus
+        subscription is live."""
+        await self.storage.__aenter__()
+        ready = asyncio.Event()
+        self._task = asyncio.create_task(
+            self._invalidation_loop(ready),
+            name="cached-storage:invalidate",
+        )
+        await ready.wait()
+        return self
+
+    async def aclose(self) -> None:
+        """Stop the invalidation loop and close the backend."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._entries.clear()
+        self._scopes.clear()
+        await self.storage.aclose()
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose backend-specific extras, e.g. ``get_client``."""
+        if name == "storage":
+            raise AttributeError(name)
+        return getattr(self.storage, name)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The cache size and its hit, miss and invalidation counters."""
+        return {
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+        }
+
+    # ------------------------------------------------------------------
+    # Cache mechanics
+    # ------------------------------------------------------------------
+
+    async def _cached(
+        self,
+        kind: str,
+        user_id: str,
+        read: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> Any:
+        """Serve a read of a cached kind, calling the backend on a miss.
+
+        Args:
+            kind (`str`):
+                The kind of record read.
+            user_id (`str`):
+                The owner user id, scoping the read.
+            read (`Callable[..., Awaitable[Any]]`):
+                The backend method.
+            *args (`Any`):
+                The method's arguments after ``user_id``.
+
+        Returns:
+            `Any`: A copy of the read's result.
+        """
+        scope = (kind, user_id)
+        key = (kind, user_id, read.__name__, args)
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return _copy(cached[1])
+
+        self._misses += 1
+        generation = self._generations.get(scope, 0)
+        value = await read(user_id, *args)
+        if self._generations.get(scope, 0) == generation:
+            self._put(scope, key, value)
+        return value
+
+    def _put(self, scope: tuple[str, str], key: tuple, value: Any) -> None:
+        """Cache a read, evicting the least recently used reads beyond
+        ``max_size``.
+
+        Args:
+            scope (`tuple[str, str]`):
+                The ``(kind, user_id)`` scope of the read.
+            key (`tuple`):
+                The cache key of the read.
+            value (`Any`):
+                The value read.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, _copy(value))
+        self._entries.move_to_end(key)
+        self._scopes.setdefault(scope, set()).add(key)
+        while len(self._entries) > self.max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self._scopes.get(evicted[:2], set()).discard(evicted)
+
+    def _invalidate(self, kinds: list[str], user_id: str) -> None:
+        """Drop the cached reads of the given kinds of one user.
+
+        Args:
+            kinds (`list[str]`):
+                The kinds of record written.
+            user_id (`str`):
+                The owner user id.
+        """
+        for kind in kinds:
+            scope = (kind, user_id)
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for key in self._scopes.pop(scope, ()):
+                if self._entries.pop(key, None) is not None:
+                    self._invalidations += 1
+
+    async def _written(self, kinds: list[str], user_id: str) -> None:
+        """Invalidate the written kinds here and on every other replica.
+
+        Args:
+            kinds (`list[str]`):
+                The kinds of record written.
+            user_id (`str`):
+                The owner user id.
+        """
+        self._invalidate(kinds, user_id)
+        try:
+            await self._bus.publish(
+                MessageBusKeys.storage_invalidate_channel(),
+                {"kinds": kinds, "user_id": user_id},
+            )
+        except Exception:  # pylint: disable=broad-except
+            # The write itself succeeded; other replicas fall back on
+            # the TTL.
+            logger.exception(
+                "CachedStorage failed to broadcast an invalidation of %s "
+                "for user %r.",
+                kinds,
+                user_id,
+            )
+
+    async def _invalidation_loop(self, ready: asyncio.Event) -> None:
+        """Subscribe to the invalidation channel and drop the matching
+        entries on each signal.
+
+        Args:
+            ready (`asyncio.Event`):
+                Signalled after the underlying SUBSCRIBE completes.
+        """
+        try:
+            async for payload in self._bus.subscribe(
+                MessageBusKeys.storage_invalidate_channel(),
+                on_ready=ready.set,
+            ):
+                kinds = payload.get("kinds")
+                user_id = payload.get("user_id")
+                if isinstance(kinds, list) and isinstance(user_id, str):
+                    self._invalidate(kinds, user_id)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("CachedStorage invalidation loop crashed.")
+        finally:
+            # Unblock ``__aenter__`` even if subscribe failed before
+            # ``on_ready`` ran, so startup cannot deadlock.
+            ready.set()
+
+    # ------------------------------------------------------------------
+    # Credentials
+    # ------------------------------------------------------------------
+
+    async def upsert_credential(
+        self,
+        user_id: str,
+        credential_data: CredentialBase,
+    ) -> str:
+        """Create or update a credential and invalidate its user's."""
+        result = await self.storage.upsert_credential(
+            user_id,
+            credential_data,
+        )
+        await self._written([_CREDENTIAL], user_id)
+        return result
+
+    async def list_credentials(self, user_id: str) -> list[CredentialRecord]:
+        """List all credentials for a given user, cached."""
+        return await self._cached(
+            _CREDENTIAL,
+            user_id,
+            self.storage.list_credentials,
+        )
+
+    async def get_credential(
+        self,
+        user_id: str,
+        credential_id: str,
+    ) -> CredentialRecord | None:
+        """Fetch a single credential record by id, cached."""
+        return await self._cached(
+            _CREDENTIAL,
+            user_id,
+            self.storage.get_credential,
+            credential_id,
+        )
+
+    async def delete_credential(
+        self,
+        user_id: str,
+        credential_id: str,
+    ) -> bool:
+        """Delete a credential and invalidate its user's."""
+        result = await self.storage.delete_credential(user_id, credential_id)
+        await self._written([_CREDENTIAL], user_id)
+        return result
+
+    # ------------------------------------------------------------------
+    # MCPs
+    # ------------------------------------------------------------------
+
+    async def upsert_mcp(self, user_id: str, mcp_record: MCPRecord) -> str:
+        """Create or update an installed-MCP record and invalidate its
+        user's."""
+        result = await self.storage.upsert_mcp(user_id, mcp_record)
+        await self._written([_MCP], user_id)
+        return result
+
+    async def list_mcps(self, user_id: str) -> list[MCPRecord]:
+        """List a user's installed MCPs, cached."""
+        return await self._cached(_MCP, user_id, self.storage.list_mcps)
+
+    async def get_mcp(self, user_id: str, mcp_id: str) -> MCPRecord | None:
+        """Fetch an installed-MCP record by id, cached."""
+        return await self._cached(
+            _MCP,
+            user_id,
+            self.storage.get_mcp,
+            mcp_id,
+        )
+
+    async def get_mcp_by_name(
+        self,
+        user_id: str,
+        name: str,
+    ) -> MCPRecord | None:
+        """Fetch an installed-MCP record by client name, cached."""
+        return await self._cached(
+            _MCP,
+            user_id,
+            self.storage.get_mcp_by_name,
+            name,
+        )
+
+    async def delete_mcp(self, user_id: str, mcp_id: str) -> bool:
+        """Delete an installed-MCP record and invalidate its user's."""
+        result = await self.storage.delete_mcp(user_id, mcp_id)
+        await self._written([_MCP], user_id)
+        return result
+
+    # ------------------------------------------------------------------
+    # Skills
+    # ------------------------------------------------------------------
+
+    async def upsert_skill(
+        self,
+        user_id: str,
+        skill_record: SkillRecord,
+    ) -> str:
+        """Create or update an installed-skill record and invalidate its
+        user's."""
+        result = await self.storage.upsert_skill(user_id, skill_record)
+        await self._written([_SKILL], user_id)
+        return result
+
+    async def list_skills(self, user_id: str) -> list[SkillRecord]:
+        """List a user's installed skills, cached."""
+        return await self._cached(_SKILL, user_id, self.storage.list_skills)
+
+    async def get_skill(
+        self,
+        user_id: str,
+        skill_id: str,
+    ) -> SkillRecord | None:
+        """Fetch an installed-skill record by id, cached."""
+        return await self._cached(
+            _SKILL,
+            user_id,
+            self.storage.get_skill,
+            skill_id,
+        )
+
+    async def get_skill_by_name(
+        self,
+        user_id: str,
+        name: str,
+    ) -> SkillRecord | None:
+        """Fetch an installed-skill record by name, cached."""
+        return await self._cached(
+            _SKILL,
+            user_id,
+            self.storage.get_skill_by_name,
+            name,
+        )
+
+    async def delete_skill(
+        self,
+        user_id: str,
+        skill_id: str,
+    ) -> bool:
+        """Delete an installed-skill record and invalidate its user's."""
+        result = await self.storage.delete_skill(user_id, skill_id)
+        await self._written([_SKILL], user_id)
+        return result
+
+    # ------------------------------------------------------------------
+    # Agents
+    # ------------------------------------------------------------------
+
+    async def upsert_agent(
+        self,
+        user_id: str,
+        agent_record: AgentRecord,
+    ) -> str:
+        """Create or update an agent and invalidate its user's."""
+        result = await self.storage.upsert_agent(user_id, agent_record)
+        await self._written([_AGENT], user_id)
+        return result
+
+    async def list_agents(self, user_id: str) -> list[AgentRecord]:
+        """List a user's agents, cached."""
+        return await self._cached(_AGENT, user_id, self.storage.list_agents)
+
+    async def get_agent(
+        self,
+        user_id: str,
+        agent_id: str,
+    ) -> AgentRecord | None:
+        """Fetch an agent record by id, cached."""
+        return await self._cached(
+            _AGENT,
+            user_id,
+            self.storage.get_agent,
+            agent_id,
+        )
+
+    async def get_agents(
+        self,
+        keys: list[tuple[str, str]],
+    ) -> list[AgentRecord | None]:
+        """Fetch several agent records, reading the uncached ones from
+        the backend in one batch and caching them as :meth:`get_agent`
+        would."""
+        records: list[AgentRecord | None] = [None] * len(keys)
+        missing: list[int] = []
+        now = time.monotonic()
+        for i, (user_id, agent_id) in enumerate(keys):
+            key = (_AGENT, user_id, "get_agent", (agent_id,))
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                records[i] = _copy(cached[1])
+            else:
+                missing.append(i)
+        if not missing:
+            return records
+
+        self._misses += len(missing)
+        generations = {
+            i: self._generations.get((_AGENT, keys[i][0]), 0) for i in missing
+        }
+        values = await self.storage.get_agents([keys[i] for i in missing])
+        for i, value in zip(missing, values):
+            records[i] = value
+            user_id, agent_id = keys[i]
+            scope = (_AGENT, user_id)
+            if self._generations.get(scope, 0) == generations[i]:
+                self._put(
+                    scope,
+                    (_AGENT, user_id, "get_agent", (agent_id,)),
+                    value,
+                )
+        return records
+
+    async def delete_agent(self, user_id: str, agent_id: str) -> bool:
+        """Delete an agent, which also scrubs its team references, and
+        invalidate its user's agents and teams."""
+        result = await self.storage.delete_agent(user_id, agent_id)
+        await self._written([_AGENT, _TEAM], user_id)
+        return result
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    async def upsert_session(
+        self,
+        user_id: str,
+        agent_id: str,
+        config: SessionConfig,
+        state: AgentState | None = None,
+        session_id: str | None = None,
+        source: SessionSource = SessionSource.USER,
+        source_schedule_id: str | None = None,
+        source_chat_id: str | None = None,
+        source_channel_id: str | None = None,
+    ) -> SessionRecord:
+        """Create or update a session."""
+        return await self.storage.upsert_session(
+            user_id,
+            agent_id,
+            config,
+            state=state,
+            session_id=session_id,
+            source=source,
+            source_schedule_id=source_schedule_id,
+            source_chat_id=source_chat_id,
+            source_channel_id=source_channel_id,
+        )
+
+    async def set_session_team_id(
+        self,
+        user_id: str,
+        session_id: str,
+        team_id: str | None,
+    ) -> None:
+        """Set or clear ``team_id`` on an existing session record."""
+        await self.storage.set_session_team_id(user_id, session_id, team_id)
+
+    async def update_session_state(
+        self,
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+        state: AgentState,
+    ) -> None:
+        """Update the agent state of a session."""
+        await self.storage.update_session_state(
+            user_id=user_id,
+            agent_id=agent_id,
+            session_id=session_id,
+            state=state,
+        )
+
+    async def list_sessions(
+        self,
+        user_id: str,
+        agent_id: str,
+    ) -> list[SessionRecord]:
+        """List an agent's sessions."""
+        return await self.storage.list_sessions(user_id, agent_id)
+
+    async def delete_session(
+        self,
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+    ) -> bool:
+        """Delete a session — a leader's takes its team and workers with
+        it — and invalidate its user's agents and teams."""
+        result = await self.storage.delete_session(
+            user_id,
+            agent_id,
+            session_id,
+        )
+        await self._written([_AGENT, _TEAM], user_id)
+        return result
+
+    async def get_session(
+        self,
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+    ) -> SessionRecord | None:
+        """Fetch a session record."""
+        return await self.storage.get_session(user_id, agent_id, session_id)
+
+    async def list_sessions_by_schedule(
+        self,
+        user_id: str,
+        schedule_id: str,
+    ) -> list[SessionRecord]:
+        """List the sessions spawned by a schedule."""
+        return await self.storage.list_sessions_by_schedule(
+            user_id,
+            schedule_id,
+        )
+
+    async def list_sessions_by_channel(
+        self,
+        user_id: str,
+        channel_id: str,
+    ) -> list[SessionRecord]:
+        """List the sessions bound to a channel."""
+        return await self.storage.list_sessions_by_channel(
+            user_id,
+            channel_id,
+        )
+
+    # ------------------------------------------------------------------
+    # Schedules
+    # ------------------------------------------------------------------
+
+    async def upsert_schedule(
+        self,
+        user_id: str,
+        record: ScheduleRecord,
+    ) -> str:
+        """Create or update a schedule."""
+        return await self.storage.upsert_schedule(user_id, record)
+
+    async def get_schedule(
+        self,
+        user_id: str,
+        schedule_id: str,
+    ) -> ScheduleRecord | None:
+        """Fetch a schedule record."""
+        return await self.storage.get_schedule(user_id, schedule_id)
+
+    async def list_schedules(self, user_id: str) -> list[ScheduleRecord]:
+        """List a user's schedules."""
+        return await self.storage.list_schedules(user_id)
+
+    async def delete_schedule(self, user_id: str, schedule_id: str) -> bool:
+        """Delete a schedule."""
+        return await self.storage.delete_schedule(user_id, schedule_id)
+
+    async def list_all_schedules(self) -> list[ScheduleRecord]:
+        """List the schedules of every user."""
+        return await self.storage.list_all_schedules()
+
+    # ------------------------------------------------------------------
+    # Channels
+    # ------------------------------------------------------------------
+
+    async def upsert_channel(
+        self,
+        record: ChannelRecord,
+        platform_bot_id: str,
+    ) -> str:
+        """Create or update a channel."""
+        return await self.storage.upsert_channel(record, platform_bot_id)
+
+    async def get_channel(self, channel_id: str) -> ChannelRecord | None:
+        """Fetch a channel record."""
+        return await self.storage.get_channel(channel_id)
+
+    async def list_channels(self, user_id: str) -> list[ChannelRecord]:
+        """List a user's channels."""
+        return await self.storage.list_channels(user_id)
+
+    async def list_all_channels(self) -> list[ChannelRecord]:
+        """List the channels of every user."""
+        return await self.storage.list_all_channels()
+
+    async def delete_channel(
+        self,
+        channel_id: str,
+        platform_bot_id: str,
+    ) -> bool:
+        """Delete a channel."""
+        return await self.storage.delete_channel(channel_id, platform_bot_id)
+
+    async def get_channel_id_by_platform_bot_id(
+        self,
+        platform_bot_id: str,
+    ) -> str | None:
+        """Find the channel bound to a platform bot."""
+        return await self.storage.get_channel_id_by_platform_bot_id(
+            platform_bot_id,
+        )
+
+    # ------------------------------------------------------------------
+    # Messages
+    # ------------------------------------------------------------------
+
+    async def upsert_message(
+        self,
+        user_id: str,
+        session_id: str,
+        msg: Msg,
+    ) -> None:
+        """Create or update a message of a session."""
+        await self.storage.upsert_message(user_id, session_id, msg)
+
+    async def write_session_batch(
+        self,
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+        messages: list[Msg],
+        state: AgentState | None = None,
+    ) -> None:
+        """Persist messages and the state of a session together."""
+        await self.storage.write_session_batch(
+            user_id,
+            agent_id,
+            session_id,
+            messages,
+            state,
+        )
+
+    async def get_message(
+        self,
+        user_id: str,
+        session_id: str,
+        message_id: str,
+    ) -> Msg | None:
+        """Fetch a message of a session."""
+        return await self.storage.get_message(user_id, session_id, message_id)
+
+    async def list_messages(
+        self,
+        user_id: str,
+        session_id: str,
+        limit: int = 50,
+        before: str | None = None,
+        **kwargs: Any,
+    ) -> tuple[list[Msg], bool]:
+        """List a page of a session's messages."""
+        return await self.storage.list_messages(
+            user_id,
+            session_id,
+            limit=limit,
+            before=before,
+            **kwargs,
+        )
+
+    # ------------------------------------------------------------------
+    # Teams
+    # ------------------------------------------------------------------
+
+    async def upsert_team(
+        self,
+        user_id: str,
+        record: TeamRecord,
+    ) -> TeamRecord:
+        """Create or update a team and invalidate its user's."""
+        result = await self.storage.upsert_team(user_id, record)
+        await self._written([_TEAM], user_id)
+        return result
+
+    async def get_team(self, user_id: str, team_id: str) -> TeamRecord | None:
+        """Fetch a team record, cached."""
+        return await self._cached(
+            _TEAM,
+            user_id,
+            self.storage.get_team,
+            team_id,
+        )
+
+    async def list_teams(self, user_id: str) -> list[TeamRecord]:
+        """List a user's teams, cached."""
+        return await self._cached(_TEAM, user_id, self.storage.list_teams)
+
+    async def delete_team(self, user_id: str, team_id: str) -> bool:
+        """Delete a team, which also deletes its workers, and invalidate
+        its user's teams and agents."""
+        result = await self.storage.delete_team(user_id, team_id)
+        await self._written([_TEAM, _AGENT], user_id)
+        return result
+
+    # ------------------------------------------------------------------
+    # Knowledge bases
+    # ------------------------------------------------------------------
+
+    async def upsert_knowledge_base(
+        self,
+        user_id: str,
+        record: KnowledgeBaseRecord,
+    ) -> KnowledgeBaseRecord:
+        """Create or update a knowledge base and invalidate its user's."""
+        result = await self.storage.upsert_knowledge_base(user_id, record)
+        await self._written([_KNOWLEDGE_BASE], user_id)
+        return result
+
+    async def get_knowledge_base(
+        self,
+        user_id: str,
+        knowledge_base_id: str,
+    ) -> KnowledgeBaseRecord | None:
+        """Fetch a knowledge base record, cached."""
+        return await self._cached(
+            _KNOWLEDGE_BASE,
+            user_id,
+            self.storage.get_knowledge_base,
+            knowledge_base_id,
+        )
+
+    async def list_knowledge_bases(
+        self,
+        user_id: str,
+    ) -> list[KnowledgeBaseRecord]:
+        """List a user's knowledge bases, cached."""
+        return await self._cached(
+            _KNOWLEDGE_BASE,
+            user_id,
+            self.storage.list_knowledge_bases,
+        )
+
+    async def delete_knowledge_base(
+        self,
+        user_id: str,
+        knowledge_base_id: str,
+    ) -> bool:
+        """Delete a knowledge base and invalidate its user's."""
+        result = await self.storage.delete_knowledge_base(
+            user_id,
+            knowledge_base_id,
+        )
+        await self._written([_KNOWLEDGE_BASE], user_id)
+        return result
+
+    # ------------------------------------------------------------------
+    # Knowledge documents
+    # ------------------------------------------------------------------
+
+    async def upsert_knowledge_document(
+        self,
+        user_id: str,
+        record: KnowledgeDocumentRecord,
+    ) -> KnowledgeDocumentRecord:
+        """Create or update a knowledge document."""
+        return await self.storage.upsert_knowledge_document(user_id, record)
+
+    async def insert_shared_knowledge_document(
+        self,
+        user_id: str,
+        record: KnowledgeDocumentRecord,
+    ) -> bool:
+        """Create a knowledge document sharing another's content blob."""
+        return await self.storage.insert_shared_knowledge_document(
+            user_id,
+            record,
+        )
+
+    async def list_knowledge_documents_by_content(
+        self,
+        user_id: str,
+        content_hash: str,
+    ) -> list[KnowledgeDocumentRecord]:
+        """List the owner's documents with a content digest."""
+        return await self.storage.list_knowledge_documents_by_content(
+            user_id,
+            content_hash,
+        )
+
+    async def get_knowledge_document(
+        self,
+        user_id: str,
+        knowledge_base_id: str,
+        document_id: str,
+    ) -> KnowledgeDocumentRecord | None:
+        """Fetch a knowledge document record."""
+        return await self.storage.get_knowledge_document(
+            user_id,
+            knowledge_base_id,
+            document_id,
+        )
+
+    async def list_knowledge_documents(
+        self,
+        user_id: str,
+        knowledge_base_id: str,
+    ) -> list[KnowledgeDocumentRecord]:
+        """List the documents of a knowledge base."""
+        return await self.storage.list_knowledge_documents(
+            user_id,
+            knowledge_base_id,
+        )
+
+    async def delete_knowledge_document(
+        self,
+        user_id: str,
+        knowledge_base_id: str,
+        document_id: str,
+    ) -> bool:
+        """Delete a knowledge document."""
+        return await self.storage.delete_knowledge_document(
+            user_id,
+            knowledge_base_id,
+            document_id,
+        )
+
+    async def update_knowledge_document_status(
+        self,
+        user_id: str,
+        knowledge_base_id: str,
+        document_id: str,
+        status: KnowledgeDocumentStatus,
+        error: str | None = None,
+        chunk_count: int | None = None,
+    ) -> None:
+        """Update the indexing status of a knowledge document."""
+        await self.storage.update_knowledge_document_status(
+            user_id,
+            knowledge_base_id,
+            document_id,
+            status,
+            error=error,
+            chunk_count=chunk_count,
+        )
+
+    async def acquire_knowledge_document_lease(
+        self,
+        user_id: str,
+        knowledge_base_id: str,
+        document_id: str,
+        processing_node: str,
+        lease_ttl: timedelta,
+        now: datetime | None = None,
+    ) -> bool:
+        """Acquire the indexing lease of a knowledge document."""
+        return await self.storage.acquire_knowledge_document_lease(
+            user_id,
+            knowledge_base_id,
+            document_id,
+            processing_node,
+            lease_ttl,
+            now=now,
+        )
+
+    async def renew_knowledge_document_lease(
+        self,
+        user_id: str,
+        knowledge_base_id: str,
+        document_id: str,
+        processing_node: str,
+        lease_ttl: timedelta,
+        now: datetime | None = None,
+    ) -> bool:
+        """Renew the indexing lease of a knowledge document."""
+        return await self.storage.renew_knowledge_document_lease(
+            user_id,
+            knowledge_base_id,
+            document_id,
+            processing_node,
+            lease_ttl,
+            now=now,
+        )
+
+    async def release_knowledge_document_lease(
+        self,
+        user_id: str,
+        knowledge_base_id: str,
+        document_id: str,
+        processing_node: str,
+    ) -> None:
+        """Release the indexing lease of a knowledge document."""
+        await self.storage.release_knowledge_document_lease(
+            user_id,
+            knowledge_base_id,
+            document_id,
+            processing_node,
+        )
+
+    async def list_knowledge_documents_with_expired_lease(
+        self,
+        now: datetime | None = None,
+    ) -> list[KnowledgeDocumentRecord]:
+        """List the documents whose indexing lease expired."""
+        return await self.storage.list_knowledge_documents_with_expired_lease(
+            now=now,
+        )
+
+    async def list_knowledge_documents_pending_since(
+        self,
+        threshold: datetime,
+    ) -> list[KnowledgeDocumentRecord]:
+        """List the documents pending indexing since a threshold."""
+        return await self.storage.list_knowledge_documents_pending_since(
+            threshold,
+        )
@@ -79,6 +79,36 @@ class KnowledgeDocumentData(BaseModel):
     :class:`~agentscope.app.rag.blob_store.BlobStoreBase`.  The worker
     streams bytes back through the same blob store."""
 
+    content_hash: str | None = Field(
+        default=None,
+        description="Hex SHA-256 digest of the uploaded bytes.",
+    )
+    """Digest of the uploaded bytes.  Documents of one owner with the
+    same digest share ``blob_uri`` and ``derived_uri``, except for
+    uploads that raced the release of the blobs they would have shared.
+    ``None`` on records that predate content addressing."""
+
+    derived_uri: str | None = Field(
+        default=None,
+        description=(
+            "URI of the blob caching the parse / chunk / embedding "
+            "output derived from the content."
+        ),
+    )
+    """Blob shared by the documents with the same ``content_hash``, in
+    which the worker caches the chunks per parser and chunker
+    configuration and their vectors per embedding model, so a duplicate
+    upload is neither re-parsed nor re-embedded.  ``None`` when the
+    upload could not be content-addressed."""
+
+    derived_key: str | None = Field(
+        default=None,
+        description="Blob store key of the blob at ``derived_uri``.",
+    )
+    """The key the worker rewrites ``derived_uri`` under.  ``None`` on
+    records written before the key was recorded, whose derived blob is
+    keyed by the owner and the digest alone."""
+
     error: str | None = Field(
         default=None,
         description=(
@@ -132,6 +132,11 @@ class RedisStorage(StorageBase):
         # Global index of every document key as ``user_id:kb_id:doc_id``;
         # used by the lease sweeper, never by per-user listing.
         knowledge_document_global_index: str = "agentscope:knowledge_documents"
+        # The owner's documents with one content digest, as
+        # ``kb_id:doc_id``
+        knowledge_content_index: str = (
+            "agentscope:user:{user_id}:knowledge_content:{content_hash}"
+        )
 
     def __init__(
         self,
@@ -785,6 +790,28 @@ class RedisStorage(StorageBase):
         raw = await self._client.get(key)
         return AgentRecord.model_validate_json(raw) if raw else None
 
+    async def get_agents(
+        self,
+        keys: list[tuple[str, str]],
+    ) -> list[AgentRecord | None]:
+        """Fetch several agent records with one ``MGET``."""
+        if not keys:
+            return []
+        raws = await self._client.mget(
+            [
+                self._key(
+                    self.key_config.agent,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                )
+                for user_id, agent_id in keys
+            ],
+        )
+        return [
+            AgentRecord.model_validate_json(raw) if raw else None
+            for raw in raws
+        ]
+
     async def delete_agent(self, user_id: str, agent_id: str) -> bool:
         """Delete an agent record and cascade-delete its sessions,
         schedules, and any team back-references.
@@ -1440,6 +1467,56 @@ class RedisStorage(StorageBase):
         await self._client.rpush(key, msg.model_dump_json())
         await self._refresh_key_ttl(key)
 
+    async def write_session_batch(
+        self,
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+        messages: list[Msg],
+        state: AgentState | None = None,
+    ) -> None:
+        """Upsert the messages and replace the state in one ``MULTI``.
+
+        The tail message and the session record are read first, then
+        every write goes out in a single transactional pipeline. The
+        caller holds the session lock, so no other writer interleaves.
+        """
+        msg_key = self._message_key(user_id, session_id)
+        session_key = self._key(
+            self.key_config.session,
+            user_id=user_id,
+            session_id=session_id,
+        )
+        record = None
+        if state is not None:
+            raw = await self._client.get(session_key)
+            if not raw:
+                raise KeyError(f"Session {session_id!r} not found.")
+            record = SessionRecord.model_validate_json(raw)
+            record.state = state
+            record.updated_at = datetime.now()
+        tail_id = None
+        if messages:
+            last_raw = await self._client.lindex(msg_key, -1)
+            if last_raw:
+                tail_id = Msg.model_validate_json(last_raw).id
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            for msg in messages:
+                if msg.id == tail_id:
+                    pipe.lset(msg_key, -1, msg.model_dump_json())
+                else:
+                    pipe.rpush(msg_key, msg.model_dump_json())
+                    tail_id = msg.id
+            if record is not None:
+                pipe.set(session_key, record.model_dump_json())
+            if self.key_ttl is not None:
+                if messages:
+                    pipe.expire(msg_key, self.key_ttl)
+                if record is not None:
+                    pipe.expire(session_key, self.key_ttl)
+            await pipe.execute()
+
     async def get_message(
         self,
         user_id: str,
@@ -1965,6 +2042,48 @@ class RedisStorage(StorageBase):
         """Encode (user_id, kb_id, doc_id) for the global sweeper index."""
         return f"{user_id}:{knowledge_base_id}:{document_id}"
 
+    def _content_index_key(self, user_id: str, content_hash: str) -> str:
+        """Format the per-digest document index Set key."""
+        return self._key(
+            self.key_config.knowledge_content_index,
+            user_id=user_id,
+            content_hash=content_hash,
+        )
+
+    def _queue_document_write(
+        self,
+        pipe: Any,
+        user_id: str,
+        record: KnowledgeDocumentRecord,
+        previous_hash: str | None,
+    ) -> None:
+        """Queue the writes of a document record and its indexes on a
+        transaction pipeline."""
+        key = self._document_key(user_id, record.knowledge_base_id, record.id)
+        token = f"{record.knowledge_base_id}:{record.id}"
+        pipe.set(key, record.model_dump_json())
+        if self.key_ttl is not None:
+            pipe.expire(key, self.key_ttl)
+        pipe.sadd(
+            self._document_index_key(user_id, record.knowledge_base_id),
+            record.id,
+        )
+        pipe.sadd(
+            self.key_config.knowledge_document_global_index,
+            self._document_global_token(
+                user_id,
+                record.knowledge_base_id,
+                record.id,
+            ),
+        )
+        if previous_hash and previous_hash != record.data.content_hash:
+            pipe.srem(self._content_index_key(user_id, previous_hash), token)
+        if record.data.content_hash:
+            pipe.sadd(
+                self._content_index_key(user_id, record.data.content_hash),
+                token,
+            )
+
     async def upsert_knowledge_document(
         self,
         user_id: str,
@@ -1997,27 +2116,102 @@ class RedisStorage(StorageBase):
             record.id,
         )
         existing_raw = await self._client.get(key)
+        previous_hash = None
         if existing_raw:
             existing = KnowledgeDocumentRecord.model_validate_json(
                 existing_raw,
             )
             record.created_at = existing.created_at
+            previous_hash = existing.data.content_hash
         record.updated_at = datetime.now()
 
-        await self._set_with_ttl(key, record.model_dump_json())
-        await self._client.sadd(
-            self._document_index_key(user_id, record.knowledge_base_id),
-            record.id,
+        async with self._client.pipeline(transaction=True) as pipe:
+            self._queue_document_write(pipe, user_id, record, previous_hash)
+            await pipe.execute()
+        return record
+
+    async def insert_shared_knowledge_document(
+        self,
+        user_id: str,
+        record: KnowledgeDocumentRecord,
+    ) -> bool:
+        """Persist a record sharing another document's content blob.
+
+        Reads the documents with the same digest under a ``WATCH`` of
+        the digest's index, which every document write and delete
+        touches in its transaction, and retries a few times on
+        ``WatchError`` before giving up (reported as ``False``).
+        """
+        if record.user_id != user_id:
+            raise ValueError(
+                "record.user_id does not match the given user_id.",
+            )
+        if not record.data.content_hash:
+            return False
+
+        index_key = self._content_index_key(
+            user_id,
+            record.data.content_hash,
         )
-        await self._client.sadd(
-            self.key_config.knowledge_document_global_index,
-            self._document_global_token(
-                user_id,
-                record.knowledge_base_id,
-                record.id,
-            ),
+        async with self._client.pipeline(transaction=True) as pipe:
+            for _ in range(3):
+                try:
+                    await pipe.watch(index_key)
+                    shared = False
+                    for token in await pipe.smembers(index_key):
+                        knowledge_base_id, document_id = token.rsplit(":", 1)
+                        raw = await pipe.get(
+                            self._document_key(
+                                user_id,
+                                knowledge_base_id,
+                                document_id,
+                            ),
+                        )
+                        if (
+                            raw
+                            and KnowledgeDocumentRecord.model_validate_json(
+                                raw,
+                            ).data.blob_uri
+                            == record.data.blob_uri
+                        ):
+                            shared = True
+                            break
+                    if not shared:
+                        await pipe.unwatch()
+                        return False
+                    record.updated_at = datetime.now()
+                    pipe.multi()
+                    self._queue_document_write(pipe, user_id, record, None)
+                    await pipe.execute()
+                    return True
+                except _watch_error():
+                    continue
+            return False
+
+    async def list_knowledge_documents_by_content(
+        self,
+        user_id: str,
+        content_hash: str,
+    ) -> list[KnowledgeDocumentRecord]:
+        """List the owner's documents with a content digest.
+
+        Reads the digest's index Set and fetches each record; records
+        whose keys have expired are skipped.
+        """
+        tokens = await self._client.smembers(
+            self._content_index_key(user_id, content_hash),
         )
-        return record
+        records: list[KnowledgeDocumentRecord] = []
+        for token in tokens:
+            knowledge_base_id, document_id = token.rsplit(":", 1)
+            raw = await self._client.get(
+                self._document_key(user_id, knowledge_base_id, document_id),
+            )
+            if raw:
+                records.append(
+                    KnowledgeDocumentRecord.model_validate_json(raw),
+                )
+        return records
 
     async def get_knowledge_document(
         self,
@@ -2066,19 +2260,32 @@ class RedisStorage(StorageBase):
     ) -> bool:
         """Delete a document record and remove it from the indexes."""
         key = self._document_key(user_id, knowledge_base_id, document_id)
-        deleted = await self._client.delete(key)
-        await self._client.srem(
-            self._document_index_key(user_id, knowledge_base_id),
-            document_id,
+        raw = await self._client.get(key)
+        content_hash = (
+            KnowledgeDocumentRecord.model_validate_json(raw).data.content_hash
+            if raw
+            else None
         )
-        await self._client.srem(
-            self.key_config.knowledge_document_global_index,
-            self._document_global_token(
-                user_id,
-                knowledge_base_id,
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.srem(
+                self._document_index_key(user_id, knowledge_base_id),
                 document_id,
-            ),
-        )
+            )
+            pipe.srem(
+                self.key_config.knowledge_document_global_index,
+                self._document_global_token(
+                    user_id,
+                    knowledge_base_id,
+                    document_id,
+                ),
+            )
+            if content_hash:
+                pipe.srem(
+                    self._content_index_key(user_id, content_hash),
+                    f"{knowledge_base_id}:{document_id}",
+                )
+            deleted = (await pipe.execute())[0]
         return deleted > 0
 
     async def update_knowledge_document_status(
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Promote the content digest of knowledge documents to a column.
+
+Revision ID: 0003_kd_content_hash
+Revises: 0002_mcps_skills
+Create Date: 2026-10-19 09:12:40.118204
+
+Uploads share their blobs with the owner's earlier documents of the same
+content, which are looked up by ``(user_id, content_hash)``. The digest
+moves out of ``payload["data"]`` into an indexed column, and back on
+downgrade.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_kd_content_hash"
+down_revision: Union[str, None] = "0002_mcps_skills"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_documents = sa.table(
+    "knowledge_documents",
+    sa.column("id", sa.String()),
+    sa.column("payload", sa.JSON()),
+    sa.column("content_hash", sa.String()),
+)
+
+
+def upgrade() -> None:
+    """Add the ``content_hash`` column and its index, and move the
+    existing digests into it."""
+    with op.batch_alter_table("knowledge_documents", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("content_hash", sa.String(length=64), nullable=True),
+        )
+        batch_op.create_index(
+            "ix_kd_user_content",
+            ["user_id", "content_hash"],
+            unique=False,
+        )
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(_documents.c.id, _documents.c.payload),
+    ).all()
+    for row_id, payload in rows:
+        data = dict((payload or {}).get("data") or {})
+        if "content_hash" not in data:
+            continue
+        content_hash = data.pop("content_hash")
+        bind.execute(
+            _documents.update()
+            .where(_documents.c.id == row_id)
+            .values(
+                payload={**payload, "data": data},
+                content_hash=content_hash,
+            ),
+        )
+
+
+def downgrade() -> None:
+    """Move the digests back into the payload and drop the column."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(
+            _documents.c.id,
+            _documents.c.payload,
+            _documents.c.content_hash,
+        ).where(_documents.c.content_hash.is_not(None)),
+    ).all()
+    for row_id, payload, content_hash in rows:
+        data = {**((payload or {}).get("data") or {})}
+        data["content_hash"] = content_hash
+        bind.execute(
+            _documents.update()
+            .where(_documents.c.id == row_id)
+            .values(payload={**payload, "data": data}),
+        )
+
+    with op.batch_alter_table("knowledge_documents", schema=None) as batch_op:
+        batch_op.drop_index("ix_kd_user_content")
+        batch_op.drop_column("content_hash")
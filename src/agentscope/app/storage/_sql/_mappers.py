@@ -7,7 +7,8 @@ Round-trip contract (the "no duplication" invariant enforced here):
   ``model_dump(mode="json")``, the envelope keys (``id`` /
   ``created_at`` / ``updated_at``) and every field listed in the
   row class' ``_indexed_fields`` are popped out into the promoted
-  columns, and whatever remains is stored verbatim in ``payload``.
+  columns, as are the nested fields named by ``_nested_fields``, and
+  whatever remains is stored verbatim in ``payload``.
 - On read (``_to_record``) the promoted columns are merged back into
   the payload dict and the whole thing is fed through
   ``model_validate`` — which, thanks to the ``mode="before"``
@@ -61,6 +62,11 @@ def _from_record(
     column_values: dict = {}
     for field in row_cls.get_indexed_fields():
         column_values[field] = dump.pop(field, None)
+    for column, path in row_cls.get_nested_fields().items():
+        parent = dump
+        for key in path[:-1]:
+            parent = parent.get(key) or {}
+        column_values[column] = parent.pop(path[-1], None)
     return row_cls(
         id=record.id,
         created_at=record.created_at,
@@ -97,4 +103,14 @@ def _to_record(
     obj["updated_at"] = row.updated_at
     for field in row.__class__.get_indexed_fields():
         obj[field] = getattr(row, field)
+    for column, path in row.__class__.get_nested_fields().items():
+        value = getattr(row, column)
+        if value is None:
+            # Leave legacy payload shapes to the record's validators
+            continue
+        parent = obj
+        for key in path[:-1]:
+            parent[key] = dict(parent.get(key) or {})
+            parent = parent[key]
+        parent[path[-1]] = value
     return record_cls.model_validate(obj)
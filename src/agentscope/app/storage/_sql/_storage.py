@@ -15,10 +15,16 @@ timestamp with :func:`_utcnow` (UTC, not the machine-local
 nodes in a distributed deployment regardless of each node's local
 timezone, while staying tz-naive so the plain ``DateTime`` columns
 need no dialect-specific timezone handling.
+
+The ``payload`` JSON columns are encoded by a
+:class:`~agentscope._utils._serialization.JSONSerializer` plugged into
+the engine, ``orjson``-backed when installed, instead of SQLAlchemy's
+default :mod:`json`.
 """
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Self
 
+from ...._utils._serialization import JSONSerializer, Serializer
 from .._base import StorageBase
 from .._model import (
     AgentRecord,
@@ -108,6 +114,7 @@ class AsyncSQLAlchemyStorage(StorageBase):
         auto_migrate: bool = False,
         engine: "AsyncEngine | None" = None,
         engine_kwargs: dict[str, Any] | None = None,
+        serializer: Serializer | None = None,
     ) -> None:
         """Configure the backend; nothing is opened until
         :meth:`__aenter__`.
@@ -144,18 +151,39 @@ class AsyncSQLAlchemyStorage(StorageBase):
                 when the engine is created internally (e.g.
                 ``echo=True``, ``pool_size=20``).  Ignored when
                 *engine* is supplied.
+            serializer (`Serializer | None`, optional):
+                Encodes the JSON columns of an internally created
+                engine; it must produce UTF-8 text.  Defaults to
+                :class:`JSONSerializer`.  ``json_serializer`` /
+                ``json_deserializer`` in *engine_kwargs* take
+                precedence.
+
+        Raises:
+            `ValueError`:
+                If ``serializer`` is binary.
         """
+        serializer = serializer or JSONSerializer()
+        if serializer.binary:
+            raise ValueError(
+                "JSON columns need a text serializer, got "
+                f"{type(serializer).__name__}.",
+            )
         self._url = url
         self._create_tables = create_tables
         self._auto_migrate = auto_migrate
         self._external_engine: "AsyncEngine | None" = engine
         self._engine_kwargs = engine_kwargs or {}
+        self._serializer = serializer
 
         # Populated in __aenter__; None until the context is entered.
         self._engine: "AsyncEngine | None" = None
         self._owns_engine: bool = False
         self._session_factory: "async_sessionmaker[AsyncSession] | None" = None
 
+    def _dump_json(self, obj: Any) -> str:
+        """Encode a JSON column value with the serializer."""
+        return self._serializer.dumps(obj).decode("utf-8")
+
     async def __aenter__(self) -> Self:
         """Build the engine (or adopt the external one) and optionally
         provision the schema.
@@ -172,7 +200,11 @@ class AsyncSQLAlchemyStorage(StorageBase):
             self._engine = create_async_engine(
                 self._url,
                 future=True,
-                **self._engine_kwargs,
+                **{
+                    "json_serializer": self._dump_json,
+                    "json_deserializer": self._serializer.loads,
+                    **self._engine_kwargs,
+                },
             )
             self._owns_engine = True
             # SQLite ignores foreign keys unless enabled per connection,
@@ -368,7 +400,9 @@ class AsyncSQLAlchemyStorage(StorageBase):
         # keeps its stored ``created_at`` and we read it back below.
         record.created_at = _to_naive_utc(record.created_at)
         new_row = _from_record(row_cls, record)
-        indexed = tuple(row_cls.get_indexed_fields())
+        indexed = tuple(row_cls.get_indexed_fields()) + tuple(
+            row_cls.get_nested_fields(),
+        )
         values = {
             col: getattr(new_row, col)
             for col in ("id", "created_at", "updated_at", "payload") + indexed
@@ -1024,6 +1058,38 @@ class AsyncSQLAlchemyStorage(StorageBase):
             return None
         return _to_record(row, AgentRecord)
 
+    async def get_agents(
+        self,
+        keys: list[tuple[str, str]],
+    ) -> list[AgentRecord | None]:
+        """Fetch several agent records in one query; owner-scoped."""
+        if not keys:
+            return []
+        from sqlalchemy import select
+
+        async with self._session() as sess:
+            rows = (
+                (
+                    await sess.execute(
+                        select(AgentRow).where(
+                            AgentRow.id.in_({aid for _uid, aid in keys}),
+                        ),
+                    )
+                )
+                .scalars()
+                .all()
+            )
+        by_id = {row.id: row for row in rows}
+        records: list[AgentRecord | None] = []
+        for user_id, agent_id in keys:
+            row = by_id.get(agent_id)
+            records.append(
+                _to_record(row, AgentRecord)
+                if row is not None and row.user_id == user_id
+                else None,
+            )
+        return records
+
     async def delete_agent(self, user_id: str, agent_id: str) -> bool:
         """Delete an agent + cascade sessions, schedules, team refs.
 
@@ -1354,6 +1420,48 @@ class AsyncSQLAlchemyStorage(StorageBase):
             )
             await sess.commit()
 
+    async def write_session_batch(
+        self,
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+        messages: list[Msg],
+        state: AgentState | None = None,
+    ) -> None:
+        """Upsert the messages and replace the state in one transaction.
+
+        New messages get increasing ``created_at`` values, a microsecond
+        apart, so they keep their batch order in :meth:`list_messages`.
+        """
+        _ = user_id, agent_id  # scoping enforced by caller
+        now = _utcnow()
+        async with self._session() as sess:
+            for offset, msg in enumerate(messages):
+                await sess.execute(
+                    self._upsert_stmt(
+                        MessageRow,
+                        {
+                            "session_id": session_id,
+                            "msg_id": msg.id,
+                            "created_at": now + timedelta(microseconds=offset),
+                            "payload": msg.model_dump(mode="json"),
+                        },
+                        ["session_id", "msg_id"],
+                        ("payload",),
+                    ),
+                )
+            if state is not None:
+                row = await sess.get(SessionRow, session_id)
+                if row is None:
+                    raise KeyError(f"Session {session_id!r} not found.")
+                record = _to_record(row, SessionRecord)
+                record.state = state
+                record.updated_at = now
+                new_row = _from_record(SessionRow, record)
+                row.payload = new_row.payload
+                row.updated_at = new_row.updated_at
+            await sess.commit()
+
     async def get_message(
         self,
         user_id: str,
@@ -1608,6 +1716,86 @@ class AsyncSQLAlchemyStorage(StorageBase):
         await self._write_row(KnowledgeDocumentRow, record)
         return record
 
+    async def insert_shared_knowledge_document(
+        self,
+        user_id: str,
+        record: KnowledgeDocumentRecord,
+    ) -> bool:
+        """Persist a record sharing another document's content blob.
+
+        A document sharing the blob is touched with an ``UPDATE``,
+        which takes its row lock, and the record is inserted in the
+        same transaction: a concurrent delete of that document either
+        commits first, and the update matches no row, or waits for
+        this commit and the deleter then sees the new record.
+        """
+        from sqlalchemy import select, update
+
+        if record.user_id != user_id:
+            raise ValueError(
+                "record.user_id does not match the given user_id.",
+            )
+        if not record.data.content_hash:
+            return False
+
+        async with self._session() as sess:
+            rows = (
+                (
+                    await sess.execute(
+                        select(KnowledgeDocumentRow).where(
+                            KnowledgeDocumentRow.user_id == user_id,
+                            KnowledgeDocumentRow.content_hash
+                            == record.data.content_hash,
+                        ),
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            for row in rows:
+                shared = _to_record(row, KnowledgeDocumentRecord)
+                if shared.data.blob_uri != record.data.blob_uri:
+                    continue
+                touched = await sess.execute(
+                    update(KnowledgeDocumentRow)
+                    .where(KnowledgeDocumentRow.id == row.id)
+                    .values(updated_at=_utcnow()),
+                )
+                if not touched.rowcount:
+                    continue
+
+                record.updated_at = _utcnow()
+                record.created_at = _to_naive_utc(record.created_at)
+                new_row = _from_record(KnowledgeDocumentRow, record)
+                sess.add(new_row)
+                await sess.commit()
+                return True
+        return False
+
+    async def list_knowledge_documents_by_content(
+        self,
+        user_id: str,
+        content_hash: str,
+    ) -> list[KnowledgeDocumentRecord]:
+        """The owner's documents with a content digest, through the
+        ``(user_id, content_hash)`` index."""
+        from sqlalchemy import select
+
+        async with self._session() as sess:
+            rows = (
+                (
+                    await sess.execute(
+                        select(KnowledgeDocumentRow).where(
+                            KnowledgeDocumentRow.user_id == user_id,
+                            KnowledgeDocumentRow.content_hash == content_hash,
+                        ),
+                    )
+                )
+                .scalars()
+                .all()
+            )
+        return [_to_record(r, KnowledgeDocumentRecord) for r in rows]
+
     async def get_knowledge_document(
         self,
         user_id: str,
@@ -70,7 +70,9 @@ class _JsonRecordMixin(_Base):
     The three envelope columns (``id`` / ``created_at`` /
     ``updated_at``) are always promoted and are handled by the mapper
     unconditionally, so ``_indexed_fields`` should list **only** the
-    extra table-specific columns.
+    extra table-specific columns.  Fields nested in the record's payload
+    are promoted through ``_nested_fields``, which maps each column to
+    the path of its field.
     """
 
     __abstract__ = True
@@ -91,12 +93,19 @@ class _JsonRecordMixin(_Base):
     # Populated by subclasses; see class docstring.
     _record_cls: ClassVar[type]
     _indexed_fields: ClassVar[tuple[str, ...]] = ()
+    _nested_fields: ClassVar[dict[str, tuple[str, ...]]] = {}
 
     @classmethod
     def get_indexed_fields(cls) -> tuple[str, ...]:
         """Return the tuple of record fields promoted to dedicated columns."""
         return cls._indexed_fields
 
+    @classmethod
+    def get_nested_fields(cls) -> dict[str, tuple[str, ...]]:
+        """Return the columns promoted from nested record fields, each
+        with the path of its field."""
+        return cls._nested_fields
+
 
 class CredentialRow(_JsonRecordMixin):
     """One row per :class:`~agentscope.app.storage.CredentialRecord`."""
@@ -267,6 +276,12 @@ class KnowledgeDocumentRow(_JsonRecordMixin):
         DateTime(),
         nullable=True,
     )
+    # Promoted from ``data.content_hash`` for the lookup of the owner's
+    # documents sharing a content blob
+    content_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+    )
 
     __table_args__ = (
         Index(
@@ -279,6 +294,11 @@ class KnowledgeDocumentRow(_JsonRecordMixin):
             "user_id",
             "knowledge_base_id",
         ),
+        Index(
+            "ix_kd_user_content",
+            "user_id",
+            "content_hash",
+        ),
     )
 
     _indexed_fields = (
@@ -288,6 +308,7 @@ class KnowledgeDocumentRow(_JsonRecordMixin):
         "status",
         "lease_expires_at",
     )
+    _nested_fields = {"content_hash": ("data", "content_hash")}
 
 
 class MCPRow(_JsonRecordMixin):
@@ -8,6 +8,7 @@ from .._embedding_response import EmbeddingResponse
 from .._embedding_usage import EmbeddingUsage
 from .._cache_base import EmbeddingCacheBase
 from .._embedding_base import EmbeddingModelBase
+from ..._utils._http_pool import _with_pooled_transport
 from ...credential import CredentialBase
 from ...message import TextBlock
 
@@ -80,7 +81,10 @@ class OllamaEmbeddingModel(EmbeddingModelBase[str | TextBlock]):
 
         import ollama
 
-        self.client: ollama.AsyncClient = ollama.AsyncClient(host=self.host)
+        self.client: ollama.AsyncClient = ollama.AsyncClient(
+            host=self.host,
+            **_with_pooled_transport({}, "ollama", self.host),
+        )
 
     async def _call_api(
         self,
@@ -9,6 +9,7 @@ from .._embedding_response import EmbeddingResponse
 from .._embedding_usage import EmbeddingUsage
 from .._cache_base import EmbeddingCacheBase
 from .._embedding_base import EmbeddingModelBase
+from ..._utils._http_pool import _with_pooled_http_client
 from ...credential import CredentialBase
 from ...message import TextBlock
 
@@ -95,7 +96,12 @@ class OpenAIEmbeddingModel(EmbeddingModelBase[str | TextBlock]):
 
         self.client: openai.AsyncClient = openai.AsyncClient(
             api_key=credential.api_key.get_secret_value(),
-            **client_kwargs,
+            **_with_pooled_http_client(
+                client_kwargs,
+                "openai",
+                client_kwargs.get("base_url"),
+                openai.DefaultAsyncHttpxClient,
+            ),
         )
         self.pass_dimensions = pass_dimensions
         self.embedding_cache: EmbeddingCacheBase | None = embedding_cache
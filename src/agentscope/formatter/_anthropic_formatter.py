@@ -8,7 +8,7 @@ from typing import Any
 import requests
 from pydantic import Field
 
-from ._formatter_base import FormatterBase
+from ._formatter_base import FormatterBase, _read_local_file_base64
 from .._logging import logger
 from .._utils._common import _json_loads_with_repair
 from ..message import (
@@ -339,8 +339,7 @@ class _AnthropicFormatterBase(FormatterBase, ABC):
         elif isinstance(source, URLSource):
             url = str(source.url)
             if url.startswith("file://"):
-                with open(url.removeprefix("file://"), "rb") as f:
-                    data = base64.b64encode(f.read()).decode("utf-8")
+                data = _read_local_file_base64(url.removeprefix("file://"))
             else:
                 response = requests.get(url, timeout=30)
                 response.raise_for_status()
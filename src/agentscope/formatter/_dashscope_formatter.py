@@ -1,14 +1,13 @@
 # -*- coding: utf-8 -*-
 """The DashScope formatter module (OpenAI-compatible format)."""
 
-import base64
 from typing import Any
 from fnmatch import fnmatch
 from abc import ABC
 
 from pydantic import Field
 
-from ._formatter_base import FormatterBase
+from ._formatter_base import FormatterBase, _read_local_file_base64
 from .._logging import logger
 from ..message import (
     Msg,
@@ -126,8 +125,7 @@ class _DashScopeFormatterBase(FormatterBase, ABC):
             url_str = str(source.url)
             if url_str.startswith("file://"):
                 local_path = url_str.removeprefix("file://")
-                with open(local_path, "rb") as f:
-                    encoded = base64.b64encode(f.read()).decode("utf-8")
+                encoded = _read_local_file_base64(local_path)
                 url = f"data:{source.media_type};base64,{encoded}"
             else:
                 url = url_str
@@ -155,8 +153,7 @@ class _DashScopeFormatterBase(FormatterBase, ABC):
             url_str = str(source.url)
             if url_str.startswith("file://"):
                 local_path = url_str.removeprefix("file://")
-                with open(local_path, "rb") as f:
-                    encoded = base64.b64encode(f.read()).decode("utf-8")
+                encoded = _read_local_file_base64(local_path)
                 url = f"data:{source.media_type};base64,{encoded}"
             else:
                 url = url_str
@@ -195,8 +192,7 @@ class _DashScopeFormatterBase(FormatterBase, ABC):
             url_str = str(source.url)
             if url_str.startswith("file://"):
                 local_path = url_str.removeprefix("file://")
-                with open(local_path, "rb") as f:
-                    encoded = base64.b64encode(f.read()).decode("utf-8")
+                encoded = _read_local_file_base64(local_path)
                 return {
                     "type": "input_audio",
                     "input_audio": {
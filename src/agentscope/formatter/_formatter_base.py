@@ -2,14 +2,18 @@
 """The formatter module."""
 import base64
 import mimetypes
+import os
 import tempfile
+import threading
 from abc import abstractmethod
+from collections import OrderedDict
 from fnmatch import fnmatch
 from typing import Any, List, AsyncGenerator
 
 import shortuuid
 from pydantic import BaseModel, Field
 
+from .._utils._metrics import _instrument_operations
 from ..message import (
     Msg,
     DataBlock,
@@ -20,7 +24,11 @@ from ..message import (
 
 
 class FormatterBase(BaseModel):
-    """The base class for formatters."""
+    """The base class for formatters.
+
+    The duration of ``format`` is recorded in the process-wide metrics
+    registry for every subclass.
+    """
 
     input_types: list[str] = Field(
         default_factory=lambda: ["text/plain"],
@@ -35,6 +43,17 @@ class FormatterBase(BaseModel):
     """The supported input types for this formatter, aligned with the model
     card's ``input_types`` field."""
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Instrument the ``format`` method of a formatter."""
+        super().__pydantic_init_subclass__(**kwargs)
+        _instrument_operations(
+            cls,
+            "agentscope_formatter_operation_seconds",
+            "Duration of message formatting.",
+            operations=("format",),
+        )
+
     @property
     def supported_input_media_types(self) -> list[str]:
         """Derive the accepted media-type patterns from :attr:`input_types` by
@@ -215,3 +234,116 @@ class FormatterBase(BaseModel):
 
         if group_type:
             yield group_type, group
+
+
+class _LocalFileCache:
+    """Base64 encodings of local files, bounded by their total size.
+
+    Formatting inlines each ``file://`` block as base64 on every model
+    call, so a ReAct loop re-reads and re-encodes the same files once
+    per iteration. Entries are keyed by the path, size and modification
+    time of the file, so a file changed on disk is read again.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes (`int`):
+                The maximum total length of the cached encodings; the
+                least recently used are evicted beyond it. Files larger
+                than this are never cached.
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The size, total encoded length, hits, misses and evictions of
+        the cache."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bytes": self._size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def read_base64(self, path: str) -> str:
+        """Read a local file as base64.
+
+        Args:
+            path (`str`):
+                The path of the file.
+
+        Returns:
+            `str`:
+                The base64-encoded content of the file.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        key = (
+            (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+            if stat is not None
+            else None
+        )
+        if key is not None:
+            with self._lock:
+                encoded = self._entries.get(key)
+                if encoded is not None:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return encoded
+                self._misses += 1
+
+        # Opened even when it cannot be stat'ed, so that a missing file
+        # raises from ``open`` as it always did
+        with open(path, "rb") as f:
+            encoded = base64.b64encode(f.read()).decode("utf-8")
+        if key is None or len(encoded) > self.max_bytes:
+            return encoded
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = encoded
+                self._size += len(encoded)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self._evictions += 1
+        return encoded
+
+    def clear(self) -> None:
+        """Drop every cached encoding and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+_LOCAL_FILE_CACHE = _LocalFileCache(max_bytes=64 * 1024 * 1024)
+
+
+def _read_local_file_base64(path: str) -> str:
+    """Read a local file as base64, reusing the encoding from an earlier
+    call while the file is unchanged.
+
+    Args:
+        path (`str`):
+            The path of the file.
+
+    Returns:
+        `str`:
+            The base64-encoded content of the file.
+    """
+    return _LOCAL_FILE_CACHE.read_base64(path)
@@ -8,7 +8,7 @@ from typing import Any
 import requests
 from pydantic import Field
 
-from ._formatter_base import FormatterBase
+from ._formatter_base import FormatterBase, _read_local_file_base64
 from .._logging import logger
 from .._utils._common import _json_loads_with_repair
 from ..message import (
@@ -85,8 +85,7 @@ class _GeminiFormatterBase(FormatterBase, ABC):
             if url.startswith("file://"):
                 # Local file - read and convert to base64
                 file_path = url.removeprefix("file://")
-                with open(file_path, "rb") as f:
-                    data = base64.b64encode(f.read()).decode("utf-8")
+                data = _read_local_file_base64(file_path)
                 return {
                     "inline_data": {
                         "data": data,
@@ -6,6 +6,7 @@ from typing import Any
 import requests
 from pydantic import Field
 
+from ._formatter_base import _read_local_file_base64
 from ._openai_formatter import _OpenAIFormatterBase
 from .._logging import logger
 from ..message import (
@@ -38,8 +39,7 @@ def _moonshot_format_image_source(
         url_str = str(source.url)
         if url_str.startswith("file://"):
             local_path = url_str.removeprefix("file://")
-            with open(local_path, "rb") as f:
-                encoded = base64.b64encode(f.read()).decode("utf-8")
+            encoded = _read_local_file_base64(local_path)
             url = f"data:{source.media_type};base64,{encoded}"
         else:
             response = requests.get(url_str, timeout=30)
@@ -9,7 +9,7 @@ from urllib.parse import urlparse
 import requests
 from pydantic import Field
 
-from ._formatter_base import FormatterBase
+from ._formatter_base import FormatterBase, _read_local_file_base64
 from .._logging import logger
 from ..message import (
     Msg,
@@ -105,8 +105,7 @@ class _OpenAIFormatterBase(FormatterBase, ABC):
             if url_str.startswith("file://"):
                 # Local file — read and encode as base64 data URI
                 local_path = url_str.removeprefix("file://")
-                with open(local_path, "rb") as f:
-                    encoded = base64.b64encode(f.read()).decode("utf-8")
+                encoded = _read_local_file_base64(local_path)
                 url = f"data:{source.media_type};base64,{encoded}"
             else:
                 # Remote URL — pass through as-is
@@ -170,8 +169,7 @@ class _OpenAIFormatterBase(FormatterBase, ABC):
                         f"Unsupported audio file extension: {extension}, "
                         "wav and mp3 are supported.",
                     )
-                with open(local_path, "rb") as f:
-                    data = base64.b64encode(f.read()).decode("utf-8")
+                data = _read_local_file_base64(local_path)
             else:
                 # Remote URL — download and encode
                 parsed = urlparse(url_str)
@@ -222,8 +220,7 @@ class _OpenAIFormatterBase(FormatterBase, ABC):
         elif isinstance(source, URLSource):
             url_str = str(source.url)
             if url_str.startswith("file://"):
-                with open(url_str.removeprefix("file://"), "rb") as f:
-                    data = base64.b64encode(f.read()).decode("utf-8")
+                data = _read_local_file_base64(url_str.removeprefix("file://"))
             else:
                 response = requests.get(url_str, timeout=30)
                 response.raise_for_status()
@@ -7,12 +7,11 @@ other formatter, the ``format()`` method returns a list of
 ``chat_pb2.Message`` proto objects rather than plain dicts, because the
 ``xai_sdk`` chat API accepts proto messages directly.
 """
-import base64
 from typing import Any, List
 
 from pydantic import Field
 
-from ._formatter_base import FormatterBase
+from ._formatter_base import FormatterBase, _read_local_file_base64
 from .._logging import logger
 from ..message import (
     Msg,
@@ -117,10 +116,9 @@ class XAIChatFormatter(FormatterBase):
                                     local_path = url_str.removeprefix(
                                         "file://",
                                     )
-                                    with open(local_path, "rb") as f:
-                                        encoded = base64.b64encode(
-                                            f.read(),
-                                        ).decode("utf-8")
+                                    encoded = _read_local_file_base64(
+                                        local_path,
+                                    )
                                     content_args.append(
                                         image(
                                             f"data:{block.source.media_type};"
@@ -321,10 +319,7 @@ class XAIChatFormatter(FormatterBase):
                     url_str = str(sub.source.url)
                     if url_str.startswith("file://"):
                         local_path = url_str.removeprefix("file://")
-                        with open(local_path, "rb") as f:
-                            encoded = base64.b64encode(f.read()).decode(
-                                "utf-8",
-                            )
+                        encoded = _read_local_file_base64(local_path)
                         args.append(
                             image(
                                 f"data:{sub.source.media_type};"
@@ -16,6 +16,7 @@ from ._block import (
     URLSource,
 )
 from ._base import Msg, UserMsg, AssistantMsg, SystemMsg, Usage
+from ._accumulator import MsgAccumulator
 
 
 __all__ = [
@@ -36,4 +37,5 @@ __all__ = [
     "AssistantMsg",
     "SystemMsg",
     "Usage",
+    "MsgAccumulator",
 ]
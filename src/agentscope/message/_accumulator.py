@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""The accumulator that folds a stream of agent events into a message."""
+import base64
+from typing import Any, TYPE_CHECKING
+
+from ._base import Msg
+from ._block import TextBlock, ToolResultBlock
+
+if TYPE_CHECKING:
+    from ..event import AgentEvent
+else:
+    AgentEvent = Any
+
+
+class MsgAccumulator:
+    """Fold the events of a streamed reply into a message in linear time.
+
+    ``Msg.append_event`` applies a text delta with ``block.text += delta``,
+    which copies the whole text on every token. The accumulator buffers the
+    text, thinking, tool-call input, tool-result text and data deltas as
+    lists of fragments instead, and joins them into the blocks of the
+    message once in ``build``. Every other event is applied with
+    ``Msg.append_event`` after the pending fragments are built, so the
+    result is the same as applying all the events to the message directly.
+
+    The blocks of ``msg`` miss the pending deltas until ``build`` is called,
+    so call it before reading, copying or serializing the message.
+
+    Example:
+        .. code-block:: python
+
+            accumulator = MsgAccumulator(reply)
+            async for event in agent.reply_stream(msg):
+                accumulator.append_event(event)
+            reply = accumulator.build()
+    """
+
+    def __init__(self, msg: Msg) -> None:
+        """Initialize the accumulator.
+
+        Args:
+            msg (`Msg`):
+                The message to fold the events into.
+        """
+        self.msg = msg
+        """The message that the events are folded into."""
+
+        self._fragments: dict[tuple[str, str], tuple[Any, str, list]] = {}
+
+    def append_event(self, event: AgentEvent) -> None:
+        """Apply a streaming event to the message, buffering its delta.
+
+        Args:
+            event (`AgentEvent`):
+                The event to apply.
+        """
+        from ..event import EventType  # local import to avoid circular dep
+
+        # pylint: disable=protected-access
+        target = None
+        if event.reply_id != self.msg.id:
+            pass
+        elif event.type == EventType.TEXT_BLOCK_DELTA:
+            key, field = ("text", event.block_id), "text"
+            target = self.msg._find_block(*key)
+            fragment: str | bytes = event.delta
+        elif event.type == EventType.THINKING_BLOCK_DELTA:
+            key, field = ("thinking", event.block_id), "thinking"
+            target = self.msg._find_block(*key)
+            fragment = event.delta
+        elif event.type == EventType.TOOL_CALL_DELTA:
+            key, field = ("tool_call", event.tool_call_id), "input"
+            target = self.msg._find_block(*key)
+            fragment = event.delta
+        elif event.type == EventType.DATA_BLOCK_DELTA and event.data:
+            key, field = ("data", event.block_id), "data"
+            block = self.msg._find_block(*key)
+            target = None if block is None else block.source
+            # Each delta is an independently base64-encoded chunk, so the
+            # raw bytes are buffered and encoded once in ``build``
+            fragment = base64.b64decode(event.data)
+        elif event.type == EventType.TOOL_RESULT_TEXT_DELTA:
+            key, field = ("tool_result", event.tool_call_id), "text"
+            block = self.msg._find_block(*key)
+            if (
+                isinstance(block, ToolResultBlock)
+                and isinstance(block.output, list)
+                and block.output
+                and isinstance(block.output[-1], TextBlock)
+            ):
+                target = block.output[-1]
+            fragment = event.delta
+
+        if target is None:
+            # Not a buffered delta, or one that starts a new text output of
+            # a tool result, or one that is skipped with a warning
+            self.build()
+            self.msg.append_event(event)
+            return
+
+        entry = self._fragments.get(key)
+        if entry is None or entry[0] is not target:
+            if entry is not None:
+                self.build()
+            self._fragments[key] = (target, field, [fragment])
+        else:
+            entry[2].append(fragment)
+
+    def build(self) -> Msg:
+        """Join the pending fragments into the blocks of the message.
+
+        Returns:
+            `Msg`:
+                The message with all the applied events.
+        """
+        fragments = self._fragments
+        self._fragments = {}
+        for target, field, pieces in fragments.values():
+            if field == "data":
+                existing = (
+                    base64.b64decode(target.data) if target.data else b""
+                )
+                target.data = base64.b64encode(
+                    existing + b"".join(pieces),
+                ).decode("ascii")
+            else:
+                setattr(
+                    target,
+                    field,
+                    getattr(target, field) + "".join(pieces),
+                )
+        return self.msg
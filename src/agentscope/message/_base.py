@@ -4,7 +4,7 @@ import base64
 from datetime import datetime
 from typing import Literal, List, overload, Sequence, Self, TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from .._utils._common import _generate_id
 from ._block import (
@@ -117,6 +117,11 @@ class Msg(BaseModel):
     """Structured error info, populated only when
     ``finished_reason == ReplyFinishedReason.ERROR``."""
 
+    _block_index: dict[tuple[str, str], int] = PrivateAttr(
+        default_factory=dict,
+    )
+    """The positions of the content blocks keyed by their type and id."""
+
     @model_validator(mode="after")
     def validate_role_content(self) -> Self:
         """Validate content blocks according to the role."""
@@ -235,11 +240,29 @@ class Msg(BaseModel):
         block_type: str,
         block_id: str,
     ) -> ContentBlock | None:
-        """Find a block in content by type and id."""
-        for block in self.content:
+        """Find a block in content by type and id.
+
+        The block-id index is validated against the content on each lookup
+        and rebuilt on a miss, so that it stays correct when the content is
+        modified without ``append_event``.
+        """
+        key = (block_type, block_id)
+        index = self._block_index.get(key)
+        if index is not None and index < len(self.content):
+            block = self.content[index]
             if block.type == block_type and block.id == block_id:
                 return block
-        return None
+
+        self._block_index = {}
+        for i, block in enumerate(self.content):
+            self._block_index.setdefault((block.type, block.id), i)
+        index = self._block_index.get(key)
+        return None if index is None else self.content[index]
+
+    def _append_block(self, block: ContentBlock) -> None:
+        """Append a block to the content and index it."""
+        self._block_index.setdefault((block.type, block.id), len(self.content))
+        self.content.append(block)
 
     def append_event(  # pylint: disable=too-many-branches
         self,
@@ -301,7 +324,7 @@ class Msg(BaseModel):
                     )
 
             case EventType.TEXT_BLOCK_START:
-                self.content.append(TextBlock(id=event.block_id, text=""))
+                self._append_block(TextBlock(id=event.block_id, text=""))
 
             case EventType.TEXT_BLOCK_DELTA | EventType.TEXT_BLOCK_END:
                 block = self._find_block("text", event.block_id)
@@ -316,7 +339,7 @@ class Msg(BaseModel):
                     block.finished_at = event.created_at
 
             case EventType.DATA_BLOCK_START:
-                self.content.append(
+                self._append_block(
                     DataBlock(
                         id=event.block_id,
                         source=Base64Source(
@@ -350,7 +373,7 @@ class Msg(BaseModel):
                     block.finished_at = event.created_at
 
             case EventType.THINKING_BLOCK_START:
-                self.content.append(
+                self._append_block(
                     ThinkingBlock(id=event.block_id, thinking=""),
                 )
 
@@ -376,10 +399,10 @@ class Msg(BaseModel):
                     hint=event.hint,
                 )
                 hint_block.finished_at = hint_block.created_at
-                self.content.append(hint_block)
+                self._append_block(hint_block)
 
             case EventType.TOOL_CALL_START:
-                self.content.append(
+                self._append_block(
                     ToolCallBlock(
                         id=event.tool_call_id,
                         name=event.tool_call_name,
@@ -401,7 +424,7 @@ class Msg(BaseModel):
                     block.finished_at = event.created_at
 
             case EventType.TOOL_RESULT_START:
-                self.content.append(
+                self._append_block(
                     ToolResultBlock(
                         id=event.tool_call_id,
                         name=event.tool_call_name,
@@ -509,7 +532,7 @@ class Msg(BaseModel):
                         continue
                     if result.finished_at is None:
                         result.finished_at = event.created_at
-                    self.content.append(result)
+                    self._append_block(result)
 
         return self
 
@@ -319,12 +319,14 @@ async def _search_across(
     knowledge base without per-KB pre-filtering.  Per-KB hits are
     flattened, sorted by descending score, and truncated to ``top_k``.
 
+    When any knowledge base has a lexical index, its scores are fused
+    ranks that do not compare with similarities, so the per-KB
+    rankings are merged with reciprocal-rank fusion instead.
+
     .. note::
         Scores from knowledge bases with different embedding models
-        are not strictly comparable; this merge sorts by raw score.
-        For mixed-embedding deployments where that matters, switch to
-        a rank-based fusion (e.g. RRF) — each per-KB
-        :meth:`KnowledgeBase.search` already returns ordered results.
+        are not strictly comparable either; without a lexical index
+        this merge still sorts by raw score.
 
     Args:
         knowledge_bases (`list[KnowledgeBase]`):
@@ -355,6 +357,14 @@ async def _search_across(
         ),
     )
 
+    if len(per_kb) > 1 and any(
+        getattr(kb, "lexical_index", None) is not None
+        for kb in knowledge_bases
+    ):
+        from ..rag import reciprocal_rank_fusion
+
+        return reciprocal_rank_fusion(per_kb)[:top_k]
+
     merged = [r for sub in per_kb for r in sub]
     merged.sort(key=lambda r: r.score, reverse=True)
     return merged[:top_k]
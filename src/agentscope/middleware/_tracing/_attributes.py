@@ -112,6 +112,14 @@ class SpanAttributes:
     )
     """The number of input tokens used to create prompt cache."""
 
+    AGENTSCOPE_TOOL_DEFINITIONS_HASH = "agentscope.tool_definitions.hash"
+    """SHA-1 digest of the tool definitions offered to a model call.
+
+    The ``gen_ai.tool.definitions`` attribute is recorded on the first
+    ``chat`` span of a trace offering a set of tools; later spans of the
+    trace offering the same set only carry this digest.
+    """
+
     AGENTSCOPE_REPLY_ID = "agentscope.agent.reply_id"
     """The reply ID of the current agent reply.
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """Extract attributes from AgentScope components for OpenTelemetry tracing."""
 import inspect
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Callable, Dict, TYPE_CHECKING
 
 from ...message import Msg, ToolCallBlock
 
@@ -11,7 +11,6 @@ from ._attributes import (
     ProviderNameValues,
 )
 from ._converter import _convert_block_to_part
-from ._utils import _serialize_to_str
 from ...model import ChatResponse, ChatModelBase
 from ...event import (
     ExternalExecutionResultEvent,
@@ -106,8 +105,8 @@ def _get_provider_name(instance: "ChatModelBase") -> str:
 def _get_tool_definitions(
     tools: list[dict[str, Any]] | None,
     tool_choice: "ToolChoice | None",
-) -> str | None:
-    """Extract and serialize tool definitions for tracing.
+) -> list[dict[str, Any]] | None:
+    """Extract tool definitions for tracing.
 
     Converts AgentScope/OpenAI nested tool format to OpenTelemetry GenAI
     flat format for tracing.
@@ -122,8 +121,8 @@ def _get_tool_definitions(
             should not be traced.
 
     Returns:
-        `str | None`:
-            Serialized tool definitions in flat format:
+        `list[dict[str, Any]] | None`:
+            Tool definitions in flat format:
             ``[{"type": "function", "name": ..., "parameters": ...}]``
             or None if tools should not be traced (e.g., tools is None/empty
             or tool_choice is "none").
@@ -157,9 +156,7 @@ def _get_tool_definitions(
             flat_tool = {k: v for k, v in flat_tool.items() if v is not None}
             flat_tools.append(flat_tool)
 
-        if flat_tools:
-            return _serialize_to_str(flat_tools)
-        return None
+        return flat_tools or None
 
     except Exception:
         return None
@@ -213,17 +210,35 @@ def _get_llm_request_attributes(
         SpanAttributes.GEN_AI_REQUEST_SEED: kwargs.get("seed"),
     }
 
-    # Extract tool definitions if provided
-    tool_definitions = _get_tool_definitions(
-        tools=kwargs.get("tools"),
-        tool_choice=kwargs.get("tool_choice"),
-    )
-    if tool_definitions:
-        attributes[SpanAttributes.GEN_AI_TOOL_DEFINITIONS] = tool_definitions
-
     return {k: v for k, v in attributes.items() if v is not None}
 
 
+def _get_llm_request_payloads(
+    kwargs: Dict[str, Any],
+) -> Dict[str, Callable[[], Any]]:
+    """Get the deferred payload attributes of an LLM request.
+
+    Args:
+        kwargs (`Dict[str, Any]`):
+            Keyword arguments of the model call, including ``tools`` and
+            ``tool_choice``.
+
+    Returns:
+        `Dict[str, Callable[[], Any]]`:
+            Callables producing the tool definitions, evaluated only if
+            the span keeps its payloads.
+    """
+    tools = kwargs.get("tools")
+    if not tools:
+        return {}
+    tool_choice = kwargs.get("tool_choice")
+    return {
+        SpanAttributes.GEN_AI_TOOL_DEFINITIONS: (
+            lambda: _get_tool_definitions(tools, tool_choice)
+        ),
+    }
+
+
 def _get_llm_span_name(attributes: Dict[str, str]) -> str:
     """Generate span name for LLM operations.
 
@@ -325,8 +340,9 @@ def _get_llm_response_attributes(
     Returns:
         `Dict[str, Any]`:
             OpenTelemetry GenAI response attributes including response ID,
-            finish reasons, token usage (input/output tokens), and output
-            messages.
+            finish reasons and token usage (input/output tokens). The
+            output messages are a payload, see
+            :func:`_get_llm_response_payloads`.
     """
     attributes = {
         SpanAttributes.GEN_AI_RESPONSE_ID: getattr(
@@ -358,15 +374,29 @@ def _get_llm_response_attributes(
                 SpanAttributes.AGENTSCOPE_CACHE_CREATION_INPUT_TOKENS
             ] = cache_creation
 
-    output_messages = _get_llm_output_messages(chat_response)
-    if output_messages:
-        attributes[SpanAttributes.GEN_AI_OUTPUT_MESSAGES] = _serialize_to_str(
-            output_messages,
-        )
-
     return attributes
 
 
+def _get_llm_response_payloads(
+    chat_response: ChatResponse | None,
+) -> Dict[str, Callable[[], Any]]:
+    """Get the deferred payload attributes of an LLM response.
+
+    Args:
+        chat_response (`ChatResponse | None`):
+            Chat response object with content blocks.
+
+    Returns:
+        `Dict[str, Callable[[], Any]]`:
+            Callables producing the output messages.
+    """
+    return {
+        SpanAttributes.GEN_AI_OUTPUT_MESSAGES: (
+            lambda: _get_llm_output_messages(chat_response) or None
+        ),
+    }
+
+
 def _get_agent_messages(
     msg: Msg | list[Msg],
 ) -> list[dict[str, Any]]:
@@ -446,7 +476,9 @@ def _get_agent_request_attributes(
     Returns:
         `Dict[str, str]`:
             OpenTelemetry GenAI attributes including operation name, agent ID,
-            agent name, agent description, and input messages (if provided).
+            agent name, agent description, and the type of a continuation
+            event. The input messages are a payload, see
+            :func:`_get_agent_request_payloads`.
     """
     attributes = {
         SpanAttributes.GEN_AI_OPERATION_NAME: (
@@ -460,24 +492,41 @@ def _get_agent_request_attributes(
     }
 
     inputs = kwargs.get("inputs")
-    if inputs is not None:
-        if isinstance(inputs, (Msg, list)):
-            input_messages = _get_agent_messages(inputs)
-            attributes[
-                SpanAttributes.GEN_AI_INPUT_MESSAGES
-            ] = _serialize_to_str(input_messages)
-        elif isinstance(inputs, UserConfirmResultEvent):
-            attributes[
-                SpanAttributes.AGENTSCOPE_INCOMING_EVENT_TYPE
-            ] = "user_confirm_result"
-        elif isinstance(inputs, ExternalExecutionResultEvent):
-            attributes[
-                SpanAttributes.AGENTSCOPE_INCOMING_EVENT_TYPE
-            ] = "external_execution_result"
+    if isinstance(inputs, UserConfirmResultEvent):
+        attributes[
+            SpanAttributes.AGENTSCOPE_INCOMING_EVENT_TYPE
+        ] = "user_confirm_result"
+    elif isinstance(inputs, ExternalExecutionResultEvent):
+        attributes[
+            SpanAttributes.AGENTSCOPE_INCOMING_EVENT_TYPE
+        ] = "external_execution_result"
 
     return attributes
 
 
+def _get_agent_request_payloads(
+    kwargs: Dict[str, Any],
+) -> Dict[str, Callable[[], Any]]:
+    """Get the deferred payload attributes of an agent request.
+
+    Args:
+        kwargs (`Dict[str, Any]`):
+            Keyword arguments passed to the agent's reply method.
+
+    Returns:
+        `Dict[str, Callable[[], Any]]`:
+            Callables producing the input messages, if any were given.
+    """
+    inputs = kwargs.get("inputs")
+    if not isinstance(inputs, (Msg, list)):
+        return {}
+    return {
+        SpanAttributes.GEN_AI_INPUT_MESSAGES: (
+            lambda: _get_agent_messages(inputs)
+        ),
+    }
+
+
 def _get_agent_span_name(attributes: Dict[str, str]) -> str:
     """Generate span name for agent operations.
 
@@ -497,25 +546,24 @@ def _get_agent_span_name(attributes: Dict[str, str]) -> str:
     )
 
 
-def _get_agent_response_attributes(
+def _get_agent_response_payloads(
     agent_response: Msg,
-) -> Dict[str, str]:
-    """Get agent response attributes for OpenTelemetry tracing.
+) -> Dict[str, Callable[[], Any]]:
+    """Get the deferred payload attributes of an agent response.
 
     Args:
         agent_response (`Msg`):
             Response message returned by agent, containing content blocks.
 
     Returns:
-        `Dict[str, str]`:
-            OpenTelemetry GenAI response attributes including output messages.
+        `Dict[str, Callable[[], Any]]`:
+            Callables producing the output messages.
     """
-    attributes = {
-        SpanAttributes.GEN_AI_OUTPUT_MESSAGES: _serialize_to_str(
-            _get_agent_messages(agent_response),
+    return {
+        SpanAttributes.GEN_AI_OUTPUT_MESSAGES: (
+            lambda: _get_agent_messages(agent_response)
         ),
     }
-    return attributes
 
 
 def _get_tool_request_attributes(
@@ -586,10 +634,10 @@ def _get_tool_span_name(attributes: Dict[str, str]) -> str:
     )
 
 
-def _get_tool_response_attributes(
+def _get_tool_response_payloads(
     tool_response: Any,
-) -> Dict[str, str]:
-    """Get tool response attributes for OpenTelemetry tracing.
+) -> Dict[str, Callable[[], Any]]:
+    """Get the deferred payload attributes of a tool execution.
 
     Args:
         tool_response (`Any`):
@@ -597,12 +645,9 @@ def _get_tool_response_attributes(
             returned by the tool function.
 
     Returns:
-        `Dict[str, str]`:
-            OpenTelemetry GenAI response attributes including tool call result.
+        `Dict[str, Callable[[], Any]]`:
+            Callables producing the tool call result.
     """
-    attributes = {
-        SpanAttributes.GEN_AI_TOOL_CALL_RESULT: _serialize_to_str(
-            tool_response,
-        ),
+    return {
+        SpanAttributes.GEN_AI_TOOL_CALL_RESULT: lambda: tool_response,
     }
-    return attributes
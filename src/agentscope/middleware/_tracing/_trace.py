@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 """TracingMiddleware and supporting utilities for OpenTelemetry tracing."""
+import hashlib
 import json
+import random
+from copy import deepcopy
+from collections import OrderedDict
 from typing import (
     Any,
     AsyncGenerator,
@@ -31,17 +35,20 @@ from ._attributes import SpanAttributes, OperationNameValues
 from ._extractor import (
     _get_common_attributes,
     _get_agent_request_attributes,
+    _get_agent_request_payloads,
     _get_agent_span_name,
-    _get_agent_response_attributes,
+    _get_agent_response_payloads,
     _get_llm_request_attributes,
+    _get_llm_request_payloads,
     _get_llm_span_name,
     _get_llm_response_attributes,
+    _get_llm_response_payloads,
     _get_tool_request_attributes,
     _get_tool_span_name,
-    _get_tool_response_attributes,
+    _get_tool_response_payloads,
 )
 from ._setup import _get_tracer
-from ._utils import _serialize_to_str
+from ._utils import _serialize_bounded, _serialize_to_str
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span
@@ -50,6 +57,13 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+Payloads = dict[str, Callable[[], Any]]
+"""Span attributes whose values are produced, and serialized, only when
+the span keeps its payloads."""
+
+_MAX_TOOL_DIGESTS = 1024
+"""The number of tool definitions whose digests are remembered."""
+
 
 # ---------------------------------------------------------------------------
 # Utility helpers
@@ -86,9 +100,15 @@ def _set_span_error_status(span: "Span", e: BaseException) -> None:
 async def _trace_async_generator_wrapper(
     res: AsyncGenerator[T, None],
     span: "Span",
+    record_payloads: Callable[["Span", Payloads, bool], None],
+    request_payloads: Payloads,
 ) -> AsyncGenerator[T, None]:
     """Wrap an async generator so that response attributes are captured from
-    the last yielded chunk before the span is closed."""
+    the last yielded chunk before the span is closed.
+
+    The request and response payloads are recorded together once the
+    stream is exhausted, so their serialization never delays a chunk.
+    """
     has_error = False
 
     try:
@@ -99,6 +119,7 @@ async def _trace_async_generator_wrapper(
 
     except BaseException as e:
         has_error = True
+        record_payloads(span, request_payloads, True)
         _set_span_error_status(span, e)
         raise
 
@@ -106,6 +127,14 @@ async def _trace_async_generator_wrapper(
         if not has_error:
             response_attributes = _get_llm_response_attributes(last_chunk)
             span.set_attributes(response_attributes)
+            record_payloads(
+                span,
+                {
+                    **request_payloads,
+                    **_get_llm_response_payloads(last_chunk),
+                },
+                False,
+            )
             _set_span_success_status(span)
 
 
@@ -121,6 +150,17 @@ class TracingMiddleware(MiddlewareBase):
     When tracing has not been configured (``setup_tracing`` was not called),
     every hook short-circuits to ``next_handler`` with near-zero overhead.
 
+    Spans start with their cheap attributes only. The payload attributes
+    (input and output messages, tool definitions and tool results) are
+    extracted and serialized when the span ends, and only if the span is
+    recorded by the tracer's sampler (head sampling) and then kept by
+    ``payload_sample_rate`` or because it failed (tail sampling). Each
+    payload is bounded by ``max_attribute_bytes``, and a set of tool
+    definitions is recorded once per trace, later ``chat`` spans carrying
+    its digest in ``agentscope.tool_definitions.hash`` instead. The digest
+    of each tool definition is remembered by tool name, so an unchanged
+    definition is compared rather than serialized again.
+
     Example::
 
         from agentscope.middleware import TracingMiddleware
@@ -131,6 +171,153 @@ class TracingMiddleware(MiddlewareBase):
         )
     """
 
+    def __init__(
+        self,
+        max_attribute_bytes: int | None = 32768,
+        payload_sample_rate: float = 1.0,
+        max_traces: int = 1024,
+    ) -> None:
+        """Initialize the tracing middleware.
+
+        Args:
+            max_attribute_bytes (`int | None`, defaults to `32768`):
+                The byte budget of each payload attribute. A message list
+                over budget keeps its first and last messages, the others
+                are replaced with a ``{"truncated": <count>}`` item; other
+                values are cut with a marker. ``None`` records payloads
+                whole.
+            payload_sample_rate (`float`, defaults to `1.0`):
+                The fraction of successful spans that record their
+                payloads. Failed spans always record them.
+            max_traces (`int`, defaults to `1024`):
+                The number of traces whose recorded tool definitions are
+                remembered for deduplication.
+        """
+        self.max_attribute_bytes = max_attribute_bytes
+        self.payload_sample_rate = payload_sample_rate
+        self.max_traces = max_traces
+        self._tool_definitions: OrderedDict[int, set[str]] = OrderedDict()
+        self._tool_digests: OrderedDict[str, tuple[dict, str]] = OrderedDict()
+
+    def _keep_payloads(self, span: "Span", has_error: bool) -> bool:
+        """Decide whether a span records its payloads.
+
+        Args:
+            span (`Span`):
+                The span about to end.
+            has_error (`bool`):
+                Whether the traced operation failed.
+
+        Returns:
+            `bool`:
+                ``False`` for a span the sampler dropped, otherwise
+                ``True`` for a failed span and with probability
+                ``payload_sample_rate`` for a successful one.
+        """
+        if not span.is_recording():
+            return False
+        return (
+            has_error
+            or self.payload_sample_rate >= 1.0
+            or random.random() < self.payload_sample_rate
+        )
+
+    def _first_in_trace(self, span: "Span", digest: str) -> bool:
+        """Record a tool definitions digest for the span's trace.
+
+        Args:
+            span (`Span`):
+                The span offering the tool definitions.
+            digest (`str`):
+                The digest of the tool definitions.
+
+        Returns:
+            `bool`:
+                Whether the digest is new to the trace.
+        """
+        trace_id = span.get_span_context().trace_id
+        seen = self._tool_definitions.get(trace_id)
+        if seen is None:
+            seen = self._tool_definitions[trace_id] = set()
+            while len(self._tool_definitions) > self.max_traces:
+                self._tool_definitions.popitem(last=False)
+        else:
+            self._tool_definitions.move_to_end(trace_id)
+        if digest in seen:
+            return False
+        seen.add(digest)
+        return True
+
+    def _tool_definitions_digest(self, definitions: list[dict]) -> str:
+        """Compute the digest of a list of tool definitions.
+
+        Each definition's digest is looked up by tool name and reused while
+        the definition is equal to the one it was computed from, so only
+        new or changed definitions are serialized.
+
+        Args:
+            definitions (`list[dict]`):
+                The tool definitions in the flat format.
+
+        Returns:
+            `str`:
+                The digest of the tool definitions.
+        """
+        digests = []
+        for definition in definitions:
+            name = str(definition.get("name"))
+            cached = self._tool_digests.get(name)
+            if cached is not None and cached[0] == definition:
+                self._tool_digests.move_to_end(name)
+                digests.append(cached[1])
+                continue
+            digest = hashlib.sha1(
+                _serialize_to_str(definition).encode("utf-8"),
+            ).hexdigest()
+            # Copied so that a schema mutated in place is seen as changed
+            self._tool_digests[name] = (deepcopy(definition), digest)
+            self._tool_digests.move_to_end(name)
+            while len(self._tool_digests) > _MAX_TOOL_DIGESTS:
+                self._tool_digests.popitem(last=False)
+            digests.append(digest)
+        return hashlib.sha1("".join(digests).encode("ascii")).hexdigest()
+
+    def _record_payloads(
+        self,
+        span: "Span",
+        payloads: Payloads,
+        has_error: bool,
+    ) -> None:
+        """Extract, serialize and set the payload attributes of a span
+        that keeps them.
+
+        Args:
+            span (`Span`):
+                The span about to end.
+            payloads (`Payloads`):
+                The payload attributes, by attribute name.
+            has_error (`bool`):
+                Whether the traced operation failed.
+        """
+        if not payloads or not self._keep_payloads(span, has_error):
+            return
+        for key, produce in payloads.items():
+            value = produce()
+            if value is None:
+                continue
+            if key == SpanAttributes.GEN_AI_TOOL_DEFINITIONS:
+                digest = self._tool_definitions_digest(value)
+                span.set_attribute(
+                    SpanAttributes.AGENTSCOPE_TOOL_DEFINITIONS_HASH,
+                    digest,
+                )
+                if not self._first_in_trace(span, digest):
+                    continue
+            span.set_attribute(
+                key,
+                _serialize_bounded(value, self.max_attribute_bytes),
+            )
+
     # ------------------------------------------------------------------
     # on_reply
     # ------------------------------------------------------------------
@@ -153,6 +340,7 @@ class TracingMiddleware(MiddlewareBase):
             agent,
             input_kwargs,
         )
+        request_payloads = _get_agent_request_payloads(input_kwargs)
         span_name = _get_agent_span_name(request_attributes)
 
         span = tracer.start_span(
@@ -183,18 +371,18 @@ class TracingMiddleware(MiddlewareBase):
                     SpanAttributes.AGENTSCOPE_IS_EXTERNAL_EXECUTION: (True),
                     **common_attrs,
                 }
-                if result.output is not None:
-                    tool_attrs[
-                        SpanAttributes.GEN_AI_TOOL_CALL_RESULT
-                    ] = _serialize_to_str(result.output)
                 with tracer.start_as_current_span(
                     name=(
                         f"{OperationNameValues.EXECUTE_TOOL}" f" {result.name}"
                     ),
                     attributes=tool_attrs,
                     context=span_context,
-                ):
-                    pass
+                ) as tool_span:
+                    self._record_payloads(
+                        tool_span,
+                        _get_tool_response_payloads(result.output),
+                        False,
+                    )
 
         has_error = False
         error_exc: BaseException | None = None
@@ -245,12 +433,14 @@ class TracingMiddleware(MiddlewareBase):
                     json.dumps(external_pending, ensure_ascii=False),
                 )
             if has_error and error_exc is not None:
+                self._record_payloads(span, request_payloads, True)
                 _set_span_error_status(span, error_exc)
             else:
                 if last_msg is not None:
-                    span.set_attributes(
-                        _get_agent_response_attributes(last_msg),
+                    request_payloads.update(
+                        _get_agent_response_payloads(last_msg),
                     )
+                self._record_payloads(span, request_payloads, False)
                 _set_span_success_status(span)
 
     # ------------------------------------------------------------------
@@ -282,6 +472,7 @@ class TracingMiddleware(MiddlewareBase):
             model,
             combined_kwargs,
         )
+        request_payloads = _get_llm_request_payloads(combined_kwargs)
         span_name = _get_llm_span_name(request_attributes)
 
         with tracer.start_as_current_span(
@@ -296,13 +487,27 @@ class TracingMiddleware(MiddlewareBase):
                 result = await next_handler(**input_kwargs)
 
                 if isinstance(result, AsyncGenerator):
-                    return _trace_async_generator_wrapper(result, span)
+                    return _trace_async_generator_wrapper(
+                        result,
+                        span,
+                        self._record_payloads,
+                        request_payloads,
+                    )
 
                 span.set_attributes(_get_llm_response_attributes(result))
+                self._record_payloads(
+                    span,
+                    {
+                        **request_payloads,
+                        **_get_llm_response_payloads(result),
+                    },
+                    False,
+                )
                 _set_span_success_status(span)
                 return result
 
             except BaseException as e:
+                self._record_payloads(span, request_payloads, True)
                 _set_span_error_status(span, e)
                 raise
 
@@ -368,7 +573,9 @@ class TracingMiddleware(MiddlewareBase):
         finally:
             if not has_error:
                 if last_item is not None:
-                    span.set_attributes(
-                        _get_tool_response_attributes(last_item),
+                    self._record_payloads(
+                        span,
+                        _get_tool_response_payloads(last_item),
+                        False,
                     )
                 _set_span_success_status(span)
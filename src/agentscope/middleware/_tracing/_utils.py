@@ -76,3 +76,111 @@ def _serialize_to_str(value: Any) -> str:
             _to_serializable(value),
             ensure_ascii=False,
         )
+
+
+# Room kept in a byte budget for the placeholder of dropped list items
+_PLACEHOLDER_RESERVE = 40
+
+
+def _truncate_str(text: str, max_bytes: int) -> str:
+    """Truncate a string to a UTF-8 byte budget, marking the cut.
+
+    Only the first ``max_bytes`` characters are encoded, so the cost does
+    not depend on the length of the string.
+
+    Args:
+        text (`str`):
+            The string to truncate.
+        max_bytes (`int`):
+            The maximum number of UTF-8 bytes kept from the string.
+
+    Returns:
+        `str`:
+            The string itself if it fits, otherwise its longest prefix that
+            fits followed by a truncation marker.
+    """
+    if len(text) * 4 <= max_bytes:
+        return text
+    encoded = text[: max_bytes + 1].encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    kept = encoded[:max_bytes].decode("utf-8", errors="ignore")
+    return f"{kept}...[truncated, {len(text)} chars in total]"
+
+
+def _clip_strings(obj: Any, max_bytes: int) -> Any:
+    """Truncate the strings nested in lists and dicts to a byte budget.
+
+    Args:
+        obj (`Any`):
+            The object whose strings are truncated.
+        max_bytes (`int`):
+            The byte budget of each string.
+
+    Returns:
+        `Any`:
+            A copy of the lists and dicts with truncated strings; other
+            objects are returned as is.
+    """
+    if isinstance(obj, str):
+        return _truncate_str(obj, max_bytes)
+    if isinstance(obj, (list, tuple)):
+        return [_clip_strings(x, max_bytes) for x in obj]
+    if isinstance(obj, dict):
+        return {key: _clip_strings(val, max_bytes) for key, val in obj.items()}
+    return obj
+
+
+def _serialize_bounded(value: Any, max_bytes: int | None) -> str:
+    """Serialize input value to a JSON string within a byte budget.
+
+    A list keeps as many items from its head and its tail, alternately,
+    as fit in the budget, and the dropped middle is replaced with a
+    ``{"truncated": <count>}`` item, so the result stays valid JSON and
+    the items in the middle are never serialized. Any other value is
+    serialized and then truncated with a marker.
+
+    Args:
+        value (`Any`):
+            The input value.
+        max_bytes (`int | None`):
+            The byte budget, or ``None`` to serialize the whole value.
+
+    Returns:
+        `str`:
+            JSON serialized string of the input value, bounded by the
+            budget.
+    """
+    if max_bytes is None:
+        return _serialize_to_str(value)
+
+    if not isinstance(value, list):
+        return _truncate_str(
+            _serialize_to_str(_clip_strings(value, max_bytes)),
+            max_bytes,
+        )
+
+    budget = max_bytes - _PLACEHOLDER_RESERVE
+    head: list[str] = []
+    tail: list[str] = []
+    low, high = 0, len(value) - 1
+    while low <= high:
+        from_head = len(head) <= len(tail)
+        item = _serialize_to_str(
+            _clip_strings(value[low if from_head else high], max_bytes),
+        )
+        # Count the item and its ", " separator
+        budget -= len(item.encode("utf-8")) + 2
+        if budget < 0:
+            break
+        if from_head:
+            head.append(item)
+            low += 1
+        else:
+            tail.append(item)
+            high -= 1
+
+    dropped = high - low + 1
+    if dropped > 0:
+        head.append(json.dumps({"truncated": dropped}))
+    return "[" + ", ".join(head + tail[::-1]) + "]"
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 """Middleware that turns reasoning text into speech and injects it as
 ``DATA_BLOCK_*`` events into the agent's event stream."""
+import asyncio
+import re
+import time
+from collections import deque
 from typing import TYPE_CHECKING, AsyncGenerator, Callable
 
 from ._base import MiddlewareBase
+from .._logging import logger
 from .._utils._common import _generate_id
 from ..event import (
     DataBlockDeltaEvent,
@@ -12,11 +17,62 @@ from ..event import (
     TextBlockDeltaEvent,
     TextBlockEndEvent,
 )
-from ..tts import TTSModelBase, TTSResponse
+from ..message import Base64Source, DataBlock
+from ..tts import TTSCacheBase, TTSModelBase, TTSResponse
 
 if TYPE_CHECKING:
     from ..agent import Agent
 
+# A sentence ends at terminal punctuation (plus closing quotes/brackets)
+# followed by whitespace — so "3.14" or "e.g." mid-stream don't cut — or
+# at full-width punctuation and line breaks, which need no whitespace.
+_SENTENCE_BOUNDARY = re.compile(
+    r"[.!?…]+[\"')\]”’]*\s+|[。！？]+[”’」』）]*|\n+",
+)
+_CLAUSE_BOUNDARY = re.compile(r"[,;:]\s+|[，；：、]")
+
+# Shorter pieces synthesize with poor prosody and cost a request each
+_MIN_SENTENCE_CHARS = 8
+_MIN_CLAUSE_CHARS = 40
+
+# A segment job's chunk queue ends with this sentinel
+_SEGMENT_END = None
+
+
+def _split_segments(text: str) -> tuple[list[str], str]:
+    """Split the complete segments off the front of streamed text.
+
+    A sentence boundary closes a segment once it holds
+    ``_MIN_SENTENCE_CHARS`` characters; a clause boundary only once it
+    holds ``_MIN_CLAUSE_CHARS``, so long sentences are split but short
+    clauses stay together.
+
+    Args:
+        text (`str`):
+            The text streamed so far and not yet segmented.
+
+    Returns:
+        `tuple[list[str], str]`:
+            The complete segments, and the rest that may still grow.
+    """
+    boundaries = sorted(
+        [
+            (m.end(), _MIN_SENTENCE_CHARS)
+            for m in _SENTENCE_BOUNDARY.finditer(text)
+        ]
+        + [
+            (m.end(), _MIN_CLAUSE_CHARS)
+            for m in _CLAUSE_BOUNDARY.finditer(text)
+        ],
+    )
+    segments = []
+    start = 0
+    for end, min_chars in boundaries:
+        if end > start and len(text[start:end].strip()) >= min_chars:
+            segments.append(text[start:end])
+            start = end
+    return segments, text[start:]
+
 
 class TTSMiddleware(MiddlewareBase):
     """Synthesize speech for every text block produced during reasoning and
@@ -33,20 +89,68 @@ class TTSMiddleware(MiddlewareBase):
       On ``TextBlockEndEvent`` :meth:`TTSModelBase.synthesize` is called
       to drain remaining audio, and the data block is closed.
 
+    With ``pipelined=True`` speech starts while the text still streams:
+
+    - Non-realtime TTS: the streamed text is cut into segments at
+      sentence (and, for long sentences, clause) boundaries, and each
+      segment is synthesized as soon as it is complete, with at most
+      ``max_concurrency`` segments in flight. Their audio is emitted
+      strictly in text order, each chunk as soon as every segment before
+      it is done — so the first sentence is heard while the model is
+      still generating the rest.
+    - Realtime TTS: the deltas are pushed by a background task, so a
+      slow :meth:`TTSModelBase.push` no longer holds back the text
+      events; the audio it produces is emitted with the next event.
+
     Each ``DataBlockDeltaEvent.data`` carries an **incremental** base64 PCM
     chunk; the full audio is the concatenation of every delta's decoded
-    bytes (the data block is keyed by ``block_id``).
+    bytes (the data block is keyed by ``block_id``). In pipelined mode the
+    segments' audio is concatenated into the block one after the other,
+    so prefer a headerless format (PCM, MP3) over one that repeats a
+    container header per segment (WAV).
+
+    With a ``cache``, the audio of each synthesized text (or pipelined
+    segment) is stored under the model, its parameters and the text, and
+    a repeated phrase is streamed back from the cache as the same
+    ``DATA_BLOCK_*`` events without calling the model. Realtime pushes
+    aren't cached, as their audio depends on how the text was split.
+
+    The seconds from the start of the latest reply to its first audio
+    delta are reported as :attr:`time_to_first_audio`.
     """
 
-    def __init__(self, tts_model: TTSModelBase) -> None:
+    def __init__(
+        self,
+        tts_model: TTSModelBase,
+        pipelined: bool = False,
+        max_concurrency: int = 3,
+        cache: TTSCacheBase | None = None,
+    ) -> None:
         """Initialize the TTS middleware.
 
         Args:
             tts_model (`TTSModelBase`):
                 The TTS model used to synthesize speech for assistant text
                 blocks produced during reasoning.
+            pipelined (`bool`, defaults to `False`):
+                Synthesize the text while it streams, segment by segment
+                for non-realtime models and from a background task for
+                realtime ones.
+            max_concurrency (`int`, defaults to `3`):
+                The maximum number of segments synthesized at once in
+                pipelined non-realtime mode.
+            cache (`TTSCacheBase | None`, defaults to `None`):
+                The cache of synthesized audio consulted before calling the
+                model. Its hit rate is reported by its ``stats``.
         """
         self.tts = tts_model
+        self.pipelined = pipelined
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+
+        self.time_to_first_audio: float | None = None
+        """The seconds from the start of the latest reply to its first
+        audio delta, or ``None`` if it has no audio (yet)."""
 
     async def on_reply(
         self,
@@ -56,6 +160,36 @@ class TTSMiddleware(MiddlewareBase):
     ) -> AsyncGenerator:
         """Intercept the reply stream, synthesize speech for text blocks,
         and inject ``DATA_BLOCK_*`` audio events into the output."""
+        if not self.pipelined:
+            stream = self._reply_buffered(agent, input_kwargs, next_handler)
+        elif self.tts.realtime:
+            stream = self._reply_realtime(agent, input_kwargs, next_handler)
+        else:
+            stream = self._reply_segmented(agent, input_kwargs, next_handler)
+
+        start = time.perf_counter()
+        self.time_to_first_audio = None
+        async for evt in stream:
+            if (
+                self.time_to_first_audio is None
+                and isinstance(evt, DataBlockDeltaEvent)
+                and (evt.media_type or "").startswith("audio/")
+            ):
+                self.time_to_first_audio = time.perf_counter() - start
+                logger.debug(
+                    "TTS time to first audio: %.3fs",
+                    self.time_to_first_audio,
+                )
+            yield evt
+
+    async def _reply_buffered(
+        self,
+        agent: "Agent",
+        input_kwargs: dict,
+        next_handler: Callable[..., AsyncGenerator],
+    ) -> AsyncGenerator:
+        """Synthesize each text block once it ends, or push its deltas
+        inline for realtime models."""
         text_buffer: str = ""
         audio_block_id: str | None = None
         audio_media_type: str | None = None
@@ -96,7 +230,7 @@ class TTSMiddleware(MiddlewareBase):
                                 audio_media_type = audio_evt.media_type
                             yield audio_evt
                     elif text.strip():
-                        res = await self.tts.synthesize(text)
+                        res = await self._synthesize(text)
                         async for audio_evt in self._emit_synth_result(
                             agent,
                             res,
@@ -116,6 +250,261 @@ class TTSMiddleware(MiddlewareBase):
                     audio_block_id = None
                     audio_media_type = None
 
+    async def _reply_segmented(
+        self,
+        agent: "Agent",
+        input_kwargs: dict,
+        next_handler: Callable[..., AsyncGenerator],
+    ) -> AsyncGenerator:
+        """Synthesize the segments of each text block concurrently while
+        it streams, and emit their audio in order."""
+        text_buffer: str = ""
+        audio_block_id: str | None = None
+        audio_media_type: str | None = None
+        window = asyncio.Semaphore(max(1, self.max_concurrency))
+        jobs: deque[tuple[asyncio.Task, asyncio.Queue]] = deque()
+
+        def _start(segment: str) -> None:
+            chunks: asyncio.Queue = asyncio.Queue()
+            task = asyncio.create_task(
+                self._synthesize_segment(segment, window, chunks),
+            )
+            jobs.append((task, chunks))
+
+        try:
+            async with self.tts:
+                async for evt in next_handler(**input_kwargs):
+                    yield evt
+
+                    if isinstance(evt, TextBlockDeltaEvent):
+                        segments, text_buffer = _split_segments(
+                            text_buffer + evt.delta,
+                        )
+                        for segment in segments:
+                            _start(segment)
+                        ready = self._take_ready(jobs)
+                    elif isinstance(evt, TextBlockEndEvent):
+                        if text_buffer.strip():
+                            _start(text_buffer)
+                        text_buffer = ""
+                        ready = self._take_all(jobs)
+                    else:
+                        ready = self._take_ready(jobs)
+
+                    async for chunk in ready:
+                        async for audio_evt in self._emit_chunk(
+                            agent,
+                            chunk,
+                            audio_block_id,
+                            audio_media_type,
+                        ):
+                            if isinstance(audio_evt, DataBlockStartEvent):
+                                audio_block_id = audio_evt.block_id
+                                audio_media_type = audio_evt.media_type
+                            yield audio_evt
+
+                    if (
+                        isinstance(evt, TextBlockEndEvent)
+                        and audio_block_id is not None
+                    ):
+                        yield DataBlockEndEvent(
+                            reply_id=agent.state.reply_id,
+                            block_id=audio_block_id,
+                        )
+                        audio_block_id = None
+                        audio_media_type = None
+        finally:
+            for task, _ in jobs:
+                task.cancel()
+
+    async def _synthesize_segment(
+        self,
+        text: str,
+        window: asyncio.Semaphore,
+        chunks: asyncio.Queue,
+    ) -> None:
+        """Synthesize one segment within the concurrency window, queueing
+        its chunks as they arrive and the end sentinel last."""
+        try:
+            async with window:
+                res = await self._synthesize(text)
+                if isinstance(res, AsyncGenerator):
+                    async for chunk in res:
+                        chunks.put_nowait(chunk)
+                else:
+                    chunks.put_nowait(res)
+        finally:
+            chunks.put_nowait(_SEGMENT_END)
+
+    @staticmethod
+    async def _take_ready(
+        jobs: deque[tuple[asyncio.Task, asyncio.Queue]],
+    ) -> AsyncGenerator[TTSResponse, None]:
+        """Take the chunks that are ready to play without waiting: those
+        queued by the first unfinished segment and the ones before it."""
+        while jobs:
+            task, chunks = jobs[0]
+            while not chunks.empty():
+                chunk = chunks.get_nowait()
+                if chunk is _SEGMENT_END:
+                    jobs.popleft()
+                    # Re-raise the failure of a segment
+                    task.result()
+                    break
+                yield chunk
+            else:
+                return
+
+    @staticmethod
+    async def _take_all(
+        jobs: deque[tuple[asyncio.Task, asyncio.Queue]],
+    ) -> AsyncGenerator[TTSResponse, None]:
+        """Take the chunks of every segment in order, waiting for each."""
+        while jobs:
+            task, chunks = jobs[0]
+            while (chunk := await chunks.get()) is not _SEGMENT_END:
+                yield chunk
+            jobs.popleft()
+            task.result()
+
+    async def _reply_realtime(
+        self,
+        agent: "Agent",
+        input_kwargs: dict,
+        next_handler: Callable[..., AsyncGenerator],
+    ) -> AsyncGenerator:
+        """Push the deltas of each text block from a background task, and
+        emit the audio it produces alongside the text events."""
+        audio_block_id: str | None = None
+        audio_media_type: str | None = None
+        deltas: asyncio.Queue = asyncio.Queue()
+        audio: asyncio.Queue = asyncio.Queue()
+        pusher: asyncio.Task | None = None
+
+        try:
+            async with self.tts:
+                async for evt in next_handler(**input_kwargs):
+                    yield evt
+
+                    if isinstance(evt, TextBlockDeltaEvent) and evt.delta:
+                        if pusher is None:
+                            pusher = asyncio.create_task(
+                                self._push_loop(deltas, audio),
+                            )
+                        deltas.put_nowait(evt.delta)
+
+                    responses: list = []
+                    if isinstance(evt, TextBlockEndEvent) and pusher:
+                        deltas.put_nowait(None)
+                        await pusher
+                        pusher = None
+                    while not audio.empty():
+                        responses.append(audio.get_nowait())
+                    if isinstance(evt, TextBlockEndEvent):
+                        responses.append(await self.tts.synthesize())
+
+                    for res in responses:
+                        async for audio_evt in self._emit_synth_result(
+                            agent,
+                            res,
+                            audio_block_id,
+                            audio_media_type,
+                        ):
+                            if isinstance(audio_evt, DataBlockStartEvent):
+                                audio_block_id = audio_evt.block_id
+                                audio_media_type = audio_evt.media_type
+                            yield audio_evt
+
+                    if (
+                        isinstance(evt, TextBlockEndEvent)
+                        and audio_block_id is not None
+                    ):
+                        yield DataBlockEndEvent(
+                            reply_id=agent.state.reply_id,
+                            block_id=audio_block_id,
+                        )
+                        audio_block_id = None
+                        audio_media_type = None
+        finally:
+            if pusher is not None:
+                pusher.cancel()
+
+    async def _push_loop(
+        self,
+        deltas: asyncio.Queue,
+        audio: asyncio.Queue,
+    ) -> None:
+        """Push the queued deltas in order until the ``None`` sentinel,
+        queueing the audio each push returns."""
+        while (delta := await deltas.get()) is not None:
+            audio.put_nowait(await self.tts.push(delta))
+
+    async def _synthesize(
+        self,
+        text: str,
+    ) -> TTSResponse | AsyncGenerator[TTSResponse, None]:
+        """Synthesize a text, serving it from the cache if possible and
+        caching the audio of a complete synthesis."""
+        if self.cache is None:
+            return await self.tts.synthesize(text)
+
+        identifier = {
+            "type": getattr(self.tts, "type", type(self.tts).__name__),
+            "model": self.tts.model,
+            "parameters": self.tts.parameters.model_dump(mode="json"),
+            "text": text,
+        }
+        cached = await self.cache.retrieve(identifier)
+        if cached is not None:
+            return self._replay(cached)
+
+        res = await self.tts.synthesize(text)
+        if isinstance(res, AsyncGenerator):
+            return self._record(res, identifier)
+        await self._store([res], identifier)
+        return res
+
+    @staticmethod
+    async def _replay(
+        chunks: list[Base64Source],
+    ) -> AsyncGenerator[TTSResponse, None]:
+        """Stream cached audio chunks back as TTS responses."""
+        for i, chunk in enumerate(chunks):
+            yield TTSResponse(
+                content=DataBlock(source=chunk),
+                is_last=i == len(chunks) - 1,
+            )
+
+    async def _record(
+        self,
+        res: AsyncGenerator[TTSResponse, None],
+        identifier: dict,
+    ) -> AsyncGenerator[TTSResponse, None]:
+        """Pass streamed TTS responses through, caching their audio once
+        the stream completes."""
+        responses = []
+        async for chunk in res:
+            responses.append(chunk)
+            yield chunk
+        await self._store(responses, identifier)
+
+    async def _store(
+        self,
+        responses: list[TTSResponse],
+        identifier: dict,
+    ) -> None:
+        """Cache the base64 audio of the responses, if they carry any."""
+        chunks = [
+            res.content.source
+            for res in responses
+            if res is not None
+            and res.content is not None
+            and isinstance(res.content.source, Base64Source)
+            and res.content.source.data
+        ]
+        if chunks:
+            await self.cache.store(chunks, identifier)
+
     async def _emit_synth_result(
         self,
         agent: "Agent",
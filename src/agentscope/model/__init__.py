@@ -5,6 +5,13 @@ from ._base import ChatModelBase
 from ._model_card import ModelCard
 from ._model_response import ChatResponse, StructuredResponse, FinishedReason
 from ._model_usage import ChatUsage
+from ._prompt_cache import PromptCachePlanner, PromptCachePlan
+from ._rate_limit import (
+    RateLimit,
+    RateLimitPriority,
+    RateLimiterBase,
+    TokenBucketRateLimiter,
+)
 from ._anthropic import AnthropicChatModel
 from ._dashscope import DashScopeChatModel
 from ._deepseek import DeepSeekChatModel
@@ -22,6 +29,12 @@ __all__ = [
     "FinishedReason",
     "ModelCard",
     "StructuredResponse",
+    "PromptCachePlanner",
+    "PromptCachePlan",
+    "RateLimit",
+    "RateLimitPriority",
+    "RateLimiterBase",
+    "TokenBucketRateLimiter",
     "AnthropicChatModel",
     "DashScopeChatModel",
     "DeepSeekChatModel",
@@ -10,7 +10,9 @@ from pydantic import BaseModel, Field
 from .._base import ChatModelBase, _TOOL_CHOICE_LITERAL_MODES
 from .._model_response import ChatResponse
 from .._model_usage import ChatUsage
+from .._prompt_cache import PromptCachePlanner
 from ..._utils._common import _generate_id
+from ..._utils._http_pool import _with_pooled_http_client
 from ...credential import AnthropicCredential
 from ...formatter import FormatterBase, AnthropicChatFormatter
 from ...message import Msg, ThinkingBlock, ToolCallBlock, TextBlock
@@ -95,6 +97,19 @@ class AnthropicChatModel(ChatModelBase):
             ),
         )
 
+        prompt_cache_enable: bool = Field(
+            default=False,
+            title="Prompt Caching",
+            description=(
+                "Mark the system prompt, the tool definitions and the most "
+                "recent context boundaries with ``cache_control`` "
+                "breakpoints, so that the repeated prefix of each ReAct "
+                "iteration is read from Anthropic's prompt cache. Off by "
+                "default, as Anthropic bills cache writes above the base "
+                "input price."
+            ),
+        )
+
     def __init__(
         self,
         credential: AnthropicCredential,
@@ -106,6 +121,7 @@ class AnthropicChatModel(ChatModelBase):
         context_size: int = 200000,
         formatter: FormatterBase | None = None,
         client_kwargs: dict[str, Any] | None = None,
+        prompt_cache_planner: PromptCachePlanner | None = None,
     ) -> None:
         """Initialize the Anthropic chat model.
 
@@ -123,7 +139,8 @@ class AnthropicChatModel(ChatModelBase):
             max_retries (`int`, defaults to `3`):
                 The maximum number of retries for the Anthropic API.
             retry_delay (`float`, defaults to `1.0`):
-                Seconds to sleep between retry attempts.
+                The seconds to sleep before the first retry; later retries
+                back off exponentially, see :class:`ChatModelBase`.
             context_size (`int`, defaults to `200000`):
                 The model context size used for context compression.
             formatter (`FormatterBase | None`, defaults to `None`):
@@ -134,6 +151,12 @@ class AnthropicChatModel(ChatModelBase):
                 Extra keyword arguments forwarded to
                 ``anthropic.AsyncAnthropic`` (e.g. ``timeout``,
                 ``default_headers``, ``http_client``, ``auth_token``).
+            prompt_cache_planner (`PromptCachePlanner | None`, defaults to \
+            `None`):
+                The planner deciding where the ``cache_control`` breakpoints
+                go when ``parameters.prompt_cache_enable`` is on. When
+                ``None``, a ``PromptCachePlanner`` within Anthropic's limit
+                of 4 breakpoints per request will be used.
         """
         super().__init__(
             credential=credential,
@@ -146,13 +169,22 @@ class AnthropicChatModel(ChatModelBase):
         )
         self.formatter = formatter or AnthropicChatFormatter()
         self.client_kwargs = client_kwargs or {}
+        self.prompt_cache_planner = prompt_cache_planner or PromptCachePlanner(
+            max_breakpoints=4,
+            boundary_roles=("user",),
+        )
 
         import anthropic
 
         self.client: anthropic.AsyncAnthropic = anthropic.AsyncAnthropic(
             api_key=self.credential.api_key.get_secret_value(),
             base_url=self.credential.base_url,
-            **self.client_kwargs,
+            **_with_pooled_http_client(
+                self.client_kwargs,
+                "anthropic",
+                self.credential.base_url,
+                anthropic.DefaultAsyncHttpxClient,
+            ),
         )
 
     @classmethod
@@ -263,6 +295,9 @@ class AnthropicChatModel(ChatModelBase):
 
         kwargs["messages"] = formatted_messages
 
+        if self.parameters.prompt_cache_enable:
+            self._apply_prompt_cache(kwargs)
+
         start_datetime = datetime.now()
 
         response = await self.client.messages.create(**kwargs)
@@ -522,6 +557,53 @@ class AnthropicChatModel(ChatModelBase):
                     delta_res.usage = usage
                     yield delta_res
 
+    def _apply_prompt_cache(self, kwargs: dict[str, Any]) -> None:
+        """Place the ``cache_control`` breakpoints planned by
+        ``self.prompt_cache_planner`` into the request kwargs in place.
+
+        Args:
+            kwargs (`dict[str, Any]`):
+                The keyword arguments for ``client.messages.create``, whose
+                ``tools``, ``system`` and ``messages`` will be marked.
+        """
+        tools = kwargs.get("tools") or []
+        system = kwargs.get("system")
+        messages = kwargs.get("messages") or []
+
+        plan = self.prompt_cache_planner.plan(
+            has_tools=bool(tools),
+            has_system=bool(system),
+            message_roles=[_["role"] for _ in messages],
+        )
+        cache_control = {"type": "ephemeral"}
+
+        if plan.cache_tools:
+            kwargs["tools"] = tools[:-1] + [
+                {**tools[-1], "cache_control": cache_control},
+            ]
+
+        if plan.cache_system:
+            if isinstance(system, str):
+                system = [{"type": "text", "text": system}]
+            system[-1] = {**system[-1], "cache_control": cache_control}
+            kwargs["system"] = system
+
+        for index in plan.message_indices:
+            content = messages[index]["content"]
+            if isinstance(content, str):
+                content = [{"type": "text", "text": content}]
+                messages[index]["content"] = content
+            # Thinking blocks cannot carry a breakpoint, so mark the last
+            # block that can. The prefix still covers the whole message
+            # up to that block.
+            for i in range(len(content) - 1, -1, -1):
+                if content[i].get("type") not in (
+                    "thinking",
+                    "redacted_thinking",
+                ):
+                    content[i] = {**content[i], "cache_control": cache_control}
+                    break
+
     def _format_tools(
         self,
         tools: list[dict] | None,
@@ -3,6 +3,7 @@
 import asyncio
 import inspect
 import json
+import time
 from abc import abstractmethod
 from copy import deepcopy
 from pathlib import Path
@@ -13,9 +14,17 @@ from pydantic import BaseModel, ValidationError as PydanticValidationError
 
 from ._model_response import StructuredResponse, ChatResponse, FinishedReason
 from ._model_card import ModelCard
+from ._model_usage import ChatUsage
+from ._rate_limit import (
+    RateLimiterBase,
+    RateLimitPriority,
+    _get_retry_after,
+    _get_retry_delay,
+)
 from ._utils import _StreamAccumulator
 from .._logging import logger
 from .._utils._common import _json_loads_with_repair
+from .._utils._metrics import _observe_seconds, get_metrics_registry
 from ..credential import CredentialBase
 from ..exception import StructuredOutputError, ToolJSONDecodeError
 from ..message import (
@@ -33,6 +42,31 @@ from ..tool import ToolChoice
 _TOOL_CHOICE_LITERAL_MODES = {"auto", "none", "required"}
 _MULTIMODAL_DATA_BLOCK_TOKEN_ESTIMATE = 2000
 
+_FIRST_TOKEN_METRIC = (
+    "agentscope_model_first_token_seconds",
+    "Time from a chat model call to its first output.",
+)
+_CALL_METRIC = (
+    "agentscope_model_call_seconds",
+    "Duration of chat model calls, up to the end of the stream.",
+)
+
+
+def _observe_model_seconds(
+    name: str,
+    documentation: str,
+    model: str,
+    start: float,
+) -> None:
+    """Record the seconds elapsed since ``start`` for a model."""
+    _observe_seconds(
+        name,
+        documentation,
+        ("model",),
+        (model,),
+        time.perf_counter() - start,
+    )
+
 
 class ChatModelBase:
     """The base class for chat models."""
@@ -54,11 +88,20 @@ class ChatModelBase:
     """The maximum number of retries for the underlying API."""
 
     retry_delay: float
-    """Seconds to sleep between retry attempts."""
+    """The seconds to sleep before the first retry. Later retries back off
+    exponentially, jittered and up to a minute, or wait as long as the
+    provider's ``retry-after`` hint asks, within a minute as well."""
 
     context_size: int
     """The model context size that will be used in the context compression."""
 
+    rate_limiter: RateLimiterBase | None = None
+    """The optional rate limiter, shared by the models calling the same
+    credential, that admits each API call against its RPM/TPM budgets."""
+
+    rate_limit_priority: RateLimitPriority = RateLimitPriority.INTERACTIVE
+    """The admission priority of this model's calls in the rate limiter."""
+
     def __init__(
         self,
         credential: CredentialBase,
@@ -85,7 +128,10 @@ class ChatModelBase:
                 listed in ``_get_retryable_exceptions()`` count against this
                 budget; other exceptions are raised immediately.
             retry_delay (`float`, defaults to `1.0`):
-                Seconds to sleep between retry attempts.
+                The seconds to sleep before the first retry, doubled for
+                each later one up to a minute and jittered. A
+                ``retry-after`` hint of the provider, capped at a minute,
+                is a lower bound.
             context_size (`int`, defaults to `32768`):
                 The model context size used for context compression.
         """
@@ -190,7 +236,16 @@ class ChatModelBase:
 
         Attempts to call the model up to ``max_retries + 1`` times. Only
         exceptions listed in ``_get_retryable_exceptions()`` count against
-        this budget; other exceptions are raised immediately.
+        this budget; other exceptions are raised immediately. The attempts
+        are spaced by a jittered exponential backoff starting from
+        ``retry_delay``, which honours the ``retry-after`` hint of the
+        provider.
+
+        When a ``rate_limiter`` is attached, each attempt first waits for
+        admission with the token estimate from ``count_tokens``, and the
+        estimate is reconciled with the actual usage once the call
+        finishes. An attempt that fails, is cancelled, or whose stream is
+        closed early releases the estimate beyond the usage it reported.
 
         Args:
             messages (`list[Msg]`):
@@ -203,11 +258,26 @@ class ChatModelBase:
                 Additional keyword arguments passed to the underlying API.
         """
 
+        # Latencies are measured as the caller sees them, including the
+        # admission waits and the retries
+        start = time.perf_counter()
+        estimated_tokens = 0
+        if self.rate_limiter is not None:
+            estimated_tokens = await self.count_tokens(messages, tools)
+
         retryable = self._get_retryable_exceptions()
         last_error: Exception | None = None
         for attempt in range(self.max_retries + 1):
-            # The accumulated chat response
+            admitted = False
             try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(
+                        self.credential.id,
+                        self.model,
+                        estimated_tokens,
+                        self.rate_limit_priority,
+                    )
+                    admitted = True
                 res = await self._call_api(
                     self.model,
                     messages=messages,
@@ -217,6 +287,12 @@ class ChatModelBase:
                 )
                 break
             except asyncio.CancelledError:
+                if admitted:
+                    await self._reconcile_usage(
+                        estimated_tokens,
+                        None,
+                        completed=False,
+                    )
                 return ChatResponse(
                     content=[],
                     is_last=True,
@@ -224,19 +300,42 @@ class ChatModelBase:
                 )
 
             except Exception as e:
+                if admitted:
+                    # The failed call consumed no tokens we know of
+                    await self._reconcile_usage(
+                        estimated_tokens,
+                        None,
+                        completed=False,
+                    )
+                registry = get_metrics_registry()
+                if registry is not None:
+                    registry.counter(
+                        "agentscope_model_call_errors_total",
+                        "Chat model attempts that raised, retried or not.",
+                        ("model",),
+                    ).labels(self.model).inc()
                 if not isinstance(e, retryable):
                     raise
                 last_error = e
+                if self.rate_limiter is not None:
+                    # The provider's retry-after holds back the other
+                    # callers of this credential as well
+                    await self.rate_limiter.pause(
+                        self.credential.id,
+                        self.model,
+                        _get_retry_after(e) or 0.0,
+                    )
                 if attempt < self.max_retries:
+                    delay = _get_retry_delay(self.retry_delay, attempt, e)
                     logger.warning(
                         "Attempt %d failed for model %s: %s. "
                         "Retrying in %.1fs...",
                         attempt + 1,
                         self.model,
                         str(e),
-                        self.retry_delay,
+                        delay,
                     )
-                    await asyncio.sleep(self.retry_delay)
+                    await asyncio.sleep(delay)
                 else:
                     logger.warning(
                         "All %d attempt(s) failed for model %s.",
@@ -255,6 +354,9 @@ class ChatModelBase:
         # Consume the model calling result
         # =====================================================================
         if isinstance(res, ChatResponse):
+            _observe_model_seconds(*_FIRST_TOKEN_METRIC, self.model, start)
+            _observe_model_seconds(*_CALL_METRIC, self.model, start)
+            await self._reconcile_usage(estimated_tokens, res.usage)
             return res
 
         async def _stream() -> AsyncGenerator[ChatResponse, None]:
@@ -262,33 +364,100 @@ class ChatModelBase:
             # For backward compatibility
             yield_acc_res = True
             acc_res = _StreamAccumulator()
+            usage = None
+            first_token = True
+            completed = False
+            settled = False
             try:
-                async for chunk in res:
-                    if not chunk.is_last:
-                        acc_res.append_chat_response(chunk)
-                        acc_res.id = chunk.id
-                        # Empty-content deltas are "carrier" chunks used
-                        # by subclasses to propagate usage / id metadata
-                        # (e.g. OpenAI-compatible APIs emit a trailing
-                        # usage-only chunk with no choices). We absorb
-                        # their metadata into ``acc_res`` above but do
-                        # not surface them to the consumer, which keeps
-                        # the visible stream free of spurious empty
-                        # deltas.
-                        if not chunk.content:
-                            continue
-                    else:
-                        yield_acc_res = False
-                    yield chunk
-            except asyncio.CancelledError:
-                acc_res.finished_reason = FinishedReason.INTERRUPTED
-                yield_acc_res = True
+                try:
+                    async for chunk in res:
+                        usage = chunk.usage or usage
+                        if not chunk.is_last:
+                            acc_res.append_chat_response(chunk)
+                            acc_res.id = chunk.id
+                            # Empty-content deltas are "carrier" chunks used
+                            # by subclasses to propagate usage / id metadata
+                            # (e.g. OpenAI-compatible APIs emit a trailing
+                            # usage-only chunk with no choices). We absorb
+                            # their metadata into ``acc_res`` above but do
+                            # not surface them to the consumer, which keeps
+                            # the visible stream free of spurious empty
+                            # deltas.
+                            if not chunk.content:
+                                continue
+                        else:
+                            yield_acc_res = False
+                        if first_token:
+                            first_token = False
+                            _observe_model_seconds(
+                                *_FIRST_TOKEN_METRIC,
+                                self.model,
+                                start,
+                            )
+                        yield chunk
+                except asyncio.CancelledError:
+                    acc_res.finished_reason = FinishedReason.INTERRUPTED
+                    yield_acc_res = True
+                else:
+                    completed = True
+
+                _observe_model_seconds(*_CALL_METRIC, self.model, start)
 
-            if yield_acc_res:
-                yield acc_res.build()
+                settled = True
+                await self._reconcile_usage(
+                    estimated_tokens,
+                    usage,
+                    completed=completed,
+                )
+
+                if yield_acc_res:
+                    yield acc_res.build()
+            finally:
+                # A failing stream, or one closed by the caller before
+                # its end, releases what its reported usage doesn't cover
+                if not settled:
+                    await self._reconcile_usage(
+                        estimated_tokens,
+                        usage,
+                        completed=False,
+                    )
 
         return _stream()
 
+    async def _reconcile_usage(
+        self,
+        estimated_tokens: int,
+        usage: ChatUsage | None,
+        completed: bool = True,
+    ) -> None:
+        """Reconcile the token estimate of an admitted call with its actual
+        usage in the rate limiter. When the provider reports no usage, a
+        completed call keeps the estimate, while a failed or abandoned one
+        releases it.
+
+        Args:
+            estimated_tokens (`int`):
+                The tokens estimated when the call was admitted.
+            usage (`ChatUsage | None`):
+                The usage reported by the provider.
+            completed (`bool`, defaults to `True`):
+                Whether the call ran to completion.
+        """
+        if self.rate_limiter is None:
+            return
+        if usage is not None:
+            actual = usage.input_tokens + usage.output_tokens
+        elif completed:
+            return
+        else:
+            actual = 0
+        await self.rate_limiter.reconcile(
+            self.credential.id,
+            self.model,
+            estimated_tokens,
+            actual,
+        )
+
     @abstractmethod
     async def _call_api(
         self,
@@ -520,6 +689,10 @@ class ChatModelBase:
             StructuredOutputError,
             *self._get_structured_output_fallback_exceptions(),
         )
+        estimated_tokens = 0
+        if self.rate_limiter is not None:
+            estimated_tokens = await self.count_tokens(messages, None)
+
         first_error: Exception | None = None
         last_error: Exception | None = None
         for name, extra_kwargs, tool_choice in strategies:
@@ -531,7 +704,16 @@ class ChatModelBase:
                     merged[key] = {**kwargs[key], **val}
 
             for attempt in range(self.max_retries + 1):
+                admitted = False
                 try:
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire(
+                            self.credential.id,
+                            self.model,
+                            estimated_tokens,
+                            self.rate_limit_priority,
+                        )
+                        admitted = True
                     result = await self._call_api_with_structured_output(
                         self.model,
                         messages=messages,
@@ -539,6 +721,8 @@ class ChatModelBase:
                         tool_choice=tool_choice,
                         **merged,
                     )
+                    admitted = False
+                    await self._reconcile_usage(estimated_tokens, result.usage)
                     if name not in ("forced", "explicit"):
                         logger.info(
                             "Structured output for %s: using fallback "
@@ -551,6 +735,14 @@ class ChatModelBase:
                     # CancelledError / KeyboardInterrupt derive from
                     # BaseException and are not caught here, so they
                     # propagate as expected.
+                    if admitted:
+                        # Released before the backoff, not after it
+                        admitted = False
+                        await self._reconcile_usage(
+                            estimated_tokens,
+                            None,
+                            completed=False,
+                        )
                     if first_error is None:
                         first_error = e
                     last_error = e
@@ -558,16 +750,27 @@ class ChatModelBase:
                         # Transient error: retry the same strategy. A
                         # different strategy hits the same endpoint, so
                         # switching would not help a rate limit or timeout.
+                        if self.rate_limiter is not None:
+                            await self.rate_limiter.pause(
+                                self.credential.id,
+                                self.model,
+                                _get_retry_after(e) or 0.0,
+                            )
                         if attempt < self.max_retries:
+                            delay = _get_retry_delay(
+                                self.retry_delay,
+                                attempt,
+                                e,
+                            )
                             logger.warning(
                                 "Structured output attempt %d for %s "
                                 "failed: %s. Retrying in %.1fs...",
                                 attempt + 1,
                                 self.model,
                                 e,
-                                self.retry_delay,
+                                delay,
                             )
-                            await asyncio.sleep(self.retry_delay)
+                            await asyncio.sleep(delay)
                             continue
                         raise  # retries exhausted -> give up
                     if not isinstance(e, fallback):
@@ -582,6 +785,14 @@ class ChatModelBase:
                         e,
                     )
                     break
+                finally:
+                    # Only still set when the call was cancelled
+                    if admitted:
+                        await self._reconcile_usage(
+                            estimated_tokens,
+                            None,
+                            completed=False,
+                        )
 
         if last_error is None:
             raise RuntimeError(
@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 
 from ..._utils._audio import _build_streaming_wav_header
 from ..._utils._common import _generate_id
+from ..._utils._http_pool import _with_pooled_http_client
 from .._base import ChatModelBase, _TOOL_CHOICE_LITERAL_MODES
 from .._model_response import ChatResponse
 from .._model_usage import ChatUsage
@@ -139,7 +140,8 @@ class DashScopeChatModel(ChatModelBase):
             max_retries (`int`, defaults to `3`):
                 The maximum number of retries for the DashScope API.
             retry_delay (`float`, defaults to `1.0`):
-                Seconds to sleep between retry attempts.
+                The seconds to sleep before the first retry; later retries
+                back off exponentially, see :class:`ChatModelBase`.
             context_size (`int`, defaults to `131072`):
                 The model context size used for context compression.
             formatter (`FormatterBase | None`, defaults to `None`):
@@ -167,7 +169,12 @@ class DashScopeChatModel(ChatModelBase):
         self.client: openai.AsyncClient = openai.AsyncClient(
             api_key=self.credential.api_key.get_secret_value(),
             base_url=self.credential.base_url,
-            **self.client_kwargs,
+            **_with_pooled_http_client(
+                self.client_kwargs,
+                "dashscope",
+                self.credential.base_url,
+                openai.DefaultAsyncHttpxClient,
+            ),
         )
 
     @classmethod
@@ -186,7 +186,8 @@ class GeminiChatModel(ChatModelBase):
             max_retries (`int`, defaults to `3`):
                 The maximum number of retries for the Gemini API.
             retry_delay (`float`, defaults to `1.0`):
-                Seconds to sleep between retry attempts.
+                The seconds to sleep before the first retry; later retries
+                back off exponentially, see :class:`ChatModelBase`.
             context_size (`int`, defaults to `1048576`):
                 The model context size used for context compression.
             formatter (`FormatterBase | None`, defaults to `None`):
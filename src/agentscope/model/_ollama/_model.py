@@ -7,6 +7,7 @@ from typing import Literal, Any, AsyncGenerator, TYPE_CHECKING, List, Type
 from pydantic import BaseModel, Field
 
 from ..._utils._common import _generate_id
+from ..._utils._http_pool import _with_pooled_transport
 from .._base import ChatModelBase
 from .._model_response import ChatResponse
 from .._model_usage import ChatUsage
@@ -82,7 +83,8 @@ class OllamaChatModel(ChatModelBase):
             max_retries (`int`, defaults to `3`):
                 The maximum number of retries for the Ollama API.
             retry_delay (`float`, defaults to `1.0`):
-                Seconds to sleep between retry attempts.
+                The seconds to sleep before the first retry; later retries
+                back off exponentially, see :class:`ChatModelBase`.
             context_size (`int`, defaults to `32768`):
                 The model context size used for context compression.
             formatter (`FormatterBase | None`, defaults to `None`):
@@ -113,7 +115,11 @@ class OllamaChatModel(ChatModelBase):
 
         self.client: ollama.AsyncClient = ollama.AsyncClient(
             host=self.credential.host,
-            **self.client_kwargs,
+            **_with_pooled_transport(
+                self.client_kwargs,
+                "ollama",
+                self.credential.host,
+            ),
         )
 
     @classmethod
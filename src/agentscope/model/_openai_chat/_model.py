@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 
 from ..._utils._audio import _build_streaming_wav_header
 from ..._utils._common import _generate_id, _flatten_json_schema
+from ..._utils._http_pool import _with_pooled_http_client
 from .._base import ChatModelBase, _TOOL_CHOICE_LITERAL_MODES
 from .._model_response import ChatResponse
 from .._model_usage import ChatUsage
@@ -137,7 +138,8 @@ class OpenAIChatModel(ChatModelBase):
             max_retries (`int`, defaults to `3`):
                 The maximum number of retries for the OpenAI API.
             retry_delay (`float`, defaults to `1.0`):
-                Seconds to sleep between retry attempts.
+                The seconds to sleep before the first retry; later retries
+                back off exponentially, see :class:`ChatModelBase`.
             context_size (`int`, defaults to `128000`):
                 The model context size used for context compression.
             formatter (`FormatterBase | None`, defaults to `None`):
@@ -170,7 +172,12 @@ class OpenAIChatModel(ChatModelBase):
             api_key=self.credential.api_key.get_secret_value(),
             organization=self.credential.organization,
             base_url=self.credential.base_url,
-            **self.client_kwargs,
+            **_with_pooled_http_client(
+                self.client_kwargs,
+                "openai",
+                self.credential.base_url,
+                openai.DefaultAsyncHttpxClient,
+            ),
         )
 
     @classmethod
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""The prompt-cache planner that decides where explicit cache breakpoints
+are placed in a model request."""
+from dataclasses import dataclass, field
+from typing import Sequence
+
+
+@dataclass
+class PromptCachePlan:
+    """The cache breakpoints planned for a single model request."""
+
+    cache_tools: bool = False
+    """Whether to place a breakpoint after the tool definitions."""
+
+    cache_system: bool = False
+    """Whether to place a breakpoint after the system prompt."""
+
+    message_indices: list[int] = field(default_factory=list)
+    """The indices of the formatted messages that end with a breakpoint,
+    in ascending order."""
+
+
+class PromptCachePlanner:
+    """A provider-agnostic planner for explicit prompt-cache breakpoints.
+
+    Providers with explicit caching (e.g. Anthropic's ``cache_control``)
+    cache the request prefix that ends at a breakpoint, in the order of
+    tools, system prompt and messages. Since agents resend an identical
+    system prompt and tool schemas plus an append-only context in every
+    ReAct iteration, the planner
+
+    - marks the stable prefix, i.e. the tool definitions and the system
+      prompt, and
+    - spends the remaining breakpoints on the most recent context
+      boundaries, so that each request writes the cache at its latest
+      boundary and reads it back from the boundary written by the previous
+      request.
+
+    A context boundary is the last message of a run of messages whose role
+    is in ``boundary_roles`` (e.g. the user turn carrying the tool results
+    that ends a ReAct iteration).
+
+    The planner only decides positions; it's up to the model class to turn
+    the plan into provider-specific markers.
+    """
+
+    def __init__(
+        self,
+        max_breakpoints: int = 4,
+        rolling_breakpoints: int = 2,
+        cache_tools: bool = True,
+        cache_system: bool = True,
+        boundary_roles: Sequence[str] = ("user", "tool"),
+    ) -> None:
+        """Initialize the prompt-cache planner.
+
+        Args:
+            max_breakpoints (`int`, defaults to `4`):
+                The maximum number of breakpoints the provider accepts in a
+                single request, e.g. 4 for Anthropic.
+            rolling_breakpoints (`int`, defaults to `2`):
+                The maximum number of breakpoints placed on the most recent
+                context boundaries.
+            cache_tools (`bool`, defaults to `True`):
+                Whether to place a breakpoint after the tool definitions.
+            cache_system (`bool`, defaults to `True`):
+                Whether to place a breakpoint after the system prompt.
+            boundary_roles (`Sequence[str]`, defaults to \
+            `("user", "tool")`):
+                The message roles that can end a context boundary.
+        """
+        if max_breakpoints < 0 or rolling_breakpoints < 0:
+            raise ValueError(
+                "The number of breakpoints must be non-negative, got "
+                f"max_breakpoints={max_breakpoints} and "
+                f"rolling_breakpoints={rolling_breakpoints}.",
+            )
+
+        self.max_breakpoints = max_breakpoints
+        self.rolling_breakpoints = rolling_breakpoints
+        self.cache_tools = cache_tools
+        self.cache_system = cache_system
+        self.boundary_roles = tuple(boundary_roles)
+
+    def plan(
+        self,
+        has_tools: bool,
+        has_system: bool,
+        message_roles: Sequence[str],
+    ) -> PromptCachePlan:
+        """Plan the breakpoints for a request within the breakpoint limit.
+
+        Args:
+            has_tools (`bool`):
+                Whether the request carries tool definitions.
+            has_system (`bool`):
+                Whether the request carries a system prompt.
+            message_roles (`Sequence[str]`):
+                The roles of the formatted messages, in order.
+
+        Returns:
+            `PromptCachePlan`:
+                The planned breakpoints.
+        """
+        plan = PromptCachePlan()
+        budget = self.max_breakpoints
+
+        # The stable prefix comes first. The system breakpoint is preferred
+        # as it also covers the tools that precede it.
+        if has_system and self.cache_system and budget > 0:
+            plan.cache_system = True
+            budget -= 1
+
+        if has_tools and self.cache_tools and budget > 0:
+            plan.cache_tools = True
+            budget -= 1
+
+        n_rolling = min(budget, self.rolling_breakpoints)
+        if n_rolling <= 0:
+            return plan
+
+        indices = []
+        for i in range(len(message_roles) - 1, -1, -1):
+            if message_roles[i] not in self.boundary_roles:
+                continue
+            if (
+                i + 1 < len(message_roles)
+                and message_roles[i + 1] in self.boundary_roles
+            ):
+                # Not the end of the run
+                continue
+            indices.append(i)
+            if len(indices) == n_rolling:
+                break
+
+        plan.message_indices = sorted(indices)
+        return plan
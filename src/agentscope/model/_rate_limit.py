@@ -0,0 +1,518 @@
+# -*- coding: utf-8 -*-
+"""The rate limiters that admit chat model calls against per-credential
+request and token budgets."""
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+
+
+class RateLimitPriority(IntEnum):
+    """The admission priority of a model call. Waiting calls with a lower
+    value are admitted first."""
+
+    INTERACTIVE = 0
+    """Calls made on behalf of a user waiting for the reply."""
+
+    BACKGROUND = 10
+    """Calls made by scheduled or other unattended runs."""
+
+
+@dataclass
+class RateLimit:
+    """The budgets of one credential and model pair. ``None`` leaves the
+    corresponding dimension unlimited."""
+
+    rpm: int | None = None
+    """The maximum number of requests per minute."""
+
+    tpm: int | None = None
+    """The maximum number of tokens per minute."""
+
+
+@dataclass
+class TokenBucket:
+    """The state of the request and token buckets of one key, refilled
+    continuously at ``rpm / 60`` requests and ``tpm / 60`` tokens per
+    second up to one minute of budget."""
+
+    requests: float
+    """The available requests."""
+
+    tokens: float
+    """The available tokens, negative when the reconciled usage exceeded
+    the estimate."""
+
+    updated_at: float
+    """The timestamp of the last refill."""
+
+    paused_until: float = 0.0
+    """The timestamp before which no call is admitted, e.g. set from the
+    ``retry-after`` header of a rate-limit error."""
+
+    @classmethod
+    def full(cls, limit: RateLimit, now: float) -> "TokenBucket":
+        """Create a bucket with the full budget of ``limit``."""
+        return cls(
+            requests=float(limit.rpm or 0),
+            tokens=float(limit.tpm or 0),
+            updated_at=now,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TokenBucket":
+        """Load a bucket from its dict form."""
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        """Dump the bucket into a JSON-serializable dict."""
+        return asdict(self)
+
+    def refill(self, limit: RateLimit, now: float) -> None:
+        """Refill the buckets for the time elapsed since the last refill."""
+        elapsed = max(0.0, now - self.updated_at)
+        if limit.rpm:
+            self.requests = min(
+                float(limit.rpm),
+                self.requests + elapsed * limit.rpm / 60,
+            )
+        if limit.tpm:
+            self.tokens = min(
+                float(limit.tpm),
+                self.tokens + elapsed * limit.tpm / 60,
+            )
+        self.updated_at = max(self.updated_at, now)
+
+    def try_take(self, limit: RateLimit, tokens: int, now: float) -> float:
+        """Take one request and ``tokens`` tokens if both are available.
+
+        Args:
+            limit (`RateLimit`):
+                The budgets of the bucket.
+            tokens (`int`):
+                The estimated tokens of the call. Estimates above the token
+                budget are capped so that large calls are still admitted
+                once the bucket is full.
+            now (`float`):
+                The current timestamp.
+
+        Returns:
+            `float`:
+                ``0`` if the call is admitted, otherwise the seconds to wait
+                before the budget becomes available.
+        """
+        self.refill(limit, now)
+
+        wait = max(0.0, self.paused_until - now)
+        if limit.rpm and self.requests < 1:
+            wait = max(wait, (1 - self.requests) * 60 / limit.rpm)
+
+        needed = min(tokens, limit.tpm) if limit.tpm else 0
+        if limit.tpm and self.tokens < needed:
+            wait = max(wait, (needed - self.tokens) * 60 / limit.tpm)
+
+        if wait > 0:
+            return wait
+
+        if limit.rpm:
+            self.requests -= 1
+        self.tokens -= needed
+        return 0.0
+
+    def adjust(self, limit: RateLimit, delta: int) -> None:
+        """Charge ``delta`` more tokens (or refund them when negative),
+        bounded to one minute of debt."""
+        if not limit.tpm:
+            return
+        self.tokens = min(
+            float(limit.tpm),
+            max(-float(limit.tpm), self.tokens - delta),
+        )
+
+
+class RateLimiterBase(ABC):
+    """The base class for rate limiters of chat model calls.
+
+    The calls are admitted against the RPM/TPM budgets of their credential
+    and model. Calls that cannot be admitted wait in a per-key priority
+    queue, where interactive calls go ahead of background ones and calls of
+    the same priority are admitted in arrival order. Only the head of the
+    queue polls the buckets, so waiting calls don't retry in lockstep.
+
+    Subclasses decide where the bucket state lives by implementing
+    ``_reserve``, ``_adjust`` and ``_pause``. The queue and the metrics are
+    process-local.
+    """
+
+    def __init__(
+        self,
+        default_limit: RateLimit | None = None,
+        limits: dict[str, RateLimit] | None = None,
+        max_poll_interval: float = 1.0,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            default_limit (`RateLimit | None`, optional):
+                The budgets of the models that aren't listed in ``limits``.
+                ``None`` leaves them unlimited.
+            limits (`dict[str, RateLimit] | None`, optional):
+                The budgets keyed by model name.
+            max_poll_interval (`float`, defaults to `1.0`):
+                The maximum seconds the head of a queue sleeps before
+                polling the buckets again, so that it notices budget
+                released by the reconciliation of other calls.
+        """
+        self.default_limit = default_limit
+        self.limits = dict(limits or {})
+        self.max_poll_interval = max_poll_interval
+
+        self._waiters: dict[str, list[tuple[int, int]]] = {}
+        self._conditions: dict[str, asyncio.Condition] = {}
+        self._counter = itertools.count()
+
+        self._admitted = 0
+        self._throttled = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._max_queue_depth = 0
+
+    def get_limit(self, model: str) -> RateLimit | None:
+        """Get the budgets of the given model.
+
+        Args:
+            model (`str`):
+                The model name.
+
+        Returns:
+            `RateLimit | None`:
+                The budgets, or ``None`` if the model is unlimited.
+        """
+        return self.limits.get(model, self.default_limit)
+
+    @staticmethod
+    def _get_key(credential_id: str, model: str) -> str:
+        """Get the bucket key of a credential and model pair."""
+        return f"{credential_id}:{model}"
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of calls currently waiting for admission."""
+        return sum(len(_) for _ in self._waiters.values())
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """The admission metrics of this limiter, including the current and
+        the maximum queue depth, the number of admitted calls, the number
+        of calls that had to wait, and the total, average and maximum wait
+        time in seconds."""
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "admitted": self._admitted,
+            "throttled": self._throttled,
+            "total_wait_time": self._total_wait_time,
+            "avg_wait_time": (
+                self._total_wait_time / self._admitted
+                if self._admitted
+                else 0.0
+            ),
+            "max_wait_time": self._max_wait_time,
+        }
+
+    async def acquire(
+        self,
+        credential_id: str,
+        model: str,
+        tokens: int,
+        priority: RateLimitPriority = RateLimitPriority.INTERACTIVE,
+    ) -> None:
+        """Wait until a call is admitted within the budgets.
+
+        Args:
+            credential_id (`str`):
+                The id of the credential used by the call.
+            model (`str`):
+                The model name.
+            tokens (`int`):
+                The estimated tokens of the call.
+            priority (`RateLimitPriority`, defaults to \
+            `RateLimitPriority.INTERACTIVE`):
+                The admission priority of the call.
+        """
+        limit = self.get_limit(model)
+        if limit is None or (not limit.rpm and not limit.tpm):
+            return
+
+        key = self._get_key(credential_id, model)
+        waiters = self._waiters.setdefault(key, [])
+        condition = self._conditions.setdefault(key, asyncio.Condition())
+        entry = (int(priority), next(self._counter))
+        heapq.heappush(waiters, entry)
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+
+        start = time.monotonic()
+        throttled = False
+        try:
+            while True:
+                if waiters[0] != entry:
+                    throttled = True
+                    async with condition:
+                        await condition.wait_for(
+                            lambda: waiters[0] == entry,
+                        )
+                    continue
+
+                wait = await self._reserve(key, limit, tokens)
+                if wait <= 0:
+                    break
+
+                throttled = True
+                # Sleep a little longer than required with jitter, so that
+                # the heads of different processes don't poll in lockstep
+                await asyncio.sleep(
+                    min(wait, self.max_poll_interval)
+                    * random.uniform(1.0, 1.2),
+                )
+        finally:
+            waiters.remove(entry)
+            heapq.heapify(waiters)
+            if not waiters:
+                self._waiters.pop(key, None)
+                self._conditions.pop(key, None)
+            else:
+                async with condition:
+                    condition.notify_all()
+
+        waited = time.monotonic() - start
+        self._admitted += 1
+        if throttled:
+            self._throttled += 1
+        self._total_wait_time += waited
+        self._max_wait_time = max(self._max_wait_time, waited)
+
+    async def reconcile(
+        self,
+        credential_id: str,
+        model: str,
+        estimated_tokens: int,
+        actual_tokens: int,
+    ) -> None:
+        """Correct the token bucket with the actual usage of an admitted
+        call.
+
+        Args:
+            credential_id (`str`):
+                The id of the credential used by the call.
+            model (`str`):
+                The model name.
+            estimated_tokens (`int`):
+                The tokens estimated when the call was admitted.
+            actual_tokens (`int`):
+                The tokens actually consumed, e.g. the sum of the input and
+                output tokens in the `ChatUsage`.
+        """
+        limit = self.get_limit(model)
+        if limit is None or not limit.tpm:
+            return
+        estimated_tokens = min(estimated_tokens, limit.tpm)
+        if actual_tokens == estimated_tokens:
+            return
+        await self._adjust(
+            self._get_key(credential_id, model),
+            limit,
+            actual_tokens - estimated_tokens,
+        )
+
+    async def pause(
+        self,
+        credential_id: str,
+        model: str,
+        seconds: float,
+    ) -> None:
+        """Stop admitting calls of a credential and model pair for the
+        given seconds, e.g. after the provider answered with a
+        ``retry-after`` header.
+
+        Args:
+            credential_id (`str`):
+                The id of the credential.
+            model (`str`):
+                The model name.
+            seconds (`float`):
+                The seconds to pause for.
+        """
+        limit = self.get_limit(model)
+        if limit is None or seconds <= 0:
+            return
+        await self._pause(self._get_key(credential_id, model), limit, seconds)
+
+    @abstractmethod
+    async def _reserve(self, key: str, limit: RateLimit, tokens: int) -> float:
+        """Atomically refill the bucket of ``key`` and take one request and
+        ``tokens`` tokens from it if available.
+
+        Returns:
+            `float`:
+                ``0`` if admitted, otherwise the seconds to wait.
+        """
+
+    @abstractmethod
+    async def _adjust(self, key: str, limit: RateLimit, delta: int) -> None:
+        """Charge ``delta`` more tokens to the bucket of ``key``, or refund
+        them when negative."""
+
+    @abstractmethod
+    async def _pause(self, key: str, limit: RateLimit, seconds: float) -> None:
+        """Stop admitting calls of ``key`` for ``seconds`` seconds."""
+
+
+class TokenBucketRateLimiter(RateLimiterBase):
+    """The in-process token-bucket rate limiter, which coordinates the
+    calls of all models sharing this limiter in the current process."""
+
+    def __init__(
+        self,
+        default_limit: RateLimit | None = None,
+        limits: dict[str, RateLimit] | None = None,
+        max_poll_interval: float = 1.0,
+    ) -> None:
+        """Initialize the in-process rate limiter.
+
+        Args:
+            default_limit (`RateLimit | None`, optional):
+                The budgets of the models that aren't listed in ``limits``.
+                ``None`` leaves them unlimited.
+            limits (`dict[str, RateLimit] | None`, optional):
+                The budgets keyed by model name.
+            max_poll_interval (`float`, defaults to `1.0`):
+                The maximum seconds the head of a queue sleeps before
+                polling the buckets again.
+        """
+        super().__init__(
+            default_limit=default_limit,
+            limits=limits,
+            max_poll_interval=max_poll_interval,
+        )
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _get_bucket(self, key: str, limit: RateLimit) -> TokenBucket:
+        """Get the bucket of ``key``, creating a full one if absent."""
+        if key not in self._buckets:
+            self._buckets[key] = TokenBucket.full(limit, time.monotonic())
+        return self._buckets[key]
+
+    async def _reserve(self, key: str, limit: RateLimit, tokens: int) -> float:
+        """Take the budget from the local bucket of ``key``."""
+        bucket = self._get_bucket(key, limit)
+        return bucket.try_take(limit, tokens, time.monotonic())
+
+    async def _adjust(self, key: str, limit: RateLimit, delta: int) -> None:
+        """Adjust the local bucket of ``key``."""
+        bucket = self._get_bucket(key, limit)
+        bucket.refill(limit, time.monotonic())
+        bucket.adjust(limit, delta)
+
+    async def _pause(self, key: str, limit: RateLimit, seconds: float) -> None:
+        """Pause the local bucket of ``key``."""
+        bucket = self._get_bucket(key, limit)
+        bucket.paused_until = max(
+            bucket.paused_until,
+            time.monotonic() + seconds,
+        )
+
+
+_MAX_RETRY_AFTER = 60.0
+"""The longest ``retry-after`` hint honoured, in seconds, so that a
+provider asking for a long wait can't park a run indefinitely."""
+
+
+def _get_retry_after(error: Exception) -> float | None:
+    """Extract the ``retry-after`` hint in seconds from a provider error.
+
+    Both the ``retry-after-ms`` and the ``retry-after`` headers of the HTTP
+    response attached to the error (as in the OpenAI and Anthropic SDKs)
+    are recognized, as well as a ``retry_after`` attribute on the error.
+    The hint is capped at ``_MAX_RETRY_AFTER`` seconds.
+
+    Args:
+        error (`Exception`):
+            The error raised by the provider SDK.
+
+    Returns:
+        `float | None`:
+            The seconds to wait, or ``None`` if the error carries no hint.
+    """
+    seconds = _parse_retry_after(error)
+    if seconds is None:
+        return None
+    return min(max(0.0, seconds), _MAX_RETRY_AFTER)
+
+
+def _parse_retry_after(error: Exception) -> float | None:
+    """Read the uncapped ``retry-after`` hint of a provider error."""
+    retry_after = getattr(error, "retry_after", None)
+    if isinstance(retry_after, (int, float)):
+        return float(retry_after)
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+
+    try:
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            return float(value) / 1000
+
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            # An HTTP date
+            return parsedate_to_datetime(value).timestamp() - time.time()
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _get_retry_delay(
+    retry_delay: float,
+    attempt: int,
+    error: Exception,
+    max_delay: float = 60.0,
+) -> float:
+    """Compute the jittered exponential backoff before the next attempt.
+
+    The delay doubles with each attempt from ``retry_delay`` up to
+    ``max_delay`` and is jittered into its upper half, so that the sessions
+    that failed together don't retry together. A ``retry-after`` hint from
+    the provider, capped at ``_MAX_RETRY_AFTER`` seconds, is a lower bound
+    of the delay.
+
+    Args:
+        retry_delay (`float`):
+            The base delay in seconds.
+        attempt (`int`):
+            The zero-based index of the failed attempt.
+        error (`Exception`):
+            The error raised by the failed attempt.
+        max_delay (`float`, defaults to `60.0`):
+            The upper bound of the exponential delay.
+
+    Returns:
+        `float`:
+            The seconds to sleep before the next attempt.
+    """
+    delay = min(max_delay, retry_delay * 2**attempt)
+    delay *= random.uniform(0.5, 1.0)
+
+    retry_after = _get_retry_after(error)
+    if retry_after is not None:
+        delay = max(delay, retry_after * random.uniform(1.0, 1.1))
+    return delay
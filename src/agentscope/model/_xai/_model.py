@@ -118,7 +118,8 @@ class XAIChatModel(ChatModelBase):
             max_retries (`int`, defaults to `3`):
                 The maximum number of retries for the xAI API.
             retry_delay (`float`, defaults to `1.0`):
-                Seconds to sleep between retry attempts.
+                The seconds to sleep before the first retry; later retries
+                back off exponentially, see :class:`ChatModelBase`.
             context_size (`int`, defaults to `131072`):
                 The model context size used for context compression.
             formatter (`XAIChatFormatter | None`, defaults to `None`):
@@ -4,6 +4,7 @@
 from ._context import PermissionContext, AdditionalWorkingDirectory
 from ._decision import PermissionDecision
 from ._engine import PermissionEngine
+from ._matcher import RuleMatcher, CommandPrefixTrie, GlobRuleIndex
 from ._rule import PermissionRule
 from ._types import PermissionMode, PermissionBehavior
 
@@ -12,6 +13,9 @@ __all__ = [
     "AdditionalWorkingDirectory",
     "PermissionDecision",
     "PermissionEngine",
+    "RuleMatcher",
+    "CommandPrefixTrie",
+    "GlobRuleIndex",
     "PermissionRule",
     "PermissionMode",
     "PermissionBehavior",
@@ -5,6 +5,7 @@ from typing import Any, List, TYPE_CHECKING
 from ._context import PermissionContext
 from ._rule import PermissionRule
 from ._decision import PermissionDecision, PermissionBehavior
+from ._matcher import RuleMatcher
 from ._types import PermissionMode
 from .._utils._common import _execute_async_or_sync_func
 
@@ -14,6 +15,52 @@ else:
     ToolBase = "ToolBase"
 
 
+def _defining_class(cls: type, name: str) -> type | None:
+    """Return the class of the MRO that defines an attribute."""
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+    return None
+
+
+class _CompiledRules:
+    """The rules of one tool and behavior, compiled for evaluation."""
+
+    def __init__(self, tool: ToolBase, rules: list[PermissionRule]) -> None:
+        """Compile the rules for the tool.
+
+        Args:
+            tool (`ToolBase`):
+                The tool the rules are evaluated for.
+            rules (`list[PermissionRule]`):
+                The rules, in priority order.
+        """
+        self.tool = tool
+        self.rules = list(rules)
+
+        # A rule without content matches everything, so the rules after
+        # the first such rule can never be the first match
+        self.catch_all = next(
+            (i for i, rule in enumerate(rules) if not rule.rule_content),
+            len(rules),
+        )
+
+        self.matcher: RuleMatcher | None = None
+        compile_owner = _defining_class(type(tool), "compile_rules")
+        match_owner = _defining_class(type(tool), "match_rule")
+        # Only trust the matcher when it is at least as specific as the
+        # match_rule it replaces
+        if (
+            self.catch_all > 0
+            and compile_owner is not None
+            and match_owner is not None
+            and issubclass(compile_owner, match_owner)
+        ):
+            self.matcher = tool.compile_rules(
+                [rule.rule_content for rule in rules[: self.catch_all]],
+            )
+
+
 class PermissionEngine:
     """Engine for checking and enforcing permission rules.
 
@@ -45,6 +92,8 @@ class PermissionEngine:
             >>> engine = PermissionEngine(context)
         """
         self.context = context
+        # Compiled matchers per (behavior, tool name); see _first_matching
+        self._compiled: dict[tuple[str, str], _CompiledRules] = {}
 
     def add_rule(self, rule: PermissionRule) -> None:
         """Add a permission rule to the context.
@@ -708,14 +757,18 @@ class PermissionEngine:
             `PermissionDecision | None`:
                 DENY decision if a rule matches, None otherwise
         """
-        rules = self.context.deny_rules.get(tool.name, [])
-        for rule in rules:
-            if await self._rule_matches(tool, rule, input_data):
-                return PermissionDecision(
-                    behavior=PermissionBehavior.DENY,
-                    message=f"Permission to use {tool.name} has been denied",
-                    decision_reason=f"Rule: {rule.rule_content}",
-                )
+        rule = await self._first_matching(
+            "deny",
+            tool,
+            self.context.deny_rules.get(tool.name, []),
+            input_data,
+        )
+        if rule is not None:
+            return PermissionDecision(
+                behavior=PermissionBehavior.DENY,
+                message=f"Permission to use {tool.name} has been denied",
+                decision_reason=f"Rule: {rule.rule_content}",
+            )
         return None
 
     async def _check_ask_rules(
@@ -735,14 +788,18 @@ class PermissionEngine:
             `PermissionDecision | None`:
                 ASK decision if a rule matches, None otherwise
         """
-        rules = self.context.ask_rules.get(tool.name, [])
-        for rule in rules:
-            if await self._rule_matches(tool, rule, input_data):
-                return PermissionDecision(
-                    behavior=PermissionBehavior.ASK,
-                    message=f"Permission required for {tool.name}",
-                    decision_reason=f"Rule: {rule.rule_content}",
-                )
+        rule = await self._first_matching(
+            "ask",
+            tool,
+            self.context.ask_rules.get(tool.name, []),
+            input_data,
+        )
+        if rule is not None:
+            return PermissionDecision(
+                behavior=PermissionBehavior.ASK,
+                message=f"Permission required for {tool.name}",
+                decision_reason=f"Rule: {rule.rule_content}",
+            )
         return None
 
     async def _check_allow_rules(
@@ -762,14 +819,75 @@ class PermissionEngine:
             `PermissionDecision | None`:
                 ALLOW decision if a rule matches, None otherwise
         """
-        rules = self.context.allow_rules.get(tool.name, [])
-        for rule in rules:
-            if await self._rule_matches(tool, rule, input_data):
-                return PermissionDecision(
-                    behavior=PermissionBehavior.ALLOW,
-                    message=f"Permission granted for {tool.name}",
-                    updated_input=input_data,
-                )
+        rule = await self._first_matching(
+            "allow",
+            tool,
+            self.context.allow_rules.get(tool.name, []),
+            input_data,
+        )
+        if rule is not None:
+            return PermissionDecision(
+                behavior=PermissionBehavior.ALLOW,
+                message=f"Permission granted for {tool.name}",
+                updated_input=input_data,
+            )
+        return None
+
+    async def _first_matching(
+        self,
+        behavior: str,
+        tool: ToolBase,
+        rules: list[PermissionRule],
+        input_data: dict[str, Any],
+    ) -> PermissionRule | None:
+        """Find the first rule of a list that matches the request.
+
+        The rules are compiled with :meth:`ToolBase.compile_rules` the
+        first time the list is evaluated for the tool, and the matcher is
+        reused until the list changes, so a check does not cost a
+        :meth:`ToolBase.match_rule` call per rule. Tools without a
+        compiled matcher are matched rule by rule.
+
+        Args:
+            behavior (`str`):
+                The behavior of the rule list, keying the compiled cache
+            tool (`ToolBase`):
+                The tool instance being called
+            rules (`list[PermissionRule]`):
+                The rules of the tool for this behavior, in priority order
+            input_data (`dict[str, Any]`):
+                The tool input data
+
+        Returns:
+            `PermissionRule | None`:
+                The first matching rule, or None if no rule matches
+        """
+        if not rules:
+            return None
+
+        compiled = self._compiled.get((behavior, tool.name))
+        # ``==`` on the lists compares the rules by identity first, so the
+        # check stays cheap while catching rules added to or removed from
+        # the context directly
+        if (
+            compiled is None
+            or compiled.tool is not tool
+            or compiled.rules != rules
+        ):
+            compiled = _CompiledRules(tool, rules)
+            self._compiled[(behavior, tool.name)] = compiled
+
+        if compiled.matcher is None:
+            for rule in rules[: compiled.catch_all]:
+                if await self._rule_matches(tool, rule, input_data):
+                    return rule
+        else:
+            index = await compiled.matcher(input_data)
+            if index is not None:
+                return rules[index]
+
+        if compiled.catch_all < len(rules):
+            return rules[compiled.catch_all]
         return None
 
     async def _rule_matches(
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Compiled indexes over the contents of permission rules.
+
+A tool that implements :meth:`ToolBase.compile_rules` turns the contents
+of an ordered rule list into a :data:`RuleMatcher` once, and the
+:class:`PermissionEngine` then asks the matcher for the first matching
+rule instead of calling :meth:`ToolBase.match_rule` for each rule. The
+indexes here are the building blocks the builtin tools compile into.
+"""
+import fnmatch
+import os
+import re
+from typing import Any, Awaitable, Callable, Sequence
+
+RuleMatcher = Callable[[dict[str, Any]], Awaitable[int | None]]
+"""An async callable returning the position of the first rule, in the
+compiled list, that matches a tool input, or ``None`` if no rule does."""
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def _min_index(first: int | None, second: int | None) -> int | None:
+    """The smaller of two optional rule positions."""
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
+
+
+class CommandPrefixTrie:
+    """A trie of command prefixes keyed by space-separated words.
+
+    A prefix matches a command that equals it or starts with it followed
+    by a space, so looking a command up walks at most as many words as
+    the longest prefix has, whatever the number of prefixes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root: dict = {}
+        self._depth = 0
+
+    def add(self, prefix: str, index: int) -> None:
+        """Add a prefix for the rule at ``index``.
+
+        Args:
+            prefix (`str`):
+                The command prefix.
+            index (`int`):
+                The position of the rule; the lowest one is kept when a
+                prefix is added twice.
+        """
+        words = prefix.split(" ")
+        node = self._root
+        for word in words:
+            node = node.setdefault(word, {})
+        # The word list cannot contain None, so it marks the rule
+        node.setdefault(None, index)
+        self._depth = max(self._depth, len(words))
+
+    def first_match(self, command: str) -> int | None:
+        """Return the lowest position of a prefix matching the command.
+
+        Args:
+            command (`str`):
+                The command to look up.
+
+        Returns:
+            `int | None`:
+                The position of the first matching rule, or ``None``.
+        """
+        best = None
+        node = self._root
+        for word in command.split(" ", self._depth):
+            node = node.get(word)
+            if node is None:
+                break
+            best = _min_index(best, node.get(None))
+        return best
+
+
+class _GlobNode:
+    """A node of :class:`GlobRuleIndex`: the patterns whose literal
+    leading directories end here, and the deeper directories."""
+
+    __slots__ = ("children", "patterns", "regex")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_GlobNode"] = {}
+        self.patterns: list[tuple[int, str]] = []
+        self.regex: re.Pattern | None = None
+
+
+class GlobRuleIndex:
+    """An index of ``fnmatch`` patterns, finding the first one matching
+    a path.
+
+    Patterns without wildcards are looked up in a dict. The others are
+    filed under the directories their literal prefix spells out, and the
+    patterns of one directory are compiled into a single regex, so a
+    lookup walks the path's directories and runs one regex per directory
+    on the way.
+    """
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        """Compile the patterns.
+
+        Args:
+            patterns (`Sequence[str]`):
+                The ``fnmatch`` patterns, in rule order.
+        """
+        self._exact: dict[str, int] = {}
+        self._root = _GlobNode()
+        for index, pattern in enumerate(patterns):
+            pattern = os.path.normcase(pattern)
+            wildcard = _GLOB_CHARS.search(pattern)
+            if wildcard is None:
+                self._exact.setdefault(pattern, index)
+                continue
+            node = self._root
+            for part in pattern[: wildcard.start()].split("/")[:-1]:
+                node = node.children.setdefault(part, _GlobNode())
+            node.patterns.append((index, fnmatch.translate(pattern)))
+        self._compile(self._root)
+
+    def _compile(self, node: _GlobNode) -> None:
+        """Combine the patterns of each node into one regex whose
+        alternatives are tried in rule order."""
+        if node.patterns:
+            node.regex = re.compile(
+                "|".join(
+                    f"(?:{regex})(?P<r{index}>)"
+                    for index, regex in node.patterns
+                ),
+            )
+        for child in node.children.values():
+            self._compile(child)
+
+    def first_match(self, path: str) -> int | None:
+        """Return the lowest position of a pattern matching the path.
+
+        Args:
+            path (`str`):
+                The path to look up, matched as ``fnmatch.fnmatch`` does.
+
+        Returns:
+            `int | None`:
+                The position of the first matching rule, or ``None``.
+        """
+        path = os.path.normcase(path)
+        best = self._exact.get(path)
+        node: _GlobNode | None = self._root
+        parts = iter(path.split("/"))
+        while node is not None:
+            if node.regex is not None:
+                match = node.regex.match(path)
+                if match is not None:
+                    best = _min_index(best, int(match.lastgroup[1:]))
+            node = node.children.get(next(parts, None))
+        return best
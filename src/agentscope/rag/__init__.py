@@ -25,10 +25,12 @@ from ._vdb import (
     QdrantStore,
     MongoDBStore,
 )
-from ._knowledge import KnowledgeBase
+from ._knowledge import KnowledgeBase, reciprocal_rank_fusion
+from ._lexical import BM25Index
 
 __all__ = [
     "ApproxTokenChunker",
+    "BM25Index",
     "ChunkerBase",
     "Chunk",
     "DocumentSummary",
@@ -48,4 +50,5 @@ __all__ = [
     "QdrantStore",
     "KnowledgeBase",
     "MongoDBStore",
+    "reciprocal_rank_fusion",
 ]
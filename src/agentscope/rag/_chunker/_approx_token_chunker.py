@@ -31,11 +31,15 @@ class ApproxTokenChunker(ChunkerBase):
     chunk.
 
     .. note:: Chunks never span across two input Sections, as
-        required by :class:`ChunkerBase`.
+        required by :class:`ChunkerBase`, and each Section is sliced
+        independently of the others, so the chunker is
+        :attr:`~ChunkerBase.section_local`.
     """
 
     chunker_type = "approx_token"
 
+    section_local = True
+
     class Parameters(ChunkerBase.Parameters):
         """The tunable parameters of the approximate-token chunker."""
 
@@ -15,6 +15,11 @@ text and :class:`DataBlock` content are passed through unchanged.
 Chunkers **never combine content across Section boundaries**.  This
 guarantee preserves the structural metadata attached by the Parser
 (page numbers, slide indices, embedded-image isolation, etc.).
+
+A chunker whose output for a Section also does not depend on the other
+Sections sets :attr:`ChunkerBase.section_local`.  Consumers may then
+chunk each Section as soon as it is parsed instead of waiting for the
+whole list; other chunkers are always given the whole list.
 """
 from abc import ABC, abstractmethod
 
@@ -53,6 +58,13 @@ class ChunkerBase(ABC):
     chunker_type: str
     """The unique identifier of the chunking strategy."""
 
+    section_local: bool = False
+    """Whether the chunks of each Section depend on that Section only,
+    up to their ``chunk_index`` and ``total_chunks``.  Set by chunkers
+    for which chunking the Sections one at a time and renumbering the
+    concatenated output gives the same chunks as one ``chunk()`` call
+    on the whole list; consumers then chunk Sections as they arrive."""
+
     class Parameters(BaseModel):
         """The tunable parameters of the chunker."""
 
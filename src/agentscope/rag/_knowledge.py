@@ -29,15 +29,23 @@ carries a ``{"tenant_id": "..."}`` payload.  It is set once at
 construction time and **always** applied: search/list never escape
 it, and insert forces it onto every chunk's metadata so a malicious or
 buggy parser cannot rebind a record into another scope.
+
+An optional :class:`~agentscope.rag.BM25Index` adds lexical retrieval:
+:meth:`search` then fuses the dense and the BM25 rankings with
+reciprocal-rank fusion, so exact identifiers and rare terms surface at
+a small ``top_k``.
 """
 
 import asyncio
+from typing import Iterable
 
 from ._document import Chunk
+from ._lexical import BM25Index
 from ._vdb import VectorRecord, VectorSearchResult, VectorStoreBase
 from .._utils._common import _generate_id
 from ..embedding import EmbeddingModelBase
 from ..message import DataBlock, TextBlock
+from ..types import Embedding
 from ._vdb import DocumentSummary
 
 
@@ -79,6 +87,8 @@ class KnowledgeBase:
         vector_store: VectorStoreBase,
         collection: str,
         metadata_filter: dict | None = None,
+        lexical_index: BM25Index | None = None,
+        rrf_k: int = 60,
     ) -> None:
         """Initialize the runtime handle.
 
@@ -117,6 +127,17 @@ class KnowledgeBase:
                 ``None`` disables filtering — the default for
                 deployments where every knowledge base owns its
                 collection outright.
+            lexical_index (`BM25Index | None`, optional):
+                A lexical index of this knowledge base's chunks,
+                maintained by :meth:`insert_document` and
+                :meth:`delete_document`.  When set, :meth:`search`
+                fuses dense and BM25 rankings.  Fill it with
+                :meth:`rebuild_lexical_index` when the collection
+                already holds documents.
+            rrf_k (`int`, defaults to ``60``):
+                The reciprocal-rank fusion constant: a hit at rank
+                ``r`` of a ranking contributes ``1 / (rrf_k + r)``.
+                Larger values flatten the advantage of the top ranks.
         """
         self.name = name
         self.description = description
@@ -124,6 +145,8 @@ class KnowledgeBase:
         self._vector_store = vector_store
         self._collection = collection
         self._metadata_filter = metadata_filter
+        self._lexical_index = lexical_index
+        self.rrf_k = rrf_k
         # Memoise the "collection exists" check after the first
         # successful ensure_collection so subsequent operations avoid
         # the extra round-trip.
@@ -153,6 +176,11 @@ class KnowledgeBase:
         """The defense-in-depth payload filter, or ``None``."""
         return self._metadata_filter
 
+    @property
+    def lexical_index(self) -> BM25Index | None:
+        """The lexical index fused into :meth:`search`, or ``None``."""
+        return self._lexical_index
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -202,6 +230,13 @@ class KnowledgeBase:
         optionally filtered by ``score_threshold``, sorted by
         descending score, and truncated to ``top_k``.
 
+        With a :attr:`lexical_index`, each text query is also ranked
+        by BM25, both retrievers fetch ``3 * top_k`` candidates, and
+        every ranking (dense and lexical, per query) is merged with
+        reciprocal-rank fusion.  The returned scores are then fused
+        scores, and ``score_threshold`` applies to the dense
+        similarities before fusion.
+
         Args:
             queries (`list[str | TextBlock | DataBlock]`):
                 Query inputs.  Text may be either bare ``str`` or
@@ -222,11 +257,14 @@ class KnowledgeBase:
         Returns:
             `list[VectorSearchResult]`:
                 At most ``top_k`` deduplicated hits ordered by
-                descending similarity score.  Empty when there are no
-                queries the bound embedding model can consume.
+                descending similarity (or fused) score.  Empty when
+                there are no queries the bound embedding model can
+                consume.
         """
         if not queries:
             return []
+        hybrid = self._lexical_index is not None
+        depth = top_k * 3 if hybrid else top_k
 
         if not self._embedding_model.supports_multimodal:
             queries = [q for q in queries if not isinstance(q, DataBlock)]
@@ -241,13 +279,34 @@ class KnowledgeBase:
                 self._vector_store.search(
                     collection=self._collection,
                     query_vector=vector,
-                    top_k=top_k,
+                    top_k=depth,
                     metadata_filter=self._metadata_filter,
                 )
                 for vector in response.embeddings
             ),
         )
 
+        if hybrid:
+            rankings = [
+                [
+                    result
+                    for result in results
+                    if score_threshold is None
+                    or result.score >= score_threshold
+                ]
+                for results in results_per_query
+            ]
+            rankings.extend(
+                self._lexical_index.search(
+                    query if isinstance(query, str) else query.text,
+                    top_k=depth,
+                    metadata_filter=self._metadata_filter,
+                )
+                for query in queries
+                if not isinstance(query, DataBlock)
+            )
+            return reciprocal_rank_fusion(rankings, k=self.rrf_k)[:top_k]
+
         best: dict[tuple[str, int], VectorSearchResult] = {}
         for results in results_per_query:
             for result in results:
@@ -280,6 +339,7 @@ class KnowledgeBase:
         chunks: list[Chunk],
         document_id: str | None = None,
         document_metadata: dict | None = None,
+        embeddings: list[Embedding] | None = None,
     ) -> str:
         """Embed and insert a list of chunks as a single source document.
 
@@ -308,6 +368,11 @@ class KnowledgeBase:
                 Document-level metadata (filename, media type, size,
                 upload time, ...).  Merged into each chunk's
                 ``metadata``.
+            embeddings (`list[Embedding] | None`, optional):
+                Vectors already computed for ``chunks`` by this
+                knowledge base's embedding model (e.g. for a duplicate
+                upload), one per chunk and in the same order.  When
+                given, the embedding model is not called.
 
         Returns:
             `str`:
@@ -315,8 +380,9 @@ class KnowledgeBase:
 
         Raises:
             `RuntimeError`:
-                If the embedding model returns a number of vectors
-                that does not match the number of chunks.
+                If the embedding model returns (or ``embeddings``
+                holds) a number of vectors that does not match the
+                number of chunks.
         """
         if not chunks:
             return document_id or _generate_id()
@@ -333,13 +399,15 @@ class KnowledgeBase:
                 **(self._metadata_filter or {}),
             }
 
-        response = await self._embedding_model(
-            [chunk.content for chunk in chunks],
-        )
+        if embeddings is None:
+            response = await self._embedding_model(
+                [chunk.content for chunk in chunks],
+            )
+            embeddings = response.embeddings
 
-        if len(response.embeddings) != len(chunks):
+        if len(embeddings) != len(chunks):
             raise RuntimeError(
-                f"Embedding model returned {len(response.embeddings)} "
+                f"Embedding model returned {len(embeddings)} "
                 f"vectors for {len(chunks)} chunks.",
             )
 
@@ -349,9 +417,11 @@ class KnowledgeBase:
                 document_id=document_id,
                 chunk=chunk,
             )
-            for vector, chunk in zip(response.embeddings, chunks)
+            for vector, chunk in zip(embeddings, chunks)
         ]
         await self._vector_store.insert(self._collection, records)
+        if self._lexical_index is not None:
+            self._lexical_index.add(document_id, chunks)
         return document_id
 
     async def delete_document(self, document_id: str) -> None:
@@ -366,6 +436,50 @@ class KnowledgeBase:
             self._collection,
             document_id,
         )
+        if self._lexical_index is not None:
+            self._lexical_index.remove(document_id)
+
+    async def rebuild_lexical_index(self, page_size: int = 100) -> int:
+        """Refill :attr:`lexical_index` from the chunks in the vector
+        store.
+
+        Needed once per process when the collection was filled
+        elsewhere (by an indexing worker, or before the index was
+        attached); afterwards :meth:`insert_document` and
+        :meth:`delete_document` keep it current.  Documents are
+        re-added, so rebuilding a current index changes nothing.
+
+        Args:
+            page_size (`int`, defaults to ``100``):
+                Chunks fetched per :meth:`list_chunks` call.
+
+        Returns:
+            `int`:
+                The number of chunks indexed.
+
+        Raises:
+            `ValueError`:
+                If no lexical index is attached.
+            `NotImplementedError`:
+                If the vector store does not support chunk listing.
+        """
+        if self._lexical_index is None:
+            raise ValueError("This knowledge base has no lexical index.")
+        indexed = 0
+        for document in await self.list_documents():
+            offset = 0
+            while True:
+                chunks = await self.list_chunks(
+                    document.document_id,
+                    offset=offset,
+                    limit=page_size,
+                )
+                self._lexical_index.add(document.document_id, chunks)
+                indexed += len(chunks)
+                offset += len(chunks)
+                if len(chunks) < page_size:
+                    break
+        return indexed
 
     async def list_documents(self) -> list["DocumentSummary"]:
         """List all distinct source documents in this knowledge base.
@@ -422,3 +536,44 @@ class KnowledgeBase:
             limit=limit,
             metadata_filter=self._metadata_filter,
         )
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[list[VectorSearchResult]],
+    k: int = 60,
+) -> list[VectorSearchResult]:
+    """Merge rankings by reciprocal-rank fusion.
+
+    A hit at 1-based rank ``r`` of a ranking scores ``1 / (k + r)``;
+    the scores of a chunk, identified by ``(document_id, chunk_index)``,
+    add up across rankings.  Only ranks count, so rankings with
+    incomparable scores (cosine similarity, BM25, different embedding
+    models) merge fairly.
+
+    Args:
+        rankings (`Iterable[list[VectorSearchResult]]`):
+            Rankings ordered best first.  A chunk listed twice in one
+            ranking counts at its best rank.
+        k (`int`, defaults to ``60``):
+            The fusion constant.
+
+    Returns:
+        `list[VectorSearchResult]`:
+            One hit per chunk, carrying its fused score, by descending
+            fused score.
+    """
+    fused: dict[tuple[str, int], float] = {}
+    hits: dict[tuple[str, int], VectorSearchResult] = {}
+    for ranking in rankings:
+        seen: set[tuple[str, int]] = set()
+        for rank, result in enumerate(ranking, start=1):
+            key = (result.document_id, result.chunk.chunk_index)
+            if key in seen:
+                continue
+            seen.add(key)
+            fused[key] = fused.get(key, 0.0) + 1.0 / (k + rank)
+            hits.setdefault(key, result)
+    return [
+        hits[key].model_copy(update={"score": score})
+        for key, score in sorted(fused.items(), key=lambda item: -item[1])
+    ]
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""In-memory BM25 index over chunk text.
+
+Dense retrieval matches meaning, not spelling: exact identifiers, error
+codes and rare terms often rank poorly against a paraphrase.  A
+:class:`BM25Index` attached to a :class:`~agentscope.rag.KnowledgeBase`
+ranks the same chunks lexically, and the knowledge base fuses both
+rankings with reciprocal-rank fusion.
+
+The index lives in process memory and is maintained by
+:meth:`KnowledgeBase.insert_document` /
+:meth:`KnowledgeBase.delete_document`; chunks inserted elsewhere (by
+another process, or before the index existed) are added with
+:meth:`KnowledgeBase.rebuild_lexical_index`.
+
+Tokenization lowercases the text and keeps:
+
+- word tokens (``\\w+``), plus each compound identifier joined by
+  ``-``, ``.``, ``/`` or ``:`` as one token (``err-4012``,
+  ``v1.2.3``) besides its parts, so exact identifiers match exactly;
+- overlapping character bigrams of CJK runs, which carry no spaces.
+"""
+import heapq
+import math
+import re
+from typing import Any, Callable
+
+from ._document import Chunk
+from ._vdb import VectorSearchResult
+from ..message import TextBlock
+
+_WORD = re.compile(r"\w+(?:[-./:]\w+)*")
+_PART = re.compile(r"[^\W_]+")
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]+")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split text into BM25 terms.
+
+    Args:
+        text (`str`):
+            The text to tokenize.
+
+    Returns:
+        `list[str]`:
+            The terms, repeated as often as they occur.
+    """
+    text = text.lower()
+    tokens: list[str] = []
+    for run in _CJK.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+    for word in _WORD.findall(_CJK.sub(" ", text)):
+        tokens.append(word)
+        parts = _PART.findall(word)
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+class BM25Index:
+    """Okapi BM25 over the text chunks of one knowledge base.
+
+    Chunks are keyed by ``(document_id, chunk_index)``, the identity
+    :meth:`KnowledgeBase.search` deduplicates on.  Multimodal chunks
+    carry no text and are not indexed.  Updates are synchronous and
+    never interleave with a search on the event loop.
+
+    .. code-block:: python
+
+        kb = KnowledgeBase(..., lexical_index=BM25Index())
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        tokenizer: Callable[[str], list[str]] | None = None,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            k1 (`float`, defaults to ``1.5``):
+                Term-frequency saturation.
+            b (`float`, defaults to ``0.75``):
+                Length normalization, from ``0`` (none) to ``1``
+                (full).
+            tokenizer (`Callable[[str], list[str]] | None`, optional):
+                Splits text into terms; the same function tokenizes
+                chunks and queries.  Defaults to the module's
+                identifier- and CJK-aware tokenizer.
+        """
+        self.k1 = k1
+        self.b = b
+        self._tokenize = tokenizer or _tokenize
+        self._chunks: dict[tuple[str, int], tuple[Chunk, int]] = {}
+        self._postings: dict[str, dict[tuple[str, int], int]] = {}
+        self._documents: dict[str, list[tuple[str, int]]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """The number of indexed chunks."""
+        return len(self._chunks)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The indexed documents, chunks and distinct terms."""
+        return {
+            "documents": len(self._documents),
+            "chunks": len(self._chunks),
+            "terms": len(self._postings),
+        }
+
+    def add(self, document_id: str, chunks: list[Chunk]) -> None:
+        """Index the text chunks of a document, replacing a chunk
+        already indexed under the same ``chunk_index``.
+
+        Args:
+            document_id (`str`):
+                The source document of the chunks.
+            chunks (`list[Chunk]`):
+                The chunks to index.
+        """
+        for chunk in chunks:
+            if not isinstance(chunk.content, TextBlock):
+                continue
+            key = (document_id, chunk.chunk_index)
+            if key in self._chunks:
+                self._remove_chunk(key)
+            else:
+                self._documents.setdefault(document_id, []).append(key)
+            terms = self._tokenize(chunk.content.text)
+            frequencies: dict[str, int] = {}
+            for term in terms:
+                frequencies[term] = frequencies.get(term, 0) + 1
+            for term, frequency in frequencies.items():
+                self._postings.setdefault(term, {})[key] = frequency
+            self._chunks[key] = (chunk, len(terms))
+            self._total_length += len(terms)
+
+    def remove(self, document_id: str) -> None:
+        """Drop every chunk of a document; unknown ids are a no-op.
+
+        Args:
+            document_id (`str`):
+                The source document to drop.
+        """
+        for key in self._documents.pop(document_id, []):
+            self._remove_chunk(key)
+
+    def _remove_chunk(self, key: tuple[str, int]) -> None:
+        """Drop one chunk from the postings and the length total."""
+        chunk, length = self._chunks.pop(key)
+        self._total_length -= length
+        for term in set(self._tokenize(chunk.content.text)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(key, None)
+            if not postings:
+                del self._postings[term]
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        metadata_filter: dict[str, Any] | None = None,
+    ) -> list[VectorSearchResult]:
+        """Rank the indexed chunks against a query.
+
+        Args:
+            query (`str`):
+                The query text.
+            top_k (`int`, defaults to ``5``):
+                Maximum number of results.
+            metadata_filter (`dict[str, Any] | None`, optional):
+                Restrict results to chunks whose ``metadata`` matches
+                every ``key == value`` pair, as the vector stores do.
+
+        Returns:
+            `list[VectorSearchResult]`:
+                Chunks containing at least one query term, by
+                descending BM25 score.
+        """
+        if not self._chunks or top_k <= 0:
+            return []
+        n_chunks = len(self._chunks)
+        average_length = self._total_length / n_chunks or 1.0
+        scores: dict[tuple[str, int], float] = {}
+        for term in set(self._tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(
+                1 + (n_chunks - len(postings) + 0.5) / (len(postings) + 0.5),
+            )
+            for key, frequency in postings.items():
+                length = self._chunks[key][1]
+                norm = self.k1 * (
+                    1 - self.b + self.b * length / average_length
+                )
+                scores[key] = scores.get(key, 0.0) + idf * (
+                    frequency * (self.k1 + 1) / (frequency + norm)
+                )
+
+        if metadata_filter:
+            ranked = sorted(scores.items(), key=lambda item: -item[1])
+        else:
+            ranked = heapq.nlargest(top_k, scores.items(), key=lambda i: i[1])
+        results: list[VectorSearchResult] = []
+        for key, score in ranked:
+            chunk = self._chunks[key][0]
+            if metadata_filter and any(
+                chunk.metadata.get(k) != v for k, v in metadata_filter.items()
+            ):
+                continue
+            results.append(
+                VectorSearchResult(
+                    score=score,
+                    document_id=key[0],
+                    chunk=chunk,
+                ),
+            )
+            if len(results) == top_k:
+                break
+        return results
@@ -12,9 +12,28 @@ Section; splitting happens later in a
 :class:`~agentscope.rag.ChunkerBase`.  Parsers also do not need to
 worry about output size — only about preserving the structural
 boundaries that downstream consumers must not cross.
+
+Streaming
+---------
+A parser that sets :attr:`ParserBase.streaming` implements
+:meth:`ParserBase.iter_sections`, a synchronous generator yielding
+each Section as soon as it is extracted (one page, slide or sheet at a
+time).  Consumers then chunk and embed the first pages while later
+ones are still being parsed, and never hold the whole Section list:
+
+- :meth:`ParserBase.parse_stream` iterates it off the event loop, in
+  the default thread pool;
+- the index worker iterates it inside its process pool, when one is
+  configured, and reads the Sections back as they are produced.
+
+Other parsers only implement :meth:`ParserBase.parse`;
+:meth:`ParserBase.parse_stream` then yields its result once it is
+complete.
 """
+import asyncio
 import mimetypes
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterator
 
 from .._document import Section
 
@@ -40,6 +59,11 @@ class ParserBase(ABC):
     ``["text/plain", "text/markdown"]``.  Used by the
     KnowledgeBaseManager to select a parser for an uploaded file."""
 
+    streaming: bool = False
+    """Whether :meth:`iter_sections` yields Sections incrementally.
+    Set by parsers that override it; consumers then stream the Sections
+    instead of waiting for :meth:`parse` to return them all."""
+
     @classmethod
     def supported_extensions(cls) -> list[str]:
         """Filename extensions (including the leading ``.``) this parser
@@ -114,3 +138,65 @@ class ParserBase(ABC):
                 ``str`` that does not name an existing file.
             `ValueError`: If the file cannot be parsed.
         """
+
+    def iter_sections(
+        self,
+        file: bytes | str,
+        filename: str,
+    ) -> Iterator[Section]:
+        """Parse a file, yielding each :class:`Section` as soon as it is
+        extracted.
+
+        Streaming parsers (:attr:`streaming` set) override this with a
+        generator doing the blocking work between two yields, so it must
+        be iterated off the event loop.  The default runs :meth:`parse`
+        to completion on a fresh event loop, hence may only be called
+        from a thread or process without a running loop.
+
+        Args:
+            file (`bytes | str`):
+                The file content or a path to it, as for :meth:`parse`.
+                A path lets the parser read the file lazily.
+            filename (`str`):
+                The original filename, copied into each Section's
+                :attr:`Section.source`.
+
+        Yields:
+            `Section`:
+                The Sections in document order, the same as
+                :meth:`parse` returns.
+        """
+        yield from asyncio.run(self.parse(file, filename))
+
+    async def parse_stream(
+        self,
+        file: bytes | str,
+        filename: str,
+    ) -> AsyncIterator[Section]:
+        """Parse a file, yielding each :class:`Section` as it is ready.
+
+        A streaming parser's :meth:`iter_sections` is advanced in the
+        default thread pool, one Section at a time, so the event loop
+        stays responsive while a large file is parsed.  Other parsers
+        yield the Sections of :meth:`parse` once it returns.
+
+        Args:
+            file (`bytes | str`):
+                The file content or a path to it, as for :meth:`parse`.
+            filename (`str`):
+                The original filename.
+
+        Yields:
+            `Section`:
+                The Sections in document order.
+        """
+        if not self.streaming:
+            for section in await self.parse(file, filename):
+                yield section
+            return
+        sections = self.iter_sections(file, filename)
+        while True:
+            section = await asyncio.to_thread(next, sections, None)
+            if section is None:
+                return
+            yield section
@@ -15,7 +15,7 @@ downstream by a :class:`~agentscope.rag.ChunkerBase`.
 import base64
 import io
 import json
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
 
 from ..._logging import logger
 from ...message import Base64Source, DataBlock, TextBlock
@@ -163,6 +163,8 @@ class ExcelParser(ParserBase):
         "application/vnd.ms-excel",
     ]
 
+    streaming = True
+
     @classmethod
     def supported_extensions(cls) -> list[str]:
         """Return ``[".xlsx", ".xls"]``."""
@@ -233,6 +235,35 @@ class ExcelParser(ParserBase):
                 ``separate_sheet=False`` (default), all text is merged
                 into a single section with ``metadata={}``.
 
+        Raises:
+            `FileNotFoundError`: If ``file`` is a ``str`` pointing to
+                a path that does not exist.
+            `ImportError`: If :mod:`pandas` is not installed.
+            `ValueError`: If the bytes cannot be parsed.
+        """
+        return list(self.iter_sections(file, filename))
+
+    def iter_sections(
+        self,
+        file: bytes | str,
+        filename: str,
+    ) -> Iterator[Section]:
+        """Yield the Sections of each sheet once it is parsed.
+
+        With ``separate_sheet=False`` the text of all sheets is merged
+        into one Section, so it is yielded after the last sheet.
+
+        Args:
+            file (`bytes | str`):
+                Either the raw Excel bytes, or a filesystem path to
+                the Excel file.
+            filename (`str`):
+                The source filename.
+
+        Yields:
+            `Section`:
+                The Sections in sheet order.
+
         Raises:
             `FileNotFoundError`: If ``file`` is a ``str`` pointing to
                 a path that does not exist.
@@ -279,12 +310,13 @@ class ExcelParser(ParserBase):
                     filename,
                     workbook,
                 )
-                sections.extend(sheet_sections)
+                if self.separate_sheet:
+                    yield from sheet_sections
+                else:
+                    sections.extend(sheet_sections)
 
             if not self.separate_sheet:
-                sections = self._merge_text_sections(sections, filename)
-
-            return sections
+                yield from self._merge_text_sections(sections, filename)
         finally:
             if workbook is not None:
                 workbook.close()
@@ -7,6 +7,7 @@ section is the image, ready to flow through to a multimodal
 embedding model unchanged.
 """
 import base64
+from typing import Iterator
 
 from ...message import Base64Source, DataBlock
 from .._document import Section
@@ -35,6 +36,8 @@ class ImageParser(ParserBase):
         "image/webp",
     ]
 
+    streaming = True
+
     @classmethod
     def supported_extensions(cls) -> list[str]:
         """Return the canonical image extensions."""
@@ -67,6 +70,30 @@ class ImageParser(ParserBase):
                 A one-element list whose section's ``content`` is a
                 :class:`DataBlock` with the base64-encoded image data.
 
+        Raises:
+            `FileNotFoundError`: If ``file`` is a ``str`` pointing to
+                a path that does not exist.
+        """
+        return list(self.iter_sections(file, filename))
+
+    def iter_sections(
+        self,
+        file: bytes | str,
+        filename: str,
+    ) -> Iterator[Section]:
+        """Yield the single image :class:`Section`.
+
+        Args:
+            file (`bytes | str`):
+                Either the raw image bytes, or a filesystem path to
+                the image file.
+            filename (`str`):
+                The source filename.
+
+        Yields:
+            `Section`:
+                The image Section.
+
         Raises:
             `FileNotFoundError`: If ``file`` is a ``str`` pointing to
                 a path that does not exist.
@@ -77,16 +104,14 @@ class ImageParser(ParserBase):
 
         media_type = _guess_image_media_type(file)
         data = base64.b64encode(file).decode("utf-8")
-        return [
-            Section(
-                content=DataBlock(
-                    source=Base64Source(
-                        media_type=media_type,
-                        data=data,
-                    ),
-                    name=filename,
+        yield Section(
+            content=DataBlock(
+                source=Base64Source(
+                    media_type=media_type,
+                    data=data,
                 ),
-                source=filename,
-                metadata={"media_type": media_type},
+                name=filename,
             ),
-        ]
+            source=filename,
+            metadata={"media_type": media_type},
+        )
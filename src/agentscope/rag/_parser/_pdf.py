@@ -7,6 +7,7 @@ boundaries.  Each section's :attr:`Section.metadata` carries the
 page number (starting at 1) for later citation.
 """
 import io
+from typing import Iterator
 
 from ...message import TextBlock
 from .._document import Section
@@ -27,6 +28,8 @@ class PDFParser(ParserBase):
 
     supported_media_types: list[str] = ["application/pdf"]
 
+    streaming = True
+
     @classmethod
     def supported_extensions(cls) -> list[str]:
         """Return the canonical ``.pdf`` extension."""
@@ -58,10 +61,35 @@ class PDFParser(ParserBase):
             `ImportError`: If :mod:`pypdf` is not installed.
             `ValueError`: If the bytes cannot be parsed as PDF.
         """
-        if isinstance(file, str):
-            with open(file, "rb") as fp:
-                file = fp.read()
+        return list(self.iter_sections(file, filename))
+
+    def iter_sections(
+        self,
+        file: bytes | str,
+        filename: str,
+    ) -> Iterator[Section]:
+        """Yield one Section per page as it is extracted.
+
+        A path is read lazily: only the page being extracted and the
+        cross-reference table are held in memory.
 
+        Args:
+            file (`bytes | str`):
+                Either the raw PDF bytes, or a filesystem path to
+                the PDF file.
+            filename (`str`):
+                The source filename.
+
+        Yields:
+            `Section`:
+                The page Sections, in document order.
+
+        Raises:
+            `FileNotFoundError`: If ``file`` is a ``str`` pointing to
+                a path that does not exist.
+            `ImportError`: If :mod:`pypdf` is not installed.
+            `ValueError`: If the bytes cannot be parsed as PDF.
+        """
         try:
             from pypdf import PdfReader
             from pypdf.errors import PdfReadError
@@ -72,21 +100,20 @@ class PDFParser(ParserBase):
                 "`pip install agentscope[rag]`).",
             ) from e
 
-        try:
-            reader = PdfReader(io.BytesIO(file))
-        except PdfReadError as e:
-            raise ValueError(
-                f"Failed to parse {filename!r} as PDF: {e}",
-            ) from e
+        with (
+            open(file, "rb") if isinstance(file, str) else io.BytesIO(file)
+        ) as fp:
+            try:
+                reader = PdfReader(fp)
+            except PdfReadError as e:
+                raise ValueError(
+                    f"Failed to parse {filename!r} as PDF: {e}",
+                ) from e
 
-        sections: list[Section] = []
-        for page_idx, page in enumerate(reader.pages, start=1):
-            text = page.extract_text() or ""
-            sections.append(
-                Section(
+            for page_idx, page in enumerate(reader.pages, start=1):
+                text = page.extract_text() or ""
+                yield Section(
                     content=TextBlock(text=text),
                     source=filename,
                     metadata={"page": page_idx},
-                ),
-            )
-        return sections
+                )
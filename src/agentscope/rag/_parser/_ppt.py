@@ -15,7 +15,8 @@ long text stays intact inside a section and is split downstream by a
 """
 import base64
 import io
-from typing import Any, Literal
+import os
+from typing import Any, Iterator, Literal
 
 from ..._logging import logger
 from ...message import Base64Source, DataBlock, TextBlock
@@ -110,6 +111,8 @@ class PPTParser(ParserBase):
         ".presentation",
     ]
 
+    streaming = True
+
     @classmethod
     def supported_extensions(cls) -> list[str]:
         """Return ``[".pptx"]`` — the only format ``python-pptx``
@@ -192,10 +195,32 @@ class PPTParser(ParserBase):
             `ImportError`: If :mod:`python-pptx` is not installed.
             `ValueError`: If the bytes cannot be parsed.
         """
-        if isinstance(file, str):
-            with open(file, "rb") as fp:
-                file = fp.read()
+        return list(self.iter_sections(file, filename))
+
+    def iter_sections(
+        self,
+        file: bytes | str,
+        filename: str,
+    ) -> Iterator[Section]:
+        """Yield the Sections of each slide once it is parsed.
 
+        Args:
+            file (`bytes | str`):
+                Either the raw PPTX bytes, or a filesystem path to
+                the PPTX file.
+            filename (`str`):
+                The source filename.
+
+        Yields:
+            `Section`:
+                The Sections in deck order.
+
+        Raises:
+            `FileNotFoundError`: If ``file`` is a ``str`` pointing to
+                a path that does not exist.
+            `ImportError`: If :mod:`python-pptx` is not installed.
+            `ValueError`: If the bytes cannot be parsed.
+        """
         try:
             from pptx import Presentation
         except ImportError as e:
@@ -206,19 +231,21 @@ class PPTParser(ParserBase):
                 "`pip install agentscope[rag]`).",
             ) from e
 
+        if isinstance(file, str):
+            if not os.path.isfile(file):
+                raise FileNotFoundError(file)
+            source: str | io.BytesIO = file
+        else:
+            source = io.BytesIO(file)
         try:
-            prs = Presentation(io.BytesIO(file))
+            prs = Presentation(source)
         except Exception as e:  # pylint: disable=broad-except
             raise ValueError(
                 f"Failed to parse {filename!r} as PPTX: {e}",
             ) from e
 
-        sections: list[Section] = []
         for slide_idx, slide in enumerate(prs.slides):
-            sections.extend(
-                self._parse_slide(slide, slide_idx, filename),
-            )
-        return sections
+            yield from self._parse_slide(slide, slide_idx, filename)
 
     # ------------------------------------------------------------------
     # Slide-level parsing
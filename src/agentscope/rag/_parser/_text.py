@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Plain-text file parser."""
 import os
+from typing import Iterator
 
 from ...message import TextBlock
 from .._document import Section
@@ -32,6 +33,8 @@ class TextParser(ParserBase):
     ]
     """Standard IANA media types this parser handles."""
 
+    streaming = True
+
     @classmethod
     def supported_extensions(cls) -> list[str]:
         """Return the human-friendly text extensions.
@@ -90,6 +93,30 @@ class TextParser(ParserBase):
                 Always a one-element list containing the entire file
                 contents.
 
+        Raises:
+            `ValueError`: If the bytes cannot be decoded with the
+                configured encoding.
+        """
+        return list(self.iter_sections(file, filename))
+
+    def iter_sections(
+        self,
+        file: bytes | str,
+        filename: str,
+    ) -> Iterator[Section]:
+        """Yield the whole file as a single :class:`Section`.
+
+        Args:
+            file (`bytes | str`):
+                The file content, a path to it, or pre-decoded text,
+                as for :meth:`parse`.
+            filename (`str`):
+                The source filename.
+
+        Yields:
+            `Section`:
+                The Section holding the entire file contents.
+
         Raises:
             `ValueError`: If the bytes cannot be decoded with the
                 configured encoding.
@@ -116,10 +143,8 @@ class TextParser(ParserBase):
                     f"{self.encoding!r}: {e}",
                 ) from e
 
-        return [
-            Section(
-                content=TextBlock(text=text),
-                source=filename,
-                metadata={},
-            ),
-        ]
+        yield Section(
+            content=TextBlock(text=text),
+            source=filename,
+            metadata={},
+        )
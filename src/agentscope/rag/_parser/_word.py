@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import base64
 import io
-from typing import Literal, TYPE_CHECKING
+from typing import Iterator, Literal, TYPE_CHECKING
 
 from ..._logging import logger
 from ...message import Base64Source, DataBlock, TextBlock
@@ -191,6 +191,8 @@ class WordParser(ParserBase):
         ".document",
     ]
 
+    streaming = True
+
     @classmethod
     def supported_extensions(cls) -> list[str]:
         """Return ``[".docx"]`` — the only format ``python-docx`` reads."""
@@ -252,6 +254,32 @@ class WordParser(ParserBase):
             `list[Section]`:
                 Sections in document order.
 
+        Raises:
+            `FileNotFoundError`: If ``file`` is a ``str`` pointing to
+                a path that does not exist.
+            `ImportError`: If :mod:`python-docx` is not installed.
+            `ValueError`: If the bytes cannot be parsed.
+        """
+        return list(self.iter_sections(file, filename))
+
+    def iter_sections(
+        self,
+        file: bytes | str,
+        filename: str,
+    ) -> Iterator[Section]:
+        """Yield each Section as soon as its content block is closed.
+
+        Args:
+            file (`bytes | str`):
+                Either the raw DOCX bytes, or a filesystem path to the
+                DOCX file.
+            filename (`str`):
+                The source filename.
+
+        Yields:
+            `Section`:
+                The Sections in document order.
+
         Raises:
             `FileNotFoundError`: If ``file`` is a ``str`` pointing to
                 a path that does not exist.
@@ -276,18 +304,15 @@ class WordParser(ParserBase):
         else:
             doc = DocxDocument(io.BytesIO(file))
 
-        sections: list[Section] = []
         text_buffer: list[str] = []
 
-        def flush_text() -> None:
+        def flush_text() -> Iterator[Section]:
             if not text_buffer:
                 return
-            sections.append(
-                Section(
-                    content=TextBlock(text="\n".join(text_buffer)),
-                    source=filename,
-                    metadata={},
-                ),
+            yield Section(
+                content=TextBlock(text="\n".join(text_buffer)),
+                source=filename,
+                metadata={},
             )
             text_buffer.clear()
 
@@ -307,18 +332,14 @@ class WordParser(ParserBase):
                         para._element.findall(".//" + qn("w:pict")),
                     )
                     if has_drawing or has_pict:
-                        flush_text()
+                        yield from flush_text()
                         for block in _extract_image_blocks(para, filename):
-                            sections.append(
-                                Section(
-                                    content=block,
-                                    source=filename,
-                                    metadata={
-                                        "media_type": (
-                                            block.source.media_type
-                                        ),
-                                    },
-                                ),
+                            yield Section(
+                                content=block,
+                                source=filename,
+                                metadata={
+                                    "media_type": block.source.media_type,
+                                },
                             )
 
             elif isinstance(element, CT_Tbl):
@@ -332,16 +353,13 @@ class WordParser(ParserBase):
                     continue
 
                 if self.separate_table:
-                    flush_text()
-                    sections.append(
-                        Section(
-                            content=TextBlock(text=rendered),
-                            source=filename,
-                            metadata={},
-                        ),
+                    yield from flush_text()
+                    yield Section(
+                        content=TextBlock(text=rendered),
+                        source=filename,
+                        metadata={},
                     )
                 else:
                     text_buffer.append(rendered)
 
-        flush_text()
-        return sections
+        yield from flush_text()
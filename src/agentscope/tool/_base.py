@@ -15,6 +15,7 @@ from ..permission import (
     PermissionDecision,
     PermissionRule,
     PermissionBehavior,
+    RuleMatcher,
 )
 from ._response import ToolChunk
 from ._utils import _remove_title_field
@@ -312,6 +313,28 @@ class ToolBase(ABC):
         # None rule_content = tool-name-level rule, matches everything
         return rule_content is None
 
+    def compile_rules(self, rule_contents: list[str]) -> RuleMatcher | None:
+        """Compile the contents of an ordered rule list into a matcher.
+
+        .. note:: This is an optional method. The permission engine calls
+        it once per rule list and reuses the matcher until the list
+        changes, instead of calling :meth:`match_rule` for every rule on
+        every invocation. The matcher must agree with :meth:`match_rule`;
+        a subclass that overrides :meth:`match_rule` but not this method
+        is matched rule by rule.
+
+        Args:
+            rule_contents (`list[str]`):
+                The non-empty rule contents, in rule order.
+
+        Returns:
+            `RuleMatcher | None`:
+                An async callable returning the position of the first
+                rule matching a tool input, or ``None`` to match the
+                rules one by one with :meth:`match_rule`.
+        """
+        return None
+
     async def generate_suggestions(
         self,
         tool_input: dict[str, Any],
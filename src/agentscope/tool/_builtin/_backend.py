@@ -42,7 +42,7 @@ import shutil
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from types import ModuleType
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 import aiofiles
 
@@ -50,6 +50,9 @@ import aiofiles
 # turn into thousands of awaits, small enough to stay off the heap.
 DEFAULT_READ_CHUNK_SIZE = 1024 * 1024
 
+# Read size when streaming a command's stdout
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 # One NUL-terminated record per entry, for the shell-based ``scandir``
 # and ``stat``. The name goes last because it is the only field that
 # may itself contain a tab, so a bounded split keeps it whole.
@@ -132,10 +135,61 @@ def _normalize_newlines(text: str) -> str:
     return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
+async def _pump_process(
+    process: asyncio.subprocess.Process,
+    on_stdout: Callable[[bytes], bool],
+    timeout: float | None,
+    terminate: Callable[[], Awaitable[None]],
+) -> ExecResult:
+    """Feed the stdout of a started process to *on_stdout* until the
+    process exits, the timeout expires or *on_stdout* returns ``False``.
+
+    Shared by the :meth:`BackendBase.exec_stream` overrides that spawn
+    a local process.
+
+    Args:
+        process (`asyncio.subprocess.Process`):
+            The process, with piped stdout and stderr.
+        on_stdout (`Callable[[bytes], bool]`):
+            Receives the stdout chunks as they arrive; returning
+            ``False`` terminates the process.
+        timeout (`float | None`):
+            Maximum number of seconds to run.
+        terminate (`Callable[[], Awaitable[None]]`):
+            Stops the process (and its children).
+
+    Returns:
+        `ExecResult`:
+            The exit code and stderr, with an empty stdout.
+    """
+    assert process.stdout is not None and process.stderr is not None
+    stderr_task = asyncio.create_task(process.stderr.read())
+    try:
+        async with asyncio.timeout(timeout):
+            while chunk := await process.stdout.read(_STREAM_CHUNK_SIZE):
+                if not on_stdout(chunk):
+                    await terminate()
+                    break
+            await process.wait()
+    except TimeoutError:
+        await terminate()
+        stderr_task.cancel()
+        return ExecResult(exit_code=-1, stdout=b"", stderr=b"timed out")
+    except BaseException:
+        await asyncio.shield(terminate())
+        stderr_task.cancel()
+        raise
+    return ExecResult(
+        exit_code=process.returncode or 0,
+        stdout=b"",
+        stderr=await stderr_task,
+    )
+
+
 # ── base class ─────────────────────────────────────────────────────────
 
 
-class BackendBase(ABC):
+class BackendBase(ABC):  # pylint: disable=too-many-public-methods
     """Filesystem + subprocess interface consumed by builtin tools.
 
     Subclasses must implement three abstract primitives — ``exec_shell``,
@@ -327,6 +381,53 @@ class BackendBase(ABC):
                 The captured exit code, stdout, and stderr.
         """
 
+    async def exec_stream(
+        self,
+        command: list[str],
+        on_stdout: Callable[[bytes], bool],
+        *,
+        cwd: str | None = None,
+        timeout: float | None = None,
+    ) -> ExecResult:
+        """Run a program, handing its stdout to *on_stdout* as it
+        arrives.
+
+        Lets a caller that needs only a prefix of a large output stop
+        the program early: once *on_stdout* returns ``False`` the
+        program is terminated and no more output is read.
+
+        The default runs :meth:`exec_shell` and hands over the whole
+        stdout at once, so it bounds neither the memory nor the run
+        time; backends that spawn a local process (``LocalBackend``,
+        ``BubblewrapBackend``) stream incrementally.
+
+        Args:
+            command (`list[str]`):
+                Executable path/name followed by its arguments.
+            on_stdout (`Callable[[bytes], bool]`):
+                Receives successive stdout chunks, split at arbitrary
+                byte boundaries. Returns whether to keep reading.
+            cwd (`str | None`, optional):
+                Working directory to run the command in.
+            timeout (`float | None`, optional):
+                Maximum number of seconds to wait. On timeout the
+                result carries an ``exit_code`` of ``-1``; the chunks
+                handed over until then stay valid.
+
+        Returns:
+            `ExecResult`:
+                The exit code and stderr. ``stdout`` is always empty,
+                as it was consumed by *on_stdout*.
+        """
+        result = await self.exec_shell(command, cwd=cwd, timeout=timeout)
+        if result.stdout:
+            on_stdout(result.stdout)
+        return ExecResult(
+            exit_code=result.exit_code,
+            stdout=b"",
+            stderr=result.stderr,
+        )
+
     @abstractmethod
     async def read_file(self, path: str) -> bytes:
         """Read the full contents of ``path`` as raw bytes.
@@ -829,6 +930,61 @@ class LocalBackend(BackendBase):
             stderr=stderr,
         )
 
+    async def exec_stream(
+        self,
+        command: list[str],
+        on_stdout: Callable[[bytes], bool],
+        *,
+        cwd: str | None = None,
+        timeout: float | None = None,
+    ) -> ExecResult:
+        """Run a program, streaming its stdout to *on_stdout*.
+
+        Args:
+            command (`list[str]`):
+                Executable path/name followed by its arguments.
+            on_stdout (`Callable[[bytes], bool]`):
+                Receives successive stdout chunks; returning ``False``
+                kills the process.
+            cwd (`str | None`, optional):
+                Working directory for the subprocess.
+            timeout (`float | None`, optional):
+                Maximum number of seconds to run before the process is
+                killed and an ``exit_code`` of ``-1`` is returned.
+
+        Returns:
+            `ExecResult`:
+                The exit code and stderr, with an empty stdout; ``127``
+                if the executable cannot be spawned.
+        """
+        kwargs = _subprocess_creation_kwargs()
+        if cwd is not None:
+            kwargs["cwd"] = cwd
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **kwargs,
+            )
+        except (FileNotFoundError, NotADirectoryError, OSError) as exc:
+            return ExecResult(
+                exit_code=127,
+                stdout=b"",
+                stderr=str(exc).encode("utf-8"),
+            )
+
+        async def _kill() -> None:
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+            await process.wait()
+
+        return await _pump_process(process, on_stdout, timeout, _kill)
+
     async def read_file(self, path: str) -> bytes:
         """Read a local file as raw bytes.
 
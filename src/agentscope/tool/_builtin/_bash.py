@@ -16,12 +16,58 @@ from ...permission import (
     PermissionBehavior,
     PermissionMode,
     PermissionRule,
+    CommandPrefixTrie,
+    RuleMatcher,
 )
 from ...message import TextBlock, ToolResultState
 from .._response import ToolChunk
 from ._backend import BackendBase
 
 
+def _has_wildcards(pattern: str) -> bool:
+    """Check if a Bash rule pattern contains unescaped ``*`` wildcards."""
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == "\\":
+            i += 2  # Skip escaped character
+        elif pattern[i] == "*":
+            return True
+        else:
+            i += 1
+    return False
+
+
+def _unescape_literal(pattern: str) -> str:
+    """Resolve the ``\\*`` and ``\\\\`` escapes of a Bash rule pattern
+    without wildcards."""
+    pattern = pattern.replace("\\\\", "\x00BACKSLASH\x00")
+    pattern = pattern.replace("\\*", "*")
+    return pattern.replace("\x00BACKSLASH\x00", "\\")
+
+
+def _wildcard_to_regex(pattern: str) -> str:
+    """Convert a Bash rule pattern with wildcards to a regex, where
+    ``*`` matches any characters and ``\\*`` a literal asterisk."""
+    # Use placeholders for escaped sequences
+    escaped_star = "\x00ESCAPED_STAR\x00"
+    escaped_backslash = "\x00ESCAPED_BACKSLASH\x00"
+
+    pattern = pattern.replace("\\\\", escaped_backslash)
+    pattern = pattern.replace("\\*", escaped_star)
+
+    # Manually escape regex special characters (except *)
+    # Don't use re.escape() as it escapes spaces too
+    for char in r".^$+?{}[]|()":
+        pattern = pattern.replace(char, "\\" + char)
+
+    # Convert * to regex .* (match any characters)
+    pattern = pattern.replace("*", ".*")
+
+    # Restore escaped sequences
+    pattern = pattern.replace(escaped_star, r"\*")
+    return pattern.replace(escaped_backslash, r"\\")
+
+
 class Bash(ToolBase):
     """The bash tool."""
 
@@ -427,59 +473,17 @@ easier to review tool calls and give permission.
             prefix = rule_content[:-2].strip()
             return command.startswith(prefix + " ") or command == prefix
 
-        # Check if pattern has unescaped wildcards
-        def has_wildcards(pattern: str) -> bool:
-            """Check if pattern contains unescaped * wildcards."""
-            i = 0
-            while i < len(pattern):
-                if pattern[i] == "\\":
-                    i += 2  # Skip escaped character
-                elif pattern[i] == "*":
-                    return True
-                else:
-                    i += 1
-            return False
-
-        if not has_wildcards(rule_content):
+        if not _has_wildcards(rule_content):
             # No wildcards, but may have escape sequences
-            # Convert escape sequences for matching
-            pattern = rule_content
-            pattern = pattern.replace("\\\\", "\x00BACKSLASH\x00")
-            pattern = pattern.replace("\\*", "*")
-            pattern = pattern.replace("\x00BACKSLASH\x00", "\\")
-            # Use substring matching with converted pattern
-            return pattern in command
-
-        # Convert wildcard pattern to regex with escape handling
-        # Use placeholders for escaped sequences
-        ESCAPED_STAR = "\x00ESCAPED_STAR\x00"
-        ESCAPED_BACKSLASH = "\x00ESCAPED_BACKSLASH\x00"
-
-        pattern = rule_content
-        # Replace \\ with placeholder
-        pattern = pattern.replace("\\\\", ESCAPED_BACKSLASH)
-        # Replace \* with placeholder
-        pattern = pattern.replace("\\*", ESCAPED_STAR)
-
-        # Manually escape regex special characters (except *)
-        # Don't use re.escape() as it escapes spaces too
-        special_chars = r".^$+?{}[]|()"
-        for char in special_chars:
-            pattern = pattern.replace(char, "\\" + char)
-
-        # Convert * to regex .* (match any characters)
-        pattern = pattern.replace("*", ".*")
-
-        # Restore escaped sequences
-        pattern = pattern.replace(ESCAPED_STAR, r"\*")
-        pattern = pattern.replace(ESCAPED_BACKSLASH, r"\\")
+            return _unescape_literal(rule_content) in command
+
+        pattern = _wildcard_to_regex(rule_content)
 
         # Special optimization: "git *" should match both "git" and "git add"
         # Pattern: if ends with .*, make it optional
         if pattern.endswith(".*"):
-            base_pattern = pattern[:-2]  # Remove .*
             # Try exact match first (handles trailing space)
-            base_pattern = base_pattern.rstrip()
+            base_pattern = pattern[:-2].rstrip()
             if re.fullmatch(base_pattern, command):
                 return True
 
@@ -490,6 +494,73 @@ easier to review tool calls and give permission.
             # Invalid regex, fall back to substring matching
             return rule_content.replace("*", "") in command
 
+    def compile_rules(self, rule_contents: list[str]) -> RuleMatcher | None:
+        """Compile Bash rule patterns into one matcher.
+
+        Prefix patterns go into a :class:`CommandPrefixTrie`, literal
+        patterns are kept unescaped for substring checks and the
+        wildcard patterns are combined into a single regex whose
+        alternatives are tried in rule order, matching exactly as
+        :meth:`match_rule` does.
+
+        Args:
+            rule_contents (`list[str]`):
+                The non-empty rule patterns, in rule order.
+
+        Returns:
+            `RuleMatcher | None`:
+                The matcher, or ``None`` if a wildcard pattern cannot be
+                combined (e.g. it compiles to a regex with groups), in
+                which case the rules are matched one by one.
+        """
+        prefixes = CommandPrefixTrie()
+        substrings: list[tuple[int, str]] = []
+        alternatives = []
+        for index, rule_content in enumerate(rule_contents):
+            if rule_content.endswith(":*"):
+                prefixes.add(rule_content[:-2].strip(), index)
+                continue
+            if not _has_wildcards(rule_content):
+                substrings.append((index, _unescape_literal(rule_content)))
+                continue
+            pattern = _wildcard_to_regex(rule_content)
+            regexes = [pattern]
+            if pattern.endswith(".*"):
+                regexes.insert(0, pattern[:-2].rstrip())
+            try:
+                compiled = [re.compile(regex) for regex in regexes]
+            except re.error:
+                if len(regexes) > 1:
+                    # match_rule raises on an invalid base pattern
+                    return None
+                substrings.append((index, rule_content.replace("*", "")))
+                continue
+            if any(regex.groups for regex in compiled):
+                return None
+            either = "|".join(f"(?:{regex})" for regex in regexes)
+            alternatives.append(f"(?:{either})\\Z(?P<r{index}>)")
+        wildcards = (
+            re.compile("|".join(alternatives)) if alternatives else None
+        )
+
+        async def first_match(tool_input: dict[str, Any]) -> int | None:
+            """Return the position of the first matching rule."""
+            command = tool_input.get("command", "")
+            best = prefixes.first_match(command)
+            if wildcards is not None:
+                match = wildcards.match(command)
+                if match is not None:
+                    index = int(match.lastgroup[1:])
+                    best = index if best is None else min(best, index)
+            for index, substring in substrings:
+                if best is not None and index > best:
+                    break
+                if substring in command:
+                    return index
+            return best
+
+        return first_match
+
     async def generate_suggestions(
         self,
         tool_input: dict[str, Any],
@@ -593,14 +664,10 @@ easier to review tool calls and give permission.
             return None
 
         # Find rm or rmdir subcommands (handle compound commands)
-        try:
-            tree = self._bash_parser.parser.parse(bytes(command, "utf8"))
-            subcommands = self._bash_parser.split_compound_command(
-                tree.root_node,
-                command,
-            )
-        except Exception:
-            subcommands = [command]
+        subcommands = [
+            subcmd
+            for subcmd, _ in self._bash_parser.parse(command).subcommands
+        ]
 
         # Check each subcommand for rm/rmdir
         for subcmd in subcommands:
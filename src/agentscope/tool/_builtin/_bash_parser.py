@@ -8,15 +8,22 @@ information for permission rule generation, including:
 - Extracting file paths from commands for dangerous path detection
 - Extracting output redirections
 - Checking if commands are read-only
+
+A permission check asks the parser several of these questions about the
+same command, so :meth:`BashCommandParser.parse` parses each command
+text once into a :class:`ParsedCommand`, kept in a bounded LRU, which
+also memoizes the answers.
 """
 
-from typing import List, Optional, Set, Tuple
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Callable, List, Optional, Set, Tuple
 
 import re
 import shlex
 
 import tree_sitter_bash as tsbash
-from tree_sitter import Language, Parser, Node
+from tree_sitter import Language, Parser, Node, Tree
 
 from .._constants import DANGEROUS_NODE_TYPES, DANGEROUS_COMMANDS
 
@@ -145,12 +152,137 @@ FIND_MUTATING_PREDICATES = {
 }
 
 
+# Parsed commands kept by default per parser
+DEFAULT_PARSE_CACHE_SIZE = 256
+
+
+def _command_nodes(root: Node) -> List[Node]:
+    """Collect the simple command nodes of a (compound) command AST.
+
+    Args:
+        root (`Node`):
+            The root AST node
+
+    Returns:
+        `List[Node]`:
+            The ``command`` nodes, in order
+    """
+    nodes = []
+
+    def extract_commands(node: Node) -> None:
+        """Recursively extract commands from AST."""
+        if node.type == "command":
+            nodes.append(node)
+        elif node.type in ["list", "pipeline", "command_list"]:
+            # Recursively process compound structures
+            for child in node.children:
+                if child.type not in ["&&", "||", ";", "|", "|&"]:
+                    extract_commands(child)
+        else:
+            # Continue traversing
+            for child in node.children:
+                extract_commands(child)
+
+    extract_commands(root)
+    return nodes
+
+
+class ParsedCommand:
+    """A bash command parsed once, with the answers derived from its
+    AST memoized for the other checks of the same command.
+
+    Args:
+        command (`str`):
+            The command text
+        tree (`Tree | None`):
+            Its AST, or ``None`` if parsing failed
+    """
+
+    def __init__(self, command: str, tree: Tree | None) -> None:
+        self.command = command
+        self.tree = tree
+        self._facts: dict[Any, Any] = {}
+
+    @property
+    def root(self) -> Node | None:
+        """The root AST node, or ``None`` if parsing failed."""
+        return self.tree.root_node if self.tree is not None else None
+
+    @cached_property
+    def subcommands(self) -> List[Tuple[str, Optional[Node]]]:
+        """The subcommands of a compound command (``&&``, ``||``, ``;``,
+        ``|``) with their AST nodes; the whole command with no node
+        when it has no simple command."""
+        data = self.command.encode("utf8")
+        nodes = _command_nodes(self.root) if self.root is not None else []
+        if not nodes:
+            return [(self.command, None)]
+        return [
+            (data[node.start_byte : node.end_byte].decode("utf8"), node)
+            for node in nodes
+        ]
+
+    def memo(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return the fact cached under *key*, computing it once."""
+        if key not in self._facts:
+            self._facts[key] = compute()
+        return self._facts[key]
+
+
 class BashCommandParser:
-    """Parse Bash commands using tree-sitter for accurate syntax analysis."""
+    """Parse Bash commands using tree-sitter for accurate syntax analysis.
 
-    def __init__(self) -> None:
+    Args:
+        cache_size (`int`, defaults to 256):
+            The number of parsed commands to keep, least recently used
+            first out
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_PARSE_CACHE_SIZE) -> None:
         """Initialize the parser with tree-sitter-bash language."""
         self.parser = Parser(Language(tsbash.language()))
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, ParsedCommand] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """The size, hits and misses of the parse cache."""
+        return {
+            "size": len(self._cache),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def parse(self, command: str) -> ParsedCommand:
+        """Parse a command, or return its cached parse.
+
+        Args:
+            command (`str`):
+                The bash command string
+
+        Returns:
+            `ParsedCommand`:
+                The parsed command, shared by all checks of the same
+                command text
+        """
+        parsed = self._cache.get(command)
+        if parsed is not None:
+            self._cache.move_to_end(command)
+            self._hits += 1
+            return parsed
+        self._misses += 1
+        try:
+            tree = self.parser.parse(bytes(command, "utf8"))
+        except Exception:
+            tree = None
+        parsed = ParsedCommand(command, tree)
+        if self.cache_size > 0:
+            self._cache[command] = parsed
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return parsed
 
     def is_read_only_command(self, command: str) -> bool:
         """Check if a command is read-only (safe to auto-allow).
@@ -176,32 +308,44 @@ class BashCommandParser:
         if ">" in cmd:
             return False
 
+        parsed = self.parse(command)
+        return parsed.memo(
+            "read_only",
+            lambda: self._is_parsed_read_only(parsed, cmd),
+        )
+
+    def _is_parsed_read_only(self, parsed: ParsedCommand, cmd: str) -> bool:
+        """Uncached body of :meth:`is_read_only_command`."""
         # Check if it's a compound command
         if any(op in cmd for op in ["&&", "||", ";", "|"]):
-            # Split into subcommands and check each one
-            try:
-                tree = self.parser.parse(bytes(cmd, "utf8"))
-                root = tree.root_node
-                subcommands = self.split_compound_command(root, cmd)
-
-                # All subcommands must be read-only
-                for subcmd in subcommands:
-                    if not self._is_single_command_read_only(subcmd.strip()):
-                        return False
-                return True
-            except Exception:
-                # If parsing fails, be conservative
+            # If parsing failed, be conservative
+            if parsed.tree is None:
                 return False
 
+            # All subcommands must be read-only
+            for subcmd, node in parsed.subcommands:
+                if not self._is_single_command_read_only(subcmd.strip(), node):
+                    return False
+            return True
+
         # Single command - check directly
-        return self._is_single_command_read_only(cmd)
+        return self._is_single_command_read_only(
+            cmd,
+            parsed.subcommands[0][1],
+        )
 
-    def _is_single_command_read_only(self, cmd: str) -> bool:
+    def _is_single_command_read_only(
+        self,
+        cmd: str,
+        node: Optional[Node] = None,
+    ) -> bool:
         """Check if a single (non-compound) command is read-only.
 
         Args:
             cmd (`str`):
                 A single command string (no &&, ||, ;, |)
+            node (`Optional[Node]`, optional):
+                Its ``command`` node, to avoid parsing it again
 
         Returns:
             `bool`:
@@ -211,7 +355,7 @@ class BashCommandParser:
         if cmd in READ_ONLY_COMMANDS:
             return True
 
-        if self._is_mutating_find_command(cmd):
+        if self._is_mutating_find_command(cmd, node):
             return False
 
         # Check if it starts with a read-only prefix
@@ -236,15 +380,18 @@ class BashCommandParser:
 
         return False
 
-    def _is_mutating_find_command(self, cmd: str) -> bool:
+    def _is_mutating_find_command(
+        self,
+        cmd: str,
+        node: Optional[Node] = None,
+    ) -> bool:
         """Check if a find command contains mutating predicates via AST."""
-        try:
-            tree = self.parser.parse(bytes(cmd, "utf8"))
-        except Exception:
-            return False
-
-        root = tree.root_node
-        cmd_node = self._find_first_simple_command(root)
+        if node is None:
+            root = self.parse(cmd).root
+            if root is None:
+                return False
+            node = root
+        cmd_node = self._find_first_simple_command(node)
         if cmd_node is None:
             return False
 
@@ -277,19 +424,30 @@ class BashCommandParser:
             `List[Tuple[str, str]]`:
                 List of tuples (command_name, file_path)
         """
-        paths = []
+        parsed = self.parse(command)
+        return list(
+            parsed.memo(
+                "file_paths",
+                lambda: self._extract_parsed_file_paths(parsed),
+            ),
+        )
+
+    def _extract_parsed_file_paths(
+        self,
+        parsed: ParsedCommand,
+    ) -> List[Tuple[str, str]]:
+        """Uncached body of :meth:`extract_file_paths`."""
+        paths: List[Tuple[str, str]] = []
 
         try:
-            # Parse command to AST
-            tree = self.parser.parse(bytes(command, "utf8"))
-            root = tree.root_node
-
             # Extract paths from commands
-            self._extract_paths_from_node(root, command, paths)
+            if parsed.root is None:
+                raise ValueError("unparsable command")
+            self._extract_paths_from_node(parsed.root, parsed.command, paths)
 
         except Exception:
             # Fallback to simple token-based extraction
-            paths = self._extract_paths_fallback(command)
+            paths = self._extract_paths_fallback(parsed.command)
 
         return paths
 
@@ -422,15 +580,28 @@ class BashCommandParser:
             `List[str]`:
                 List of file paths that are redirection targets
         """
-        redirections = []
+        parsed = self.parse(command)
+        return list(
+            parsed.memo(
+                "redirections",
+                lambda: self._extract_parsed_redirections(parsed),
+            ),
+        )
+
+    def _extract_parsed_redirections(self, parsed: ParsedCommand) -> List[str]:
+        """Uncached body of :meth:`extract_redirections`."""
+        command = parsed.command
+        redirections: List[str] = []
 
         try:
-            # Parse command to AST
-            tree = self.parser.parse(bytes(command, "utf8"))
-            root = tree.root_node
-
             # Extract redirections
-            self._extract_redirections_from_node(root, command, redirections)
+            if parsed.root is None:
+                raise ValueError("unparsable command")
+            self._extract_redirections_from_node(
+                parsed.root,
+                command,
+                redirections,
+            )
 
         except Exception:
             # Fallback to simple extraction
@@ -501,19 +672,26 @@ class BashCommandParser:
         if not command or not command.strip():
             return []
 
-        # Parse command to AST
-        tree = self.parser.parse(bytes(command, "utf8"))
-        root = tree.root_node
-
-        # Split compound commands
-        subcommands = self.split_compound_command(root, command)
+        parsed = self.parse(command)
+        return list(
+            parsed.memo(
+                ("prefixes", max_prefixes),
+                lambda: self._extract_parsed_prefixes(parsed, max_prefixes),
+            ),
+        )
 
+    def _extract_parsed_prefixes(
+        self,
+        parsed: ParsedCommand,
+        max_prefixes: int,
+    ) -> List[str]:
+        """Uncached body of :meth:`extract_command_prefixes`."""
         # Extract prefixes from each subcommand
-        prefixes = []
+        prefixes: List[str] = []
         seen = set()
 
-        for subcmd in subcommands[:max_prefixes]:
-            prefix = self._extract_command_prefix(subcmd)
+        for subcmd, node in parsed.subcommands[:max_prefixes]:
+            prefix = self._extract_command_prefix(subcmd, node)
             if prefix and prefix not in seen:
                 prefixes.append(prefix)
                 seen.add(prefix)
@@ -538,30 +716,16 @@ class BashCommandParser:
             `List[str]`:
                 List of individual subcommands
         """
-        subcommands = []
-
-        def extract_commands(node: Node) -> None:
-            """Recursively extract commands from AST."""
-            if node.type == "command":
-                # Extract command text
-                cmd_text = command[node.start_byte : node.end_byte]
-                subcommands.append(cmd_text)
-            elif node.type in ["list", "pipeline", "command_list"]:
-                # Recursively process compound structures
-                for child in node.children:
-                    if child.type not in ["&&", "||", ";", "|", "|&"]:
-                        extract_commands(child)
-            else:
-                # Continue traversing
-                for child in node.children:
-                    extract_commands(child)
-
-        extract_commands(root)
+        subcommands = [
+            command[node.start_byte : node.end_byte]
+            for node in _command_nodes(root)
+        ]
         return subcommands if subcommands else [command]
 
     def _extract_command_prefix(
         self,
         subcmd: str,
+        node: Optional[Node] = None,
     ) -> Optional[str]:
         """Extract command prefix (first two words) from a subcommand.
 
@@ -573,17 +737,20 @@ class BashCommandParser:
         Args:
             subcmd (`str`):
                 The subcommand string to extract prefix from
+            node (`Optional[Node]`, optional):
+                Its ``command`` node, to avoid parsing it again
 
         Returns:
             `Optional[str]`:
                 Command prefix (e.g., "npm run") or None if cannot extract
         """
-        # Parse the subcommand
-        tree = self.parser.parse(bytes(subcmd, "utf8"))
-        root = tree.root_node
+        if node is None:
+            node = self.parse(subcmd).root
+            if node is None:
+                return None
 
         # Find the first simple_command node
-        simple_cmd = self._find_first_simple_command(root)
+        simple_cmd = self._find_first_simple_command(node)
         if not simple_cmd:
             return None
 
@@ -594,16 +761,14 @@ class BashCommandParser:
         for child in simple_cmd.children:
             if child.type == "variable_assignment":
                 # Environment variable assignment
-                var_name = subcmd[child.start_byte : child.end_byte].split(
-                    "=",
-                )[0]
+                var_name = child.text.decode("utf8").split("=")[0]
                 env_vars.append(var_name)
             elif child.type == "command_name":
                 # Command name
-                parts.append(subcmd[child.start_byte : child.end_byte])
+                parts.append(child.text.decode("utf8"))
             elif child.type == "word" and len(parts) >= 1:
                 # Argument (might be a flag or subcommand)
-                word = subcmd[child.start_byte : child.end_byte]
+                word = child.text.decode("utf8")
                 parts.append(word)
                 # Stop after we have command + first argument
                 if len(parts) >= 2:
@@ -658,7 +823,14 @@ class BashCommandParser:
             `Optional[str]`:
                 The matched dangerous pattern if found, None otherwise
         """
-
+        return self.parse(command).memo(
+            "dangerous",
+            lambda: self._match_dangerous_command(command),
+        )
+
+    @staticmethod
+    def _match_dangerous_command(command: str) -> Optional[str]:
+        """Uncached body of :meth:`check_dangerous_command`."""
         # Normalize command for matching
         normalized = " ".join(command.split())
 
@@ -702,6 +874,18 @@ class BashCommandParser:
         if "sed" not in command:
             return None
 
+        return self.parse(command).memo(
+            ("sed", tuple(dangerous_files)),
+            lambda: self._check_sed(command, dangerous_files),
+        )
+
+    def _check_sed(
+        self,
+        command: str,
+        dangerous_files: List[str],
+    ) -> str | None:
+        """Uncached body of :meth:`check_sed_constraints`."""
+
         # Parse command using shlex
         try:
             tokens = shlex.split(command)
@@ -888,11 +1072,21 @@ class BashCommandParser:
             analyzed"
         """
 
+        parsed = self.parse(command)
+        if parsed.root is None:
+            # If parsing fails, be conservative and require review
+            return "Command parsing failed, cannot verify safety"
+        return parsed.memo(
+            "injection_risk",
+            lambda: self._check_parsed_injection_risk(parsed.root),
+        )
+
+    def _check_parsed_injection_risk(self, root: Node) -> Optional[str]:
+        """Uncached body of :meth:`check_injection_risk`."""
         try:
-            tree = self.parser.parse(bytes(command, "utf8"))
-            return self._walk_for_dangerous_nodes(tree.root_node)
+            return self._walk_for_dangerous_nodes(root)
         except Exception:
-            # If parsing fails, be conservative and require review
+            # E.g. a recursion error on a deeply nested command
             return "Command parsing failed, cannot verify safety"
 
     def _walk_for_dangerous_nodes(self, node: Node) -> Optional[str]:
@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+"""A resident file index answering the :class:`Glob` tool on the host.
+
+The index walks a directory tree once, remembering every file's mtime,
+and keeps itself fresh from the Linux inotify events of the watched
+directories instead of walking again.  The events are drained lazily at
+the start of each query, so no thread is needed: between queries the
+kernel queues them, and a queue overflow just schedules a rebuild.
+
+Queries scan the files newest first and stop as soon as the requested
+number of matches is found.  Where inotify is unavailable (other
+platforms, or the watch limit is exhausted) :func:`query_file_index`
+returns ``None`` and the caller falls back to walking the tree.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+import threading
+from collections import OrderedDict
+
+from ..._logging import logger
+from ._scripts._glob_helper import (
+    IGNORE_FILES,
+    DirLister,
+    is_ignored,
+    load_ignore_rules,
+    pattern_to_regex,
+    split_pattern,
+)
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_DONT_FOLLOW = 0x02000000
+_IN_EXCL_UNLINK = 0x04000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+    | _IN_DONT_FOLLOW
+    | _IN_EXCL_UNLINK
+)
+
+_EVENT = struct.Struct("iIII")
+
+# Indexes kept alive at once, each holding one inotify instance
+_MAX_INDEXES = 8
+
+
+class _Inotify:
+    """A minimal non-blocking inotify instance over ``ctypes``."""
+
+    _libc: ctypes.CDLL | None = None
+
+    def __init__(self) -> None:
+        if _Inotify._libc is None:
+            _Inotify._libc = ctypes.CDLL(
+                ctypes.util.find_library("c") or "libc.so.6",
+                use_errno=True,
+            )
+        self._fd = _Inotify._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path: str) -> int:
+        """Watch a directory and return the watch descriptor."""
+        wd = self._libc.inotify_add_watch(  # type: ignore[union-attr]
+            self._fd,
+            os.fsencode(path),
+            _WATCH_MASK,
+        )
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"cannot watch {path}")
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        """Stop watching, ignoring already removed watches."""
+        self._libc.inotify_rm_watch(  # type: ignore[union-attr]
+            self._fd,
+            wd,
+        )
+
+    def read(self) -> list[tuple[int, int, str]]:
+        """Return the pending ``(wd, mask, name)`` events."""
+        events = []
+        while True:
+            try:
+                buf = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, length = _EVENT.unpack_from(buf, offset)
+                offset += _EVENT.size
+                name = os.fsdecode(buf[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                events.append((wd, mask, name))
+
+    def close(self) -> None:
+        """Release the instance and all its watches."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class FileIndex:
+    """The files under one root with their mtimes, ordered newest first
+    and kept fresh with inotify.
+
+    Args:
+        root (`str`):
+            The absolute directory to index.
+        respect_ignore (`bool`, defaults to `True`):
+            Whether to leave out the paths excluded by ``.gitignore`` /
+            ``.ignore`` files, and ``.git``.
+    """
+
+    def __init__(self, root: str, respect_ignore: bool = True) -> None:
+        self.root = root
+        self.respect_ignore = respect_ignore
+        self._lock = threading.Lock()
+        self._inotify: _Inotify | None = None
+        self._files: dict[str, float] = {}
+        self._ordered: list[str] = []
+        self._added: list[str] = []
+        self._dirty = False
+        # Watched directories by relative path, with their ignore rules
+        self._dirs: dict[str, list | None] = {}
+        self._wds: dict[int, str] = {}
+        self._stale = True
+        # Set when watching fails, so the tree isn't walked in vain again
+        self._failed = False
+
+    def covers(self, rel: str) -> bool:
+        """Whether the directory *rel* is indexed, i.e. the index is
+        built and the directory isn't ignored."""
+        with self._lock:
+            return not self._stale and rel in self._dirs
+
+    def query(
+        self,
+        pattern: str,
+        limit: int | None = None,
+        prefix: str = "",
+    ) -> list[str]:
+        """Return the files matching *pattern*, newest first.
+
+        Args:
+            pattern (`str`):
+                A glob pattern relative to the root, or to *prefix*.
+            limit (`int | None`, optional):
+                Stop after this many matches.
+            prefix (`str`, defaults to `""`):
+                A directory relative to the root that the matches must
+                be below, compared literally so that glob characters in
+                its name aren't wildcards.
+
+        Returns:
+            `list[str]`:
+                The ``/``-joined paths of the matches, relative to the
+                root.
+
+        Raises:
+            `OSError`:
+                If the index cannot be kept fresh, e.g. when the
+                inotify watch limit is exhausted.
+        """
+        if self._failed:
+            raise OSError(f"no file index for {self.root}")
+        parts = split_pattern(pattern)
+        if not parts:
+            return []
+        regex = pattern_to_regex(parts)
+        prefix = f"{prefix}/" if prefix else ""
+        with self._lock:
+            self._refresh()
+            matches = []
+            for rel in self._ordered:
+                if rel.startswith(prefix) and regex.match(rel[len(prefix) :]):
+                    matches.append(rel)
+                    if limit is not None and len(matches) >= limit:
+                        break
+            return matches
+
+    def close(self) -> None:
+        """Release the inotify instance."""
+        with self._lock:
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+            self._stale = True
+
+    def _refresh(self) -> None:
+        """Apply the pending events, rebuilding when they can't be."""
+        if not self._stale:
+            for wd, mask, name in self._inotify.read():  # type: ignore
+                if not self._apply(wd, mask, name):
+                    self._stale = True
+                    break
+        if self._stale:
+            self._rebuild()
+        if self._dirty:
+            # Mostly ordered already, which timsort exploits
+            self._ordered = [
+                r
+                for r in dict.fromkeys(self._ordered + self._added)
+                if r in self._files
+            ]
+            self._ordered.sort(key=self._files.__getitem__, reverse=True)
+            self._added = []
+            self._dirty = False
+
+    def _rebuild(self) -> None:
+        """Walk the whole tree again under a fresh inotify instance."""
+        if self._inotify is not None:
+            self._inotify.close()
+        self._inotify = _Inotify()
+        self._files = {}
+        self._ordered = []
+        self._added = []
+        self._dirs = {}
+        self._wds = {}
+        self._stale = False
+        try:
+            self._scan("", [] if self.respect_ignore else None)
+        except OSError:
+            self._inotify.close()
+            self._inotify = None
+            self._failed = True
+            raise
+        self._dirty = True
+
+    def _scan(self, rel: str, parent_rules: list | None) -> None:
+        """Watch and index a directory and its subtree.
+
+        The watch is added before listing, so an entry created while
+        scanning is either listed or reported.
+        """
+        path = os.path.join(self.root, rel) if rel else self.root
+        try:
+            wd = self._inotify.add_watch(path)  # type: ignore[union-attr]
+        except OSError as e:
+            if e.errno in (2, 20):  # ENOENT, ENOTDIR: gone meanwhile
+                return
+            raise
+        self._wds[wd] = rel
+        files, dirs = DirLister().list(path)
+        rules = parent_rules
+        if rules is not None:
+            rules = rules + load_ignore_rules(path, rel, files)
+        self._dirs[rel] = rules
+        for name in files:
+            self._update_file(rel, name)
+        for name in dirs:
+            child = f"{rel}/{name}" if rel else name
+            if rules is None or not is_ignored(child, True, rules):
+                self._scan(child, rules)
+
+    def _update_file(self, parent: str, name: str) -> None:
+        """Record the current mtime of a file, or forget it."""
+        rel = f"{parent}/{name}" if parent else name
+        rules = self._dirs[parent]
+        if rules is not None and is_ignored(rel, False, rules):
+            return
+        try:
+            st = os.stat(os.path.join(self.root, rel))
+        except OSError:
+            self._forget(rel)
+            return
+        if rel not in self._files:
+            self._added.append(rel)
+        self._files[rel] = st.st_mtime
+        self._dirty = True
+
+    def _forget(self, rel: str, is_dir: bool = False) -> None:
+        """Drop a file, or a directory with everything below it."""
+        if not is_dir:
+            if self._files.pop(rel, None) is not None:
+                self._dirty = True
+            return
+        prefix = rel + "/"
+        for key in [k for k in self._files if k.startswith(prefix)]:
+            del self._files[key]
+            self._dirty = True
+        for wd, path in list(self._wds.items()):
+            if path == rel or path.startswith(prefix):
+                self._inotify.rm_watch(wd)  # type: ignore[union-attr]
+                del self._wds[wd]
+                self._dirs.pop(path, None)
+
+    def _apply(self, wd: int, mask: int, name: str) -> bool:
+        """Apply one event; ``False`` asks for a rebuild."""
+        if mask & _IN_Q_OVERFLOW:
+            return False
+        parent = self._wds.get(wd)
+        if mask & _IN_IGNORED:
+            if parent is not None:
+                del self._wds[wd]
+            return True
+        if parent is None:
+            return True
+        if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+            return parent != ""
+        if name in IGNORE_FILES and self.respect_ignore:
+            return False
+
+        rel = f"{parent}/{name}" if parent else name
+        if mask & _IN_ISDIR:
+            if mask & (_IN_DELETE | _IN_MOVED_FROM):
+                self._forget(rel, is_dir=True)
+            elif mask & (_IN_CREATE | _IN_MOVED_TO) and rel not in self._dirs:
+                rules = self._dirs[parent]
+                if rules is None or not is_ignored(rel, True, rules):
+                    self._scan(rel, rules)
+            return True
+        if mask & (_IN_DELETE | _IN_MOVED_FROM):
+            self._forget(rel)
+        else:
+            self._update_file(parent, name)
+        return True
+
+
+_indexes: OrderedDict[tuple[str, bool], FileIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def _find_index(base_dir: str, respect_ignore: bool) -> tuple:
+    """Find an index covering *base_dir*, creating one for it if none.
+
+    Returns:
+        `tuple[FileIndex, str]`:
+            The index, and *base_dir* relative to its root.
+    """
+    with _indexes_lock:
+        for (root, respect), index in _indexes.items():
+            if respect != respect_ignore:
+                continue
+            if base_dir == root:
+                _indexes.move_to_end((root, respect))
+                return index, ""
+            if base_dir.startswith(root.rstrip(os.sep) + os.sep):
+                rel = os.path.relpath(base_dir, root).replace(os.sep, "/")
+                # Only if the subtree is indexed rather than ignored
+                if index.covers(rel):
+                    _indexes.move_to_end((root, respect))
+                    return index, rel
+        index = FileIndex(base_dir, respect_ignore)
+        _indexes[(base_dir, respect_ignore)] = index
+        while len(_indexes) > _MAX_INDEXES:
+            _indexes.popitem(last=False)[1].close()
+        return index, ""
+
+
+def query_file_index(
+    base_dir: str,
+    pattern: str,
+    limit: int | None = None,
+    respect_ignore: bool = True,
+) -> list[str] | None:
+    """Glob *pattern* under *base_dir* through the shared file indexes.
+
+    Blocking: the first query of a tree walks it.  An index rooted at
+    an ancestor of *base_dir* answers too, so nested searches reuse the
+    workspace index.
+
+    Args:
+        base_dir (`str`):
+            The absolute directory to search from.
+        pattern (`str`):
+            The glob pattern, relative to *base_dir*.
+        limit (`int | None`, optional):
+            Only return the newest *limit* matches.
+        respect_ignore (`bool`, defaults to `True`):
+            Whether to honour ``.gitignore`` / ``.ignore`` files.
+
+    Returns:
+        `list[str] | None`:
+            The matching paths newest first, or ``None`` when no index
+            can serve the query on this platform.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    index, rel = _find_index(os.path.realpath(base_dir), respect_ignore)
+    try:
+        matches = index.query(pattern, limit, prefix=rel)
+    except OSError as e:
+        logger.debug("File index for %s unavailable: %s", index.root, e)
+        return None
+    skip = len(rel) + 1 if rel else 0
+    # Relative to the caller's spelling of base_dir, like the helper
+    return [os.path.join(base_dir, m[skip:]) for m in matches]
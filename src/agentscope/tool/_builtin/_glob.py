@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import fnmatch
 import json
 import sys
@@ -14,6 +15,8 @@ from ...permission import (
     PermissionContext,
     PermissionDecision,
     PermissionRule,
+    GlobRuleIndex,
+    RuleMatcher,
 )
 from .._base import ToolBase, ToolMiddlewareBase
 from .._response import ToolChunk
@@ -50,6 +53,7 @@ any codebase size.
 
 Supports glob patterns like "**/*.js" or "src/**/*.ts" and returns
 matching file paths sorted by modification time (newest first).
+Files excluded by .gitignore / .ignore files are left out.
 
 Use this tool when you need to find files by pattern across the
 codebase."""  # ignore: E501
@@ -68,6 +72,11 @@ codebase."""  # ignore: E501
                 "description": "The base directory to search from "
                 "(defaults to current working directory)",
             },
+            "head_limit": {
+                "type": "integer",
+                "description": "Only return the N most recently "
+                "modified matches (defaults to all matches)",
+            },
         },
         "required": ["pattern"],
     }
@@ -83,6 +92,9 @@ codebase."""  # ignore: E501
         backend: BackendBase | None = None,
         glob_helper_path: str | None = None,
         middlewares: List[ToolMiddlewareBase] | None = None,
+        glob_index_path: str | None = None,
+        respect_ignore_files: bool = True,
+        use_file_index: bool = True,
     ) -> None:
         """Initialize the glob tool.
 
@@ -99,6 +111,17 @@ codebase."""  # ignore: E501
                 (suitable for :class:`LocalBackend`). Remote backends
                 (Docker, E2B) should pass the path where the script
                 was deployed during workspace initialization.
+            glob_index_path (`str | None`, optional):
+                File (inside the backend's environment) in which the
+                helper persists directory listings between calls, so
+                it only re-lists the directories changed since.
+            respect_ignore_files (`bool`, defaults to `True`):
+                Whether to leave out the files excluded by
+                ``.gitignore`` / ``.ignore`` files, and ``.git``.
+            use_file_index (`bool`, defaults to `True`):
+                Whether to answer from the resident inotify-backed
+                file index on a :class:`LocalBackend` on Linux, instead
+                of walking the tree on every call.
         """
         from ._backend import LocalBackend
 
@@ -108,6 +131,9 @@ codebase."""  # ignore: E501
         # current interpreter (``sys.executable``) rather than assuming
         # ``python3`` is on PATH.
         self._is_local = isinstance(self._backend, LocalBackend)
+        self._glob_index_path = glob_index_path
+        self._respect_ignore_files = respect_ignore_files
+        self._use_file_index = use_file_index and self._is_local
         self._glob_helper_path = (
             glob_helper_path
             if glob_helper_path is not None
@@ -168,6 +194,33 @@ codebase."""  # ignore: E501
 
         return False
 
+    def compile_rules(self, rule_contents: list[str]) -> RuleMatcher:
+        """Compile the rule glob patterns into a :class:`GlobRuleIndex`
+        matched against both the "path" and "pattern" parameters.
+
+        Args:
+            rule_contents (`list[str]`):
+                The glob patterns, in rule order
+
+        Returns:
+            `RuleMatcher`:
+                The matcher returning the position of the first pattern
+                matching the search path or the pattern
+        """
+        index = GlobRuleIndex(rule_contents)
+
+        async def first_match(tool_input: dict[str, Any]) -> int | None:
+            """Return the position of the first matching rule."""
+            best = None
+            for key in ("path", "pattern"):
+                value = tool_input.get(key, "")
+                position = index.first_match(value) if value else None
+                if position is not None and (best is None or position < best):
+                    best = position
+            return best
+
+        return first_match
+
     async def generate_suggestions(
         self,
         tool_input: dict[str, Any],
@@ -207,23 +260,26 @@ codebase."""  # ignore: E501
         self,
         pattern: str,
         path: str | None = None,
+        head_limit: int | None = None,
     ) -> ToolChunk:
         """Execute the glob pattern matching and return the results.
 
-        Invokes the standalone ``_glob_helper.py`` script via
-        ``exec_shell``. The script performs high-performance
-        ``os.walk`` + ``os.scandir`` matching and returns results
+        On a :class:`LocalBackend` the query is answered by the
+        resident file index (see :func:`query_file_index`), which scans
+        the indexed files newest first and stops after ``head_limit``
+        matches. Otherwise, or where the index is unavailable, invokes
+        the standalone ``_glob_helper.py`` script via ``exec_shell``.
+        The script performs ``os.scandir`` matching and returns results
         sorted by modification time (newest first) as JSON.
 
-        This unified path works identically across Local, Docker,
-        and E2B backends.
-
         Args:
             pattern (`str`):
                 The glob pattern to match against (e.g. ``**/*.py``).
             path (`str | None`, optional):
                 Base directory to search from. Defaults to the current
                 working directory when ``None``.
+            head_limit (`int | None`, optional):
+                Only return the newest ``head_limit`` matches.
 
         Returns:
             `ToolChunk`:
@@ -246,6 +302,55 @@ codebase."""  # ignore: E501
                 is_last=True,
             )
 
+        if head_limit is not None and head_limit <= 0:
+            head_limit = None
+
+        matches = None
+        if self._use_file_index:
+            from ._file_index import query_file_index
+
+            matches = await asyncio.to_thread(
+                query_file_index,
+                base_dir,
+                pattern,
+                head_limit,
+                self._respect_ignore_files,
+            )
+        if matches is None:
+            result = await self._run_helper(pattern, base_dir, head_limit)
+            if isinstance(result, ToolChunk):
+                return result
+            matches = result
+
+        if len(matches) == 0:
+            return ToolChunk(
+                content=[
+                    TextBlock(
+                        text=f"No files found matching pattern: {pattern}",
+                    ),
+                ],
+                state=ToolResultState.RUNNING,
+                is_last=True,
+            )
+
+        return ToolChunk(
+            content=[TextBlock(text="\n".join(matches))],
+            state=ToolResultState.RUNNING,
+            is_last=True,
+        )
+
+    async def _run_helper(
+        self,
+        pattern: str,
+        base_dir: str,
+        head_limit: int | None,
+    ) -> list[str] | ToolChunk:
+        """Run the glob helper script in the backend.
+
+        Returns:
+            `list[str] | ToolChunk`:
+                The matches, or an error chunk if the helper failed.
+        """
         # Invoke the glob helper script via exec_shell as an argv list
         # (run directly, without a shell, so no platform-specific
         # quoting is needed). Use the current interpreter locally
@@ -261,6 +366,12 @@ codebase."""  # ignore: E501
             "--base-dir",
             base_dir,
         ]
+        if head_limit is not None:
+            command += ["--limit", str(head_limit)]
+        if not self._respect_ignore_files:
+            command.append("--no-ignore")
+        if self._glob_index_path is not None:
+            command += ["--index-file", self._glob_index_path]
         result = await self._backend.exec_shell(command, timeout=30.0)
 
         # A non-zero exit means the helper itself failed (missing
@@ -281,25 +392,8 @@ codebase."""  # ignore: E501
             )
 
         try:
-            matches = json.loads(
+            return json.loads(
                 result.stdout.decode("utf-8", errors="replace"),
             )
         except (json.JSONDecodeError, ValueError):
-            matches = []
-
-        if len(matches) == 0:
-            return ToolChunk(
-                content=[
-                    TextBlock(
-                        text=f"No files found matching pattern: {pattern}",
-                    ),
-                ],
-                state=ToolResultState.RUNNING,
-                is_last=True,
-            )
-
-        return ToolChunk(
-            content=[TextBlock(text="\n".join(matches))],
-            state=ToolResultState.RUNNING,
-            is_last=True,
-        )
+            return []
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The grep tool in agentscope."""
+import base64
 import fnmatch
+import json
 from typing import Any, List, Literal
 
 from .._base import ToolBase, ToolMiddlewareBase
@@ -9,6 +11,8 @@ from ...permission import (
     PermissionDecision,
     PermissionBehavior,
     PermissionRule,
+    GlobRuleIndex,
+    RuleMatcher,
 )
 from .._response import ToolChunk
 from ...message import TextBlock, ToolResultState
@@ -27,6 +31,12 @@ VCS_DIRECTORIES_TO_EXCLUDE = [
 # Default cap on grep results when head_limit is unspecified
 DEFAULT_HEAD_LIMIT = 250
 
+# Default cap on the ripgrep output read before the search is stopped
+DEFAULT_MAX_OUTPUT_BYTES = 16 * 1024 * 1024
+
+# Lines longer than this are omitted, as ``rg --max-columns`` does
+MAX_COLUMNS = 500
+
 
 class RipgrepTimeoutError(Exception):
     """Custom error class for ripgrep timeouts."""
@@ -36,6 +46,154 @@ class RipgrepTimeoutError(Exception):
         self.partial_results = partial_results
 
 
+def _rg_text(value: dict) -> str:
+    """Decode a ripgrep JSON ``{"text": ...}`` / ``{"bytes": ...}``
+    value."""
+    if "text" in value:
+        return value["text"]
+    return base64.b64decode(value.get("bytes", "")).decode(
+        "utf-8",
+        errors="ignore",
+    )
+
+
+class _RipgrepStream:
+    """Collects the streamed output of ripgrep into result lines, and
+    asks to stop once enough lines or bytes were read.
+
+    In ``content`` and ``count`` modes ripgrep runs with ``--json``;
+    each output line is then rendered the way the text printer would
+    (``path:line:text`` for matches, ``path-line-text`` for context,
+    ``--`` between context groups, ``path:count`` for counts) and
+    kept alongside its structured form. In ``files_with_matches`` mode
+    each output line is a path.
+
+    Args:
+        output_mode (`str`):
+            The grep output mode.
+        search_path (`str`):
+            The searched path; like ripgrep, matches within a searched
+            file are rendered without the file name.
+        line_numbers (`bool`):
+            Whether to render the line numbers of content lines.
+        with_context (`bool`):
+            Whether context lines were requested, so groups are
+            separated.
+        max_lines (`int | None`):
+            Stop after this many result lines.
+        max_bytes (`int`):
+            Stop after reading this many bytes.
+    """
+
+    def __init__(
+        self,
+        output_mode: str,
+        search_path: str,
+        line_numbers: bool,
+        with_context: bool,
+        max_lines: int | None,
+        max_bytes: int,
+    ) -> None:
+        self.output_mode = output_mode
+        self.search_path = search_path
+        self.line_numbers = line_numbers
+        self.with_context = with_context
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.lines: list[str] = []
+        self.entries: list[dict | None] = []
+        self.bytes_read = 0
+        self.stopped = False
+        self.byte_budget_exceeded = False
+        self._buffer = b""
+        self._last: tuple[str, int] | None = None
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume a chunk of stdout; returns whether to keep reading."""
+        if self.stopped:
+            return False
+        self.bytes_read += len(chunk)
+        *complete, self._buffer = (self._buffer + chunk).split(b"\n")
+        for raw in complete:
+            self._handle(raw)
+            if self.max_lines is not None and len(self.lines) >= (
+                self.max_lines
+            ):
+                self.stopped = True
+                return False
+        if self.bytes_read >= self.max_bytes:
+            self.stopped = True
+            self.byte_budget_exceeded = True
+            return False
+        return True
+
+    def close(self) -> None:
+        """Consume the final unterminated line, if any."""
+        if self._buffer and not self.stopped:
+            self._handle(self._buffer)
+        self._buffer = b""
+
+    def _add(self, line: str, entry: dict | None) -> None:
+        """Append a result line and its structured form."""
+        self.lines.append(line)
+        self.entries.append(entry)
+
+    def _handle(self, raw: bytes) -> None:
+        """Consume one complete line of ripgrep output."""
+        text = raw.decode("utf-8", errors="ignore").rstrip("\r")
+        if not text:
+            return
+        if self.output_mode == "files_with_matches":
+            self._add(text, {"path": text})
+            return
+        try:
+            message = json.loads(text)
+        except ValueError:
+            return
+        kind = message.get("type")
+        data = message.get("data", {})
+        if kind == "end" and self.output_mode == "count":
+            path = _rg_text(data["path"])
+            count = data.get("stats", {}).get("matched_lines", 0)
+            if count:
+                prefix = "" if path == self.search_path else f"{path}:"
+                self._add(f"{prefix}{count}", {"path": path, "count": count})
+        elif kind in ("match", "context") and self.output_mode == "content":
+            self._handle_lines(kind, data)
+
+    def _handle_lines(self, kind: str, data: dict) -> None:
+        """Render the line(s) of a match or context message."""
+        path = _rg_text(data["path"])
+        number = data.get("line_number") or 0
+        if (
+            self.with_context
+            and self._last is not None
+            and self._last != (path, number - 1)
+        ):
+            self._add("--", None)
+        sep = ":" if kind == "match" else "-"
+        prefix = "" if path == self.search_path else f"{path}{sep}"
+        n_matches = len(data.get("submatches", []))
+        for offset, line in enumerate(
+            _rg_text(data["lines"]).rstrip("\n").split("\n"),
+        ):
+            line = line.rstrip("\r")
+            shown = line
+            if len(line) > MAX_COLUMNS:
+                shown = f"[Omitted long line with {n_matches} matches]"
+            numbered = f"{number + offset}{sep}" if self.line_numbers else ""
+            self._add(
+                f"{prefix}{numbered}{shown}",
+                {
+                    "type": kind,
+                    "path": path,
+                    "line_number": number + offset,
+                    "text": line,
+                },
+            )
+            self._last = (path, number + offset)
+
+
 class Grep(ToolBase):
     """The grep tool for searching file contents using ripgrep."""
 
@@ -160,6 +318,7 @@ class Grep(ToolBase):
         self,
         middlewares: List[ToolMiddlewareBase] | None = None,
         backend: BackendBase | None = None,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
     ) -> None:
         """Initialize the grep tool.
 
@@ -169,14 +328,18 @@ class Grep(ToolBase):
             backend (`BackendBase | None`, optional):
                 The sandbox backend to use for shell execution. When
                 ``None``, a :class:`LocalBackend` is created.
-                Ripgrep is always invoked via ``exec_shell`` so that
+                Ripgrep is always invoked via ``exec_stream`` so that
                 the same code path works for local, Docker, and E2B
                 backends.
+            max_output_bytes (`int`, defaults to 16 MiB):
+                The ripgrep output read at most; a search producing
+                more is stopped and its results marked as partial.
         """
         from ._backend import LocalBackend
 
         super().__init__(middlewares=middlewares)
         self._backend = backend or LocalBackend()
+        self._max_output_bytes = max_output_bytes
 
     async def check_permissions(
         self,
@@ -222,6 +385,31 @@ class Grep(ToolBase):
             path = await self._backend.getcwd()
         return fnmatch.fnmatch(path, rule_content)
 
+    def compile_rules(self, rule_contents: list[str]) -> RuleMatcher:
+        """Compile the rule glob patterns into a :class:`GlobRuleIndex`
+        over the search path.
+
+        Args:
+            rule_contents (`list[str]`):
+                The glob patterns, in rule order
+
+        Returns:
+            `RuleMatcher`:
+                The matcher returning the position of the first pattern
+                matching the search path, or the current working
+                directory when no path is given
+        """
+        index = GlobRuleIndex(rule_contents)
+
+        async def first_match(tool_input: dict[str, Any]) -> int | None:
+            """Return the position of the first matching rule."""
+            path = tool_input.get("path", "")
+            if not path:
+                path = await self._backend.getcwd()
+            return index.first_match(path)
+
+        return first_match
+
     async def generate_suggestions(
         self,
         tool_input: dict[str, Any],
@@ -258,10 +446,10 @@ class Grep(ToolBase):
 
     def _apply_head_limit(
         self,
-        items: list[str],
+        items: list,
         limit: int | None,
         offset: int = 0,
-    ) -> tuple[list[str], int | None]:
+    ) -> tuple[list, int | None]:
         """Apply head_limit and offset to a list of items.
 
         Returns (sliced_items, applied_limit_if_truncated).
@@ -277,31 +465,37 @@ class Grep(ToolBase):
         self,
         args: list[str],
         search_path: str,
+        stream: _RipgrepStream,
         timeout: int = 30,
-    ) -> list[str]:
-        """Run ripgrep and return output lines.
+    ) -> None:
+        """Run ripgrep, collecting its output into *stream*.
 
         Builds an argument vector and dispatches it through
-        ``backend.exec_shell`` (which runs the program directly, without
-        a shell), so the same code path works for local, Docker, and E2B
-        backends and needs no platform-specific argument quoting.
+        ``backend.exec_stream`` (which runs the program directly,
+        without a shell), so the same code path works for local,
+        Docker, and E2B backends and needs no platform-specific
+        argument quoting. Where the backend streams, ripgrep is stopped
+        as soon as *stream* has enough lines or bytes.
         """
         command = ["rg", *args, search_path]
 
-        result = await self._backend.exec_shell(
+        result = await self._backend.exec_stream(
             command,
+            stream.feed,
             timeout=float(timeout),
         )
+        stream.close()
 
         if result.exit_code == -1 and result.stderr == b"timed out":
             raise RipgrepTimeoutError(
                 f"Ripgrep search timed out after {timeout} seconds. "
                 "Try searching a more specific path or pattern.",
-                [],
+                stream.lines,
             )
 
-        # returncode 0 = matches found, 1 = no matches
-        if result.exit_code not in (0, 1):
+        # returncode 0 = matches found, 1 = no matches; a stopped search
+        # exits with whatever the kill left
+        if result.exit_code not in (0, 1) and not stream.stopped:
             error_msg = result.stderr.decode(
                 "utf-8",
                 errors="ignore",
@@ -310,13 +504,6 @@ class Grep(ToolBase):
                 f"ripgrep error (code {result.exit_code}): {error_msg}",
             )
 
-        raw = result.stdout.decode("utf-8", errors="ignore")
-
-        lines = [
-            line.rstrip("\r") for line in raw.split("\n") if line.rstrip("\r")
-        ]
-        return lines
-
     async def call(  # type: ignore[override]
         self,
         pattern: str,
@@ -393,15 +580,12 @@ class Grep(ToolBase):
         if i or case_insensitive:
             args.append("-i")
 
-        # Output mode flags
+        # Output mode flags. Content and count are read as JSON, since
+        # ripgrep rejects --json together with -l / -c
         if output_mode == "files_with_matches":
             args.append("-l")
-        elif output_mode == "count":
-            args.append("-c")
-
-        # Line numbers (content mode only)
-        if n and output_mode == "content":
-            args.append("-n")
+        else:
+            args.append("--json")
 
         # Context flags (content mode only)
         if output_mode == "content":
@@ -441,14 +625,41 @@ class Grep(ToolBase):
             for gp in glob_patterns:
                 args.extend(["--glob", gp])
 
+        # Read one line past the page, to know whether it's truncated
+        effective_limit = (
+            head_limit if head_limit is not None else DEFAULT_HEAD_LIMIT
+        )
+        stream = _RipgrepStream(
+            output_mode,
+            search_path,
+            line_numbers=n,
+            with_context=output_mode == "content"
+            and any(
+                value
+                for value in (
+                    context,
+                    kwargs.get("-A"),
+                    kwargs.get("-B"),
+                    kwargs.get("-C"),
+                )
+            ),
+            max_lines=offset + effective_limit + 1
+            if effective_limit
+            else None,
+            max_bytes=self._max_output_bytes,
+        )
+
+        notice = ""
         try:
-            results = await self._run_ripgrep(args, search_path)
+            await self._run_ripgrep(args, search_path, stream)
         except RipgrepTimeoutError as e:
-            return ToolChunk(
-                content=[TextBlock(text=str(e))],
-                state=ToolResultState.ERROR,
-                is_last=True,
-            )
+            if not e.partial_results:
+                return ToolChunk(
+                    content=[TextBlock(text=str(e))],
+                    state=ToolResultState.ERROR,
+                    is_last=True,
+                )
+            notice = f"\n\n[Partial results: {e}]"
         except RuntimeError as e:
             return ToolChunk(
                 content=[TextBlock(text=str(e))],
@@ -456,6 +667,7 @@ class Grep(ToolBase):
                 is_last=True,
             )
 
+        results = stream.lines
         if not results:
             return ToolChunk(
                 content=[
@@ -464,12 +676,23 @@ class Grep(ToolBase):
                 state=ToolResultState.SUCCESS,
                 is_last=True,
             )
+        if stream.byte_budget_exceeded:
+            notice = (
+                f"\n\n[Partial results: the search was stopped after "
+                f"{stream.bytes_read} bytes of output. Try searching a "
+                "more specific path or pattern.]"
+            )
 
         limited, applied_limit = self._apply_head_limit(
             results,
             head_limit,
             offset,
         )
+        entries, _ = self._apply_head_limit(
+            stream.entries,
+            head_limit,
+            offset,
+        )
 
         suffix = ""
         if applied_limit is not None:
@@ -482,7 +705,8 @@ class Grep(ToolBase):
             suffix += "]"
 
         return ToolChunk(
-            content=[TextBlock(text="\n".join(limited) + suffix)],
+            content=[TextBlock(text="\n".join(limited) + suffix + notice)],
             state=ToolResultState.SUCCESS,
             is_last=True,
+            metadata={"matches": [e for e in entries if e is not None]},
         )
@@ -8,24 +8,71 @@ and invoked via ``exec_shell`` by the :class:`Glob` tool.
 
 Usage::
 
-    python3 _glob_helper.py --pattern '**/*.py' --base-dir /workspace
+    python3 _glob_helper.py --pattern '**/*.py' --base-dir /workspace \
+        [--limit 100] [--no-ignore] [--index-file /path/index.json]
 
 Output: a JSON array of matching file paths, sorted by modification
 time (newest first).  Exits with code 0 on success (even when no
 matches are found — the array is simply empty).
+
+``.gitignore`` / ``.ignore`` files are honoured (and ``.git`` is
+skipped) unless ``--no-ignore`` is given.  With ``--index-file`` the
+directory listings are persisted between invocations, keyed by the
+directory mtime, so a later glob only re-lists the directories that
+changed since.
 """
 
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import os
 import re
 import sys
+import time
+from typing import Any
+
+# Files whose patterns exclude paths from the results
+IGNORE_FILES = (".gitignore", ".ignore")
+
+# Directories skipped whenever ignore files are honoured
+ALWAYS_IGNORED = frozenset({".git"})
+
+# Listings of directories modified this recently are not persisted, as
+# a change within the same mtime tick would go unnoticed
+_RACY_SECONDS = 2.0
+
+# Persisting an index larger than this costs more than it saves
+_MAX_INDEXED_DIRS = 50_000
 
 # ── glob matching (mirrors the logic from Glob tool) ──────────────
 
 
+def _translate_part(part: str, any_char: str = ".") -> str:
+    """Translate one glob segment into (unanchored) regex source.
+
+    Args:
+        part: One path segment of a glob pattern.
+        any_char: The regex matching a single character; ``[^/]`` when
+            the result is embedded in a full-path regex.
+
+    Returns:
+        The regex source of the segment.
+    """
+    regex_str = ""
+    for c in part:
+        if c == "*":
+            regex_str += any_char + "*"
+        elif c == "?":
+            regex_str += any_char
+        elif c in ".^$+{}[]|()\\":
+            regex_str += "\\" + c
+        else:
+            regex_str += c
+    return regex_str
+
+
 def _glob_part_to_regex(part: str) -> re.Pattern[str]:
     """Convert a single glob pattern segment to a compiled regex.
 
@@ -40,37 +87,222 @@ def _glob_part_to_regex(part: str) -> re.Pattern[str]:
     Returns:
         A compiled :class:`re.Pattern` anchored with ``^…$``.
     """
+    return re.compile(f"^{_translate_part(part)}$")
+
+
+def split_pattern(pattern: str) -> list[str]:
+    """Split a glob pattern on ``/`` or ``\\`` into its segments.
+
+    Args:
+        pattern: Glob pattern such as ``"src/**/*.py"``.
+
+    Returns:
+        The non-empty segments.
+    """
+    return [p for p in re.split(r"[\\/]+", pattern) if p]
+
+
+def pattern_to_regex(parts: list[str]) -> re.Pattern[str]:
+    """Compile glob segments into one regex over ``/``-joined relative
+    paths, equivalent to the segment-wise walk of :func:`glob_match`.
+
+    Args:
+        parts: The segments returned by :func:`split_pattern`.
+
+    Returns:
+        A compiled :class:`re.Pattern` anchored with ``^…$``.
+    """
+    pieces = []
+    for i, part in enumerate(parts):
+        is_last = i == len(parts) - 1
+        if part == "**":
+            pieces.append(".+" if is_last else "(?:[^/]+/)*")
+        else:
+            pieces.append(_translate_part(part, "[^/]"))
+            if not is_last:
+                pieces.append("/")
+    return re.compile("^" + "".join(pieces) + "$")
+
+
+# ── ignore files ──────────────────────────────────────────────────
+
+
+def _compile_ignore_line(line: str, base: str) -> tuple | None:
+    """Compile one line of an ignore file into a rule.
+
+    Supports the common gitignore subset: ``*``, ``?``, ``[...]``,
+    ``**``, ``!`` negation, a trailing ``/`` for directories only and
+    a leading or inner ``/`` anchoring the pattern to the directory of
+    the ignore file.
+
+    Args:
+        line: The raw line.
+        base: The ``/``-joined path of the directory holding the
+            ignore file, relative to the search root (``""`` for the
+            root itself).
+
+    Returns:
+        A ``(base, regex, negate, dir_only)`` tuple, or ``None`` for
+        blank lines and comments.
+    """
+    line = line.rstrip("\n\r")
+    if not line.endswith("\\ "):
+        line = line.rstrip(" ")
+    if not line or line.startswith("#"):
+        return None
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    line = line.replace("\\", "")
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    anchored = "/" in line
+    line = line.lstrip("/")
+
     regex_str = ""
-    for c in part:
-        if c == "*":
-            regex_str += ".*"
-        elif c == "?":
-            regex_str += "."
-        elif c in ".^$+{}[]|()\\":
-            regex_str += "\\" + c
+    i = 0
+    while i < len(line):
+        if line.startswith("**/", i):
+            regex_str += "(?:.*/)?"
+            i += 3
+        elif line.startswith("/**", i) and i + 3 == len(line):
+            regex_str += "/.*"
+            i += 3
+        elif line[i] == "*":
+            regex_str += "[^/]*"
+            i += 1
+        elif line[i] == "?":
+            regex_str += "[^/]"
+            i += 1
+        elif line[i] == "[" and "]" in line[i + 2 :]:
+            end = line.index("]", i + 2)
+            body = line[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            regex_str += "[" + body.replace("\\", "\\\\") + "]"
+            i = end + 1
         else:
-            regex_str += c
-    return re.compile(f"^{regex_str}$")
+            regex_str += re.escape(line[i])
+            i += 1
+    if not anchored:
+        regex_str = "(?:.*/)?" + regex_str
+    return base, re.compile("^" + regex_str + "$"), negate, dir_only
+
+
+def load_ignore_rules(dir_path: str, base: str, names: Any) -> list:
+    """Read the ignore files present in one directory.
+
+    Args:
+        dir_path: The directory's absolute path.
+        base: Its ``/``-joined path relative to the search root.
+        names: The file names in the directory, to skip the ``open``
+            calls for absent ignore files.
+
+    Returns:
+        The rules, in file order.
+    """
+    rules = []
+    for name in IGNORE_FILES:
+        if name not in names:
+            continue
+        try:
+            with open(
+                os.path.join(dir_path, name),
+                encoding="utf-8",
+                errors="replace",
+            ) as f:
+                for line in f:
+                    rule = _compile_ignore_line(line, base)
+                    if rule is not None:
+                        rules.append(rule)
+        except OSError:
+            pass
+    return rules
 
 
-def _collect_all(current_dir: str, results: list[str]) -> None:
-    """Recursively collect all file paths under *current_dir*.
+def is_ignored(rel: str, is_dir: bool, rules: list) -> bool:
+    """Whether the last rule matching *rel* excludes it.
 
-    Uses :func:`os.walk` to traverse the directory tree.
-    ``PermissionError`` and ``OSError`` are silently ignored so that
-    inaccessible subtrees do not abort the entire glob operation.
+    Args:
+        rel: The ``/``-joined path relative to the search root.
+        is_dir: Whether *rel* is a directory.
+        rules: The rules in effect for the parent directory, outermost
+            first.
+
+    Returns:
+        ``True`` if *rel* is ignored.
+    """
+    if is_dir and rel.rsplit("/", 1)[-1] in ALWAYS_IGNORED:
+        return True
+    for base, regex, negate, dir_only in reversed(rules):
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not rel.startswith(base + "/"):
+                continue
+            sub = rel[len(base) + 1 :]
+        else:
+            sub = rel
+        if regex.match(sub):
+            return not negate
+    return False
+
+
+# ── directory listing ─────────────────────────────────────────────
+
+
+class DirLister:
+    """Lists directories, optionally through a cache of listings
+    validated by the directory mtime.
 
     Args:
-        current_dir: Root directory to walk.
-        results: Accumulator list; matched file paths are appended
-            in-place.
+        entries: Cached listings ``{path: [mtime_ns, files, dirs]}``,
+            or ``None`` to always scan.
     """
-    try:
-        for root, _dirs, files in os.walk(current_dir):
-            for fname in files:
-                results.append(os.path.join(root, fname))
-    except (PermissionError, OSError):
-        pass
+
+    def __init__(self, entries: dict | None = None) -> None:
+        self.entries = entries
+        self.dirty = False
+
+    def list(self, path: str) -> tuple[list[str], list[str]]:
+        """Return the file and subdirectory names of *path*.
+
+        Symlinks to files count as files; symlinks to directories are
+        not followed.  Unreadable directories list as empty.
+        """
+        mtime_ns = None
+        if self.entries is not None:
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                return [], []
+            cached = self.entries.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1], cached[2]
+
+        files: list[str] = []
+        dirs: list[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        pass
+        except (PermissionError, OSError):
+            pass
+
+        if self.entries is not None:
+            if time.time() - mtime_ns / 1e9 < _RACY_SECONDS:
+                mtime_ns = -1
+            self.entries[path] = [mtime_ns, files, dirs]
+            self.dirty = True
+        return files, dirs
 
 
 def _match_parts(
@@ -78,6 +310,11 @@ def _match_parts(
     part_index: int,
     current_dir: str,
     results: list[str],
+    *,
+    lister: DirLister,
+    rel: str = "",
+    rules: list | None = None,
+    listing: tuple | None = None,
 ) -> None:
     """Recursively match glob pattern *parts* against directory entries.
 
@@ -96,52 +333,90 @@ def _match_parts(
         current_dir: The directory currently being scanned.
         results: Accumulator list; matched file paths are appended
             in-place.
+        lister: Lists the directories.
+        rel: *current_dir* relative to the search root.
+        rules: The ignore rules in effect, or ``None`` to not honour
+            ignore files.
+        listing: The ``(files, dirs, rules)`` of *current_dir* when
+            already entered, so ``**`` doesn't list it twice.
     """
     if part_index >= len(parts):
         return
 
+    if listing is None:
+        files, dirs = lister.list(current_dir)
+        if rules is not None:
+            rules = rules + load_ignore_rules(current_dir, rel, files)
+    else:
+        files, dirs, rules = listing
+
+    def _child(name: str, is_dir: bool) -> str | None:
+        child_rel = f"{rel}/{name}" if rel else name
+        if rules is not None and is_ignored(child_rel, is_dir, rules):
+            return None
+        return child_rel
+
     part = parts[part_index]
     is_last = part_index == len(parts) - 1
 
     if part == "**":
         if is_last:
-            _collect_all(current_dir, results)
+            for name in files:
+                if _child(name, False) is not None:
+                    results.append(os.path.join(current_dir, name))
         else:
-            _match_parts(parts, part_index + 1, current_dir, results)
-            try:
-                with os.scandir(current_dir) as entries:
-                    for entry in entries:
-                        if entry.is_dir(follow_symlinks=False):
-                            _match_parts(
-                                parts,
-                                part_index,
-                                entry.path,
-                                results,
-                            )
-            except (PermissionError, OSError):
-                pass
-    else:
-        regex = _glob_part_to_regex(part)
-        try:
-            with os.scandir(current_dir) as entries:
-                for entry in entries:
-                    if regex.match(entry.name):
-                        full_path = entry.path
-                        if is_last:
-                            if entry.is_file(follow_symlinks=False):
-                                results.append(full_path)
-                        elif entry.is_dir(follow_symlinks=False):
-                            _match_parts(
-                                parts,
-                                part_index + 1,
-                                full_path,
-                                results,
-                            )
-        except (PermissionError, OSError):
-            pass
-
+            _match_parts(
+                parts,
+                part_index + 1,
+                current_dir,
+                results,
+                lister=lister,
+                rel=rel,
+                rules=rules,
+                listing=(files, dirs, rules),
+            )
+        for name in dirs:
+            child_rel = _child(name, True)
+            if child_rel is not None:
+                _match_parts(
+                    parts,
+                    part_index,
+                    os.path.join(current_dir, name),
+                    results,
+                    lister=lister,
+                    rel=child_rel,
+                    rules=rules,
+                )
+        return
 
-def glob_match(pattern: str, base_dir: str) -> list[str]:
+    regex = _glob_part_to_regex(part)
+    if is_last:
+        for name in files:
+            if regex.match(name) and _child(name, False) is not None:
+                results.append(os.path.join(current_dir, name))
+        return
+    for name in dirs:
+        if regex.match(name):
+            child_rel = _child(name, True)
+            if child_rel is not None:
+                _match_parts(
+                    parts,
+                    part_index + 1,
+                    os.path.join(current_dir, name),
+                    results,
+                    lister=lister,
+                    rel=child_rel,
+                    rules=rules,
+                )
+
+
+def glob_match(
+    pattern: str,
+    base_dir: str,
+    *,
+    respect_ignore: bool = False,
+    lister: DirLister | None = None,
+) -> list[str]:
     """Match files against a glob pattern starting from *base_dir*.
 
     Splits *pattern* on path separators (``/`` or ``\\``) and
@@ -153,6 +428,10 @@ def glob_match(pattern: str, base_dir: str) -> list[str]:
         pattern: Glob pattern such as ``"**/*.py"`` or
             ``"src/utils/*.txt"``.
         base_dir: Absolute path of the directory to search from.
+        respect_ignore: Whether to honour ``.gitignore`` / ``.ignore``
+            files and skip ``.git``.
+        lister: Lists the directories; a fresh uncached
+            :class:`DirLister` when ``None``.
 
     Returns:
         A list of absolute file paths that match *pattern*.  The
@@ -160,17 +439,52 @@ def glob_match(pattern: str, base_dir: str) -> list[str]:
         modification time).
     """
     results: list[str] = []
-    parts = [p for p in re.split(r"[\\/]+", pattern) if p]
-    _match_parts(parts, 0, base_dir, results)
+    _match_parts(
+        split_pattern(pattern),
+        0,
+        base_dir,
+        results,
+        lister=lister or DirLister(),
+        rules=[] if respect_ignore else None,
+    )
     return results
 
 
+# ── persisted index ───────────────────────────────────────────────
+
+
+def _load_index(path: str) -> dict:
+    """Load the persisted listings, or an empty dict."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_index(path: str, entries: dict) -> None:
+    """Persist the listings atomically, best effort."""
+    if len(entries) > _MAX_INDEXED_DIRS:
+        return
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
 # ── entry point ───────────────────────────────────────────────────
 
 
 def main() -> None:
-    """CLI entry point: parse ``--pattern`` and ``--base-dir``, run
-    the glob, and print results as a JSON array to stdout.
+    """CLI entry point: parse the arguments, run the glob, and print
+    results as a JSON array to stdout.
 
     The results are sorted by file modification time (newest first).
     If *base_dir* does not exist, an empty JSON array ``[]`` is
@@ -189,6 +503,22 @@ def main() -> None:
         required=True,
         help="Base directory to search from",
     )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Only return the newest N matches",
+    )
+    parser.add_argument(
+        "--no-ignore",
+        action="store_true",
+        help="Don't honour .gitignore / .ignore files",
+    )
+    parser.add_argument(
+        "--index-file",
+        default=None,
+        help="File persisting directory listings between runs",
+    )
     args = parser.parse_args()
 
     if not os.path.isdir(args.base_dir):
@@ -197,7 +527,17 @@ def main() -> None:
         json.dump([], sys.stdout)
         return
 
-    matches = glob_match(args.pattern, args.base_dir)
+    lister = DirLister(
+        _load_index(args.index_file) if args.index_file else None,
+    )
+    matches = glob_match(
+        args.pattern,
+        args.base_dir,
+        respect_ignore=not args.no_ignore,
+        lister=lister,
+    )
+    if args.index_file and lister.dirty:
+        _save_index(args.index_file, lister.entries)
 
     # Sort by modification time, newest first.
     def _mtime(path: str) -> float:
@@ -206,7 +546,10 @@ def main() -> None:
         except (OSError, FileNotFoundError):
             return 0.0
 
-    matches.sort(key=_mtime, reverse=True)
+    if args.limit is not None and args.limit > 0:
+        matches = heapq.nlargest(args.limit, matches, key=_mtime)
+    else:
+        matches.sort(key=_mtime, reverse=True)
 
     json.dump(matches, sys.stdout)
 
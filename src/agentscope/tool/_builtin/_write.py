@@ -16,6 +16,8 @@ from ...permission import (
     PermissionBehavior,
     PermissionMode,
     PermissionRule,
+    GlobRuleIndex,
+    RuleMatcher,
 )
 from .._response import ToolChunk
 from ...message import TextBlock, ToolResultState
@@ -193,6 +195,28 @@ Usage:
             return False
         return fnmatch.fnmatch(file_path, rule_content)
 
+    def compile_rules(self, rule_contents: list[str]) -> RuleMatcher:
+        """Compile the rule glob patterns into a :class:`GlobRuleIndex`
+        over the "file_path" parameter.
+
+        Args:
+            rule_contents (`list[str]`):
+                The glob patterns, in rule order
+
+        Returns:
+            `RuleMatcher`:
+                The matcher returning the position of the first pattern
+                matching the file path
+        """
+        index = GlobRuleIndex(rule_contents)
+
+        async def first_match(tool_input: dict[str, Any]) -> int | None:
+            """Return the position of the first matching rule."""
+            file_path = tool_input.get("file_path", "")
+            return index.first_match(file_path) if file_path else None
+
+        return first_match
+
     async def generate_suggestions(
         self,
         tool_input: dict[str, Any],
@@ -2,6 +2,7 @@
 """The toolkit class for tool calls in AgentScope."""
 import asyncio
 import inspect
+import time
 from collections import OrderedDict
 from typing import (
     AsyncGenerator,
@@ -24,6 +25,7 @@ from ._response import ToolResponse, ToolChunk
 from ..skill import SkillLoaderBase, Skill
 from ._types import RegisteredTool
 from .._utils._common import _describe_exception, _json_loads_with_repair
+from .._utils._metrics import _observe_seconds
 from ..exception import (
     DeveloperOrientedException,
     ToolNotFoundError,
@@ -292,6 +294,7 @@ class Toolkit:
 
         # Obtain the tool function
         tool_func = available_tools[tool_call.name].tool
+        start = time.perf_counter()
 
         # Async function
         try:
@@ -384,6 +387,13 @@ class Toolkit:
             tool_response.append_chunk(chunk)
 
         finally:
+            _observe_seconds(
+                "agentscope_tool_call_seconds",
+                "Duration of tool calls, up to their complete response.",
+                ("tool", "state"),
+                (tool_call.name, str(tool_response.state)),
+                time.perf_counter() - start,
+            )
             # Finally, yield the complete tool response
             yield tool_response
 
@@ -11,6 +11,9 @@ from ._dashscope import (
 )
 from ._gemini import GeminiTTSModel
 from ._openai import OpenAITTSModel
+from ._cache_base import TTSCacheBase
+from ._memory_cache import InMemoryTTSCache
+from ._file_cache import FileTTSCache
 
 __all__ = [
     "TTSModelBase",
@@ -22,4 +25,7 @@ __all__ = [
     "DashScopeRealtimeTTSModel",
     "GeminiTTSModel",
     "OpenAITTSModel",
+    "TTSCacheBase",
+    "InMemoryTTSCache",
+    "FileTTSCache",
 ]
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""The TTS audio cache base class."""
+from abc import abstractmethod
+from typing import Any
+
+from ..message import Base64Source
+from ..types import JSONSerializableObject
+
+
+class TTSCacheBase:
+    """Base class for TTS audio caches, which store the audio synthesized
+    for a text so that repeated phrases are not synthesized again.
+
+    The audio is kept as the ordered list of chunks the model produced, and
+    the identifier covers everything the audio depends on (model, voice,
+    parameters and text). Implementations count their lookups in
+    :attr:`hits` and :attr:`misses`.
+    """
+
+    hits: int = 0
+    """The number of lookups that found the audio."""
+
+    misses: int = 0
+    """The number of lookups that didn't find the audio."""
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """The hit and miss counters and the hit rate of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    @abstractmethod
+    async def store(
+        self,
+        chunks: list[Base64Source],
+        identifier: JSONSerializableObject,
+        overwrite: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Store the audio chunks with the given identifier.
+
+        Args:
+            chunks (`list[Base64Source]`):
+                The audio chunks to store, in playing order.
+            identifier (`JSONSerializableObject`):
+                The identifier to distinguish the audio.
+            overwrite (`bool`, defaults to `False`):
+                Whether to overwrite existing audio with the same
+                identifier. If `True`, existing audio will be replaced.
+        """
+
+    @abstractmethod
+    async def retrieve(
+        self,
+        identifier: JSONSerializableObject,
+    ) -> list[Base64Source] | None:
+        """Retrieve the audio chunks with the given identifier. If not
+        found, return `None`.
+
+        Args:
+            identifier (`JSONSerializableObject`):
+                The identifier to retrieve the audio.
+        """
+
+    @abstractmethod
+    async def remove(
+        self,
+        identifier: JSONSerializableObject,
+    ) -> None:
+        """Remove the audio with the given identifier.
+
+        Args:
+            identifier (`JSONSerializableObject`):
+                The identifier to remove the audio.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Clear all cached audio."""
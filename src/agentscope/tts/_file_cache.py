@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""A file TTS audio cache implementation for storing and retrieving
+synthesized audio in JSON files."""
+import hashlib
+import json
+import os
+from typing import Any
+
+from ._cache_base import TTSCacheBase
+from .._logging import logger
+from ..message import Base64Source
+from ..types import JSONSerializableObject
+
+
+class FileTTSCache(TTSCacheBase):
+    """The TTS audio cache class that stores the audio of each text in a
+    JSON file, evicting the least recently used files beyond a byte
+    budget."""
+
+    def __init__(
+        self,
+        cache_dir: str = "./.cache/tts",
+        max_file_number: int | None = None,
+        max_cache_size: float | None = 256,
+    ) -> None:
+        """Initialize the file TTS cache class.
+
+        Args:
+            cache_dir (`str`, defaults to `"./.cache/tts"`):
+                The directory to store the audio files.
+            max_file_number (`int | None`, defaults to `None`):
+                The maximum number of files to keep in the cache directory.
+                If exceeded, the least recently used files will be removed.
+            max_cache_size (`float | None`, defaults to `256`):
+                The maximum size of the cache directory in MB. If exceeded,
+                the least recently used files will be removed until the
+                size is within the limit.
+        """
+        self._cache_dir = os.path.abspath(cache_dir)
+        self.max_file_number = max_file_number
+        self.max_cache_size = max_cache_size
+
+    @property
+    def cache_dir(self) -> str:
+        """The cache directory where the audio files are stored."""
+        if not os.path.exists(self._cache_dir):
+            os.makedirs(self._cache_dir, exist_ok=True)
+        return self._cache_dir
+
+    async def store(
+        self,
+        chunks: list[Base64Source],
+        identifier: JSONSerializableObject,
+        overwrite: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Store the audio chunks with the given identifier.
+
+        Args:
+            chunks (`list[Base64Source]`):
+                The audio chunks to store, in playing order.
+            identifier (`JSONSerializableObject`):
+                The identifier to distinguish the audio, which will be
+                used to generate a hashable filename, so it should be
+                JSON serializable (e.g. a string, number, list, dict).
+            overwrite (`bool`, defaults to `False`):
+                Whether to overwrite existing audio with the same
+                identifier. If `True`, existing audio will be replaced.
+        """
+        path_file = os.path.join(
+            self.cache_dir,
+            self._get_filename(identifier),
+        )
+
+        if os.path.exists(path_file):
+            if not os.path.isfile(path_file):
+                raise RuntimeError(
+                    f"Path {path_file} exists but is not a file.",
+                )
+            if not overwrite:
+                return
+
+        # Write aside and rename, so readers never see a partial file
+        path_tmp = f"{path_file}.{os.getpid()}.tmp"
+        with open(path_tmp, "w", encoding="utf-8") as f:
+            json.dump([chunk.model_dump() for chunk in chunks], f)
+        os.replace(path_tmp, path_file)
+        await self._maintain_cache_dir()
+
+    async def retrieve(
+        self,
+        identifier: JSONSerializableObject,
+    ) -> list[Base64Source] | None:
+        """Retrieve the audio chunks with the given identifier. If not
+        found, return `None`.
+
+        Args:
+            identifier (`JSONSerializableObject`):
+                The identifier to retrieve the audio, which will be
+                used to generate a hashable filename, so it should be
+                JSON serializable (e.g. a string, number, list, dict).
+        """
+        path_file = os.path.join(
+            self.cache_dir,
+            self._get_filename(identifier),
+        )
+
+        try:
+            with open(path_file, "r", encoding="utf-8") as f:
+                chunks = [Base64Source.model_validate(_) for _ in json.load(f)]
+            # Mark the file as recently used for the eviction order
+            os.utime(path_file)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return chunks
+
+    async def remove(self, identifier: JSONSerializableObject) -> None:
+        """Remove the audio with the given identifier.
+
+        Args:
+            identifier (`JSONSerializableObject`):
+                The identifier to remove the audio, which will be
+                used to generate a hashable filename, so it should be
+                JSON serializable (e.g. a string, number, list, dict).
+        """
+        path_file = os.path.join(
+            self.cache_dir,
+            self._get_filename(identifier),
+        )
+
+        if os.path.exists(path_file):
+            os.remove(path_file)
+        else:
+            raise FileNotFoundError(f"File {path_file} does not exist.")
+
+    async def clear(self) -> None:
+        """Clear the cache directory by removing all files."""
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(".json"):
+                os.remove(os.path.join(self.cache_dir, filename))
+
+    @staticmethod
+    def _get_filename(identifier: JSONSerializableObject) -> str:
+        """Generate a filename based on the identifier."""
+        json_str = json.dumps(identifier, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(json_str.encode("utf-8")).hexdigest() + ".json"
+
+    async def _maintain_cache_dir(self) -> None:
+        """Maintain the cache directory by removing the least recently used
+        files if the number of files exceeds the maximum limit or if the
+        cache size exceeds the maximum size."""
+        files = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                files.append((entry.name, stat.st_mtime, stat.st_size))
+        files.sort(key=lambda x: x[1])
+
+        total_size = sum(size for _, _, size in files)
+        max_bytes = (
+            None
+            if self.max_cache_size is None
+            else self.max_cache_size * 1024 * 1024
+        )
+
+        removed = 0
+        for filename, _, size in files:
+            over_number = (
+                self.max_file_number is not None
+                and len(files) - removed > self.max_file_number
+            )
+            over_size = max_bytes is not None and total_size > max_bytes
+            if not over_number and not over_size:
+                break
+            os.remove(os.path.join(self.cache_dir, filename))
+            total_size -= size
+            removed += 1
+
+        if removed:
+            logger.info(
+                "Remove %d cached TTS audio file(s) for the limited number "
+                "of files (%s) or cache size (%s MB).",
+                removed,
+                self.max_file_number,
+                self.max_cache_size,
+            )
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""An in-memory TTS audio cache with an LRU eviction policy."""
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any
+
+from ._cache_base import TTSCacheBase
+from ..message import Base64Source
+from ..types import JSONSerializableObject
+
+
+class InMemoryTTSCache(TTSCacheBase):
+    """The TTS audio cache that keeps the audio in memory, evicting the
+    least recently used entries beyond a byte budget."""
+
+    def __init__(
+        self,
+        max_cache_size: float = 64,
+        max_entry_number: int | None = None,
+    ) -> None:
+        """Initialize the in-memory TTS cache.
+
+        Args:
+            max_cache_size (`float`, defaults to `64`):
+                The maximum size of the cached audio data in MB. If
+                exceeded, the least recently used entries will be removed.
+            max_entry_number (`int | None`, defaults to `None`):
+                The maximum number of cached entries. If exceeded, the least
+                recently used entries will be removed.
+        """
+        self.max_cache_size = max_cache_size
+        self.max_entry_number = max_entry_number
+        self._entries: OrderedDict[str, list[Base64Source]] = OrderedDict()
+        self._size = 0
+
+    async def store(
+        self,
+        chunks: list[Base64Source],
+        identifier: JSONSerializableObject,
+        overwrite: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Store the audio chunks with the given identifier.
+
+        Args:
+            chunks (`list[Base64Source]`):
+                The audio chunks to store, in playing order.
+            identifier (`JSONSerializableObject`):
+                The identifier to distinguish the audio, which will be
+                hashed into the cache key, so it should be JSON serializable
+                (e.g. a string, number, list, dict).
+            overwrite (`bool`, defaults to `False`):
+                Whether to overwrite existing audio with the same
+                identifier. If `True`, existing audio will be replaced.
+        """
+        key = self._get_key(identifier)
+        if key in self._entries:
+            if not overwrite:
+                return
+            self._size -= self._get_size(self._entries.pop(key))
+
+        self._entries[key] = list(chunks)
+        self._size += self._get_size(chunks)
+        self._maintain()
+
+    async def retrieve(
+        self,
+        identifier: JSONSerializableObject,
+    ) -> list[Base64Source] | None:
+        """Retrieve the audio chunks with the given identifier. If not
+        found, return `None`.
+
+        Args:
+            identifier (`JSONSerializableObject`):
+                The identifier to retrieve the audio.
+        """
+        key = self._get_key(identifier)
+        chunks = self._entries.get(key)
+        if chunks is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return list(chunks)
+
+    async def remove(self, identifier: JSONSerializableObject) -> None:
+        """Remove the audio with the given identifier.
+
+        Args:
+            identifier (`JSONSerializableObject`):
+                The identifier to remove the audio.
+        """
+        key = self._get_key(identifier)
+        if key not in self._entries:
+            raise KeyError(f"No cached audio for identifier {identifier}.")
+        self._size -= self._get_size(self._entries.pop(key))
+
+    async def clear(self) -> None:
+        """Clear all cached audio."""
+        self._entries.clear()
+        self._size = 0
+
+    @staticmethod
+    def _get_key(identifier: JSONSerializableObject) -> str:
+        """Generate the cache key based on the identifier."""
+        json_str = json.dumps(identifier, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_size(chunks: list[Base64Source]) -> int:
+        """Get the size of the audio data in bytes."""
+        return sum(len(chunk.data) for chunk in chunks)
+
+    def _maintain(self) -> None:
+        """Remove the least recently used entries while the cache exceeds
+        its entry number or size limit."""
+        max_bytes = self.max_cache_size * 1024 * 1024
+        while self._entries and (
+            self._size > max_bytes
+            or (
+                self.max_entry_number is not None
+                and len(self._entries) > self.max_entry_number
+            )
+        ):
+            _, chunks = self._entries.popitem(last=False)
+            self._size -= self._get_size(chunks)
@@ -12,6 +12,7 @@ from typing import (
 from pydantic import BaseModel, Field
 
 from .._tts_base import TTSModelBase
+from ..._utils._http_pool import _with_pooled_http_client
 from .._tts_response import TTSResponse, TTSUsage
 from ...credential import OpenAICredential
 from ...message import DataBlock, Base64Source
@@ -127,6 +128,12 @@ class OpenAITTSModel(TTSModelBase):
             api_key=self.credential.api_key.get_secret_value(),
             organization=self.credential.organization,
             base_url=self.credential.base_url,
+            **_with_pooled_http_client(
+                {},
+                "openai",
+                self.credential.base_url,
+                openai.DefaultAsyncHttpxClient,
+            ),
         )
 
     async def synthesize(
@@ -292,6 +292,16 @@ class WorkspaceBase:
         """
         return None
 
+    @property
+    def _glob_index_path(self) -> str | None:
+        """Optional path (backend-side) where the ``Glob`` helper
+        persists directory listings between calls.
+
+        ``None`` when the backend answers globs otherwise (e.g. the
+        resident file index of :class:`LocalBackend`).
+        """
+        return None
+
     def __init__(
         self,
         *,
@@ -560,7 +570,8 @@ class WorkspaceBase:
         filesystem and process I/O happens inside the workspace's
         execution environment. :class:`Bash` is rooted at
         :attr:`workdir`; :class:`Glob` receives the optional
-        :attr:`_glob_helper_path` when the backend ships one.
+        :attr:`_glob_helper_path` and :attr:`_glob_index_path` when
+        the backend ships them.
 
         Raises:
             RuntimeError:
@@ -572,6 +583,8 @@ class WorkspaceBase:
         glob_kwargs: dict = {"backend": backend}
         if self._glob_helper_path is not None:
             glob_kwargs["glob_helper_path"] = self._glob_helper_path
+        if self._glob_index_path is not None:
+            glob_kwargs["glob_index_path"] = self._glob_index_path
         return [
             Bash(cwd=self.workdir, backend=backend),
             Edit(backend=backend),
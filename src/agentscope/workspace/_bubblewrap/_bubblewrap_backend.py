@@ -14,9 +14,10 @@ import os
 import posixpath
 import signal
 from pathlib import PurePosixPath
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable
 
 from ...tool import BackendBase, ExecResult
+from ...tool._builtin._backend import _pump_process
 from ._constants import SANDBOX_CACHE_DIR, SANDBOX_TMPDIR, SANDBOX_WORKDIR
 
 
@@ -169,6 +170,43 @@ class BubblewrapBackend(BackendBase):
             stderr=stderr,
         )
 
+    async def exec_stream(
+        self,
+        command: list[str],
+        on_stdout: Callable[[bytes], bool],
+        *,
+        cwd: str | None = None,
+        timeout: float | None = None,
+    ) -> ExecResult:
+        """Run an argv list inside Bubblewrap, streaming its stdout."""
+        if not command:
+            return ExecResult(
+                exit_code=127,
+                stdout=b"",
+                stderr=b"empty command",
+            )
+
+        try:
+            process = await self.start_process(
+                command,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except (FileNotFoundError, NotADirectoryError, OSError) as exc:
+            return ExecResult(
+                exit_code=127,
+                stdout=b"",
+                stderr=str(exc).encode("utf-8"),
+            )
+
+        return await _pump_process(
+            process,
+            on_stdout,
+            timeout,
+            lambda: self._terminate_process_tree(process, grace=1.0),
+        )
+
     async def start_process(
         self,
         command: list[str],
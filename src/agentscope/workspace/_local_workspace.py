@@ -146,6 +146,8 @@ class LocalWorkspace(WorkspaceBase):
         glob_kwargs: dict = {"backend": backend}
         if self._glob_helper_path is not None:
             glob_kwargs["glob_helper_path"] = self._glob_helper_path
+        if self._glob_index_path is not None:
+            glob_kwargs["glob_index_path"] = self._glob_index_path
 
         if os.name == "nt":
             shell: ToolBase = PowerShell(cwd=self.workdir, backend=backend)
@@ -30,6 +30,7 @@ from ._utils import (
     DEFAULT_GATEWAY_SCRIPT,
     DEFAULT_GATEWAY_VENV,
     DEFAULT_GLOB_HELPER_SCRIPT,
+    DEFAULT_GLOB_INDEX_FILE,
     _read_gateway_script_bytes,
     _read_glob_helper_bytes,
 )
@@ -111,6 +112,14 @@ class SandboxedWorkspaceBase(WorkspaceBase):
             DEFAULT_GLOB_HELPER_SCRIPT,
         )
 
+    @property
+    def _glob_index_path(self) -> str:
+        """Listings persisted by the glob helper between calls."""
+        return self.get_backend().join_path(
+            self._gateway_home,
+            DEFAULT_GLOB_INDEX_FILE,
+        )
+
     def __init__(
         self,
         *,
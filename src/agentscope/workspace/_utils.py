@@ -93,6 +93,7 @@ DEFAULT_GATEWAY_VENV = ".venv"
 DEFAULT_GATEWAY_LOG = "gateway.log"
 DEFAULT_GATEWAY_SCRIPT = "_mcp_gateway_app.py"
 DEFAULT_GLOB_HELPER_SCRIPT = "_glob_helper.py"
+DEFAULT_GLOB_INDEX_FILE = ".glob_index.json"
 
 #: Minimum Python packages the gateway script needs at runtime.
 #: Both Docker (image build) and E2B (sandbox bootstrap) install this
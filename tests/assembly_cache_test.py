@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Unit tests for the per-process cache of assembled agents and its use
+in :meth:`ChatService._run_impl`."""
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import AsyncGenerator
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from utils import MockModel
+
+from agentscope.agent import Agent, ContextConfig, ReActConfig
+from agentscope.app._bus_ops import publish_assembly_invalidation
+from agentscope.app._manager import AssemblyCache
+from agentscope.app._service import ChatService
+from agentscope.app.message_bus import InMemoryMessageBus
+from agentscope.app.storage import (
+    AgentData,
+    AgentRecord,
+    ChatModelConfig,
+    SessionConfig,
+    SessionKnowledgeConfig,
+    SessionRecord,
+)
+from agentscope.state import AgentState
+
+
+class _RAGMiddleware(list):
+    """Stand in for the RAG middleware as the list of its knowledge
+    bases."""
+
+    Parameters = dict
+
+    def __init__(self, knowledge_bases: list, parameters: dict) -> None:
+        del parameters
+        super().__init__(knowledge_bases)
+
+
+class AssemblyCacheTest(IsolatedAsyncioTestCase):
+    """Test the validation, bounds and invalidation of the cache."""
+
+    async def asyncSetUp(self) -> None:
+        """The async setup method."""
+        self.bus = InMemoryMessageBus()
+        self.cache = AssemblyCache(self.bus, max_size=2, idle_ttl=60.0)
+
+    def _put(self, session_id: str, user_id: str = "u", **kw: str) -> None:
+        """Cache a placeholder agent under the fingerprint ``(1,)``."""
+        self.cache.put(
+            session_id,
+            (1,),
+            SimpleNamespace(),
+            user_id=user_id,
+            agent_id=kw.get("agent_id", "a"),
+        )
+
+    async def test_fingerprint_validates_entries(self) -> None:
+        """Only a run with the same fingerprint reuses the agent."""
+        agent = SimpleNamespace()
+        self.cache.put("s1", (1,), agent, user_id="u", agent_id="a")
+
+        self.assertIs(self.cache.get("s1", (1,)), agent)
+        self.assertIsNone(self.cache.get("s1", (2,)))
+        self.assertIsNone(self.cache.get("s2", (1,)))
+        self.assertEqual(self.cache.stats["hits"], 1)
+        self.assertEqual(self.cache.stats["misses"], 2)
+
+    async def test_lru_and_idle_ttl(self) -> None:
+        """The least recently used entry goes first, and idle entries
+        expire."""
+        self._put("s1")
+        self._put("s2")
+        self.cache.get("s1", (1,))
+        self._put("s3")
+        self.assertIsNone(self.cache.get("s2", (1,)))
+        self.assertIsNotNone(self.cache.get("s1", (1,)))
+
+        self.cache.idle_ttl = 0.0
+        self.assertIsNone(self.cache.get("s3", (1,)))
+        self.assertDictEqual(
+            self.cache.stats,
+            {
+                "size": 0,
+                "hits": 2,
+                "misses": 2,
+                "invalidations": 0,
+                "evictions": 3,
+            },
+        )
+
+    async def test_bus_invalidation(self) -> None:
+        """Published invalidations drop the matching entries."""
+        self.cache.max_size = 10
+        async with self.cache:
+            self._put("s1", user_id="u1", agent_id="a1")
+            self._put("s2", user_id="u1", agent_id="a2")
+            self._put("s3", user_id="u2", agent_id="a1")
+            self._put("s4", user_id="u2", agent_id="a2")
+
+            await publish_assembly_invalidation(self.bus, session_id="s1")
+            await publish_assembly_invalidation(
+                self.bus,
+                user_id="u2",
+                agent_id="a1",
+            )
+            await asyncio.sleep(0.05)
+            self.assertListEqual(list(self.cache._entries), ["s2", "s4"])
+
+            await publish_assembly_invalidation(self.bus)
+            await asyncio.sleep(0.05)
+            self.assertEqual(self.cache.stats["size"], 0)
+            self.assertEqual(self.cache.stats["invalidations"], 4)
+
+    async def test_load_state(self) -> None:
+        """A cached agent runs on the state swapped in."""
+        agent = Agent(
+            name="Friday",
+            system_prompt="You are a helpful assistant.",
+            model=MockModel(),
+        )
+        state = AgentState(session_id="s1")
+        agent.load_state(state)
+        self.assertIs(agent.state, state)
+        self.assertIs(agent._engine.context, state.permission_context)
+
+
+class ChatServiceAssemblyCacheTest(IsolatedAsyncioTestCase):
+    """Test the reuse of assembled agents across runs of a session."""
+
+    async def asyncSetUp(self) -> None:
+        """Build a service whose toolkit assembly is counted."""
+        self.agent_record = AgentRecord(
+            id="agent-1",
+            user_id="user-1",
+            data=AgentData(
+                name="Friday",
+                context_config=ContextConfig(),
+                react_config=ReActConfig(),
+            ),
+        )
+        self.session_record = SessionRecord(
+            id="session-1",
+            user_id="user-1",
+            agent_id="agent-1",
+            config=SessionConfig(
+                workspace_id="ws-1",
+                chat_model_config=ChatModelConfig(
+                    type="test",
+                    credential_id="cred-1",
+                    model="m",
+                    parameters={},
+                ),
+            ),
+        )
+        self.agents: list = []
+        self.accessible = {"kb-1", "kb-2"}
+        self.toolkit_calls = 0
+        workspace = SimpleNamespace(workdir="/tmp/agentscope-assembly-test")
+        test = self
+
+        class _Agent:
+            """Record itself and the states it runs on."""
+
+            def __init__(
+                self,
+                *,
+                state: AgentState,
+                middlewares: list,
+                **_: object,
+            ) -> None:
+                self.state = state
+                self.states = [state]
+                self.middlewares = middlewares
+                test.agents.append(self)
+
+            def load_state(self, state: AgentState) -> None:
+                """Swap in the state of the next run."""
+                self.state = state
+                self.states.append(state)
+
+            async def reply_stream(
+                self,
+                inputs: object,
+            ) -> AsyncGenerator[object, None]:
+                """Yield nothing."""
+                del inputs
+                for _ in ():
+                    yield _
+
+        class _Storage:
+            """Serve detached copies of the records."""
+
+            async def get_session(self, *_: object) -> SessionRecord:
+                """Return the session."""
+                return test.session_record.model_copy(deep=True)
+
+            async def update_session_state(self, **_: object) -> None:
+                """Accept the post-run state persistence."""
+
+            async def write_session_batch(self, *_: object) -> None:
+                """Accept the batched post-run persistence."""
+
+        class _Access:
+            """Resolve the agent and the knowledge bases the user can
+            access."""
+
+            async def resolve_agent(self, *_: object) -> AgentRecord:
+                """Return the agent."""
+                return test.agent_record.model_copy(deep=True)
+
+            async def resolve_knowledge_base(
+                self,
+                user_id: str,
+                knowledge_base_id: str,
+            ) -> SimpleNamespace:
+                """Return the knowledge base if it is accessible."""
+                if knowledge_base_id not in test.accessible:
+                    raise LookupError(knowledge_base_id)
+                return SimpleNamespace(
+                    id=knowledge_base_id,
+                    user_id=user_id,
+                    updated_at=test.agent_record.updated_at,
+                )
+
+        class _KnowledgeBaseManager:
+            """Hand out the knowledge base ids as their handles."""
+
+            async def get_knowledge(self, _: str, kb_id: str) -> str:
+                """Return the id."""
+                return kb_id
+
+        class _WorkspaceManager:
+            """Return the same workspace, as the managers cache them."""
+
+            async def get_workspace(self, *_: object) -> object:
+                """Return the workspace."""
+                return workspace
+
+        self.bus = InMemoryMessageBus()
+        self.cache = AssemblyCache(self.bus)
+        self.service = ChatService(
+            storage=_Storage(),
+            workspace_manager=_WorkspaceManager(),
+            scheduler_manager=object(),
+            background_task_manager=object(),
+            message_bus=self.bus,
+            resource_access_service=_Access(),
+            knowledge_base_manager=_KnowledgeBaseManager(),
+            custom_agent_cls=_Agent,
+            assembly_cache=self.cache,
+        )
+
+    async def _run(self) -> None:
+        """Run the session once."""
+
+        async def _get_toolkit(**_: object) -> object:
+            self.toolkit_calls += 1
+            return object()
+
+        async def _get_model(*_: object, **__: object) -> object:
+            return object()
+
+        with (
+            patch(
+                "agentscope.app._service._chat.get_toolkit",
+                new=_get_toolkit,
+            ),
+            patch("agentscope.app._service._chat.get_model", new=_get_model),
+            patch(
+                "agentscope.app._service._chat.RAGMiddleware",
+                new=_RAGMiddleware,
+            ),
+        ):
+            await self.service._run_impl(
+                "user-1",
+                "session-1",
+                "agent-1",
+                None,
+            )
+
+    async def test_agent_reused_until_records_change(self) -> None:
+        """The second run reuses the agent on its fresh state, and an
+        agent update re-assembles it."""
+        await self._run()
+        await self._run()
+        self.assertEqual(self.toolkit_calls, 1)
+        self.assertEqual(len(self.agents), 1)
+        states = self.agents[0].states
+        self.assertEqual(len(states), 2)
+        self.assertIsNot(states[0], states[1])
+        self.assertEqual(states[1].session_id, "session-1")
+
+        self.agent_record.updated_at += timedelta(seconds=1)
+        await self._run()
+        self.assertEqual(self.toolkit_calls, 2)
+
+        self.session_record.config.chat_model_config.model = "m2"
+        await self._run()
+        self.assertEqual(self.toolkit_calls, 3)
+
+        self.cache.invalidate(session_id="session-1")
+        await self._run()
+        self.assertEqual(self.toolkit_calls, 4)
+        self.assertEqual(len(self.agents), 4)
+
+    async def test_revoked_knowledge_base_not_used(self) -> None:
+        """A knowledge base the user lost access to is dropped from the
+        agent of the next run."""
+        self.session_record.config.knowledge_config = SessionKnowledgeConfig(
+            knowledge_base_ids=["kb-1", "kb-2"],
+        )
+        await self._run()
+        await self._run()
+        self.assertEqual(self.toolkit_calls, 1)
+        self.assertIn(["kb-1", "kb-2"], self.agents[-1].middlewares)
+
+        self.accessible.discard("kb-2")
+        with self.assertLogs("as", level="ERROR"):
+            await self._run()
+        self.assertEqual(self.toolkit_calls, 2)
+        self.assertIn(["kb-1"], self.agents[-1].middlewares)
+        self.assertNotIn(["kb-1", "kb-2"], self.agents[-1].middlewares)
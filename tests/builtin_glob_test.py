@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 """Glob tool test case."""
+import json
 import os
+import sys
 import tempfile
+import unittest
 from unittest.async_case import IsolatedAsyncioTestCase
 
 from utils import AnyString
@@ -236,3 +239,134 @@ class GlobToolTest(IsolatedAsyncioTestCase):
         expected_pattern = os.path.abspath(cwd).rstrip("/") + "/**"
         suggestion_contents = [s.rule_content for s in suggestions]
         self.assertIn(expected_pattern, suggestion_contents)
+
+
+class GlobIndexTest(IsolatedAsyncioTestCase):
+    """The resident file index and the helper's incremental mode."""
+
+    async def asyncSetUp(self) -> None:
+        """Create a tree with an ignore file and staggered mtimes."""
+        self.temp_dir = tempfile.mkdtemp()
+        self._write(".gitignore", "build/\n*.log\n!keep.log\n", mtime=1)
+        for i, name in enumerate(
+            ["old.py", "src/mid.py", "build/out.py", "a.log", "keep.log"],
+        ):
+            self._write(name, "", mtime=1_000_000 + i)
+
+    async def asyncTearDown(self) -> None:
+        """Clean up temporary files."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name: str, text: str, mtime: float | None = None) -> str:
+        """Write a file below the temp dir."""
+        path = os.path.join(self.temp_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    async def _glob(self, tool: Glob, pattern: str, **kwargs: int) -> list:
+        """Run the tool and split the matches."""
+        chunk = await tool(pattern=pattern, path=self.temp_dir, **kwargs)
+        text = chunk.content[0].text
+        if text.startswith("No files found"):
+            return []
+        return [os.path.relpath(p, self.temp_dir) for p in text.split("\n")]
+
+    async def test_ignore_files_and_limit(self) -> None:
+        """Both paths honour ignore files and return the newest first."""
+        for tool in (Glob(), Glob(use_file_index=False)):
+            self.assertListEqual(
+                await self._glob(tool, "**/*"),
+                [
+                    "keep.log",
+                    os.path.join("src", "mid.py"),
+                    "old.py",
+                    ".gitignore",
+                ],
+            )
+            self.assertListEqual(
+                await self._glob(tool, "**/*.py", head_limit=1),
+                [os.path.join("src", "mid.py")],
+            )
+        self.assertEqual(
+            len(await self._glob(Glob(respect_ignore_files=False), "**/*")),
+            6,
+        )
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify")
+    async def test_index_follows_changes(self) -> None:
+        """Creations, moves and deletions are seen without a rescan."""
+        tool = Glob()
+        self.assertEqual(len(await self._glob(tool, "**/*.py")), 2)
+
+        self._write("src/deep/new.py", "")
+        os.rename(
+            os.path.join(self.temp_dir, "old.py"),
+            os.path.join(self.temp_dir, "src", "moved.py"),
+        )
+        self.assertListEqual(
+            await self._glob(tool, "src/**/*.py", head_limit=2),
+            [
+                os.path.join("src", "deep", "new.py"),
+                os.path.join("src", "mid.py"),
+            ],
+        )
+        os.remove(os.path.join(self.temp_dir, "src", "deep", "new.py"))
+        self.assertListEqual(
+            await self._glob(tool, "*/*.py"),
+            [os.path.join("src", "mid.py"), os.path.join("src", "moved.py")],
+        )
+
+        # An edited ignore file rebuilds the index
+        self._write(".gitignore", "*.py\n")
+        self.assertListEqual(await self._glob(tool, "**/*.py"), [])
+
+        # A subdirectory is answered by the index of its ancestor
+        self._write(".gitignore", "")
+        chunk = await tool(
+            pattern="*.py",
+            path=os.path.join(self.temp_dir, "src"),
+        )
+        self.assertIn("moved.py", chunk.content[0].text)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify")
+    async def test_ancestor_index_matches_subdir_literally(self) -> None:
+        """Glob characters in a subdirectory answered by the index of an
+        ancestor aren't wildcards."""
+        tool = Glob()
+        self._write("app/[slug]/page.py", "", mtime=2_000_000)
+        self._write("app/s/other.py", "", mtime=2_000_001)
+        self._write("a/x*/f.txt", "")
+        self._write("a/xy/g.txt", "")
+        self.assertEqual(len(await self._glob(tool, "**/*.py")), 4)
+
+        for sub, pattern, expected in (
+            ("app/[slug]", "*.py", "page.py"),
+            ("a/x*", "*.txt", "f.txt"),
+        ):
+            path = os.path.join(self.temp_dir, sub)
+            chunk = await tool(pattern=pattern, path=path)
+            self.assertListEqual(
+                chunk.content[0].text.split("\n"),
+                [os.path.join(path, expected)],
+            )
+
+    async def test_helper_index_file(self) -> None:
+        """The helper re-lists only the directories that changed."""
+        index_path = os.path.join(self.temp_dir, "index.json")
+        tool = Glob(use_file_index=False, glob_index_path=index_path)
+        self.assertEqual(len(await self._glob(tool, "**/*.py")), 2)
+        with open(index_path, encoding="utf-8") as f:
+            listings = json.load(f)
+        self.assertIn(os.path.join(self.temp_dir, "src"), listings)
+
+        self._write("src/new.py", "")
+        self.assertIn(
+            os.path.join("src", "new.py"),
+            await self._glob(tool, "**/*.py"),
+        )
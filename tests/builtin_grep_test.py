@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 """Grep tool test case."""
+import asyncio
+import json
 import os
+import sys
 import tempfile
+import unittest
+from unittest import mock
 from unittest.async_case import IsolatedAsyncioTestCase
 
 from agentscope.message import ToolResultState
@@ -252,3 +257,144 @@ class GrepToolTest(IsolatedAsyncioTestCase):
         expected_pattern = os.path.abspath(cwd).rstrip("/") + "/**"
         suggestion_contents = [s.rule_content for s in suggestions]
         self.assertIn(expected_pattern, suggestion_contents)
+
+
+_FAKE_RG = """#!{python}
+import os, sys, time
+with open(os.environ["FAKE_RG_OUTPUT"], encoding="utf-8") as f:
+    lines = f.read().splitlines()
+for line in lines:
+    print(line, flush=True)
+# Keep producing output until killed
+while os.environ.get("FAKE_RG_ENDLESS"):
+    print(lines[-1], flush=True)
+    time.sleep(0.001)
+"""
+
+
+def _rg_line(kind: str, path: str, number: int, text: str) -> str:
+    """Render one ripgrep ``--json`` match or context message."""
+    return json.dumps(
+        {
+            "type": kind,
+            "data": {
+                "path": {"text": path},
+                "lines": {"text": text + "\n"},
+                "line_number": number,
+                "submatches": [{}] if kind == "match" else [],
+            },
+        },
+    )
+
+
+@unittest.skipUnless(os.name == "posix", "fake rg is a shebang script")
+class GrepStreamTest(IsolatedAsyncioTestCase):
+    """Streamed, early-terminating ripgrep output, read as JSON."""
+
+    async def asyncSetUp(self) -> None:
+        """Put a fake ``rg`` replaying canned output first on PATH."""
+        self.temp_dir = tempfile.mkdtemp()
+        script = os.path.join(self.temp_dir, "rg")
+        with open(script, "w", encoding="utf-8") as f:
+            f.write(_FAKE_RG.format(python=sys.executable))
+        os.chmod(script, 0o755)
+        self.output = os.path.join(self.temp_dir, "output.jsonl")
+        self.enterContext(
+            mock.patch.dict(
+                os.environ,
+                {
+                    "PATH": self.temp_dir + os.pathsep + os.environ["PATH"],
+                    "FAKE_RG_OUTPUT": self.output,
+                },
+            ),
+        )
+
+    async def asyncTearDown(self) -> None:
+        """Clean up temporary files."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _replay(self, lines: list[str], endless: bool = False) -> None:
+        """Set the output of the fake ``rg``."""
+        with open(self.output, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        if endless:
+            os.environ["FAKE_RG_ENDLESS"] = "1"
+
+    async def test_head_limit_stops_ripgrep(self) -> None:
+        """An endless search returns once the page is full."""
+        self._replay(
+            [_rg_line("match", "a.py", i, f"x = {i}") for i in range(1, 6)],
+            endless=True,
+        )
+        chunk = await asyncio.wait_for(
+            Grep()(
+                pattern="x",
+                path="src",
+                output_mode="content",
+                head_limit=3,
+            ),
+            timeout=10,
+        )
+        self.assertEqual(
+            chunk.content[0].text,
+            "a.py:1:x = 1\na.py:2:x = 2\na.py:3:x = 3\n\n"
+            "[Showing results with pagination = limit: 3]",
+        )
+        self.assertListEqual(
+            [m["line_number"] for m in chunk.metadata["matches"]],
+            [1, 2, 3],
+        )
+
+    async def test_context_and_count_rendering(self) -> None:
+        """JSON messages render like the ripgrep text printer."""
+        self._replay(
+            [
+                _rg_line("match", "a.py", 1, "x = 1"),
+                _rg_line("context", "a.py", 2, "y = 2"),
+                _rg_line("match", "a.py", 7, "x = 7\nz = 8"),
+                _rg_line("match", "b.py", 1, "x" * 600),
+            ],
+        )
+        chunk = await Grep()(
+            pattern="x",
+            path="src",
+            output_mode="content",
+            context=1,
+        )
+        self.assertEqual(
+            chunk.content[0].text,
+            "a.py:1:x = 1\na.py-2-y = 2\n--\na.py:7:x = 7\na.py:8:z = 8\n"
+            "--\nb.py:1:[Omitted long line with 1 matches]",
+        )
+
+        self._replay(
+            [
+                json.dumps(
+                    {
+                        "type": "end",
+                        "data": {
+                            "path": {"text": "src"},
+                            "stats": {"matched_lines": 4},
+                        },
+                    },
+                ),
+            ],
+        )
+        chunk = await Grep()(pattern="x", path="src", output_mode="count")
+        self.assertEqual(chunk.content[0].text, "4")
+        self.assertListEqual(
+            chunk.metadata["matches"],
+            [{"path": "src", "count": 4}],
+        )
+
+    async def test_byte_budget(self) -> None:
+        """An unlimited search stops at the byte budget, marked partial."""
+        self._replay(["src/a.py"], endless=True)
+        chunk = await asyncio.wait_for(
+            Grep(max_output_bytes=1000)(pattern="x", path="src", head_limit=0),
+            timeout=10,
+        )
+        self.assertEqual(chunk.state, ToolResultState.SUCCESS)
+        self.assertIn("[Partial results:", chunk.content[0].text)
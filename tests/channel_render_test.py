@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Tests for the throttled, incremental rendering of channel streaming
+cards."""
+# pylint: disable=protected-access,missing-function-docstring
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from agentscope.app.channel._render import StreamingRenderer
+from agentscope.event import (
+    ReplyStartEvent,
+    TextBlockDeltaEvent,
+    TextBlockStartEvent,
+    ThinkingBlockDeltaEvent,
+    ThinkingBlockStartEvent,
+)
+
+_RID = "reply-1"
+
+
+def _renderer(**kwargs: bool) -> StreamingRenderer:
+    renderer = StreamingRenderer(0.5, 2.0, **kwargs)
+    renderer.feed(
+        ReplyStartEvent(session_id="s", reply_id=_RID, name="assistant"),
+    )
+    return renderer
+
+
+class StreamingRendererTest(IsolatedAsyncioTestCase):
+    """The streaming renderer folds events and renders on demand."""
+
+    async def test_render_reuses_unchanged_blocks(self) -> None:
+        renderer = _renderer(show_thinking=True)
+        renderer.feed(ThinkingBlockStartEvent(reply_id=_RID, block_id="th"))
+        renderer.feed(
+            ThinkingBlockDeltaEvent(reply_id=_RID, block_id="th", delta="x"),
+        )
+        renderer.feed(TextBlockStartEvent(reply_id=_RID, block_id="t"))
+        renderer.feed(
+            TextBlockDeltaEvent(reply_id=_RID, block_id="t", delta="Hi"),
+        )
+        self.assertEqual(renderer.render(), "💭 x\nHi")
+
+        thinking_part = renderer._parts[0]
+        renderer.feed(
+            TextBlockDeltaEvent(reply_id=_RID, block_id="t", delta="!"),
+        )
+        self.assertEqual(renderer.render(), "💭 x\nHi!")
+        # The unchanged thinking block wasn't rendered again
+        self.assertIs(renderer._parts[0], thinking_part)
+
+    async def test_hidden_blocks_render_empty(self) -> None:
+        renderer = _renderer()
+        renderer.feed(ThinkingBlockStartEvent(reply_id=_RID, block_id="th"))
+        renderer.feed(
+            ThinkingBlockDeltaEvent(reply_id=_RID, block_id="th", delta="x"),
+        )
+        self.assertTrue(renderer.due())
+        self.assertEqual(renderer.render(), "")
+        self.assertFalse(renderer.due())
+
+        # An empty render doesn't delay the first text
+        renderer.feed(TextBlockStartEvent(reply_id=_RID, block_id="t"))
+        self.assertTrue(renderer.due())
+
+    async def test_due_is_throttled(self) -> None:
+        renderer = _renderer()
+        renderer.feed(TextBlockStartEvent(reply_id=_RID, block_id="t"))
+        renderer.feed(
+            TextBlockDeltaEvent(reply_id=_RID, block_id="t", delta="a"),
+        )
+        with patch("time.monotonic", return_value=100.0):
+            self.assertTrue(renderer.due())
+            self.assertEqual(renderer.render(), "a")
+            renderer.feed(
+                TextBlockDeltaEvent(reply_id=_RID, block_id="t", delta="b"),
+            )
+            self.assertFalse(renderer.due())
+        with patch("time.monotonic", return_value=100.5):
+            self.assertTrue(renderer.due())
+
+    async def test_interval_adapts_to_latency(self) -> None:
+        renderer = _renderer()
+        renderer.record_update(0.1)
+        self.assertEqual(renderer.interval, 0.5)
+
+        renderer.record_update(0.9)
+        # 2 * (0.1 + 0.3 * 0.8)
+        self.assertAlmostEqual(renderer.interval, 0.68)
+
+        for _ in range(20):
+            renderer.record_update(5.0)
+        self.assertEqual(renderer.interval, 2.0)
+
+        for _ in range(20):
+            renderer.record_update(0.0)
+        self.assertAlmostEqual(renderer.interval, 0.5)
@@ -22,6 +22,8 @@ Coverage
 * Wrong reply_id → event silently skipped
 * Missing block  → warning, no crash
 """
+import base64
+import copy
 from typing import Any
 from unittest.async_case import IsolatedAsyncioTestCase
 
@@ -55,6 +57,8 @@ from agentscope.event import (
 )
 from agentscope.message import (
     Msg,
+    MsgAccumulator,
+    TextBlock,
     ToolCallBlock,
     ToolResultBlock,
     ToolResultState,
@@ -989,6 +993,24 @@ class EventToMessageTest(IsolatedAsyncioTestCase):
                 msg=f"Mismatch after event[{idx}] ({event.type})",
             )
 
+    async def test_accumulator_stream(self) -> None:
+        """Folding the events with MsgAccumulator gives the same message as
+        applying them with append_event, after each non-delta event and at
+        the end."""
+        accumulator = MsgAccumulator(self.msg)
+        for idx, (event, expected) in enumerate(
+            zip(self.events, self.ground_truths),
+        ):
+            accumulator.append_event(event)
+            if not event.type.endswith("_DELTA"):
+                self.assertDictEqual(
+                    self.msg.model_dump(),
+                    expected,
+                    msg=f"Mismatch after event[{idx}] ({event.type})",
+                )
+        self.assertIs(accumulator.build(), self.msg)
+        self.assertDictEqual(self.msg.model_dump(), self.ground_truths[-1])
+
     async def test_wrong_reply_id_is_skipped(self) -> None:
         """An event whose reply_id does not match msg.id must be ignored."""
         original_dump = self.msg.model_dump()
@@ -1058,3 +1080,173 @@ class EventToMessageTest(IsolatedAsyncioTestCase):
 
     async def asyncTearDown(self) -> None:
         """No teardown needed."""
+
+
+class StreamAccumulationTest(IsolatedAsyncioTestCase):
+    """Test the accumulation of long streams, and that the accumulated
+    blocks are plain objects that copies and references agree on."""
+
+    async def asyncSetUp(self) -> None:
+        """Build an empty reply."""
+        self.msg = Msg(
+            id=_REPLY_ID,
+            name="TestAgent",
+            role="assistant",
+            content=[],
+        )
+
+    def _text_deltas(self, *deltas: str) -> list[TextBlockDeltaEvent]:
+        """Text deltas of the text block."""
+        return [
+            TextBlockDeltaEvent(
+                reply_id=_REPLY_ID,
+                block_id=_B_TEXT,
+                delta=delta,
+            )
+            for delta in deltas
+        ]
+
+    async def test_accumulator_builds_long_stream(self) -> None:
+        """The deltas are joined once, in build."""
+        accumulator = MsgAccumulator(self.msg)
+        accumulator.append_event(
+            TextBlockStartEvent(reply_id=_REPLY_ID, block_id=_B_TEXT),
+        )
+        for event in self._text_deltas(*(str(i % 10) for i in range(10000))):
+            accumulator.append_event(event)
+
+        # The block isn't touched until the accumulator is built
+        self.assertEqual(self.msg.content[0].text, "")
+        accumulator.build()
+        self.assertEqual(self.msg.get_text_content(), "0123456789" * 1000)
+
+        for event in self._text_deltas("!"):
+            accumulator.append_event(event)
+        accumulator.append_event(
+            TextBlockEndEvent(reply_id=_REPLY_ID, block_id=_B_TEXT),
+        )
+        self.assertEqual(
+            self.msg.get_text_content(),
+            "0123456789" * 1000 + "!",
+        )
+
+    async def test_shallow_copy_does_not_duplicate_deltas(self) -> None:
+        """Shallow copies share the blocks without replaying the deltas."""
+        self.msg.append_event(
+            TextBlockStartEvent(reply_id=_REPLY_ID, block_id=_B_TEXT),
+        )
+        for event in self._text_deltas("hel", "lo"):
+            self.msg.append_event(event)
+
+        for copied in (self.msg.model_copy(), copy.copy(self.msg)):
+            self.assertEqual(copied.get_text_content(), "hello")
+            self.assertEqual(self.msg.get_text_content(), "hello")
+            self.assertEqual(copied, self.msg)
+
+        deep = copy.deepcopy(self.msg)
+        for event in self._text_deltas("!"):
+            self.msg.append_event(event)
+        self.assertEqual(deep.get_text_content(), "hello")
+        self.assertEqual(self.msg.get_text_content(), "hello!")
+
+    async def test_held_block_reference_sees_deltas(self) -> None:
+        """A block held across deltas agrees with the serialized message."""
+        self.msg.append_event(
+            TextBlockStartEvent(reply_id=_REPLY_ID, block_id=_B_TEXT),
+        )
+        block = self.msg.content[0]
+        for event in self._text_deltas("a", "b", "c"):
+            self.msg.append_event(event)
+        self.assertEqual(block.text, "abc")
+        self.assertEqual(self.msg.model_dump()["content"][0]["text"], "abc")
+
+        accumulator = MsgAccumulator(self.msg)
+        for event in self._text_deltas("d", "e"):
+            accumulator.append_event(event)
+        accumulator.build()
+        self.assertEqual(block.text, "abcde")
+
+    async def test_tool_result_text_around_data(self) -> None:
+        """Text deltas around a data delta end up in separate outputs."""
+        accumulator = MsgAccumulator(self.msg)
+        accumulator.append_event(
+            ToolResultStartEvent(
+                reply_id=_REPLY_ID,
+                tool_call_id=_TC_IMG,
+                tool_call_name="screenshot",
+            ),
+        )
+        for delta in ["a", "b"]:
+            accumulator.append_event(
+                ToolResultTextDeltaEvent(
+                    reply_id=_REPLY_ID,
+                    tool_call_id=_TC_IMG,
+                    delta=delta,
+                ),
+            )
+        accumulator.append_event(
+            ToolResultDataDeltaEvent(
+                reply_id=_REPLY_ID,
+                tool_call_id=_TC_IMG,
+                block_id=_RES_DATA_B,
+                media_type="image/png",
+                data=base64.b64encode(b"png").decode(),
+            ),
+        )
+        for delta in ["c", "d"]:
+            accumulator.append_event(
+                ToolResultTextDeltaEvent(
+                    reply_id=_REPLY_ID,
+                    tool_call_id=_TC_IMG,
+                    delta=delta,
+                ),
+            )
+
+        output = accumulator.build().content[0].output
+        self.assertListEqual(
+            [(block.type, getattr(block, "text", None)) for block in output],
+            [("text", "ab"), ("data", None), ("text", "cd")],
+        )
+
+    async def test_data_deltas_are_concatenated_as_bytes(self) -> None:
+        """Independently padded base64 deltas decode to the joined bytes."""
+        accumulator = MsgAccumulator(self.msg)
+        accumulator.append_event(
+            DataBlockStartEvent(
+                reply_id=_REPLY_ID,
+                block_id=_B_DATA,
+                media_type="audio/pcm",
+            ),
+        )
+        for chunk in [b"a", b"bc", b"def"]:
+            accumulator.append_event(
+                DataBlockDeltaEvent(
+                    reply_id=_REPLY_ID,
+                    block_id=_B_DATA,
+                    data=base64.b64encode(chunk).decode(),
+                    media_type="audio/pcm",
+                ),
+            )
+        self.assertEqual(
+            base64.b64decode(accumulator.build().content[0].source.data),
+            b"abcdef",
+        )
+
+    async def test_index_follows_external_content_changes(self) -> None:
+        """The block index stays correct when the content is modified
+        outside append_event."""
+        self.msg.append_event(
+            TextBlockStartEvent(reply_id=_REPLY_ID, block_id=_B_TEXT),
+        )
+        self.msg.content.insert(0, TextBlock(id="inserted", text="x"))
+        for event in self._text_deltas("y"):
+            self.msg.append_event(event)
+        self.assertListEqual(
+            [block.text for block in self.msg.content],
+            ["x", "y"],
+        )
+
+        self.msg.content = [TextBlock(id=_B_TEXT, text="z")]
+        for event in self._text_deltas("!"):
+            self.msg.append_event(event)
+        self.assertEqual(self.msg.get_text_content(), "z!")
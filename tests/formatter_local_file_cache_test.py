@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Tests for the base64 encodings of local files reused across the
+``format`` calls of every chat formatter."""
+import base64
+import os
+import shutil
+import tempfile
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
+
+from agentscope.formatter import (
+    AnthropicChatFormatter,
+    DashScopeChatFormatter,
+    FormatterBase,
+    GeminiChatFormatter,
+    MoonshotChatFormatter,
+    OllamaChatFormatter,
+    OpenAIChatFormatter,
+)
+from agentscope.formatter import _formatter_base
+from agentscope.message import DataBlock, TextBlock, URLSource, UserMsg
+
+_FORMATTERS: list[type[FormatterBase]] = [
+    AnthropicChatFormatter,
+    DashScopeChatFormatter,
+    GeminiChatFormatter,
+    MoonshotChatFormatter,
+    OllamaChatFormatter,
+    OpenAIChatFormatter,
+]
+
+
+def _write(path: str, data: bytes, mtime_ns: int) -> None:
+    """Write a file with a given modification time."""
+    with open(path, "wb") as f:
+        f.write(data)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class LocalFileFormattingTest(IsolatedAsyncioTestCase):
+    """Every chat formatter reads an unchanged local file once."""
+
+    async def asyncSetUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "image.png")
+        _write(self.path, b"first image", 10**18)
+        _formatter_base._LOCAL_FILE_CACHE.clear()
+
+    async def asyncTearDown(self) -> None:
+        shutil.rmtree(self.root)
+        _formatter_base._LOCAL_FILE_CACHE.clear()
+
+    def _msgs(self) -> list[UserMsg]:
+        """A message with a local image."""
+        return [
+            UserMsg(
+                name="user",
+                content=[
+                    TextBlock(text="What is in the image?"),
+                    DataBlock(
+                        source=URLSource(
+                            url=f"file://{self.path}",
+                            media_type="image/png",
+                        ),
+                    ),
+                ],
+            ),
+        ]
+
+    async def test_reads_once_until_changed(self) -> None:
+        """Formatting twice reads the file once and gives the same
+        result; a changed file is read again."""
+        first = base64.b64encode(b"first image").decode()
+        second = base64.b64encode(b"second image").decode()
+        for formatter_class in _FORMATTERS:
+            with self.subTest(formatter=formatter_class.__name__):
+                _write(self.path, b"first image", 10**18)
+                _formatter_base._LOCAL_FILE_CACHE.clear()
+                formatter = formatter_class(input_types=["image/*"])
+
+                with patch.object(
+                    _formatter_base,
+                    "open",
+                    side_effect=open,
+                    create=True,
+                ) as opened:
+                    formatted = await formatter.format(self._msgs())
+                    again = await formatter.format(self._msgs())
+                    self.assertEqual(formatted, again)
+                    self.assertIn(first, str(formatted))
+                    self.assertEqual(opened.call_count, 1)
+
+                    _write(self.path, b"second image", 10**18 + 1)
+                    changed = await formatter.format(self._msgs())
+                    self.assertIn(second, str(changed))
+                    self.assertEqual(opened.call_count, 2)
+
+    async def test_missing_file_still_raises(self) -> None:
+        """A file that does not exist raises from ``open``."""
+        os.remove(self.path)
+        with self.assertRaises(FileNotFoundError):
+            await OpenAIChatFormatter(input_types=["image/*"]).format(
+                self._msgs(),
+            )
+
+
+class LocalFileCacheTest(TestCase):
+    """Eviction and counters of :class:`_LocalFileCache`."""
+
+    def test_bounded_by_size(self) -> None:
+        """The least recently used encodings are evicted beyond the
+        budget, and larger files are not kept."""
+        with tempfile.TemporaryDirectory() as root:
+            paths = []
+            for name in ("a", "b", "c"):
+                paths.append(os.path.join(root, name))
+                _write(paths[-1], b"x" * 6, 10**18)
+            big = os.path.join(root, "big")
+            _write(big, b"x" * 30, 10**18)
+
+            cache = _formatter_base._LocalFileCache(max_bytes=20)
+            for path in paths:
+                cache.read_base64(path)
+            self.assertEqual(
+                [key[0] for key in cache._entries],
+                [os.path.abspath(p) for p in paths[1:]],
+            )
+            cache.read_base64(big)
+            self.assertEqual(len(cache._entries), 2)
+            self.assertEqual(cache._size, 16)
+
+    def test_stats(self) -> None:
+        """Hits, misses and evictions are counted until cleared."""
+        with tempfile.TemporaryDirectory() as root:
+            paths = []
+            for name in ("a", "b", "c"):
+                paths.append(os.path.join(root, name))
+                _write(paths[-1], b"x" * 6, 10**18)
+
+            cache = _formatter_base._LocalFileCache(max_bytes=20)
+            cache.read_base64(paths[0])
+            cache.read_base64(paths[0])
+            cache.read_base64(paths[1])
+            cache.read_base64(paths[2])
+            self.assertEqual(
+                cache.stats,
+                {
+                    "size": 2,
+                    "bytes": 16,
+                    "hits": 1,
+                    "misses": 3,
+                    "evictions": 1,
+                },
+            )
+
+            cache.clear()
+            self.assertEqual(
+                cache.stats,
+                {
+                    "size": 0,
+                    "bytes": 0,
+                    "hits": 0,
+                    "misses": 0,
+                    "evictions": 0,
+                },
+            )
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Unit tests for the shared HTTP transport pool."""
+import asyncio
+import gc
+import os
+from unittest.async_case import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+import httpx
+import openai
+
+from agentscope._utils._http_pool import (
+    HTTPTransportPool,
+    _get_backend,
+    _with_pooled_http_client,
+    _with_pooled_transport,
+)
+
+
+class _KeepAliveServer:
+    """A local HTTP/1.1 server answering with keep-alive responses and
+    counting the connections it accepts."""
+
+    def __init__(self) -> None:
+        """Initialize the server."""
+        self.connections = 0
+        self.server: asyncio.Server | None = None
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answer every request of a connection."""
+        self.connections += 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok",
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        """Start the server and return its base URL."""
+        self.server = await asyncio.start_server(
+            self._handle,
+            "127.0.0.1",
+            0,
+        )
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        self.server.close()
+
+
+class HTTPTransportPoolTest(IsolatedAsyncioTestCase):
+    """Test the shared HTTP transport pool."""
+
+    async def asyncSetUp(self) -> None:
+        """Start a local server."""
+        self.server = _KeepAliveServer()
+        self.base_url = await self.server.start()
+        self.pool = HTTPTransportPool()
+
+    async def asyncTearDown(self) -> None:
+        """Close the pool and the server."""
+        await self.pool.aclose()
+        await self.server.stop()
+
+    async def test_clients_share_connections(self) -> None:
+        """Clients of the same settings reuse each other's connections."""
+        for _ in range(3):
+            async with httpx.AsyncClient(
+                transport=self.pool.get_transport("test", self.base_url),
+            ) as client:
+                response = await client.get(f"{self.base_url}/x")
+                self.assertEqual(response.text, "ok")
+
+        self.assertEqual(self.server.connections, 1)
+        stats = self.pool.stats[f"test {self.base_url}"]
+        self.assertEqual(stats["refs"], 0)
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["max_in_flight"], 1)
+        self.assertEqual(stats["connections"], 1)
+        self.assertEqual(stats["idle_connections"], 1)
+
+    async def test_settings_are_isolated(self) -> None:
+        """Different providers or TLS settings get separate transports."""
+        for provider, verify in [("a", True), ("b", True), ("a", False)]:
+            client = httpx.AsyncClient(
+                transport=self.pool.get_transport(
+                    provider,
+                    self.base_url,
+                    verify=verify,
+                ),
+            )
+            await client.get(f"{self.base_url}/x")
+
+        self.assertEqual(len(self.pool._entries), 3)
+        self.assertEqual(self.server.connections, 3)
+
+    async def test_release_and_idle_eviction(self) -> None:
+        """Unreferenced transports are evicted after the idle TTL."""
+        self.pool.idle_ttl = 0.0
+        transport = self.pool.get_transport("test", self.base_url)
+        client = httpx.AsyncClient(transport=transport)
+        await client.get(f"{self.base_url}/x")
+        self.assertEqual(self.pool.stats[f"test {self.base_url}"]["refs"], 1)
+
+        # Evicting keeps the transports in use
+        self.pool.evict_idle()
+        self.assertEqual(len(self.pool._entries), 1)
+
+        del client, transport
+        gc.collect()
+        self.assertEqual(self.pool.stats[f"test {self.base_url}"]["refs"], 0)
+        self.pool.evict_idle()
+        self.assertDictEqual(self.pool.stats, {})
+
+    async def test_sdk_kwargs(self) -> None:
+        """The SDK keyword arguments are extended unless they configure
+        their own client or transport."""
+        self.assertEqual(_get_backend(httpx.AsyncClient), "httpx")
+        self.assertTrue(
+            _get_backend(openai.DefaultAsyncHttpxClient).startswith("httpx"),
+        )
+
+        own_client = {"http_client": object()}
+        self.assertIs(
+            _with_pooled_http_client(
+                own_client,
+                "openai",
+                None,
+                openai.DefaultAsyncHttpxClient,
+            ),
+            own_client,
+        )
+        kwargs = _with_pooled_http_client(
+            {"timeout": 10},
+            "openai",
+            self.base_url,
+            openai.DefaultAsyncHttpxClient,
+        )
+        self.assertEqual(kwargs["timeout"], 10)
+        client = openai.AsyncClient(
+            api_key="x",
+            base_url=self.base_url,
+            **kwargs,
+        )
+        self.assertIsNotNone(client)
+
+        proxied = {"proxy": "http://proxy:8080"}
+        self.assertIs(
+            _with_pooled_transport(proxied, "ollama", self.base_url),
+            proxied,
+        )
+        self.assertIn(
+            "transport",
+            _with_pooled_transport({}, "ollama", self.base_url),
+        )
+
+    async def test_default_base_url_uses_environment_proxy(self) -> None:
+        """A client built without a base URL gets the proxy of the SDK's
+        default URL, as httpx ignores the environment for it."""
+        env = {"HTTPS_PROXY": "http://proxy:8080"}
+        with patch.dict(os.environ, env, clear=True):
+            kwargs = _with_pooled_http_client(
+                {},
+                "openai",
+                None,
+                openai.DefaultAsyncHttpxClient,
+            )
+            transport = kwargs["http_client"]._transport
+            self.assertEqual(transport._entry.key.proxy, "http://proxy:8080")
+            self.assertEqual(
+                self.pool.get_transport("unknown", None)._entry.key.proxy,
+                "http://proxy:8080",
+            )
+            # Ollama defaults to a local HTTP URL
+            self.assertIsNone(
+                self.pool.get_transport("ollama", None)._entry.key.proxy,
+            )
+
+        env["NO_PROXY"] = "api.openai.com"
+        with patch.dict(os.environ, env, clear=True):
+            self.assertIsNone(
+                self.pool.get_transport("openai", None)._entry.key.proxy,
+            )
@@ -80,6 +80,47 @@ class TestQueuePrimitive(IsolatedAsyncioTestCase):
         self.assertEqual([p for _id, p in b], [{"x": 2}])
 
 
+class TestClaimQueue(IsolatedAsyncioTestCase):
+    """Mode B — ``queue_claim`` + ``queue_ack`` semantics."""
+
+    async def asyncSetUp(self) -> None:
+        self._stack = AsyncExitStack()
+        self.bus = await self._stack.enter_async_context(
+            InMemoryMessageBus(),
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self._stack.aclose()
+
+    async def test_entries_go_to_one_consumer_until_acked(self) -> None:
+        """Each entry is claimed by one consumer; an unacked entry is
+        claimed again once idle, an acked one is gone."""
+        for i in range(3):
+            await self.bus.queue_push("k", {"i": i})
+
+        first = await self.bus.queue_claim("k", "g", "c1", max_count=2)
+        second = await self.bus.queue_claim("k", "g", "c2")
+        self.assertEqual([p["i"] for _id, p in first], [0, 1])
+        self.assertEqual([p["i"] for _id, p in second], [2])
+        self.assertEqual(await self.bus.queue_claim("k", "g", "c2"), [])
+
+        await self.bus.queue_ack("k", "g", [first[0][0], second[0][0]])
+        reclaimed = await self.bus.queue_claim(
+            "k",
+            "g",
+            "c2",
+            reclaim_idle_secs=0,
+        )
+        self.assertEqual(reclaimed, [first[1]])
+
+        await self.bus.queue_ack("k", "g", [first[1][0], "0-1"])
+        self.assertEqual(
+            await self.bus.queue_claim("k", "g", "c1", reclaim_idle_secs=0),
+            [],
+        )
+        self.assertEqual(await self.bus.queue_length("k"), 0)
+
+
 class TestLogPrimitive(IsolatedAsyncioTestCase):
     """Mode C — replay log: append / read with cursor / trim."""
 
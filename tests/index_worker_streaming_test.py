@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Tests for streaming parsers and the pipelined parse → chunk → embed
+of the index worker."""
+import io
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Iterator
+from unittest import IsolatedAsyncioTestCase
+
+from agentscope.app._service._index_worker import IndexWorker
+from agentscope.app.rag.blob_store import LocalBlobStore
+from agentscope.message import TextBlock
+from agentscope.rag import (
+    Chunk,
+    ChunkerBase,
+    ParserBase,
+    Section,
+    TextParser,
+)
+
+
+class _LineParser(ParserBase):
+    """Yield one section per line of a file, recording its progress."""
+
+    supported_media_types = ["text/plain"]
+    streaming = True
+
+    def __init__(self, fail_at: int | None = None) -> None:
+        self.fail_at = fail_at
+        self.exhausted = False
+
+    async def parse(self, file: bytes | str, filename: str) -> list[Section]:
+        """Return every line section."""
+        return list(self.iter_sections(file, filename))
+
+    def iter_sections(
+        self,
+        file: bytes | str,
+        filename: str,
+    ) -> Iterator[Section]:
+        """Yield the lines of the file one at a time."""
+        with open(file, "rb") as fp:
+            for index, line in enumerate(fp):
+                if index == self.fail_at:
+                    raise ValueError(f"Bad line {index}")
+                yield Section(
+                    content=TextBlock(text=line.decode().strip()),
+                    source=filename,
+                    metadata={"line": index},
+                )
+        self.exhausted = True
+
+
+class _WholeParser(ParserBase):
+    """A parser that only implements ``parse``."""
+
+    supported_media_types = ["text/plain"]
+
+    async def parse(self, file: bytes | str, filename: str) -> list[Section]:
+        """Return the whole file as one section."""
+        return [
+            Section(content=TextBlock(text=file.decode()), source=filename),
+        ]
+
+
+class _JoiningChunker(ChunkerBase):
+    """Join all the sections into one chunk, recording the calls."""
+
+    chunker_type = "joining"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[int] = []
+
+    async def chunk(self, sections: list[Section]) -> list[Chunk]:
+        """Return one chunk of all the section texts."""
+        self.calls.append(len(sections))
+        return [
+            Chunk(
+                content=TextBlock(
+                    text=" ".join(s.content.text for s in sections),
+                ),
+                source=sections[0].source,
+                chunk_index=0,
+                total_chunks=1,
+            ),
+        ]
+
+
+class _Knowledge:
+    """Record the embedding calls."""
+
+    def __init__(self, parser: _LineParser | None = None) -> None:
+        self.parser = parser
+        self.calls: list[tuple[int, bool]] = []
+
+    async def embedding_model(self, contents: list) -> SimpleNamespace:
+        """Embed each content as its length."""
+        self.calls.append(
+            (len(contents), self.parser is not None and self.parser.exhausted),
+        )
+        return SimpleNamespace(
+            embeddings=[[float(len(c.text))] for c in contents],
+        )
+
+
+class ParseStreamTest(IsolatedAsyncioTestCase):
+    """:meth:`ParserBase.parse_stream`."""
+
+    async def test_streaming_and_whole_parsers(self) -> None:
+        """A streaming parser yields lazily; another one yields the
+        result of ``parse``."""
+        with tempfile.NamedTemporaryFile("wb", suffix=".txt") as fp:
+            fp.write(b"a\nb\n")
+            fp.flush()
+            parser = _LineParser()
+            stream = parser.parse_stream(fp.name, "f.txt")
+            first = await anext(stream)
+            self.assertEqual(first.content.text, "a")
+            self.assertFalse(parser.exhausted)
+            rest = [section async for section in stream]
+            self.assertEqual([s.metadata["line"] for s in rest], [1])
+
+        whole = [s async for s in _WholeParser().parse_stream(b"x", "f")]
+        self.assertEqual(whole[0].content.text, "x")
+        text = [s async for s in TextParser().parse_stream(b"hi", "f")]
+        self.assertEqual(text[0].content.text, "hi")
+
+
+class StreamingPipelineTest(IsolatedAsyncioTestCase):
+    """:meth:`IndexWorker._stream_chunks` over a local blob store."""
+
+    async def asyncSetUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        self.blob_store = await self.enterAsyncContext(
+            LocalBlobStore(self.root),
+        )
+        self.blob_uri = await self.blob_store.write_stream(
+            key="doc.txt",
+            stream=io.BytesIO(b"".join(b"line %d\n" % i for i in range(7))),
+        )
+
+    async def asyncTearDown(self) -> None:
+        shutil.rmtree(self.root)
+
+    def _worker(self, **kwargs: Any) -> IndexWorker:
+        """Build a worker over the blob store."""
+        return IndexWorker(
+            storage=None,
+            blob_store=self.blob_store,
+            knowledge_base_manager=None,
+            parsers=[_LineParser()],
+            node_id="node",
+            **kwargs,
+        )
+
+    async def test_embeds_while_parsing(self) -> None:
+        """Full batches are embedded before the parser is done and the
+        chunks are numbered across the document."""
+        parser = _LineParser()
+        knowledge = _Knowledge(parser)
+        worker = self._worker(embed_batch_size=3)
+        chunker = worker._resolve_chunker_from_record(
+            SimpleNamespace(data=SimpleNamespace(chunker_config=None)),
+        )
+        chunks, embeddings = await worker._stream_chunks(
+            knowledge,
+            parser,
+            chunker,
+            self.blob_uri,
+            "doc.txt",
+        )
+
+        self.assertEqual([n for n, _ in knowledge.calls], [3, 3, 1])
+        self.assertFalse(knowledge.calls[0][1])
+        self.assertEqual([c.chunk_index for c in chunks], list(range(7)))
+        self.assertEqual({c.total_chunks for c in chunks}, {7})
+        self.assertEqual(len(embeddings), 7)
+
+    async def test_chunker_not_section_local_gets_all_sections(
+        self,
+    ) -> None:
+        """A chunker that does not opt into section-local chunking is
+        called once with the whole section list."""
+        chunker = _JoiningChunker()
+        chunks, embeddings = await self._worker()._stream_chunks(
+            _Knowledge(),
+            _LineParser(),
+            chunker,
+            self.blob_uri,
+            "doc.txt",
+        )
+
+        self.assertEqual(chunker.calls, [7])
+        self.assertEqual(
+            [c.content.text for c in chunks],
+            [" ".join(f"line {i}" for i in range(7))],
+        )
+        self.assertEqual(len(embeddings), 1)
+
+    async def test_process_pool(self) -> None:
+        """A pooled streaming parser hands its sections back in order and
+        its errors surface."""
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            worker = self._worker(parser_executor=pool)
+            sections = [
+                s
+                async for s in worker._iter_sections(
+                    _LineParser(),
+                    self.blob_uri,
+                    "doc.txt",
+                )
+            ]
+            self.assertEqual(
+                [s.content.text for s in sections],
+                [f"line {i}" for i in range(7)],
+            )
+
+            with self.assertRaisesRegex(ValueError, "Bad line 4"):
+                async for _ in worker._iter_sections(
+                    _LineParser(fail_at=4),
+                    self.blob_uri,
+                    "doc.txt",
+                ):
+                    pass
+
+    async def test_whole_parser_gets_bytes(self) -> None:
+        """A parser that does not stream still receives the bytes."""
+        worker = self._worker()
+        sections = [
+            s
+            async for s in worker._iter_sections(
+                _WholeParser(),
+                self.blob_uri,
+                "doc.txt",
+            )
+        ]
+        self.assertEqual(len(sections), 1)
+        self.assertTrue(sections[0].content.text.startswith("line 0"))
+
+
+class EmbedBatchTest(IsolatedAsyncioTestCase):
+    """:meth:`IndexWorker._embed` splits cached chunks into batches."""
+
+    async def test_batches(self) -> None:
+        """Every chunk gets a vector, ``embed_batch_size`` per call."""
+        worker = IndexWorker(
+            storage=None,
+            blob_store=None,
+            knowledge_base_manager=None,
+            parsers=[],
+            node_id="node",
+            embed_batch_size=2,
+        )
+        knowledge = _Knowledge()
+        chunker = worker._resolve_chunker_from_record(
+            SimpleNamespace(data=SimpleNamespace(chunker_config=None)),
+        )
+        chunks = await chunker.chunk(
+            [
+                Section(content=TextBlock(text=t), source="f")
+                for t in ("a", "bb", "ccc")
+            ],
+        )
+        embeddings = await worker._embed(knowledge, chunks)
+        self.assertEqual(embeddings, [[1.0], [2.0], [3.0]])
+        self.assertEqual([n for n, _ in knowledge.calls], [2, 1])
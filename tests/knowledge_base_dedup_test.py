@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Tests for the content-addressed upload dedup of knowledge documents
+and the worker's cache of the outputs derived from shared content."""
+import io
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace
+from typing import Any
+from unittest import IsolatedAsyncioTestCase
+
+from agentscope.app._service._index_worker import IndexWorker
+from agentscope.app._service._knowledge_base import KnowledgeBaseService
+from agentscope.app.message_bus import InMemoryMessageBus
+from agentscope.app.rag.blob_store import LocalBlobStore
+from agentscope.app.storage import (
+    EmbeddingModelConfig,
+    KnowledgeBaseData,
+    KnowledgeBaseRecord,
+)
+from agentscope.message import TextBlock
+from agentscope.rag import Section
+
+
+class _Storage:
+    """Keep knowledge bases and documents in dicts."""
+
+    def __init__(self) -> None:
+        self.knowledge_bases: dict[str, KnowledgeBaseRecord] = {}
+        self.documents: dict[str, Any] = {}
+
+    async def list_knowledge_bases(self, user_id: str) -> list:
+        """List the knowledge bases of a user."""
+        return [
+            kb for kb in self.knowledge_bases.values() if kb.user_id == user_id
+        ]
+
+    async def list_knowledge_documents(
+        self,
+        user_id: str,
+        knowledge_base_id: str,
+    ) -> list:
+        """List the documents of a knowledge base."""
+        return [
+            doc
+            for doc in self.documents.values()
+            if doc.user_id == user_id
+            and doc.knowledge_base_id == knowledge_base_id
+        ]
+
+    async def list_knowledge_documents_by_content(
+        self,
+        user_id: str,
+        content_hash: str,
+    ) -> list:
+        """List the documents of a user with the given content."""
+        return [
+            doc
+            for doc in self.documents.values()
+            if doc.user_id == user_id and doc.data.content_hash == content_hash
+        ]
+
+    async def upsert_knowledge_document(self, _: str, record: Any) -> Any:
+        """Store a document."""
+        self.documents[record.id] = record
+        return record
+
+    async def insert_shared_knowledge_document(
+        self,
+        user_id: str,
+        record: Any,
+    ) -> bool:
+        """Store a document only while its blob is still referenced."""
+        for doc in await self.list_knowledge_documents_by_content(
+            user_id,
+            record.data.content_hash,
+        ):
+            if (
+                doc.id != record.id
+                and doc.data.blob_uri == record.data.blob_uri
+            ):
+                self.documents[record.id] = record
+                return True
+        return False
+
+    async def get_knowledge_document(self, *args: str) -> Any:
+        """Get a document."""
+        return self.documents.get(args[-1])
+
+    async def delete_knowledge_document(self, *args: str) -> None:
+        """Delete a document."""
+        self.documents.pop(args[-1], None)
+
+    async def update_knowledge_document_status(
+        self,
+        *_: Any,
+        **__: Any,
+    ) -> None:
+        """Accept the status transitions."""
+
+
+class _Knowledge:
+    """Record the vectors inserted and count the embedding calls."""
+
+    def __init__(self) -> None:
+        self.embed_calls = 0
+        self.inserted: dict[str, tuple] = {}
+
+    async def embedding_model(self, contents: list) -> SimpleNamespace:
+        """Embed each content as its length."""
+        self.embed_calls += 1
+        return SimpleNamespace(
+            embeddings=[[float(len(c.text))] for c in contents],
+        )
+
+    async def delete_document(self, document_id: str) -> None:
+        """Drop the vectors of a document."""
+        self.inserted.pop(document_id, None)
+
+    async def insert_document(self, **kwargs: Any) -> None:
+        """Record the chunks and vectors of a document."""
+        self.inserted[kwargs["document_id"]] = (
+            kwargs["chunks"],
+            kwargs["embeddings"],
+        )
+
+
+class _Parser:
+    """Parse text files into one section, counting the calls."""
+
+    supported_media_types = ["text/plain"]
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def parse(self, file: bytes, filename: str) -> list[Section]:
+        """Return the whole file as one section."""
+        self.calls += 1
+        return [
+            Section(content=TextBlock(text=file.decode()), source=filename),
+        ]
+
+
+class KnowledgeDocumentDedupTest(IsolatedAsyncioTestCase):
+    """Duplicate uploads share their blob and derived outputs."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up a service and a worker over one local blob store."""
+        self.root = tempfile.mkdtemp()
+        self.blob_store = await self.enterAsyncContext(
+            LocalBlobStore(self.root),
+        )
+        self.storage = _Storage()
+        for kb_id, dimensions in (("kb-1", 1), ("kb-2", 1), ("kb-3", 2)):
+            self.storage.knowledge_bases[kb_id] = KnowledgeBaseRecord(
+                id=kb_id,
+                user_id="user-1",
+                data=KnowledgeBaseData(
+                    name=kb_id,
+                    embedding_model_config=EmbeddingModelConfig(
+                        type="test",
+                        credential_id=f"cred-{kb_id}",
+                        model="embed",
+                        dimensions=dimensions,
+                    ),
+                    collection_name=kb_id,
+                ),
+            )
+        self.knowledge = _Knowledge()
+        storage = self.storage
+        knowledge = self.knowledge
+
+        class _Manager:
+            """Resolve the stub knowledge bases."""
+
+            async def get_knowledge_base(self, _: str, kb_id: str) -> Any:
+                """Return the record."""
+                return storage.knowledge_bases.get(kb_id)
+
+            async def get_knowledge(self, *_: str) -> _Knowledge:
+                """Return the shared runtime."""
+                return knowledge
+
+            async def delete_knowledge_base(self, _: str, kb_id: str) -> bool:
+                """Delete the record and cascade to its documents."""
+                for doc in await storage.list_knowledge_documents(
+                    "user-1",
+                    kb_id,
+                ):
+                    storage.documents.pop(doc.id)
+                return storage.knowledge_bases.pop(kb_id, None) is not None
+
+        class _Access:
+            """Grant the owner edit access."""
+
+            async def resolve_for_edit(self, user_id: str, *_: Any) -> tuple:
+                """Return the owner id."""
+                return user_id, None
+
+            async def resolve_knowledge_base(self, *args: str) -> Any:
+                """Return the record."""
+                return storage.knowledge_bases[args[-1]]
+
+        self.service = KnowledgeBaseService(
+            storage=self.storage,
+            knowledge_base_manager=_Manager(),
+            blob_store=self.blob_store,
+            message_bus=InMemoryMessageBus(),
+            resource_access_service=_Access(),
+        )
+        self.parser = _Parser()
+        self.worker = IndexWorker(
+            storage=self.storage,
+            blob_store=self.blob_store,
+            knowledge_base_manager=_Manager(),
+            parsers=[self.parser],
+            node_id="node",
+        )
+
+    async def asyncTearDown(self) -> None:
+        """Remove the blob store."""
+        shutil.rmtree(self.root)
+
+    async def _upload(self, kb_id: str, content: bytes, name: str) -> Any:
+        """Upload and index a document."""
+        record = await self.service.register_document(
+            "user-1",
+            kb_id,
+            name,
+            io.BytesIO(content),
+            len(content),
+            "text/plain",
+        )
+        await self.worker._run_pipeline("user-1", kb_id, record.id)
+        return record
+
+    def _blob_files(self) -> list[str]:
+        """List the files in the blob store."""
+        return sorted(
+            os.path.relpath(os.path.join(root, name), self.root)
+            for root, _, names in os.walk(self.root)
+            for name in names
+        )
+
+    async def test_duplicates_share_blob_and_outputs(self) -> None:
+        """A duplicate is neither stored, parsed nor embedded again, and
+        the shared blobs go with the last reference."""
+        first = await self._upload("kb-1", b"handbook", "a.txt")
+        second = await self._upload("kb-2", b"handbook", "b.txt")
+
+        self.assertEqual(first.data.blob_uri, second.data.blob_uri)
+        self.assertEqual(first.data.derived_uri, second.data.derived_uri)
+        self.assertEqual(len(self._blob_files()), 2)
+        self.assertEqual(self.parser.calls, 1)
+        self.assertEqual(self.knowledge.embed_calls, 1)
+        chunks, vectors = self.knowledge.inserted[second.id]
+        self.assertEqual(chunks[0].source, "b.txt")
+        self.assertEqual(vectors, self.knowledge.inserted[first.id][1])
+
+        # Another embedding configuration reuses the chunks only
+        await self._upload("kb-3", b"handbook", "c.txt")
+        self.assertEqual(self.parser.calls, 1)
+        self.assertEqual(self.knowledge.embed_calls, 2)
+
+        # Different content gets its own blob
+        await self._upload("kb-1", b"other", "d.txt")
+        self.assertEqual(len(self._blob_files()), 4)
+
+        await self.service.delete_document("user-1", "kb-1", first.id)
+        await self.service.delete_knowledge_base("user-1", "kb-3")
+        self.assertEqual(len(self._blob_files()), 4)
+        await self.service.delete_document("user-1", "kb-2", second.id)
+        self.assertEqual(len(self._blob_files()), 2)
+
+    async def test_upload_racing_last_delete_stores_own_blob(self) -> None:
+        """An upload that finds a duplicate deleted before it takes its
+        reference stores the content again instead of sharing the blob
+        the delete releases."""
+        first = await self._upload("kb-1", b"handbook", "a.txt")
+        lookup = self.storage.list_knowledge_documents_by_content
+        raced = []
+
+        async def _lookup_then_delete(user_id: str, content_hash: str) -> list:
+            """Delete the duplicate right after the upload looks it up."""
+            documents = await lookup(user_id, content_hash)
+            if not raced:
+                raced.append(True)
+                await self.service.delete_document("user-1", "kb-1", first.id)
+            return documents
+
+        self.storage.list_knowledge_documents_by_content = (  # type: ignore
+            _lookup_then_delete
+        )
+        second = await self._upload("kb-2", b"handbook", "b.txt")
+
+        self.assertNotEqual(second.data.blob_uri, first.data.blob_uri)
+        self.assertNotEqual(second.data.derived_uri, first.data.derived_uri)
+        self.assertNotIn(first.id, self.storage.documents)
+        async with self.blob_store.open(second.data.blob_uri) as fp:
+            self.assertEqual(await fp.read(), b"handbook")
+        self.assertEqual(len(self._blob_files()), 2)
+        self.assertEqual(self.parser.calls, 2)
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""Tests for the runtime metrics registry, its hooks and the ``/metrics``
+endpoint."""
+import tempfile
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from fastapi.testclient import TestClient
+from utils import MockModel
+
+from agentscope import (
+    MetricsRegistry,
+    get_metrics_registry,
+    set_metrics_registry,
+)
+from agentscope.app import create_app
+from agentscope.app.message_bus import InMemoryMessageBus, MessageBusKeys
+from agentscope.app.storage import AsyncSQLAlchemyStorage
+from agentscope.app.workspace_manager import LocalWorkspaceManager
+from agentscope.message import TextBlock, UserMsg
+from agentscope.model import ChatResponse
+
+
+def _sample(registry: MetricsRegistry, line_prefix: str) -> float:
+    """Read the value of the first sample line starting with a prefix."""
+    for line in registry.render().splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"No sample {line_prefix!r}")
+
+
+class MetricsRegistryTest(TestCase):
+    """Prometheus text rendering of the metric kinds."""
+
+    def test_render(self) -> None:
+        """Counters, gauges and cumulative histogram buckets render in the
+        exposition format, with escaped label values."""
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls.", ["tool"])
+        calls.labels('say "hi"').inc()
+        calls.labels('say "hi"').inc(2)
+        registry.gauge("depth", "Queue depth.").labels().set(4)
+        latency = registry.histogram(
+            "latency_seconds",
+            "Latency.",
+            buckets=[0.1, 1.0],
+        )
+        for value in (0.05, 0.5, 5.0):
+            latency.labels().observe(value)
+
+        self.assertEqual(
+            registry.render(),
+            "# HELP calls_total Calls.\n"
+            "# TYPE calls_total counter\n"
+            'calls_total{tool="say \\"hi\\""} 3.0\n'
+            "# HELP depth Queue depth.\n"
+            "# TYPE depth gauge\n"
+            "depth 4.0\n"
+            "# HELP latency_seconds Latency.\n"
+            "# TYPE latency_seconds histogram\n"
+            'latency_seconds_bucket{le="0.1"} 1\n'
+            'latency_seconds_bucket{le="1.0"} 2\n'
+            'latency_seconds_bucket{le="+Inf"} 3\n'
+            "latency_seconds_sum 5.55\n"
+            "latency_seconds_count 3\n",
+        )
+
+    def test_conflicting_registration(self) -> None:
+        """A name keeps its kind and labels."""
+        registry = MetricsRegistry()
+        registry.counter("calls_total", "Calls.", ["tool"])
+        self.assertIs(
+            registry.counter("calls_total", "Calls.", ["tool"]),
+            registry.get("calls_total"),
+        )
+        with self.assertRaises(ValueError):
+            registry.gauge("calls_total", "Calls.", ["tool"])
+        with self.assertRaises(ValueError):
+            registry.counter("calls_total", "Calls.")
+        with self.assertRaises(ValueError):
+            registry.counter("calls_total", "Calls.", ["tool"]).labels()
+
+
+class MetricsHooksTest(IsolatedAsyncioTestCase):
+    """The message bus, storage and chat model hooks record into the
+    process-wide registry."""
+
+    async def asyncSetUp(self) -> None:
+        """Install a fresh registry."""
+        self.previous = get_metrics_registry()
+        self.registry = MetricsRegistry()
+        set_metrics_registry(self.registry)
+
+    async def asyncTearDown(self) -> None:
+        """Restore the previous registry."""
+        set_metrics_registry(self.previous)
+
+    async def test_message_bus_and_storage_operations(self) -> None:
+        """Each outermost operation is recorded once, by backend."""
+        bus = InMemoryMessageBus()
+        await bus.queue_push_many("q", [{"n": 1}, {"n": 2}])
+        await bus.queue_drain("q", max_count=10)
+        self.assertEqual(await bus.queue_length("q"), 0)
+
+        prefix = "agentscope_message_bus_operation_seconds_count"
+        self.assertEqual(
+            _sample(
+                self.registry,
+                f'{prefix}{{backend="InMemoryMessageBus",'
+                'operation="queue_drain"}',
+            ),
+            1,
+        )
+        # The default batch push goes through queue_push
+        self.assertEqual(
+            _sample(
+                self.registry,
+                f'{prefix}{{backend="InMemoryMessageBus",'
+                'operation="queue_push"}',
+            ),
+            2,
+        )
+
+        async with AsyncSQLAlchemyStorage(
+            "sqlite+aiosqlite:///:memory:",
+            create_tables=True,
+        ) as storage:
+            await storage.list_credentials("user-1")
+        self.assertEqual(
+            _sample(
+                self.registry,
+                "agentscope_storage_operation_seconds_count"
+                '{backend="AsyncSQLAlchemyStorage",'
+                'operation="list_credentials"}',
+            ),
+            1,
+        )
+
+    async def test_only_interface_operations(self) -> None:
+        """The public coroutines an implementation adds to the interface
+        are not recorded."""
+
+        class _Bus(InMemoryMessageBus):
+            """A bus with an extra public coroutine."""
+
+            async def queue_length(self, key: str) -> int | None:
+                """Count the queue entries."""
+                return await super().queue_length(key)
+
+            async def probe(self) -> bool:
+                """Answer that the bus is up."""
+                return True
+
+        bus = _Bus()
+        await bus.queue_length("q")
+        await bus.probe()
+
+        text = self.registry.render()
+        self.assertIn(
+            'backend="_Bus",operation="queue_length"',
+            text,
+        )
+        self.assertNotIn('operation="probe"', text)
+
+    async def test_chat_model_latencies(self) -> None:
+        """A streamed call records its first token and its duration."""
+        model = MockModel(model="mock-model")
+        model.set_responses(
+            [
+                [
+                    ChatResponse(
+                        content=[TextBlock(text="hi", id="t1")],
+                        is_last=False,
+                    ),
+                ],
+            ],
+        )
+        stream = await model(messages=[UserMsg(name="user", content="hi")])
+        async for _ in stream:
+            pass
+
+        for name in (
+            "agentscope_model_first_token_seconds",
+            "agentscope_model_call_seconds",
+        ):
+            self.assertEqual(
+                _sample(self.registry, f'{name}_count{{model="mock-model"}}'),
+                1,
+            )
+
+    async def test_disabled_registry(self) -> None:
+        """Without a registry the hooks record nothing and still work."""
+        set_metrics_registry(None)
+        bus = InMemoryMessageBus()
+        await bus.queue_push("q", {})
+        self.assertEqual(await bus.queue_length("q"), 1)
+        self.assertEqual(self.registry.render(), "")
+
+
+class MetricsRouterTest(IsolatedAsyncioTestCase):
+    """The endpoint of an app over the in-memory bus and SQLite."""
+
+    async def test_metrics_endpoint(self) -> None:
+        """A scrape renders the recorded metrics and the queue depths."""
+        previous = get_metrics_registry()
+        self.addCleanup(set_metrics_registry, previous)
+        set_metrics_registry(MetricsRegistry())
+
+        # pylint: disable=consider-using-with
+        workdir = self.enterContext(tempfile.TemporaryDirectory())
+        bus = InMemoryMessageBus()
+        app = create_app(
+            storage=AsyncSQLAlchemyStorage(
+                "sqlite+aiosqlite:///:memory:",
+                create_tables=True,
+            ),
+            message_bus=bus,
+            workspace_manager=LocalWorkspaceManager(workdir),
+            enable_index_worker=False,
+        )
+        await bus.queue_push(MessageBusKeys.index_tasks_queue(), {})
+        with TestClient(app) as client:
+            response = client.get("/metrics", headers={"X-User-ID": "u"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            response.headers["content-type"].startswith("text/plain"),
+        )
+        self.assertIn(
+            'agentscope_queue_depth{queue="index_tasks"} 1.0',
+            response.text,
+        )
+        self.assertIn(
+            'agentscope_queue_depth{queue="run_triggers"} 0.0',
+            response.text,
+        )
+        self.assertIn("agentscope_storage_operation_seconds", response.text)
+        self.assertIn(
+            'agentscope_formatter_file_cache{stat="hits"}',
+            response.text,
+        )
+
+        set_metrics_registry(None)
+        with TestClient(app) as client:
+            response = client.get("/metrics", headers={"X-User-ID": "u"})
+        self.assertEqual(response.status_code, 404)
@@ -14,8 +14,16 @@ from unittest.mock import AsyncMock, MagicMock
 
 from utils import AnyString
 
-from agentscope.message import TextBlock, ToolCallBlock, ThinkingBlock
-from agentscope.model import AnthropicChatModel
+from agentscope.message import (
+    AssistantMsg,
+    SystemMsg,
+    TextBlock,
+    ThinkingBlock,
+    ToolCallBlock,
+    ToolResultBlock,
+    UserMsg,
+)
+from agentscope.model import AnthropicChatModel, PromptCachePlanner
 from agentscope.credential import AnthropicCredential
 from agentscope.tool import ToolChoice
 
@@ -425,6 +433,146 @@ class TestAnthropicThinkingMode(IsolatedAsyncioTestCase):
 # ---------------------------------------------------------------------------
 
 
+class TestAnthropicPromptCache(IsolatedAsyncioTestCase):
+    """Tests for the automatic ``cache_control`` breakpoints."""
+
+    def setUp(self) -> None:
+        self.model = _make_model(stream=False)
+        self.model.parameters.prompt_cache_enable = True
+        self.mock_client = MagicMock()
+        self.model.client = self.mock_client
+        self.mock_create = AsyncMock(return_value=_mock_completion(text="hi"))
+        self.mock_client.messages.create = self.mock_create
+
+        self.tools = [
+            {
+                "type": "function",
+                "function": {
+                    "name": name,
+                    "description": f"The {name} tool.",
+                    "parameters": {"type": "object", "properties": {}},
+                },
+            }
+            for name in ["bash", "read"]
+        ]
+        self.msgs = [SystemMsg(name="system", content="Be helpful.")]
+        for i in range(3):
+            self.msgs.extend(
+                [
+                    UserMsg(name="user", content=f"Question {i}")
+                    if i == 0
+                    else AssistantMsg(
+                        name="assistant",
+                        content=[
+                            ThinkingBlock(thinking="hmm", signature="sig"),
+                            ToolCallBlock(id=f"c{i}", name="bash", input="{}"),
+                        ],
+                    ),
+                    AssistantMsg(
+                        name="assistant",
+                        content=[
+                            ToolResultBlock(
+                                id=f"c{i}",
+                                name="bash",
+                                output=f"result {i}",
+                            ),
+                        ],
+                    ),
+                ],
+            )
+
+    @staticmethod
+    def _breakpoints(blocks: list) -> list[int]:
+        return [i for i, b in enumerate(blocks) if "cache_control" in b]
+
+    async def test_breakpoints_within_limit(self) -> None:
+        """System, tools and the two latest boundaries are marked."""
+        await self.model(self.msgs, tools=self.tools)
+
+        kwargs = self.mock_create.call_args.kwargs
+        self.assertEqual(
+            kwargs["system"][-1]["cache_control"],
+            {"type": "ephemeral"},
+        )
+        self.assertEqual(self._breakpoints(kwargs["tools"]), [1])
+
+        marked = [
+            i
+            for i, msg in enumerate(kwargs["messages"])
+            if self._breakpoints(msg["content"])
+        ]
+        # The tool results end each iteration in a user message
+        self.assertEqual(marked, [3, 5])
+        self.assertEqual(kwargs["messages"][5]["role"], "user")
+
+        n_breakpoints = (
+            len(self._breakpoints(kwargs["system"]))
+            + len(self._breakpoints(kwargs["tools"]))
+            + len(marked)
+        )
+        self.assertLessEqual(n_breakpoints, 4)
+
+    async def test_thinking_block_not_marked(self) -> None:
+        """A breakpoint never lands on a thinking block."""
+        self.model.prompt_cache_planner = PromptCachePlanner(
+            boundary_roles=("assistant",),
+        )
+        await self.model(self.msgs, tools=self.tools)
+
+        messages = self.mock_create.call_args.kwargs["messages"]
+        self.assertEqual(messages[4]["content"][0]["type"], "thinking")
+        self.assertEqual(self._breakpoints(messages[4]["content"]), [1])
+
+    async def test_string_content_converted(self) -> None:
+        """A plain-string message is converted to a marked text block."""
+        await self.model([UserMsg(name="user", content="hi")])
+
+        messages = self.mock_create.call_args.kwargs["messages"]
+        self.assertEqual(self._breakpoints(messages[0]["content"]), [0])
+
+    async def test_disabled_by_default(self) -> None:
+        """No breakpoint is sent unless prompt caching is enabled."""
+        model = _make_model(stream=False)
+        self.assertFalse(model.parameters.prompt_cache_enable)
+        model.client = self.mock_client
+        await model(self.msgs, tools=self.tools)
+
+        kwargs = self.mock_create.call_args.kwargs
+        self.assertNotIn("cache_control", json.dumps(kwargs))
+
+    async def test_marks_not_carried_over(self) -> None:
+        """Marking one request doesn't leak into the next one."""
+        await self.model(self.msgs, tools=self.tools)
+        self.model.parameters.prompt_cache_enable = False
+        await self.model(self.msgs, tools=self.tools)
+
+        kwargs = self.mock_create.call_args.kwargs
+        self.assertNotIn("cache_control", json.dumps(kwargs))
+
+    def test_planner(self) -> None:
+        """The planner respects the budget and picks run ends."""
+        planner = PromptCachePlanner(max_breakpoints=3)
+        plan = planner.plan(
+            has_tools=True,
+            has_system=True,
+            message_roles=["user", "assistant", "tool", "tool", "assistant"],
+        )
+        self.assertTrue(plan.cache_system)
+        self.assertTrue(plan.cache_tools)
+        self.assertEqual(plan.message_indices, [3])
+
+        plan = PromptCachePlanner().plan(
+            has_tools=False,
+            has_system=False,
+            message_roles=["user", "assistant", "user", "assistant", "user"],
+        )
+        self.assertFalse(plan.cache_tools)
+        self.assertEqual(plan.message_indices, [2, 4])
+
+        with self.assertRaises(ValueError):
+            PromptCachePlanner(max_breakpoints=-1)
+
+
 class TestAnthropicStream(IsolatedAsyncioTestCase):
     """Tests for AnthropicChatModel in streaming mode."""
 
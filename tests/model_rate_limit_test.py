@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Unit tests for the chat model rate limiters and their integration in
+:meth:`agentscope.model.ChatModelBase.__call__`."""
+import asyncio
+import json
+import time
+from unittest.async_case import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock
+
+from utils import MockModel
+
+from agentscope.app.message_bus import (
+    InMemoryMessageBus,
+    MessageBusRateLimiter,
+)
+from agentscope.message import TextBlock, UserMsg
+from agentscope.model import (
+    ChatResponse,
+    ChatUsage,
+    RateLimit,
+    RateLimiterBase,
+    RateLimitPriority,
+    TokenBucketRateLimiter,
+)
+from agentscope.model._rate_limit import (
+    TokenBucket,
+    _get_retry_after,
+    _get_retry_delay,
+)
+
+
+class _RateLimitError(Exception):
+    """A provider rate-limit error carrying an HTTP response."""
+
+    def __init__(self, headers: dict) -> None:
+        """Attach a fake response with the given headers."""
+        super().__init__("429 Too Many Requests")
+        self.response = MagicMock(headers=headers)
+
+
+class _RetryableMockModel(MockModel):
+    """A mock model that retries ``_RateLimitError``."""
+
+    @classmethod
+    def _get_retryable_exceptions(cls) -> tuple[type[Exception], ...]:
+        """Retry the rate-limit error."""
+        return (_RateLimitError,)
+
+
+class TokenBucketTest(IsolatedAsyncioTestCase):
+    """Test the token bucket arithmetic."""
+
+    async def test_take_and_refill(self) -> None:
+        """Requests and tokens are taken, and refilled over time."""
+        limit = RateLimit(rpm=60, tpm=600)
+        bucket = TokenBucket.full(limit, now=0.0)
+
+        self.assertEqual(bucket.try_take(limit, 600, now=0.0), 0.0)
+        # The token bucket is empty: 100 tokens need 10 seconds
+        self.assertAlmostEqual(bucket.try_take(limit, 100, now=0.0), 10.0)
+        self.assertEqual(bucket.try_take(limit, 100, now=10.0), 0.0)
+        # The request bucket refilled up to its capacity
+        self.assertAlmostEqual(bucket.requests, 59)
+
+    async def test_oversized_estimate_is_capped(self) -> None:
+        """An estimate above the TPM budget is admitted on a full bucket."""
+        limit = RateLimit(tpm=100)
+        bucket = TokenBucket.full(limit, now=0.0)
+        self.assertEqual(bucket.try_take(limit, 1000, now=0.0), 0.0)
+        self.assertEqual(bucket.tokens, 0.0)
+
+    async def test_rpm_and_pause(self) -> None:
+        """The RPM budget and a pause both hold calls back."""
+        limit = RateLimit(rpm=2)
+        bucket = TokenBucket.full(limit, now=0.0)
+        self.assertEqual(bucket.try_take(limit, 0, now=0.0), 0.0)
+        self.assertEqual(bucket.try_take(limit, 0, now=0.0), 0.0)
+        self.assertAlmostEqual(bucket.try_take(limit, 0, now=0.0), 30.0)
+
+        bucket.paused_until = 100.0
+        self.assertAlmostEqual(bucket.try_take(limit, 0, now=60.0), 40.0)
+        self.assertEqual(bucket.try_take(limit, 0, now=100.0), 0.0)
+
+    async def test_adjust_is_bounded(self) -> None:
+        """Reconciliation charges and refunds within one minute of debt."""
+        limit = RateLimit(tpm=100)
+        bucket = TokenBucket.full(limit, now=0.0)
+        bucket.adjust(limit, 500)
+        self.assertEqual(bucket.tokens, -100.0)
+        bucket.adjust(limit, -500)
+        self.assertEqual(bucket.tokens, 100.0)
+
+
+class TokenBucketRateLimiterTest(IsolatedAsyncioTestCase):
+    """Test the in-process rate limiter."""
+
+    async def test_unlimited_model(self) -> None:
+        """Models without budgets are admitted immediately."""
+        limiter = TokenBucketRateLimiter(
+            limits={"limited": RateLimit(rpm=1)},
+        )
+        for _ in range(5):
+            await limiter.acquire("cred", "other", 100)
+        self.assertEqual(limiter.stats["admitted"], 0)
+
+    async def test_interactive_before_background(self) -> None:
+        """A waiting interactive call is admitted before a background call
+        that arrived earlier."""
+        limiter = TokenBucketRateLimiter(
+            default_limit=RateLimit(rpm=600),
+            max_poll_interval=0.05,
+        )
+        limiter._buckets["cred:m"] = TokenBucket(
+            requests=0,
+            tokens=0,
+            updated_at=time.monotonic(),
+        )
+
+        order = []
+
+        async def _call(name: str, priority: RateLimitPriority) -> None:
+            await limiter.acquire("cred", "m", 0, priority)
+            order.append(name)
+
+        background = asyncio.create_task(
+            _call("background", RateLimitPriority.BACKGROUND),
+        )
+        await asyncio.sleep(0.01)
+        interactive = asyncio.create_task(
+            _call("interactive", RateLimitPriority.INTERACTIVE),
+        )
+        await asyncio.sleep(0)
+        self.assertEqual(limiter.queue_depth, 2)
+
+        await asyncio.gather(background, interactive)
+
+        self.assertListEqual(order, ["interactive", "background"])
+        stats = limiter.stats
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["max_queue_depth"], 2)
+        self.assertEqual(stats["admitted"], 2)
+        self.assertEqual(stats["throttled"], 2)
+        self.assertGreater(stats["max_wait_time"], 0)
+
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        """A cancelled waiter is removed from the queue."""
+        limiter = TokenBucketRateLimiter(default_limit=RateLimit(rpm=1))
+        await limiter.acquire("cred", "m", 0)
+
+        task = asyncio.create_task(limiter.acquire("cred", "m", 0))
+        await asyncio.sleep(0.01)
+        self.assertEqual(limiter.queue_depth, 1)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(limiter.queue_depth, 0)
+
+
+class MessageBusRateLimiterTest(IsolatedAsyncioTestCase):
+    """Test the rate limiter sharing its buckets over the message bus."""
+
+    async def test_budget_shared_across_limiters(self) -> None:
+        """Two limiters on one bus, standing for two replicas, draw from
+        the same budget."""
+        bus = InMemoryMessageBus()
+        replica_1 = MessageBusRateLimiter(bus, RateLimit(rpm=2, tpm=100))
+        replica_2 = MessageBusRateLimiter(bus, RateLimit(rpm=2, tpm=100))
+        limit = replica_1.get_limit("m")
+
+        self.assertEqual(await replica_1._reserve("k", limit, 10), 0.0)
+        self.assertEqual(await replica_2._reserve("k", limit, 10), 0.0)
+        self.assertGreater(await replica_1._reserve("k", limit, 10), 0.0)
+        self.assertGreater(await replica_2._reserve("k", limit, 10), 0.0)
+
+        await replica_2.reconcile("cred", "m", 10, 50)
+        await replica_1.pause("cred", "m", 30)
+        raw = await bus.registry_getall(
+            "agentscope:rate_limit:cred:m",
+        )
+        bucket = TokenBucket.from_dict(json.loads(raw["bucket"]))
+        self.assertGreater(bucket.paused_until, time.time() + 20)
+        self.assertLess(bucket.tokens, 100 - 40 + 1)
+
+
+class ChatModelRateLimitTest(IsolatedAsyncioTestCase):
+    """Test the rate limiter integration in ``ChatModelBase.__call__``."""
+
+    async def asyncSetUp(self) -> None:
+        """The async setup method."""
+        self.messages = [UserMsg(name="user", content="x" * 400)]
+        self.limiter = TokenBucketRateLimiter(
+            default_limit=RateLimit(tpm=10000),
+        )
+
+    def _get_bucket(self, model: MockModel) -> TokenBucket:
+        """Get the limiter bucket of the model."""
+        return self.limiter._buckets[f"{model.credential.id}:{model.model}"]
+
+    async def test_reconcile_non_stream(self) -> None:
+        """The estimate is replaced by the reported usage."""
+        model = MockModel()
+        model.rate_limiter = self.limiter
+        model.set_responses(
+            [
+                ChatResponse(
+                    content=[TextBlock(text="hi")],
+                    is_last=True,
+                    usage=ChatUsage(
+                        input_tokens=1000,
+                        output_tokens=500,
+                        time=0.1,
+                    ),
+                ),
+            ],
+        )
+        await model(self.messages)
+
+        self.assertAlmostEqual(
+            self._get_bucket(model).tokens,
+            10000 - 1500,
+            delta=5,
+        )
+        self.assertEqual(self.limiter.stats["admitted"], 1)
+
+    async def test_reconcile_stream(self) -> None:
+        """The usage of the last streamed delta is reconciled once the
+        stream is consumed."""
+        model = MockModel()
+        model.rate_limiter = self.limiter
+        model.set_responses(
+            [
+                [
+                    ChatResponse(
+                        content=[TextBlock(text="hi", id="t")],
+                        is_last=False,
+                    ),
+                    ChatResponse(
+                        content=[],
+                        is_last=False,
+                        usage=ChatUsage(
+                            input_tokens=2000,
+                            output_tokens=1000,
+                            time=0.1,
+                        ),
+                    ),
+                ],
+            ],
+        )
+        async for _ in await model(self.messages):
+            pass
+
+        self.assertAlmostEqual(
+            self._get_bucket(model).tokens,
+            10000 - 3000,
+            delta=5,
+        )
+
+    async def test_failed_call_releases_estimate(self) -> None:
+        """A non-retryable error and a cancelled call release the
+        estimate they were admitted with."""
+        model = MockModel()
+        model.rate_limiter = self.limiter
+        model.set_responses([ValueError("bad request")])
+        with self.assertRaises(ValueError):
+            await model(self.messages)
+        self.assertAlmostEqual(self._get_bucket(model).tokens, 10000, delta=1)
+
+        model.set_responses([asyncio.CancelledError()])
+        res = await model(self.messages)
+        self.assertEqual(res.finished_reason.value, "interrupted")
+        self.assertAlmostEqual(self._get_bucket(model).tokens, 10000, delta=1)
+
+    async def test_abandoned_stream_releases_estimate(self) -> None:
+        """A stream failing mid-way releases its estimate, and a stream
+        closed by the caller is charged the usage it reported."""
+        model = MockModel()
+        model.rate_limiter = self.limiter
+        delta = ChatResponse(
+            content=[TextBlock(text="hi", id="t")],
+            is_last=False,
+        )
+        model.set_responses([[delta, RuntimeError("connection reset")]])
+        with self.assertRaises(RuntimeError):
+            async for _ in await model(self.messages):
+                pass
+        self.assertAlmostEqual(self._get_bucket(model).tokens, 10000, delta=1)
+
+        usage = ChatResponse(
+            content=[TextBlock(text="!", id="t")],
+            is_last=False,
+            usage=ChatUsage(input_tokens=300, output_tokens=200, time=0.1),
+        )
+        model.set_responses([[delta, usage, delta, delta]])
+        stream = await model(self.messages)
+        async for chunk in stream:
+            if chunk.usage is not None:
+                break
+        await stream.aclose()
+        self.assertAlmostEqual(
+            self._get_bucket(model).tokens,
+            10000 - 500,
+            delta=1,
+        )
+
+    async def test_structured_output_releases_estimate(self) -> None:
+        """The structured-output path releases the estimate of a call that
+        raises or is cancelled."""
+
+        class _FailingModel(MockModel):
+            """Raise the configured error from structured output."""
+
+            error: BaseException = ValueError("bad request")
+
+            async def _call_api_with_structured_output(
+                self,
+                *args: object,
+                **kwargs: object,
+            ) -> None:
+                """Raise."""
+                raise self.error
+
+        model = _FailingModel()
+        model.rate_limiter = self.limiter
+        for error in (ValueError("bad request"), asyncio.CancelledError()):
+            model.error = error
+            with self.assertRaises(type(error)):
+                await model.generate_structured_output(
+                    self.messages,
+                    {"type": "object", "properties": {}},
+                )
+            self.assertAlmostEqual(
+                self._get_bucket(model).tokens,
+                10000,
+                delta=1,
+            )
+
+    async def test_retry_after_pauses_credential(self) -> None:
+        """A rate-limit error refunds the estimate, pauses the credential
+        for its retry-after, and the next attempt waits for it."""
+        model = _RetryableMockModel()
+        model.rate_limiter = self.limiter
+        model.retry_delay = 0.0
+        model.set_responses(
+            [
+                _RateLimitError({"retry-after-ms": "100"}),
+                ChatResponse(content=[TextBlock(text="hi")], is_last=True),
+            ],
+        )
+
+        start = time.monotonic()
+        res = await model(self.messages)
+
+        self.assertEqual(res.content[0].text, "hi")
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+        self.assertEqual(model.cnt, 2)
+
+
+class RetryDelayTest(IsolatedAsyncioTestCase):
+    """Test the retry-after parsing and the jittered backoff."""
+
+    async def test_get_retry_after(self) -> None:
+        """Both retry-after headers are recognized."""
+        self.assertEqual(
+            _get_retry_after(_RateLimitError({"retry-after": "2"})),
+            2.0,
+        )
+        self.assertEqual(
+            _get_retry_after(_RateLimitError({"retry-after-ms": "1500"})),
+            1.5,
+        )
+        self.assertIsNone(_get_retry_after(_RateLimitError({})))
+        self.assertIsNone(_get_retry_after(ValueError()))
+
+    async def test_retry_after_is_capped(self) -> None:
+        """A long retry-after hint doesn't park the call indefinitely."""
+        error = _RateLimitError({"retry-after": "86400"})
+        self.assertEqual(_get_retry_after(error), 60.0)
+        self.assertLessEqual(_get_retry_delay(1.0, 0, error), 66.0)
+
+    async def test_base_class_is_abstract(self) -> None:
+        """The rate limiter base class can't be instantiated."""
+        with self.assertRaises(TypeError):
+            RateLimiterBase()  # pylint: disable=abstract-class-instantiated
+
+    async def test_get_retry_delay(self) -> None:
+        """The backoff grows exponentially and honours retry-after."""
+        error = ValueError()
+        for attempt in range(4):
+            delay = _get_retry_delay(1.0, attempt, error)
+            self.assertGreaterEqual(delay, 0.5 * 2**attempt)
+            self.assertLessEqual(delay, 2**attempt)
+
+        self.assertLessEqual(_get_retry_delay(1.0, 20, error), 60.0)
+        self.assertGreaterEqual(
+            _get_retry_delay(
+                0.1,
+                0,
+                _RateLimitError({"retry-after": "5"}),
+            ),
+            5.0,
+        )
@@ -5,6 +5,7 @@ import unittest
 from unittest.async_case import IsolatedAsyncioTestCase
 
 from agentscope.tool._builtin._bash_parser import BashCommandParser
+from agentscope.permission import PermissionContext
 from agentscope.tool import Bash
 
 
@@ -1342,3 +1343,40 @@ class BashParserDangerousCommandTest(IsolatedAsyncioTestCase):
     async def asyncTearDown(self) -> None:
         """Clean up test fixtures."""
         self.parser = None
+
+
+@unittest.skipIf(
+    sys.platform == "win32",
+    "Bash tool is not supported on Windows",
+)
+class BashParserCacheTest(IsolatedAsyncioTestCase):
+    """Test cases for the parse-once cache of BashCommandParser."""
+
+    async def test_one_parse_per_permission_check(self) -> None:
+        """All checks of one Bash call share a single parse."""
+        # pylint: disable=protected-access
+        tool = Bash()
+        parser = tool._bash_parser
+        command = "git add . && git commit -m x && rm -rf build > out.txt"
+        tool_input = {"command": command}
+
+        await tool.check_read_only(tool_input)
+        await tool.check_permissions(tool_input, PermissionContext())
+        await tool.generate_suggestions(tool_input)
+
+        self.assertEqual(parser.stats["misses"], 1)
+        self.assertGreater(parser.stats["hits"], 1)
+        # Cached answers are copies the caller may mutate
+        parser.extract_file_paths(command).clear()
+        self.assertIn(("rm", "build"), parser.extract_file_paths(command))
+
+    async def test_cache_is_bounded_lru(self) -> None:
+        """The least recently used parse is evicted first."""
+        parser = BashCommandParser(cache_size=2)
+        parser.parse("ls")
+        parser.parse("pwd")
+        parser.parse("ls")
+        parser.parse("cat x")
+        self.assertEqual(parser.stats, {"size": 2, "hits": 1, "misses": 3})
+        parser.parse("pwd")
+        self.assertEqual(parser.stats["misses"], 4)
@@ -820,3 +820,145 @@ class PermissionEngineBypassImmuneFieldTest(IsolatedAsyncioTestCase):
             {},
         )
         self.assertEqual(decision.behavior, PermissionBehavior.DENY)
+
+
+class _RuleByRuleBash(Bash):
+    """A Bash tool overriding ``match_rule`` only, so the engine matches
+    its rules one by one."""
+
+    async def match_rule(
+        self,
+        rule_content: str | None,
+        tool_input: dict,
+    ) -> bool:
+        """Delegate to the builtin matching."""
+        return await super().match_rule(rule_content, tool_input)
+
+
+class PermissionEngineCompiledRulesTest(IsolatedAsyncioTestCase):
+    """Test cases for the compiled rule matchers."""
+
+    BASH_RULES = [
+        "git push --force:*",
+        "npm run build",
+        "rm -rf *",
+        "git *",
+        "docker:*",
+        "echo \\*",
+        "* --no-verify",
+        "python -m *",
+    ]
+
+    COMMANDS = [
+        "git",
+        "git push --force origin main",
+        "git status",
+        "npm run build && npm test",
+        "rm -rf build",
+        "docker ps",
+        "dockerd",
+        "echo *",
+        "git commit --no-verify",
+        "python -m pytest",
+        "cargo build",
+    ]
+
+    async def _decisions(self, tool: ToolBase, key: str, values: list) -> list:
+        """Evaluate each value with a fresh engine over deny rules."""
+        context = PermissionContext(mode=PermissionMode.DEFAULT)
+        engine = PermissionEngine(context)
+        for rule_content in self.BASH_RULES:
+            engine.add_rule(
+                PermissionRule(
+                    tool_name="Bash",
+                    rule_content=rule_content,
+                    behavior=PermissionBehavior.DENY,
+                    source="test",
+                ),
+            )
+        decisions = []
+        for value in values:
+            decision = await engine.check_permission(tool, {key: value})
+            decisions.append(
+                decision.decision_reason
+                if decision.behavior == PermissionBehavior.DENY
+                else None,
+            )
+        return decisions
+
+    async def test_compiled_bash_rules_match_rule_by_rule(self) -> None:
+        """The compiled matcher picks the same first rule as matching the
+        rules one by one."""
+        compiled = await self._decisions(Bash(), "command", self.COMMANDS)
+        one_by_one = await self._decisions(
+            _RuleByRuleBash(),
+            "command",
+            self.COMMANDS,
+        )
+        self.assertEqual(compiled, one_by_one)
+        self.assertEqual(compiled[1], "Rule: git push --force:*")
+        self.assertEqual(compiled[8], "Rule: git *")
+        self.assertIsNone(compiled[-1])
+
+    async def test_rules_compiled_once_and_refreshed(self) -> None:
+        """Rules are compiled on first use, reused, and recompiled when
+        the context's rule list changes."""
+        context = PermissionContext(mode=PermissionMode.DEFAULT)
+        engine = PermissionEngine(context)
+        engine.add_rule(
+            PermissionRule(
+                tool_name="Write",
+                rule_content="src/**",
+                behavior=PermissionBehavior.ALLOW,
+                source="test",
+            ),
+        )
+        tool = Write()
+        calls = []
+        compile_rules = tool.compile_rules
+
+        def _counting(rule_contents: list) -> object:
+            calls.append(list(rule_contents))
+            return compile_rules(rule_contents)
+
+        tool.compile_rules = _counting
+
+        for path in ("src/a.py", "src/b/c.py"):
+            decision = await engine.check_permission(
+                tool,
+                {"file_path": path},
+            )
+            self.assertEqual(decision.behavior, PermissionBehavior.ALLOW)
+        self.assertEqual(calls, [["src/**"]])
+
+        # Rules added straight to the context are picked up too
+        context.deny_rules["Write"] = [
+            PermissionRule(
+                tool_name="Write",
+                rule_content="src/secret*",
+                behavior=PermissionBehavior.DENY,
+                source="test",
+            ),
+        ]
+        decision = await engine.check_permission(
+            tool,
+            {"file_path": "src/secret.txt"},
+        )
+        self.assertEqual(decision.behavior, PermissionBehavior.DENY)
+        self.assertEqual(decision.decision_reason, "Rule: src/secret*")
+
+        # A rule without content matches everything after its position
+        context.allow_rules["Write"].insert(
+            0,
+            PermissionRule(
+                tool_name="Write",
+                rule_content=None,
+                behavior=PermissionBehavior.ALLOW,
+                source="test",
+            ),
+        )
+        decision = await engine.check_permission(
+            tool,
+            {"file_path": "docs/a.md"},
+        )
+        self.assertEqual(decision.behavior, PermissionBehavior.ALLOW)
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Tests for the BM25 index and hybrid search in :class:`KnowledgeBase`."""
+from contextlib import AsyncExitStack
+from unittest import TestCase
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from agentscope.embedding import EmbeddingResponse
+from agentscope.message import TextBlock
+from agentscope.rag import (
+    BM25Index,
+    Chunk,
+    KnowledgeBase,
+    QdrantStore,
+    VectorSearchResult,
+    reciprocal_rank_fusion,
+)
+
+_TEXTS = {
+    "router": "Reset the router to fix connectivity problems.",
+    "license": "Error ERR-4012 means the license has expired.",
+    "cats": "Cats are mammals.",
+}
+
+_VECTORS = {
+    _TEXTS["router"]: [1.0, 0.0, 0.0],
+    _TEXTS["license"]: [0.0, 1.0, 0.0],
+    _TEXTS["cats"]: [0.0, 0.0, 1.0],
+}
+
+_QUERY = "What does ERR-4012 mean?"
+
+
+def _chunk(text: str, chunk_index: int = 0, **metadata: str) -> Chunk:
+    """Build a one-chunk document."""
+    return Chunk(
+        content=TextBlock(text=text),
+        source="doc.txt",
+        chunk_index=chunk_index,
+        total_chunks=1,
+        metadata=metadata,
+    )
+
+
+class _StubEmbeddingModel:
+    """Embeds the known texts to fixed vectors; a query to a vector
+    close to the router chunk, as a paraphrase-biased model might."""
+
+    supports_multimodal = False
+    dimensions = 3
+
+    async def __call__(self, inputs: list) -> EmbeddingResponse:
+        """Return one vector per input."""
+        return EmbeddingResponse(
+            embeddings=[
+                _VECTORS.get(
+                    item if isinstance(item, str) else item.text,
+                    [0.9, 0.1, 0.0],
+                )
+                for item in inputs
+            ],
+        )
+
+
+class BM25IndexTest(TestCase):
+    """Ranking and maintenance of :class:`BM25Index`."""
+
+    def test_exact_identifier_ranks_first(self) -> None:
+        """A compound identifier matches as a whole and by its parts."""
+        index = BM25Index()
+        for name, text in _TEXTS.items():
+            index.add(name, [_chunk(text)])
+
+        results = index.search(_QUERY, top_k=3)
+        self.assertEqual(results[0].document_id, "license")
+        self.assertEqual(
+            [r.document_id for r in index.search("4012")],
+            ["license"],
+        )
+        self.assertEqual(index.search("unrelated words"), [])
+
+    def test_remove_and_replace(self) -> None:
+        """Removed documents stop matching; re-adding a chunk index
+        replaces its text."""
+        index = BM25Index()
+        index.add("doc", [_chunk("alpha beta")])
+        index.add("doc", [_chunk("gamma")])
+        self.assertEqual(index.search("alpha"), [])
+        self.assertEqual(len(index.search("gamma")), 1)
+        self.assertEqual(index.stats["chunks"], 1)
+
+        index.remove("doc")
+        index.remove("missing")
+        self.assertEqual(len(index), 0)
+        self.assertEqual(
+            index.stats,
+            {"documents": 0, "chunks": 0, "terms": 0},
+        )
+
+    def test_metadata_filter_and_cjk(self) -> None:
+        """Filters match chunk metadata; CJK text matches by bigrams."""
+        index = BM25Index()
+        index.add("a", [_chunk("检索增强生成的原理", tenant="t1")])
+        index.add("b", [_chunk("检索系统的设计", tenant="t2")])
+
+        self.assertEqual(
+            [r.document_id for r in index.search("增强生成")],
+            ["a"],
+        )
+        self.assertEqual(
+            [
+                r.document_id
+                for r in index.search("检索", metadata_filter={"tenant": "t2"})
+            ],
+            ["b"],
+        )
+
+
+class ReciprocalRankFusionTest(TestCase):
+    """:func:`reciprocal_rank_fusion`."""
+
+    def test_fuses_by_rank(self) -> None:
+        """Chunks ranked by several rankings win; scores do not count."""
+
+        def _hit(document_id: str, score: float) -> VectorSearchResult:
+            return VectorSearchResult(
+                score=score,
+                document_id=document_id,
+                chunk=_chunk(document_id),
+            )
+
+        fused = reciprocal_rank_fusion(
+            [
+                [_hit("a", 0.99), _hit("b", 0.98)],
+                [_hit("b", 12.0), _hit("c", 3.0)],
+            ],
+            k=60,
+        )
+        self.assertEqual([r.document_id for r in fused], ["b", "a", "c"])
+        self.assertAlmostEqual(fused[0].score, 1 / 62 + 1 / 61)
+
+
+class HybridKnowledgeBaseTest(IsolatedAsyncioTestCase):
+    """:meth:`KnowledgeBase.search` with a lexical index."""
+
+    async def asyncSetUp(self) -> None:
+        self._stack = AsyncExitStack()
+        self.store = await self._stack.enter_async_context(
+            QdrantStore(location=":memory:"),
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self._stack.aclose()
+
+    def _knowledge(self, lexical_index: BM25Index | None) -> KnowledgeBase:
+        """Build a handle over the shared collection."""
+        return KnowledgeBase(
+            name="support",
+            description="Support notes.",
+            embedding_model=_StubEmbeddingModel(),
+            vector_store=self.store,
+            collection="support",
+            lexical_index=lexical_index,
+        )
+
+    async def test_identifier_surfaces_at_small_top_k(self) -> None:
+        """Dense search alone misses the identifier; fused search finds
+        it, and the index follows inserts and deletes."""
+        knowledge = self._knowledge(BM25Index())
+        for name, text in _TEXTS.items():
+            await knowledge.insert_document([_chunk(text)], document_id=name)
+
+        dense = await self._knowledge(None).search([_QUERY], top_k=1)
+        self.assertEqual(dense[0].document_id, "router")
+
+        hybrid = await knowledge.search([_QUERY], top_k=1)
+        self.assertEqual(hybrid[0].document_id, "license")
+
+        await knowledge.delete_document("license")
+        self.assertEqual(knowledge.lexical_index.search("4012"), [])
+
+    async def test_rebuild_from_the_vector_store(self) -> None:
+        """A fresh index is filled from the chunks already stored."""
+        writer = self._knowledge(None)
+        for name, text in _TEXTS.items():
+            await writer.insert_document([_chunk(text)], document_id=name)
+
+        knowledge = self._knowledge(BM25Index())
+        self.assertEqual(await knowledge.rebuild_lexical_index(), 3)
+        hybrid = await knowledge.search([_QUERY], top_k=1)
+        self.assertEqual(hybrid[0].document_id, "license")
+
+        with self.assertRaises(ValueError):
+            await writer.rebuild_lexical_index()
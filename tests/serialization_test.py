@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Tests for the payload serializers."""
+import importlib.util
+import json
+from unittest import TestCase, skipUnless
+
+from agentscope.app.message_bus import JSONSerializer, MsgpackSerializer
+
+_PAYLOAD = {
+    "text": "héllo",
+    "n": 3,
+    "x": 0.5,
+    "ok": True,
+    "none": None,
+    "items": [1, {"k": "v"}],
+}
+
+
+class JSONSerializerTest(TestCase):
+    """Both encoders of :class:`JSONSerializer`."""
+
+    def _serializers(self) -> list[JSONSerializer]:
+        """The orjson-backed serializer (when installed) and the
+        standard-library one."""
+        return [JSONSerializer(), JSONSerializer(use_orjson=False)]
+
+    def test_round_trip_matches_stdlib(self) -> None:
+        """Encodings decode to what :mod:`json` produces, from bytes and
+        from text."""
+        for serializer in self._serializers():
+            data = serializer.dumps(_PAYLOAD)
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(json.loads(data), _PAYLOAD)
+            self.assertEqual(serializer.loads(data), _PAYLOAD)
+            self.assertEqual(serializer.loads(data.decode()), _PAYLOAD)
+
+    def test_stdlib_compatibility(self) -> None:
+        """Non-string keys are stringified and oversized integers still
+        encode."""
+        for serializer in self._serializers():
+            self.assertEqual(
+                serializer.loads(serializer.dumps({1: "a", "big": 2**70})),
+                {"1": "a", "big": 2**70},
+            )
+            with self.assertRaises(TypeError):
+                serializer.dumps({"x": object()})
+
+    def test_bytes_pass_through(self) -> None:
+        """Already-encoded bytes are returned unchanged."""
+        encoded = b'{"a":1}'
+        for serializer in self._serializers():
+            self.assertIs(serializer.dumps(encoded), encoded)
+
+    def test_backend(self) -> None:
+        """The standard library is used when asked or when orjson is
+        missing."""
+        self.assertEqual(JSONSerializer(use_orjson=False).backend, "json")
+        self.assertEqual(
+            JSONSerializer().backend,
+            "orjson" if importlib.util.find_spec("orjson") else "json",
+        )
+
+
+class MsgpackSerializerTest(TestCase):
+    """:class:`MsgpackSerializer`."""
+
+    @skipUnless(importlib.util.find_spec("msgpack"), "msgpack missing")
+    def test_round_trip(self) -> None:
+        """Payloads round-trip and are smaller than their JSON."""
+        serializer = MsgpackSerializer()
+        self.assertTrue(serializer.binary)
+        data = serializer.dumps(_PAYLOAD)
+        self.assertEqual(serializer.loads(data), _PAYLOAD)
+        self.assertLess(len(data), len(JSONSerializer().dumps(_PAYLOAD)))
+
+    @skipUnless(not importlib.util.find_spec("msgpack"), "msgpack present")
+    def test_missing_dependency(self) -> None:
+        """Constructing it without msgpack says what to install."""
+        with self.assertRaisesRegex(ImportError, "msgpack"):
+            MsgpackSerializer()
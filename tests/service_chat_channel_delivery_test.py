@@ -128,6 +128,9 @@ class _Storage:
     async def upsert_message(self, *_: object, **__: object) -> None:
         """Accept persisted reply messages."""
 
+    async def write_session_batch(self, *_: object, **__: object) -> None:
+        """Accept the batched message and state persistence."""
+
 
 class _WorkspaceManager:
     """Return a minimal workspace handle."""
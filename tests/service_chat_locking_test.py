@@ -105,6 +105,25 @@ class _Storage:
         assert session_id == self.session.id
         self.messages.append(message)
 
+    async def write_session_batch(
+        self,
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+        messages: list[object],
+        state: AgentState | None = None,
+    ) -> None:
+        """Persist a batch through the single-write methods."""
+        for message in messages:
+            await self.upsert_message(user_id, session_id, message)
+        if state is not None:
+            await self.update_session_state(
+                user_id,
+                agent_id,
+                session_id,
+                state,
+            )
+
 
 class _Access:
     """Return the one agent visible to the test user."""
@@ -20,6 +20,7 @@ from unittest import IsolatedAsyncioTestCase
 from agentscope.app._bus_ops import (
     abandon_inbox_consumer,
     deliver_to_inbox,
+    deliver_to_inboxes,
     has_pending_inbox_or_release,
     register_inbox_consumer,
 )
@@ -60,6 +61,28 @@ class TestInboxHandoff(IsolatedAsyncioTestCase):
         entries = await self.bus.queue_drain(MessageBusKeys.inbox(self.sid))
         self.assertEqual([p["hint"] for _i, p in entries], ["hello"])
 
+    async def test_batched_delivery_wakes_idle_recipients_only(
+        self,
+    ) -> None:
+        """A batched delivery fills every inbox and wakes only the
+        sessions without a registered consumer."""
+        await register_inbox_consumer(self.bus, "sess-busy")
+        await deliver_to_inboxes(
+            self.bus,
+            user_id="u",
+            recipients=[("sess-idle", "a1"), ("sess-busy", "a2")],
+            payload={"type": "hint", "hint": "hello"},
+        )
+
+        wakeups = await self._wakeups()
+        self.assertEqual(
+            [(w["session_id"], w["agent_id"], w["kind"]) for w in wakeups],
+            [("sess-idle", "a1", "wake")],
+        )
+        for sid in ("sess-idle", "sess-busy"):
+            entries = await self.bus.queue_drain(MessageBusKeys.inbox(sid))
+            self.assertEqual([p["hint"] for _i, p in entries], ["hello"])
+
     async def test_registered_consumer_suppresses_wakeup(self) -> None:
         """A registered consumer is expected to drain it itself, so no
         wake-up is enqueued."""
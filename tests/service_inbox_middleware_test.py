@@ -17,6 +17,7 @@ the four branches below cover the whole inbox→context pipeline:
 Each non-empty drain must also yield one ``HintBlockEvent`` per hint so
 the SSE stream renders them.
 """
+import asyncio
 import uuid
 from contextlib import asynccontextmanager
 from types import SimpleNamespace
@@ -25,7 +26,13 @@ from unittest import IsolatedAsyncioTestCase
 
 from utils import AnyString
 
-from agentscope.app.message_bus import MessageBus
+from agentscope.app._bus_ops import signal_inbox
+from agentscope.app._manager import InboxWatcher
+from agentscope.app.message_bus import (
+    InMemoryMessageBus,
+    MessageBus,
+    MessageBusKeys,
+)
 from agentscope.app.middleware import InboxMiddleware
 from agentscope.message import (
     AssistantMsg,
@@ -514,3 +521,99 @@ class TestInboxMiddlewareDelegatesDownstream(IsolatedAsyncioTestCase):
             },
         )
         self.assertEqual(out[1:], ["ds-1", "ds-2"])
+
+
+class _CountingBus(InMemoryMessageBus):
+    """In-memory bus counting the inbox drains."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.drains = 0
+
+    async def queue_drain(
+        self,
+        key: str,
+        *,
+        max_count: int,
+    ) -> list[tuple[str, dict]]:
+        self.drains += 1
+        return await super().queue_drain(key, max_count=max_count)
+
+
+class TestInboxMiddlewareWatcher(IsolatedAsyncioTestCase):
+    """With an :class:`InboxWatcher`, only the first step of a reply
+    and the steps after a signal read the inbox."""
+
+    async def asyncSetUp(self) -> None:
+        """Start a watcher over a counting in-memory bus."""
+        self.bus = _CountingBus()
+        self.watcher = await self.enterAsyncContext(
+            InboxWatcher(self.bus),
+        )
+        self.mw = InboxMiddleware(
+            self.bus,
+            max_count=2,
+            inbox_watcher=self.watcher,
+        )
+        self.agent = _make_agent(
+            name="A",
+            session_id="s",
+            reply_id="rid-1",
+            context=[],
+        )
+
+    async def _deliver(self, *hints: str) -> None:
+        """Push hints to the inbox and signal it, as producers do."""
+        for hint in hints:
+            await self.bus.queue_push(
+                MessageBusKeys.inbox("s"),
+                HintBlock(hint=hint, source="x").model_dump(mode="json"),
+            )
+        await signal_inbox(self.bus, ["s"])
+        # Let the watch loop receive the signal
+        await asyncio.sleep(0)
+
+    async def _step(self) -> list:
+        """Run one reasoning step and return the injected hints."""
+        events = await _drain(
+            self.mw.on_reasoning(self.agent, {}, _noop_next_handler),
+        )
+        return [event.hint for event in events]
+
+    async def test_drains_only_after_signals(self) -> None:
+        """Unsignalled steps skip the bus, signalled ones drain, and a
+        full batch keeps the session signalled."""
+        # The first step of a reply drains unconditionally
+        self.assertEqual(await self._step(), [])
+        self.assertEqual(self.bus.drains, 1)
+        self.assertEqual(await self._step(), [])
+        self.assertEqual(self.bus.drains, 1)
+
+        await self._deliver("a", "b", "c")
+        self.assertEqual(await self._step(), ["a", "b"])
+        self.assertEqual(await self._step(), ["c"])
+        self.assertEqual(await self._step(), [])
+        self.assertEqual(self.bus.drains, 3)
+
+        # Signals for other sessions do not concern this one
+        await signal_inbox(self.bus, ["other"])
+        await asyncio.sleep(0)
+        await self._step()
+        self.assertEqual(self.bus.drains, 3)
+
+        # A new reply drains again, even without a signal
+        self.agent.state.reply_id = "rid-2"
+        await self.bus.queue_push(
+            MessageBusKeys.inbox("s"),
+            HintBlock(hint="d", source="x").model_dump(mode="json"),
+        )
+        self.assertEqual(await self._step(), ["d"])
+        self.assertEqual(self.bus.drains, 4)
+
+    async def test_dead_watcher_drains_every_step(self) -> None:
+        """A watcher whose loop stopped reports every session as
+        signalled."""
+        await self.watcher.__aexit__(None, None, None)
+        await self._step()
+        await self._step()
+        self.assertEqual(self.bus.drains, 2)
@@ -143,11 +143,25 @@ class _FakeKnowledge:
         self._vector_store = vector_store
         self._collection_name = collection_name
 
+    async def embedding_model(self, contents: list) -> Any:
+        """Pretend to embed ``contents`` as fixed zero-vectors.
+
+        Args:
+            contents (`list`):
+                The chunk contents to embed.
+
+        Returns:
+            `Any`:
+                An object carrying one ``[0.0]`` vector per content.
+        """
+        return type("_Response", (), {"embeddings": [[0.0]] * len(contents)})
+
     async def insert_document(
         self,
         chunks: list,
         document_id: str | None = None,
         document_metadata: dict | None = None,
+        embeddings: list | None = None,
     ) -> str:
         """Pretend to embed and insert ``chunks`` into the bound store.
 
@@ -164,13 +178,16 @@ class _FakeKnowledge:
             document_metadata (`dict | None`, optional):
                 Document-level metadata; ignored — the upload tests
                 don't assert on metadata propagation.
+            embeddings (`list | None`, optional):
+                Precomputed vectors; ignored in favour of the fixed
+                vector.
 
         Returns:
             `str`:
                 The (caller-supplied) document id, or ``""`` when
                 none was passed.
         """
-        del document_metadata  # unused — see docstring
+        del document_metadata, embeddings  # unused — see docstring
         records = [
             VectorRecord(
                 vector=[0.0],
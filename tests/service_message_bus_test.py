@@ -10,15 +10,39 @@ that are layered on top.
 """
 import asyncio
 from contextlib import AsyncExitStack
+from typing import Any
 from unittest import IsolatedAsyncioTestCase
 
 import fakeredis.aioredis
 
-from agentscope.app.message_bus import MessageBus, RedisMessageBus
+from agentscope.app.message_bus import (
+    JSONSerializer,
+    LockedQueuePush,
+    MessageBus,
+    RedisMessageBus,
+    Serializer,
+)
+
+
+class _BinarySerializer(Serializer):
+    """JSON behind a byte that is not valid UTF-8, standing in for a
+    binary format."""
+
+    binary = True
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode."""
+        return b"\xff" + JSONSerializer().dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode."""
+        assert isinstance(data, bytes) and data[:1] == b"\xff"
+        return JSONSerializer().loads(data[1:])
 
 
 def _make_bus(
     fake_redis: fakeredis.aioredis.FakeRedis,
+    serializer: Serializer | None = None,
 ) -> RedisMessageBus:
     """Construct a :class:`RedisMessageBus` that uses *fake_redis*.
 
@@ -28,6 +52,8 @@ def _make_bus(
     Args:
         fake_redis (`fakeredis.aioredis.FakeRedis`):
             A fakeredis client whose pubsub / streams APIs are async.
+        serializer (`Serializer | None`, optional):
+            The payload serializer of the bus.
 
     Returns:
         `RedisMessageBus`:
@@ -46,7 +72,7 @@ def _make_bus(
             # The fakeredis client is owned by the test, not the bus.
             self._client = None
 
-    return _FakeBus()
+    return _FakeBus(serializer=serializer)
 
 
 class TestQueuePrimitive(IsolatedAsyncioTestCase):
@@ -83,6 +109,87 @@ class TestQueuePrimitive(IsolatedAsyncioTestCase):
         self.assertEqual([p["i"] for _id, p in first], [0, 1, 2])
         self.assertEqual([p["i"] for _id, p in rest], [3, 4])
 
+    async def test_push_many_keeps_order(self) -> None:
+        """``queue_push_many`` appends a batch in order, with one id per
+        payload."""
+        await self.bus.queue_push("k", {"i": 0})
+        ids = await self.bus.queue_push_many("k", [{"i": 1}, {"i": 2}])
+        entries = await self.bus.queue_drain("k", max_count=10)
+        self.assertEqual([p["i"] for _id, p in entries], [0, 1, 2])
+        self.assertEqual(ids, [entry_id for entry_id, _p in entries[1:]])
+
+    async def test_push_locked_reads_registry_and_releases(self) -> None:
+        """``queue_push_locked`` pushes every payload, reads each
+        registry field under its lock and leaves no lock behind, also
+        when a lock is contended."""
+        await self.bus.registry_set("reg:b", "consumer", "1")
+        pushes = [
+            LockedQueuePush(
+                f"q:{n}",
+                {"n": n},
+                f"lock:{n}",
+                f"reg:{n}",
+                "consumer",
+            )
+            for n in ("a", "b", "c")
+        ]
+
+        async def _holder() -> None:
+            async with self.bus.acquire_lock("lock:c", ttl_secs=10):
+                await asyncio.sleep(0.05)
+
+        holder = asyncio.create_task(_holder())
+        await asyncio.sleep(0.01)
+        values = await self.bus.queue_push_locked(pushes, lock_ttl_secs=10)
+        await holder
+
+        self.assertEqual(values, [None, "1", None])
+        for n in ("a", "b", "c"):
+            entries = await self.bus.queue_drain(f"q:{n}")
+            self.assertEqual([p for _id, p in entries], [{"n": n}])
+            self.assertFalse(await self.bus.is_locked(f"lock:{n}"))
+
+
+class TestClaimQueue(IsolatedAsyncioTestCase):
+    """Mode B — ``queue_claim`` + ``queue_ack`` semantics."""
+
+    async def asyncSetUp(self) -> None:
+        self.fr = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        self._stack = AsyncExitStack()
+        self.bus = await self._stack.enter_async_context(_make_bus(self.fr))
+
+    async def asyncTearDown(self) -> None:
+        await self._stack.aclose()
+        await self.fr.aclose()
+
+    async def test_entries_go_to_one_consumer_until_acked(self) -> None:
+        """Each entry is claimed by one consumer; an unacked entry is
+        claimed again once idle, an acked one is gone."""
+        for i in range(3):
+            await self.bus.queue_push("k", {"i": i})
+
+        first = await self.bus.queue_claim("k", "g", "c1", max_count=2)
+        second = await self.bus.queue_claim("k", "g", "c2")
+        self.assertEqual([p["i"] for _id, p in first], [0, 1])
+        self.assertEqual([p["i"] for _id, p in second], [2])
+        self.assertEqual(await self.bus.queue_claim("k", "g", "c2"), [])
+
+        await self.bus.queue_ack("k", "g", [first[0][0], second[0][0]])
+        reclaimed = await self.bus.queue_claim(
+            "k",
+            "g",
+            "c2",
+            reclaim_idle_secs=0,
+        )
+        self.assertEqual(reclaimed, [first[1]])
+
+        await self.bus.queue_ack("k", "g", [first[1][0], "0-1"])
+        self.assertEqual(
+            await self.bus.queue_claim("k", "g", "c1", reclaim_idle_secs=0),
+            [],
+        )
+        self.assertEqual(await self.bus.queue_length("k"), 0)
+
 
 class TestLogPrimitive(IsolatedAsyncioTestCase):
     """Mode C — replay log: append / read with cursor / trim."""
@@ -160,6 +267,66 @@ class TestPubSubPrimitive(IsolatedAsyncioTestCase):
         self.assertEqual([p["i"] for p in received], [1, 2])
 
 
+class TestPayloadSerializer(IsolatedAsyncioTestCase):
+    """The bus's serializer for stream payloads, and the undecoded
+    replay read."""
+
+    async def asyncSetUp(self) -> None:
+        self.fr = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        self._stack = AsyncExitStack()
+
+    async def asyncTearDown(self) -> None:
+        await self._stack.aclose()
+        await self.fr.aclose()
+
+    async def test_log_read_encoded_returns_stored_json(self) -> None:
+        """The encoded read returns the stored JSON bytes, from the
+        cursor on."""
+        bus = await self._stack.enter_async_context(_make_bus(self.fr))
+        first = await bus.log_append("log", {"i": 1, "text": "héllo"})
+        await bus.log_append("log", {"i": 2})
+
+        entries = await bus.log_read_encoded("log", since=first)
+        self.assertEqual(len(entries), 1)
+        self.assertIsInstance(entries[0][1], bytes)
+        self.assertEqual(JSONSerializer().loads(entries[0][1]), {"i": 2})
+        everything = await bus.log_read_encoded("log")
+        self.assertEqual(
+            JSONSerializer().loads(everything[0][1]),
+            {"i": 1, "text": "héllo"},
+        )
+
+    async def test_binary_serializer(self) -> None:
+        """Queues and logs carry binary payloads through a decoding
+        client; the encoded read and Pub/Sub stay JSON."""
+        bus = await self._stack.enter_async_context(
+            _make_bus(self.fr, _BinarySerializer()),
+        )
+        await bus.queue_push_many("q", [{"i": 1}, {"i": 2}])
+        drained = await bus.queue_drain("q")
+        self.assertEqual([p for _id, p in drained], [{"i": 1}, {"i": 2}])
+
+        await bus.log_append("log", {"i": 3})
+        self.assertEqual(
+            [p for _id, p in await bus.log_read("log")],
+            [{"i": 3}],
+        )
+        [(_id, data)] = await bus.log_read_encoded("log")
+        self.assertEqual(JSONSerializer().loads(data), {"i": 3})
+
+        ready = asyncio.Event()
+
+        async def _first() -> dict:
+            async for payload in bus.subscribe("ch", on_ready=ready.set):
+                return payload
+            return {}
+
+        task = asyncio.create_task(_first())
+        await asyncio.wait_for(ready.wait(), timeout=2.0)
+        await bus.publish("ch", {"i": 4})
+        self.assertEqual(await asyncio.wait_for(task, timeout=2.0), {"i": 4})
+
+
 class TestLockPrimitive(IsolatedAsyncioTestCase):
     """Mode E — distributed mutex semantics."""
 
@@ -83,6 +83,11 @@ class _Storage:
         if self.fail_writes:
             raise RuntimeError("storage is down")
 
+    async def write_session_batch(self, *_: object, **__: object) -> None:
+        """Accept batched replies and state, or fail them on demand."""
+        if self.fail_writes:
+            raise RuntimeError("storage is down")
+
 
 class _WorkspaceManager:
     """Return a minimal workspace handle."""
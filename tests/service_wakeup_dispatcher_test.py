@@ -13,6 +13,8 @@ Verifies the four behaviours that callers rely on:
   ``__aenter__`` without waiting for a fresh signal.
 - Sessions that are already running are skipped (no duplicate run).
 - Malformed entries are logged and skipped, not raised.
+- Sessions are dispatched concurrently, the triggers of one session in
+  order, and each trigger is acked once dispatched.
 """
 import asyncio
 from contextlib import asynccontextmanager
@@ -20,7 +22,11 @@ from typing import Any, AsyncGenerator, Callable
 from unittest import IsolatedAsyncioTestCase
 
 from agentscope.app._manager import ChatRunRegistry, WakeupDispatcher
-from agentscope.app.message_bus import MessageBus, MessageBusKeys
+from agentscope.app.message_bus import (
+    InMemoryMessageBus,
+    MessageBus,
+    MessageBusKeys,
+)
 
 
 class _FakeStorage:
@@ -507,6 +513,145 @@ class TestWakeupDispatcherDispatch(IsolatedAsyncioTestCase):
         self.assertIsNone(chat.calls[0]["input_msg"])
 
 
+class _SlowStorage(_FakeStorage):
+    """Storage whose session lookups take a while, recording their
+    order and how many overlap."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_session(
+        self,
+        _user_id: str,
+        _agent_id: str,
+        session_id: str,
+    ) -> object | None:
+        """Record the lookup, then wait before answering."""
+        self.lookups.append((session_id, _agent_id))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.in_flight -= 1
+        return object()
+
+
+class TestWakeupDispatcherClaim(IsolatedAsyncioTestCase):
+    """Claim-and-ack dispatch over :class:`InMemoryMessageBus`."""
+
+    async def asyncSetUp(self) -> None:
+        self.bus = await self.enterAsyncContext(InMemoryMessageBus())
+        self.chat = _FakeChatService()
+
+    async def _pending(self) -> list[tuple[str, dict]]:
+        """Claim whatever the dispatcher left unacked."""
+        return await self.bus.queue_claim(
+            MessageBusKeys.wakeup_queue(),
+            MessageBusKeys.wakeup_group(),
+            "inspector",
+            reclaim_idle_secs=0,
+        )
+
+    async def test_sessions_concurrent_and_ordered(self) -> None:
+        """Sessions overlap up to ``max_concurrency``; the triggers of
+        one session run in queue order; all are acked."""
+        storage = _SlowStorage()
+        for n in range(2):
+            for session_id in ("s1", "s2", "s3", "s4"):
+                await self.bus.queue_push(
+                    MessageBusKeys.wakeup_queue(),
+                    {
+                        "user_id": "u",
+                        "session_id": session_id,
+                        "agent_id": f"a{n}",
+                    },
+                )
+
+        async with WakeupDispatcher(
+            message_bus=self.bus,
+            storage=storage,
+            chat_service=self.chat,
+            chat_run_registry=ChatRunRegistry(),
+            max_concurrency=2,
+            batch_size=3,
+        ):
+            await _yield_a_few_times()
+
+        self.assertEqual(len(self.chat.calls), 8)
+        self.assertEqual(storage.max_in_flight, 2)
+        for session_id in ("s1", "s2", "s3", "s4"):
+            self.assertEqual(
+                [a for s, a in storage.lookups if s == session_id],
+                ["a0", "a1"],
+            )
+        self.assertEqual(await self._pending(), [])
+
+    async def test_unacked_trigger_is_reclaimed(self) -> None:
+        """A trigger claimed by a consumer that never acked it is
+        dispatched once it has been idle long enough."""
+        await self.bus.queue_push(
+            MessageBusKeys.wakeup_queue(),
+            {"user_id": "u", "session_id": "orphan", "agent_id": "a"},
+        )
+        await self.bus.queue_claim(
+            MessageBusKeys.wakeup_queue(),
+            MessageBusKeys.wakeup_group(),
+            "dead-replica",
+        )
+
+        async with WakeupDispatcher(
+            message_bus=self.bus,
+            storage=_FakeStorage(),
+            chat_service=self.chat,
+            chat_run_registry=ChatRunRegistry(),
+            reclaim_idle_secs=0.05,
+        ):
+            self.assertEqual(self.chat.calls, [])
+            await asyncio.wait_for(self.chat.notify.wait(), timeout=2.0)
+
+        self.assertEqual(self.chat.calls[0]["session_id"], "orphan")
+        self.assertEqual(await self._pending(), [])
+
+    async def test_locked_trigger_acked_once_requeued(self) -> None:
+        """A trigger for a busy session stays pending until its retry
+        has re-queued it, and is spawned once the lock frees."""
+        lock = MessageBusKeys.session_lock("busy")
+        async with self.bus.acquire_lock(lock, ttl_secs=10):
+            await self.bus.queue_push(
+                MessageBusKeys.wakeup_queue(),
+                {"user_id": "u", "session_id": "busy", "agent_id": "a"},
+            )
+            async with WakeupDispatcher(
+                message_bus=self.bus,
+                storage=_FakeStorage(),
+                chat_service=self.chat,
+                chat_run_registry=ChatRunRegistry(),
+            ) as dispatcher:
+                self.assertEqual(len(dispatcher._retry_tasks), 1)
+                self.assertEqual(
+                    len(
+                        self.bus._pending[
+                            (
+                                MessageBusKeys.wakeup_queue(),
+                                MessageBusKeys.wakeup_group(),
+                            )
+                        ],
+                    ),
+                    1,
+                )
+                await asyncio.sleep(0.15)
+                self.assertEqual(self.chat.calls, [])
+                await self.bus.unlock(lock)
+                await asyncio.wait_for(self.chat.notify.wait(), timeout=2.0)
+
+        self.assertEqual(self.chat.calls[0]["session_id"], "busy")
+        self.assertEqual(await self._pending(), [])
+
+
 class TestWakeupDispatcherLifecycle(IsolatedAsyncioTestCase):
     """Tests covering the ``__aenter__`` / ``__aexit__`` ACM behaviour."""
 
@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access,attribute-defined-outside-init
+"""Tests for the batched session writes and the write-behind buffer of
+chat runs."""
+from contextlib import AsyncExitStack
+from typing import AsyncGenerator
+from unittest.async_case import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+import fakeredis.aioredis
+from service_chat_locking_test import (
+    _Access,
+    _Storage,
+    _WorkspaceManager,
+    _get_model,
+    _get_toolkit,
+)
+
+from agentscope.agent import ContextConfig, ReActConfig
+from agentscope.app._service import ChatService
+from agentscope.app._service._write_behind import SessionWriteBehind
+from agentscope.app.message_bus import InMemoryMessageBus
+from agentscope.app.storage import (
+    AgentData,
+    AgentRecord,
+    AsyncSQLAlchemyStorage,
+    ChatModelConfig,
+    RedisStorage,
+    SessionConfig,
+    SessionRecord,
+    StorageBase,
+)
+from agentscope.event import (
+    ModelCallStartEvent,
+    ReplyStartEvent,
+    TextBlockDeltaEvent,
+    TextBlockStartEvent,
+)
+from agentscope.message import AssistantMsg, UserMsg
+from agentscope.state import AgentState
+
+
+def _session_config() -> SessionConfig:
+    """Build a minimal :class:`SessionConfig`."""
+    return SessionConfig(
+        workspace_id="ws-1",
+        chat_model_config=ChatModelConfig(
+            type="openai",
+            credential_id="cred-1",
+            model="gpt-4o",
+            parameters={},
+        ),
+    )
+
+
+def _redis_storage() -> RedisStorage:
+    """Create a RedisStorage instance backed by fakeredis."""
+    storage = RedisStorage.__new__(RedisStorage)
+    storage._client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    storage.key_ttl = 60
+    storage.key_config = RedisStorage.KeyConfig()
+    return storage
+
+
+class _BatchTests:
+    """Backend-independent checks of ``write_session_batch``; mixed into
+    one test case per backend."""
+
+    storage: StorageBase
+
+    async def _create_session(self) -> str:
+        """Create an agent and a session and return the session id."""
+        self.agent_id = await self.storage.upsert_agent(
+            "user-1",
+            AgentRecord(
+                user_id="user-1",
+                data=AgentData(
+                    name="agent",
+                    context_config=ContextConfig(),
+                    react_config=ReActConfig(),
+                ),
+            ),
+        )
+        session = await self.storage.upsert_session(
+            user_id="user-1",
+            agent_id=self.agent_id,
+            config=_session_config(),
+        )
+        return session.id
+
+    async def test_batch_appends_replaces_and_sets_state(self) -> None:
+        """A batch keeps its order, replaces a message already at the
+        tail and writes the state."""
+        session_id = await self._create_session()
+        streamed = AssistantMsg(name="a", content="partial")
+        await self.storage.upsert_message("user-1", session_id, streamed)
+
+        done = AssistantMsg(id=streamed.id, name="a", content="done")
+        question = UserMsg(name="u", content="next?")
+        state = AgentState(summary="two turns")
+        await self.storage.write_session_batch(
+            "user-1",
+            self.agent_id,
+            session_id,
+            [done, question],
+            state,
+        )
+
+        listed, _ = await self.storage.list_messages("user-1", session_id)
+        self.assertEqual([m.id for m in listed], [streamed.id, question.id])
+        self.assertEqual(listed[0].content, done.content)
+        session = await self.storage.get_session(
+            "user-1",
+            self.agent_id,
+            session_id,
+        )
+        self.assertEqual(session.state.summary, "two turns")
+
+    async def test_batch_state_for_missing_session_raises(self) -> None:
+        """Like ``update_session_state``, a missing session raises."""
+        with self.assertRaises(KeyError):
+            await self.storage.write_session_batch(
+                "user-1",
+                "agent-x",
+                "no-such-session",
+                [],
+                AgentState(),
+            )
+
+
+class SQLBatchTest(_BatchTests, IsolatedAsyncioTestCase):
+    """``write_session_batch`` on :class:`AsyncSQLAlchemyStorage`."""
+
+    async def asyncSetUp(self) -> None:
+        self._stack = AsyncExitStack()
+        self.storage = await self._stack.enter_async_context(
+            AsyncSQLAlchemyStorage(
+                "sqlite+aiosqlite:///:memory:",
+                create_tables=True,
+            ),
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self._stack.aclose()
+
+
+class RedisBatchTest(_BatchTests, IsolatedAsyncioTestCase):
+    """``write_session_batch`` on :class:`RedisStorage`."""
+
+    async def asyncSetUp(self) -> None:
+        self.storage = _redis_storage()
+
+    async def test_batch_refreshes_ttl(self) -> None:
+        """The message list expires with the storage TTL."""
+        session_id = await self._create_session()
+        await self.storage.write_session_batch(
+            "user-1",
+            self.agent_id,
+            session_id,
+            [UserMsg(name="u", content="hi")],
+        )
+        ttl = await self.storage._client.ttl(
+            self.storage._message_key("user-1", session_id),
+        )
+        self.assertGreater(ttl, 0)
+
+
+class _CountingStorage:
+    """Records the batches written, failing them on demand."""
+
+    def __init__(self) -> None:
+        self.batches: list[tuple[list, AgentState | None]] = []
+        self.fail = False
+
+    async def write_session_batch(
+        self,
+        user_id: str,
+        agent_id: str,
+        session_id: str,
+        messages: list,
+        state: AgentState | None = None,
+    ) -> None:
+        """Record the batch."""
+        del user_id, agent_id, session_id
+        if self.fail:
+            raise RuntimeError("storage is down")
+        self.batches.append((messages, state))
+
+
+class SessionWriteBehindTest(IsolatedAsyncioTestCase):
+    """Buffering, coalescing and flushing of :class:`SessionWriteBehind`."""
+
+    def _writer(self, **kwargs: object) -> SessionWriteBehind:
+        """Build a writer over a counting storage."""
+        self.storage = _CountingStorage()
+        return SessionWriteBehind(
+            self.storage,
+            "user-1",
+            "agent-1",
+            "session-1",
+            **kwargs,
+        )
+
+    async def test_coalesces_upserts_of_one_message(self) -> None:
+        """Rewrites of a buffered message are written once, with the
+        latest content, at the position of the first upsert."""
+        writer = self._writer()
+        first = UserMsg(name="u", content="q")
+        reply = AssistantMsg(name="a", content="v1")
+        writer.add_message(first)
+        writer.add_message(reply)
+        final = AssistantMsg(id=reply.id, name="a", content="v2")
+        writer.add_message(final)
+        writer.set_state(AgentState())
+
+        self.assertIs(writer.get_message(reply.id), final)
+        await writer.flush()
+
+        self.assertEqual(len(self.storage.batches), 1)
+        messages, state = self.storage.batches[0]
+        self.assertEqual([m.id for m in messages], [first.id, reply.id])
+        self.assertIs(messages[1], final)
+        self.assertIsNotNone(state)
+        self.assertEqual(
+            writer.stats,
+            {"flushes": 1, "coalesced": 1, "pending": 0},
+        )
+
+    async def test_maybe_flush_thresholds(self) -> None:
+        """Nothing is written below the thresholds unless forced."""
+        writer = self._writer(max_pending=2, flush_interval=3600)
+        writer.add_message(UserMsg(name="u", content="1"))
+        await writer.maybe_flush()
+        self.assertEqual(self.storage.batches, [])
+
+        writer.add_message(UserMsg(name="u", content="2"))
+        await writer.maybe_flush()
+        self.assertEqual(len(self.storage.batches), 1)
+
+        writer.add_message(UserMsg(name="u", content="3"))
+        await writer.maybe_flush(force=True)
+        self.assertEqual(len(self.storage.batches), 2)
+
+        # An empty buffer is never written
+        await writer.maybe_flush(force=True)
+        self.assertEqual(len(self.storage.batches), 2)
+
+    async def test_failed_flush_keeps_writes(self) -> None:
+        """A failed opportunistic flush keeps the writes for the next one;
+        the final flush raises."""
+        writer = self._writer()
+        early = UserMsg(name="u", content="early")
+        writer.add_message(early)
+        self.storage.fail = True
+        await writer.maybe_flush(force=True)
+        self.assertEqual(writer.pending, 1)
+
+        late = UserMsg(name="u", content="late")
+        writer.add_message(late)
+        with self.assertRaises(RuntimeError):
+            await writer.flush()
+        self.assertEqual(writer.pending, 2)
+
+        self.storage.fail = False
+        await writer.flush()
+        messages, _ = self.storage.batches[0]
+        self.assertEqual([m.id for m in messages], [early.id, late.id])
+
+
+class _IterationAgent:
+    """Reason twice, recording what storage holds at each model call."""
+
+    def __init__(self, *, name: str, state: AgentState, **_: object) -> None:
+        self.name = name
+        self.state = state
+        self.storage: _Storage | None = None
+        self.seen: list[list] = []
+
+    async def reply_stream(self, inputs: object) -> AsyncGenerator:
+        """Yield a reply whose second model call follows a first step."""
+        del inputs
+        yield ReplyStartEvent(session_id="session-1", reply_id="r", name="a")
+        for step in range(2):
+            yield ModelCallStartEvent(reply_id="r", model_name="m")
+            self.seen.append(
+                [m.model_copy(deep=True) for m in self.storage.messages],
+            )
+            yield TextBlockStartEvent(reply_id="r", block_id=f"b{step}")
+            yield TextBlockDeltaEvent(
+                reply_id="r",
+                block_id=f"b{step}",
+                delta=f"step {step}",
+            )
+
+
+class ChatRunWriteThroughTest(IsolatedAsyncioTestCase):
+    """When a chat run's buffered writes reach storage."""
+
+    async def test_input_before_reply_and_iteration_checkpoints(
+        self,
+    ) -> None:
+        """The input message is written before the reply starts, and the
+        reply so far at the next iteration boundary."""
+        agent = AgentRecord(
+            id="agent-1",
+            user_id="user-1",
+            data=AgentData(
+                name="agent",
+                context_config=ContextConfig(),
+                react_config=ReActConfig(),
+            ),
+        )
+        session = SessionRecord(
+            id="session-1",
+            user_id="user-1",
+            agent_id=agent.id,
+            config=SessionConfig(
+                workspace_id="workspace-1",
+                chat_model_config=ChatModelConfig(
+                    type="test",
+                    credential_id="credential-1",
+                    model="test-model",
+                    parameters={},
+                ),
+            ),
+        )
+        storage = _Storage(session)
+        agents: list[_IterationAgent] = []
+
+        def _make_agent(**kwargs: object) -> _IterationAgent:
+            """Build the agent and let it read the storage."""
+            built = _IterationAgent(**kwargs)  # type: ignore[arg-type]
+            built.storage = storage
+            agents.append(built)
+            return built
+
+        service = ChatService(
+            storage=storage,
+            workspace_manager=_WorkspaceManager(),
+            scheduler_manager=object(),
+            background_task_manager=object(),
+            message_bus=InMemoryMessageBus(),
+            resource_access_service=_Access(agent),
+            custom_agent_cls=_make_agent,
+        )
+        question = UserMsg(name="user", content="hi")
+        with (
+            patch(
+                "agentscope.app._service._chat.get_toolkit",
+                new=_get_toolkit,
+            ),
+            patch(
+                "agentscope.app._service._chat.get_model",
+                new=_get_model,
+            ),
+        ):
+            await service._run_impl(
+                "user-1",
+                session.id,
+                agent.id,
+                question,
+            )
+
+        first, second = agents[0].seen
+        self.assertEqual([m.id for m in first], [question.id])
+        self.assertEqual([m.id for m in second], [question.id, "r"])
+        self.assertEqual(second[1].get_text_content(), "step 0")
+        self.assertEqual(len(storage.persisted_states), 2)
+        self.assertEqual(
+            storage.messages[-1].get_text_content(),
+            "step 0\nstep 1",
+        )
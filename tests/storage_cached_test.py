@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Unit tests for the read-through CachedStorage."""
+import asyncio
+from unittest.async_case import IsolatedAsyncioTestCase
+
+from storage_redis_test import make_agent_record, make_storage
+
+from agentscope.app.message_bus import InMemoryMessageBus
+from agentscope.app.storage import CachedStorage, TeamData, TeamRecord
+
+
+class CachedStorageTest(IsolatedAsyncioTestCase):
+    """Two cached replicas in front of one backend, sharing a bus."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up test fixtures."""
+        self.backend = make_storage()
+        self.bus = InMemoryMessageBus()
+        self.replica_1 = CachedStorage(self.backend, self.bus)
+        self.replica_2 = CachedStorage(self.backend, self.bus)
+        # Start only the invalidation loops: entering the fakeredis-backed
+        # backend would replace its client with a real connection pool
+        for replica in (self.replica_1, self.replica_2):
+            ready = asyncio.Event()
+            replica._task = asyncio.create_task(
+                replica._invalidation_loop(ready),
+            )
+            await ready.wait()
+        self.user_id = "user-1"
+
+    async def asyncTearDown(self) -> None:
+        """Stop the invalidation loops."""
+        for replica in (self.replica_1, self.replica_2):
+            replica._task.cancel()
+
+    async def test_reads_are_cached_copies(self) -> None:
+        """Repeated reads hit the cache and callers get copies."""
+        agent_id = await self.backend.upsert_agent(
+            self.user_id,
+            make_agent_record(self.user_id),
+        )
+        first = await self.replica_1.get_agent(self.user_id, agent_id)
+        first.data.name = "mutated"
+        second = await self.replica_1.get_agent(self.user_id, agent_id)
+
+        self.assertEqual(second.data.name, "test-agent")
+        self.assertDictEqual(
+            self.replica_1.stats,
+            {"size": 1, "hits": 1, "misses": 1, "invalidations": 0},
+        )
+
+    async def test_get_agents_shares_get_agent_entries(self) -> None:
+        """A batched read serves cached agents and caches the others
+        for later single reads."""
+        ids = [
+            await self.backend.upsert_agent(
+                self.user_id,
+                make_agent_record(self.user_id),
+            )
+            for _ in range(3)
+        ]
+        await self.replica_1.get_agent(self.user_id, ids[0])
+        records = await self.replica_1.get_agents(
+            [(self.user_id, agent_id) for agent_id in ids]
+            + [(self.user_id, "missing")],
+        )
+        self.assertEqual([r.id if r else None for r in records], ids + [None])
+        await self.replica_1.get_agent(self.user_id, ids[2])
+        self.assertDictEqual(
+            self.replica_1.stats,
+            {"size": 4, "hits": 2, "misses": 4, "invalidations": 0},
+        )
+
+    async def test_writes_invalidate_every_replica(self) -> None:
+        """A write on one replica drops the entries of both."""
+        record = make_agent_record(self.user_id)
+        agent_id = await self.replica_1.upsert_agent(self.user_id, record)
+        await asyncio.sleep(0.05)
+        self.assertEqual(
+            len(await self.replica_2.list_agents(self.user_id)),
+            1,
+        )
+        await self.replica_2.get_agent(self.user_id, agent_id)
+
+        record.data.name = "renamed"
+        await self.replica_1.upsert_agent(self.user_id, record)
+        await asyncio.sleep(0.05)
+
+        fetched = await self.replica_2.get_agent(self.user_id, agent_id)
+        self.assertEqual(fetched.data.name, "renamed")
+        self.assertEqual(self.replica_2.stats["invalidations"], 2)
+
+        # Deleting the agent also drops the cached teams of the user
+        team = await self.replica_1.upsert_team(
+            self.user_id,
+            TeamRecord(
+                user_id=self.user_id,
+                session_id="s",
+                data=TeamData(name="team"),
+            ),
+        )
+        await self.replica_2.get_team(self.user_id, team.id)
+        await self.replica_1.delete_agent(self.user_id, agent_id)
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.replica_2.stats["size"], 0)
+
+    async def test_read_overlapping_a_write_is_not_cached(self) -> None:
+        """A read started before an invalidation doesn't fill the cache."""
+        agent_id = await self.backend.upsert_agent(
+            self.user_id,
+            make_agent_record(self.user_id),
+        )
+        read = self.backend.get_agent
+
+        async def _slow_get_agent(user_id: str, aid: str) -> object:
+            record = await read(user_id, aid)
+            self.replica_1._invalidate(["agent"], user_id)
+            return record
+
+        _slow_get_agent.__name__ = "get_agent"
+        self.replica_1.storage = type(
+            "_Backend",
+            (),
+            {"get_agent": staticmethod(_slow_get_agent)},
+        )()
+        await self.replica_1.get_agent(self.user_id, agent_id)
+        self.assertEqual(self.replica_1.stats["size"], 0)
+
+    async def test_ttl_and_uncached_kinds(self) -> None:
+        """Expired entries are read again, and sessions always are."""
+        self.replica_1.ttl = 0.0
+        await self.replica_1.list_teams(self.user_id)
+        await self.replica_1.list_teams(self.user_id)
+        await self.replica_1.list_sessions(self.user_id, "agent")
+        self.assertEqual(self.replica_1.stats["misses"], 2)
+        self.assertEqual(self.replica_1.stats["hits"], 0)
+        # Backend-specific extras stay reachable
+        self.assertEqual(self.replica_1.get_client, self.backend.get_client)
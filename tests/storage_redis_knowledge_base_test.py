@@ -9,7 +9,10 @@ from agentscope.app.storage import (
     EmbeddingModelConfig,
     KnowledgeBaseData,
     KnowledgeBaseRecord,
+    KnowledgeDocumentData,
+    KnowledgeDocumentRecord,
     RedisStorage,
+    StorageBase,
 )
 
 
@@ -40,6 +43,24 @@ def make_record(user_id: str, name: str = "kb") -> KnowledgeBaseRecord:
     )
 
 
+def make_document(
+    knowledge_base_id: str,
+    content_hash: str,
+    blob_uri: str,
+) -> KnowledgeDocumentRecord:
+    """Build a KnowledgeDocumentRecord of user-1 with the given content."""
+    return KnowledgeDocumentRecord(
+        user_id="user-1",
+        knowledge_base_id=knowledge_base_id,
+        data=KnowledgeDocumentData(
+            filename="f.txt",
+            size=1,
+            blob_uri=blob_uri,
+            content_hash=content_hash,
+        ),
+    )
+
+
 class KnowledgeBaseStorageTest(IsolatedAsyncioTestCase):
     """Tests for the KnowledgeBaseRecord CRUD methods on RedisStorage."""
 
@@ -111,3 +132,133 @@ class KnowledgeBaseStorageTest(IsolatedAsyncioTestCase):
         self.assertEqual(second.id, first.id)
         self.assertEqual(second.created_at, first.created_at)
         self.assertEqual(second.data.name, "renamed")
+
+
+class KnowledgeDocumentContentIndexTest(IsolatedAsyncioTestCase):
+    """Tests for the content-hash index of the knowledge documents."""
+
+    async def test_lookup_and_shared_insert(self) -> None:
+        """The index follows upserts and deletes, and a shared insert
+        succeeds only while another document references the blob."""
+        storage = make_storage()
+        first = make_document("kb-1", "h1", "local://a")
+        other = make_document("kb-1", "h2", "local://b")
+        await storage.upsert_knowledge_document("user-1", first)
+        await storage.upsert_knowledge_document("user-1", other)
+
+        self.assertEqual(
+            [
+                d.id
+                for d in await storage.list_knowledge_documents_by_content(
+                    "user-1",
+                    "h1",
+                )
+            ],
+            [first.id],
+        )
+        self.assertEqual(
+            await storage.list_knowledge_documents_by_content("user-2", "h1"),
+            [],
+        )
+
+        # A blob that no document with the same content references
+        stray = make_document("kb-2", "h1", "local://b")
+        self.assertFalse(
+            await storage.insert_shared_knowledge_document("user-1", stray),
+        )
+        self.assertIsNone(
+            await storage.get_knowledge_document("user-1", "kb-2", stray.id),
+        )
+
+        shared = make_document("kb-2", "h1", "local://a")
+        self.assertTrue(
+            await storage.insert_shared_knowledge_document("user-1", shared),
+        )
+        self.assertEqual(
+            len(
+                await storage.list_knowledge_documents_by_content(
+                    "user-1",
+                    "h1",
+                ),
+            ),
+            2,
+        )
+
+        # Changing the content moves the document in the index
+        other.data.content_hash = "h1"
+        await storage.upsert_knowledge_document("user-1", other)
+        self.assertEqual(
+            await storage.list_knowledge_documents_by_content("user-1", "h2"),
+            [],
+        )
+
+        await storage.delete_knowledge_document("user-1", "kb-1", first.id)
+        await storage.delete_knowledge_base("user-1", "kb-2")
+        self.assertEqual(
+            [
+                d.id
+                for d in await storage.list_knowledge_documents_by_content(
+                    "user-1",
+                    "h1",
+                )
+            ],
+            [other.id],
+        )
+        late = make_document("kb-3", "h1", "local://a")
+        self.assertFalse(
+            await storage.insert_shared_knowledge_document("user-1", late),
+        )
+
+    async def test_default_implementations(self) -> None:
+        """Backends without a content index get working defaults."""
+        self.assertFalse(
+            {
+                "insert_shared_knowledge_document",
+                "list_knowledge_documents_by_content",
+            }
+            & StorageBase.__abstractmethods__,
+        )
+        storage = make_storage()
+        kb = await storage.upsert_knowledge_base(
+            "user-1",
+            make_record("user-1"),
+        )
+        first = make_document(kb.id, "h1", "local://a")
+        await storage.upsert_knowledge_document("user-1", first)
+        await storage.upsert_knowledge_document(
+            "user-1",
+            make_document(kb.id, "h2", "local://b"),
+        )
+        self.assertEqual(
+            [
+                d.id
+                for d in await StorageBase.list_knowledge_documents_by_content(
+                    storage,
+                    "user-1",
+                    "h1",
+                )
+            ],
+            [first.id],
+        )
+
+        shared = make_document(kb.id, "h1", "local://a")
+        self.assertTrue(
+            await StorageBase.insert_shared_knowledge_document(
+                storage,
+                "user-1",
+                shared,
+            ),
+        )
+        await storage.delete_knowledge_document("user-1", kb.id, first.id)
+        await storage.delete_knowledge_document("user-1", kb.id, shared.id)
+        late = make_document(kb.id, "h1", "local://a")
+        self.assertFalse(
+            await StorageBase.insert_shared_knowledge_document(
+                storage,
+                "user-1",
+                late,
+            ),
+        )
+        self.assertIsNone(
+            await storage.get_knowledge_document("user-1", kb.id, late.id),
+        )
@@ -178,6 +178,24 @@ class TestAgent(IsolatedAsyncioTestCase):
         records = await self.storage.list_agents("user-B")
         self.assertEqual(records, [])
 
+    async def test_get_agents(self) -> None:
+        """``get_agents`` reads records of several owners in key order."""
+        first = make_agent_record("user-A")
+        second = make_agent_record("user-B")
+        await self.storage.upsert_agent("user-A", first)
+        await self.storage.upsert_agent("user-B", second)
+        records = await self.storage.get_agents(
+            [
+                ("user-B", second.id),
+                ("user-A", first.id),
+                ("user-A", second.id),
+            ],
+        )
+        self.assertEqual(
+            [r.id if r else None for r in records],
+            [second.id, first.id, None],
+        )
+
 
 class TestSession(IsolatedAsyncioTestCase):
     """Tests for session CRUD and cascading operations."""
@@ -226,6 +226,26 @@ class AsyncSQLAlchemyStorageTest(IsolatedAsyncioTestCase):
             team_agent.id,
         )
 
+    async def test_get_agents_in_one_query(self) -> None:
+        """``get_agents`` returns records in key order, owner-scoped."""
+        first = _agent_record("user-1", "a")
+        second = _agent_record("user-2", "b")
+        await self.storage.upsert_agent("user-1", first)
+        await self.storage.upsert_agent("user-2", second)
+
+        records = await self.storage.get_agents(
+            [
+                ("user-2", second.id),
+                ("user-1", first.id),
+                ("user-1", second.id),
+                ("user-1", "missing"),
+            ],
+        )
+        self.assertEqual(
+            [r.id if r else None for r in records],
+            [second.id, first.id, None, None],
+        )
+
     async def test_delete_agent_cascades_sessions_and_schedules(self) -> None:
         """Deleting an agent removes its sessions + schedules."""
         agent = _agent_record("user-1")
@@ -577,6 +597,68 @@ class AsyncSQLAlchemyStorageTest(IsolatedAsyncioTestCase):
             [],
         )
 
+    async def test_documents_by_content_and_shared_insert(self) -> None:
+        """Lookup by content hash; a shared insert succeeds only while
+        another document with the same content references the blob."""
+        kb = _kb_record("user-1")
+        await self.storage.upsert_knowledge_base("user-1", kb)
+        first = _kd_record("user-1", kb.id, "a.txt")
+        first.data.content_hash = "h1"
+        await self.storage.upsert_knowledge_document("user-1", first)
+
+        found = await self.storage.list_knowledge_documents_by_content(
+            "user-1",
+            "h1",
+        )
+        self.assertEqual([d.id for d in found], [first.id])
+        self.assertEqual(found[0].data.content_hash, "h1")
+        self.assertEqual(
+            await self.storage.list_knowledge_documents_by_content(
+                "user-2",
+                "h1",
+            ),
+            [],
+        )
+
+        stray = _kd_record("user-1", kb.id, "b.txt")
+        stray.data.content_hash = "h1"
+        self.assertFalse(
+            await self.storage.insert_shared_knowledge_document(
+                "user-1",
+                stray,
+            ),
+        )
+
+        shared = _kd_record("user-1", kb.id, "a.txt")
+        shared.data.content_hash = "h1"
+        self.assertTrue(
+            await self.storage.insert_shared_knowledge_document(
+                "user-1",
+                shared,
+            ),
+        )
+        fetched = await self.storage.get_knowledge_document(
+            "user-1",
+            kb.id,
+            shared.id,
+        )
+        self.assertEqual(fetched.data.blob_uri, first.data.blob_uri)
+
+        await self.storage.delete_knowledge_document("user-1", kb.id, first.id)
+        await self.storage.delete_knowledge_document(
+            "user-1",
+            kb.id,
+            shared.id,
+        )
+        late = _kd_record("user-1", kb.id, "a.txt")
+        late.data.content_hash = "h1"
+        self.assertFalse(
+            await self.storage.insert_shared_knowledge_document(
+                "user-1",
+                late,
+            ),
+        )
+
     async def test_document_kb_foreign_key_is_enforced(self) -> None:
         """The document→KB FK is live (PRAGMA on): cascade + rejection.
 
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
+# pylint: disable=protected-access
 """Unit tests for the tracing module using an in-memory OTel exporter."""
 import asyncio
 import json
 from typing import Any
 from unittest.async_case import IsolatedAsyncioTestCase
+from unittest.mock import patch
 
 from opentelemetry import trace as otel_trace
 from opentelemetry.sdk.trace import TracerProvider
@@ -37,6 +39,7 @@ from agentscope.permission import (
 )
 from agentscope.tool import Toolkit, ToolBase
 from agentscope.middleware import TracingMiddleware
+from agentscope.middleware._tracing import _trace
 
 
 # ---------------------------------------------------------------------------
@@ -159,7 +162,9 @@ def _make_text_response(text: str) -> ChatResponse:
     )
 
 
-class TracingTest(IsolatedAsyncioTestCase):
+class TracingTest(
+    IsolatedAsyncioTestCase,
+):  # pylint: disable=too-many-public-methods
     """Tests that OTel spans are emitted with correct attributes.
 
     The in-memory exporter is set up once per class (setUpClass) because
@@ -849,6 +854,122 @@ class TracingTest(IsolatedAsyncioTestCase):
             "external_execution_result",
         )
 
+    # -----------------------------------------------------------------------
+    # Tests: payload sampling, budgets and deduplication
+    # -----------------------------------------------------------------------
+
+    async def test_tool_definitions_recorded_once_per_trace(self) -> None:
+        """Only the first chat span of a trace records the tool definitions;
+        both carry their digest."""
+        self.model.set_responses(
+            [
+                _make_tool_call_response("c20", "Xiamen"),
+                _make_text_response("Xiamen is sunny."),
+            ],
+        )
+        await self.agent.reply(UserMsg(name="user", content="Xiamen?"))
+
+        chat_spans = sorted(
+            self._spans_by_name("chat"),
+            key=lambda s: s.start_time,
+        )
+        self.assertEqual(len(chat_spans), 2)
+        first, second = (dict(s.attributes or {}) for s in chat_spans)
+        tools = json.loads(first["gen_ai.tool.definitions"])
+        self.assertEqual([t["name"] for t in tools], ["get_weather"])
+        self.assertNotIn("gen_ai.tool.definitions", second)
+        self.assertEqual(
+            first["agentscope.tool_definitions.hash"],
+            second["agentscope.tool_definitions.hash"],
+        )
+
+    async def test_tool_definitions_serialized_once_while_unchanged(
+        self,
+    ) -> None:
+        """Tool definitions rebuilt for every call are serialized for
+        their digest only once while unchanged; a changed definition
+        changes the digest."""
+        self.model.set_responses(
+            [
+                _make_tool_call_response("c21", "Xiamen"),
+                _make_tool_call_response("c22", "Xiamen"),
+                _make_text_response("Xiamen is sunny."),
+            ],
+        )
+        with patch.object(
+            _trace,
+            "_serialize_to_str",
+            side_effect=_trace._serialize_to_str,
+        ) as serialize:
+            await self.agent.reply(UserMsg(name="user", content="Xiamen?"))
+        self.assertEqual(serialize.call_count, 1)
+
+        middleware = TracingMiddleware()
+        definition = {"type": "function", "name": "f", "parameters": {}}
+        digest = middleware._tool_definitions_digest([definition])
+        definition["parameters"]["type"] = "object"
+        self.assertNotEqual(
+            middleware._tool_definitions_digest([definition]),
+            digest,
+        )
+
+    async def test_payloads_bounded_by_byte_budget(self) -> None:
+        """An input message list over budget keeps its head and tail around
+        a placeholder and stays valid JSON."""
+        self.agent = Agent(
+            name="test-agent",
+            system_prompt="You are a test assistant.",
+            model=self.model,
+            toolkit=Toolkit(tools=[WeatherTool()]),
+            middlewares=[TracingMiddleware(max_attribute_bytes=1024)],
+        )
+        self.model.set_responses([_make_text_response("Done.")])
+        await self.agent.reply(
+            [
+                UserMsg(name="user", content=f"message {i} " + "x" * 100)
+                for i in range(50)
+            ],
+        )
+
+        span_attrs = dict(self._spans_by_name("invoke_agent")[0].attributes)
+        raw = span_attrs["gen_ai.input.messages"]
+        self.assertLessEqual(len(raw.encode("utf-8")), 1024)
+        input_msgs = json.loads(raw)
+        placeholder = [m for m in input_msgs if "truncated" in m]
+        self.assertEqual(len(placeholder), 1)
+        self.assertEqual(
+            len(input_msgs) - 1 + placeholder[0]["truncated"],
+            50,
+        )
+        contents = [
+            m["parts"][0]["content"] for m in input_msgs if "parts" in m
+        ]
+        self.assertTrue(contents[0].startswith("message 0 "))
+        self.assertTrue(contents[-1].startswith("message 49 "))
+
+    async def test_payloads_sampled_out(self) -> None:
+        """With a zero payload sample rate successful spans keep their
+        cheap attributes only."""
+        self.agent = Agent(
+            name="test-agent",
+            system_prompt="You are a test assistant.",
+            model=self.model,
+            toolkit=Toolkit(tools=[WeatherTool()]),
+            middlewares=[TracingMiddleware(payload_sample_rate=0.0)],
+        )
+        self.model.set_responses([_make_text_response("Sampled out.")])
+        await self.agent.reply(UserMsg(name="user", content="Hi?"))
+
+        for span in self.exporter.get_finished_spans():
+            attrs = dict(span.attributes or {})
+            self.assertIn("gen_ai.operation.name", attrs)
+            for key in (
+                "gen_ai.input.messages",
+                "gen_ai.output.messages",
+                "gen_ai.tool.definitions",
+            ):
+                self.assertNotIn(key, attrs)
+
     # -----------------------------------------------------------------------
     # Tests: streaming close from another asyncio task (issue #2076)
     # -----------------------------------------------------------------------
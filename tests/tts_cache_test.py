@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=protected-access
+"""Unit tests for the TTS audio caches and their use in TTSMiddleware."""
+import os
+import tempfile
+from typing import Any, AsyncGenerator
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from agentscope.event import (
+    DataBlockDeltaEvent,
+    TextBlockDeltaEvent,
+    TextBlockEndEvent,
+)
+from agentscope.message import Base64Source, DataBlock
+from agentscope.middleware import TTSMiddleware
+from agentscope.tts import (
+    FileTTSCache,
+    InMemoryTTSCache,
+    TTSModelBase,
+    TTSResponse,
+)
+
+
+def _chunks(*data: str) -> list[Base64Source]:
+    """Build audio chunks."""
+    return [Base64Source(data=d, media_type="audio/pcm") for d in data]
+
+
+class InMemoryTTSCacheTest(IsolatedAsyncioTestCase):
+    """Test the in-memory TTS cache."""
+
+    async def test_lru_within_byte_budget(self) -> None:
+        """The least recently used audio goes first beyond the budget."""
+        # Room for two entries of 400 KB
+        cache = InMemoryTTSCache(max_cache_size=1)
+        payload = "x" * 400 * 1024
+        await cache.store(_chunks(payload), "a")
+        await cache.store(_chunks(payload), "b")
+        await cache.retrieve("a")
+        await cache.store(_chunks(payload), "c")
+
+        self.assertIsNotNone(await cache.retrieve("a"))
+        self.assertIsNone(await cache.retrieve("b"))
+        self.assertEqual(await cache.retrieve("c"), _chunks(payload))
+        self.assertDictEqual(
+            cache.stats,
+            {"hits": 3, "misses": 1, "hit_rate": 0.75},
+        )
+
+        await cache.remove("a")
+        await cache.clear()
+        self.assertIsNone(await cache.retrieve("c"))
+
+
+class FileTTSCacheTest(IsolatedAsyncioTestCase):
+    """Test the file TTS cache."""
+
+    async def test_store_retrieve_and_evict(self) -> None:
+        """Audio survives a new cache instance, and the least recently
+        used files go first beyond the file number."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = FileTTSCache(cache_dir, max_file_number=2)
+            await cache.store(_chunks("A1", "A2"), {"text": "a"})
+            await cache.store(_chunks("B1"), {"text": "b"})
+            path_a = os.path.join(
+                cache_dir,
+                cache._get_filename({"text": "a"}),
+            )
+            path_b = os.path.join(
+                cache_dir,
+                cache._get_filename({"text": "b"}),
+            )
+            os.utime(path_a, (0, 0))
+            os.utime(path_b, (1, 1))
+            # Reading "a" makes "b" the least recently used
+            self.assertEqual(
+                await FileTTSCache(cache_dir).retrieve({"text": "a"}),
+                _chunks("A1", "A2"),
+            )
+            await cache.store(_chunks("C1"), {"text": "c"})
+
+            self.assertIsNone(await cache.retrieve({"text": "b"}))
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            self.assertEqual(cache.stats["misses"], 1)
+
+
+class TTSMiddlewareCacheTest(IsolatedAsyncioTestCase):
+    """Test that TTSMiddleware serves repeated phrases from the cache."""
+
+    async def test_repeated_text_served_from_cache(self) -> None:
+        """The second reply with the same text doesn't call the model and
+        emits the same audio."""
+
+        async def _stream(_text: str) -> AsyncGenerator[TTSResponse, None]:
+            for data in ("A1", "A2"):
+                yield TTSResponse(
+                    content=DataBlock(
+                        source=Base64Source(data=data, media_type="audio/pcm"),
+                    ),
+                )
+
+        tts = MagicMock(spec=TTSModelBase)
+        tts.realtime = False
+        tts.type = "test_tts"
+        tts.model = "test-model"
+        tts.parameters = TTSModelBase.Parameters()
+        tts.__aenter__ = AsyncMock(return_value=tts)
+        tts.__aexit__ = AsyncMock(return_value=None)
+        tts.synthesize = AsyncMock(side_effect=_stream)
+
+        cache = InMemoryTTSCache()
+        middleware = TTSMiddleware(tts, cache=cache)
+        agent = MagicMock()
+        agent.state.reply_id = "reply-1"
+
+        async def next_handler(**_kwargs: Any) -> AsyncGenerator:
+            yield TextBlockDeltaEvent(
+                reply_id="reply-1",
+                block_id="blk-1",
+                delta="Hello there",
+            )
+            yield TextBlockEndEvent(reply_id="reply-1", block_id="blk-1")
+
+        async def _audio() -> list[str]:
+            return [
+                evt.data
+                async for evt in middleware.on_reply(agent, {}, next_handler)
+                if isinstance(evt, DataBlockDeltaEvent)
+            ]
+
+        self.assertEqual(await _audio(), ["A1", "A2"])
+        self.assertEqual(await _audio(), ["A1", "A2"])
+        tts.synthesize.assert_awaited_once_with("Hello there")
+        self.assertEqual(cache.stats["hits"], 1)
+
+        # Other parameters make another entry
+        tts.model = "other-model"
+        self.assertEqual(await _audio(), ["A1", "A2"])
+        self.assertEqual(tts.synthesize.await_count, 2)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Unit tests for TTSMiddleware."""
+import asyncio
 import base64
 from typing import Any, AsyncGenerator
 from unittest import IsolatedAsyncioTestCase
@@ -15,6 +16,7 @@ from agentscope.event import (
 )
 from agentscope.message import Base64Source, DataBlock
 from agentscope.middleware import TTSMiddleware
+from agentscope.middleware._tts_middleware import _split_segments
 from agentscope.tts import TTSModelBase, TTSResponse
 
 _EXCLUDE = {"id", "created_at", "metadata"}
@@ -424,3 +426,167 @@ class TestTTSMiddlewareRealtime(IsolatedAsyncioTestCase):
                 },
             ],
         )
+
+
+def _text_events(*deltas: str) -> list:
+    """Build the events of one streamed text block."""
+    return [
+        TextBlockDeltaEvent(reply_id="reply-1", block_id="blk-1", delta=d)
+        for d in deltas
+    ] + [TextBlockEndEvent(reply_id="reply-1", block_id="blk-1")]
+
+
+class TestTTSMiddlewarePipelined(IsolatedAsyncioTestCase):
+    """Tests for the pipelined (segmented / decoupled) TTS paths."""
+
+    async def _run(self, middleware: TTSMiddleware, events: list) -> list:
+        """Run the middleware over upstream events, yielding control to
+        the background work between them."""
+
+        async def next_handler(**_kwargs: Any) -> AsyncGenerator:
+            for evt in events:
+                yield evt
+                await asyncio.sleep(0.05)
+
+        return [
+            evt
+            async for evt in middleware.on_reply(
+                _make_agent_stub(),
+                {},
+                next_handler,
+            )
+        ]
+
+    def test_split_segments(self) -> None:
+        """Sentences cut once long enough, clauses only in long text."""
+        self.assertEqual(
+            _split_segments("Hi. Pi is 3.14 here. And then"),
+            (["Hi. Pi is 3.14 here. "], "And then"),
+        )
+        self.assertEqual(
+            _split_segments("你好世界，今天天气很好。然后"),
+            (["你好世界，今天天气很好。"], "然后"),
+        )
+        clause = "word " * 9 + "end, "
+        self.assertEqual(
+            _split_segments(clause + "more"),
+            ([clause], "more"),
+        )
+
+    async def test_segments_emitted_in_order_within_window(self) -> None:
+        """Segments synthesize concurrently up to the window, and their
+        audio is emitted in text order though they finish out of order."""
+        in_flight = 0
+        peak = 0
+
+        async def _synthesize(text: str) -> TTSResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Earlier segments finish later
+            await asyncio.sleep(0.03 if text.startswith("One") else 0.01)
+            in_flight -= 1
+            return _make_tts_response(text.split()[0], "audio/pcm")
+
+        tts = MagicMock(spec=TTSModelBase)
+        tts.realtime = False
+        tts.__aenter__ = AsyncMock(return_value=tts)
+        tts.__aexit__ = AsyncMock(return_value=None)
+        tts.synthesize = AsyncMock(side_effect=_synthesize)
+
+        middleware = TTSMiddleware(tts, pipelined=True, max_concurrency=2)
+        emitted = await self._run(
+            middleware,
+            _text_events(
+                "One sentence here. Two sentence here. ",
+                "Three sentence here. Four",
+            ),
+        )
+
+        self.assertEqual(
+            [c.args[0] for c in tts.synthesize.call_args_list],
+            [
+                "One sentence here. ",
+                "Two sentence here. ",
+                "Three sentence here. ",
+                "Four",
+            ],
+        )
+        self.assertEqual(peak, 2)
+        data_events = [
+            e
+            for e in emitted
+            if isinstance(
+                e,
+                (DataBlockStartEvent, DataBlockDeltaEvent, DataBlockEndEvent),
+            )
+        ]
+        self.assertIsInstance(data_events[0], DataBlockStartEvent)
+        self.assertEqual(
+            [e.data for e in data_events[1:-1]],
+            ["One", "Two", "Three", "Four"],
+        )
+        self.assertIsInstance(data_events[-1], DataBlockEndEvent)
+        self.assertEqual(
+            len({e.block_id for e in data_events}),
+            1,
+        )
+        # The first audio was emitted before the text block ended
+        self.assertLess(
+            emitted.index(data_events[0]),
+            emitted.index(
+                next(e for e in emitted if isinstance(e, TextBlockEndEvent)),
+            ),
+        )
+        self.assertIsNotNone(middleware.time_to_first_audio)
+
+    async def test_segment_failure_propagates(self) -> None:
+        """A failed segment fails the reply."""
+        tts = MagicMock(spec=TTSModelBase)
+        tts.realtime = False
+        tts.__aenter__ = AsyncMock(return_value=tts)
+        tts.__aexit__ = AsyncMock(return_value=None)
+        tts.synthesize = AsyncMock(side_effect=RuntimeError("boom"))
+
+        middleware = TTSMiddleware(tts, pipelined=True)
+        with self.assertRaises(RuntimeError):
+            await self._run(middleware, _text_events("Short text"))
+
+    async def test_realtime_push_decoupled(self) -> None:
+        """Slow pushes run in the background without holding back the
+        text events, and their audio precedes the drained audio."""
+
+        async def _push(text: str) -> TTSResponse:
+            await asyncio.sleep(0.05)
+            return _make_tts_response(text.strip(), "audio/pcm")
+
+        tts = MagicMock(spec=TTSModelBase)
+        tts.realtime = True
+        tts.__aenter__ = AsyncMock(return_value=tts)
+        tts.__aexit__ = AsyncMock(return_value=None)
+        tts.push = AsyncMock(side_effect=_push)
+        tts.synthesize = AsyncMock(
+            return_value=_make_tts_response("FINAL", "audio/pcm"),
+        )
+
+        events = _text_events("a ", "b")
+
+        async def next_handler(**_kwargs: Any) -> AsyncGenerator:
+            for evt in events:
+                yield evt
+
+        emitted = [
+            evt
+            async for evt in TTSMiddleware(tts, pipelined=True).on_reply(
+                _make_agent_stub(),
+                {},
+                next_handler,
+            )
+        ]
+
+        self.assertEqual(emitted[:3], events)
+        self.assertEqual(
+            [e.data for e in emitted if isinstance(e, DataBlockDeltaEvent)],
+            ["a", "b", "FINAL"],
+        )
+        self.assertIsInstance(emitted[-1], DataBlockEndEvent)